@@ -25,8 +25,9 @@ Usage:
 """
 
 import sys
+import time
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
 # Add project to path
@@ -56,6 +57,9 @@ logger = get_logger(__name__)
 
 load_dotenv()
 
+# How long loaded clothing items are reused (covers the variations of one job)
+CLOTHING_ITEM_CACHE_SECONDS = 300.0
+
 
 class ModularImageGenerator:
     """
@@ -77,6 +81,8 @@ class ModularImageGenerator:
 
         self.router = LLMRouter(model=model)
         self.preset_manager = PresetManager()
+        # item_id -> (loaded_at, clothing item dict)
+        self._clothing_item_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
     def _merge_outfits(self, outfit_specs: list) -> OutfitSpec:
         """
@@ -128,10 +134,43 @@ class ModularImageGenerator:
             aesthetic=aesthetic
         )
 
+    async def _fetch_clothing_items(self, item_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get clothing item dicts by ID, from the cache or with one IN query
+
+        Returns:
+            Dict of item_id -> clothing item dict (missing IDs are absent)
+        """
+        now = time.monotonic()
+        items = {}
+        missing = []
+        for item_id in item_ids:
+            cached = self._clothing_item_cache.get(item_id)
+            if cached and now - cached[0] < CLOTHING_ITEM_CACHE_SECONDS:
+                items[item_id] = cached[1]
+            else:
+                missing.append(item_id)
+
+        if missing:
+            from api.database import get_session
+            from api.services.clothing_items_service_db import ClothingItemServiceDB
+
+            async with get_session() as session:
+                loaded = await ClothingItemServiceDB(session).get_clothing_items(missing)
+
+            for item_dict in loaded:
+                self._clothing_item_cache[item_dict['item_id']] = (now, item_dict)
+                items[item_dict['item_id']] = item_dict
+
+        return items
+
     async def _load_clothing_items_from_db(self, **clothing_categories) -> Optional[OutfitSpec]:
         """
         Load clothing items from database and create an OutfitSpec
 
+        All requested items are fetched in one query; items loaded in the last
+        few minutes (e.g. by an earlier variation of the same job) are reused.
+
         Args:
             **clothing_categories: Keyword arguments for each clothing category
                                   (headwear, tops, bottoms, etc.)
@@ -139,37 +178,35 @@ class ModularImageGenerator:
         Returns:
             OutfitSpec containing all clothing items, or None if no items provided
         """
-        from api.database import get_session
-        from api.services.clothing_items_service_db import ClothingItemServiceDB
-
-        all_clothing_items = []
-
-        # Iterate through all clothing categories
+        # Normalize to category -> list of IDs, keeping the requested order
+        ids_by_category = {}
         for category_key, item_ids in clothing_categories.items():
             if not item_ids:
                 continue
+            ids_by_category[category_key] = [item_ids] if isinstance(item_ids, str) else list(item_ids)
 
-            # Ensure item_ids is a list
-            if isinstance(item_ids, str):
-                item_ids = [item_ids]
+        if not ids_by_category:
+            return None
 
-            # Load each item from database
-            async with get_session() as session:
-                service = ClothingItemServiceDB(session)
-
-                for item_id in item_ids:
-                    item_dict = await service.get_clothing_item(item_id)
-                    if item_dict:
-                        # Convert database dict to ClothingItem (legacy type for OutfitSpec)
-                        # OutfitSpec expects ClothingItem, not ClothingItemEntity
-                        clothing_item = ClothingItem(
-                            item=item_dict['item'],
-                            fabric=item_dict['fabric'],
-                            color=item_dict['color'],
-                            details=item_dict['details']
-                        )
-                        all_clothing_items.append(clothing_item)
-                        logger.info(f"  ✓ Loaded {item_dict['category']}: {item_dict['item']}")
+        items_by_id = await self._fetch_clothing_items(list(dict.fromkeys(
+            item_id for item_ids in ids_by_category.values() for item_id in item_ids
+        )))
+
+        all_clothing_items = []
+        for item_ids in ids_by_category.values():
+            for item_id in item_ids:
+                item_dict = items_by_id.get(item_id)
+                if item_dict:
+                    # Convert database dict to ClothingItem (legacy type for OutfitSpec)
+                    # OutfitSpec expects ClothingItem, not ClothingItemEntity
+                    clothing_item = ClothingItem(
+                        item=item_dict['item'],
+                        fabric=item_dict['fabric'],
+                        color=item_dict['color'],
+                        details=item_dict['details']
+                    )
+                    all_clothing_items.append(clothing_item)
+                    logger.info(f"  ✓ Loaded {item_dict['category']}: {item_dict['item']}")
 
         if not all_clothing_items:
             return None
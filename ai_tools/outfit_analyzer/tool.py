@@ -112,6 +112,42 @@ class OutfitAnalyzer:
         base_template_path = Path(__file__).parent / "template.md"
         return base_template_path.read_text()
 
+    async def _save_clothing_items(self, clothing_items: List[Dict[str, Any]], image_path: Path) -> List[Dict[str, Any]]:
+        """
+        Save detected clothing items with a single bulk insert
+
+        No previews are generated (don't slow down outfit analysis); they can
+        be requested per item later, or for a batch with
+        ClothingItemServiceDB.queue_preview_jobs as one job group.
+        """
+        items = [
+            {
+                "category": item_data["category"],
+                "item": item_data["item"],
+                "fabric": item_data["fabric"],
+                "color": item_data["color"],
+                "details": item_data["details"],
+            }
+            for item_data in clothing_items
+        ]
+
+        # If we don't have a service yet (analyzer service didn't provide session), create one
+        if self.clothing_service is None:
+            from api.database import get_session
+            from api.services.clothing_items_service_db import ClothingItemServiceDB
+
+            async with get_session() as session:
+                service = ClothingItemServiceDB(session, user_id=self.user_id)
+                created_items, _ = await service.create_many(items, source_image=str(image_path))
+        else:
+            # Use existing service (session provided to __init__)
+            created_items, _ = await self.clothing_service.create_many(items, source_image=str(image_path))
+
+        for item_dict in created_items:
+            logger.info(f"   Saved {item_dict['category']}: {item_dict['item']}")
+
+        return created_items
+
     async def aanalyze(
         self,
         image_path: Union[Path, str],
@@ -169,44 +205,7 @@ class OutfitAnalyzer:
                 if cached:
                     logger.info(f"CACHE HIT - Processing cached analysis for {image_path.name}")
                     # Process cached result into clothing items using service
-                    created_items = []
-
-                    # If we don't have a service yet, create one
-                    if self.clothing_service is None:
-                        from api.database import get_session
-                        from api.services.clothing_items_service_db import ClothingItemServiceDB
-
-                        async with get_session() as session:
-                            service = ClothingItemServiceDB(session, user_id=self.user_id)
-
-                            for item_data in cached.clothing_items:
-                                item_dict = await service.create_clothing_item(
-                                    category=item_data["category"],
-                                    item=item_data["item"],
-                                    fabric=item_data["fabric"],
-                                    color=item_data["color"],
-                                    details=item_data["details"],
-                                    source_image=str(image_path),
-                                    generate_preview=False,  # Don't slow down outfit analysis
-                                    background_tasks=None
-                                )
-                                created_items.append(item_dict)
-                                logger.info(f"   Saved {item_dict['category']}: {item_dict['item']}")
-                    else:
-                        # Use existing service
-                        for item_data in cached.clothing_items:
-                            item_dict = await self.clothing_service.create_clothing_item(
-                                category=item_data["category"],
-                                item=item_data["item"],
-                                fabric=item_data["fabric"],
-                                color=item_data["color"],
-                                details=item_data["details"],
-                                source_image=str(image_path),
-                                generate_preview=False,  # Don't slow down outfit analysis
-                                background_tasks=None
-                            )
-                            created_items.append(item_dict)
-                            logger.info(f"   Saved {item_dict['category']}: {item_dict['item']}")
+                    created_items = await self._save_clothing_items(cached.clothing_items, image_path)
 
                     logger.info(f"\n✨ Created {len(created_items)} clothing items from cache")
                     return {
@@ -237,44 +236,7 @@ class OutfitAnalyzer:
             )
 
             # Create and save individual clothing items using service
-            created_items = []
-
-            # If we don't have a service yet (analyzer service didn't provide session), create one
-            if self.clothing_service is None:
-                from api.database import get_session
-                from api.services.clothing_items_service_db import ClothingItemServiceDB
-
-                async with get_session() as session:
-                    service = ClothingItemServiceDB(session, user_id=self.user_id)
-
-                    for item_data in analysis.clothing_items:
-                        item_dict = await service.create_clothing_item(
-                            category=item_data["category"],
-                            item=item_data["item"],
-                            fabric=item_data["fabric"],
-                            color=item_data["color"],
-                            details=item_data["details"],
-                            source_image=str(image_path),
-                            generate_preview=False,  # Don't slow down outfit analysis
-                            background_tasks=None
-                        )
-                        created_items.append(item_dict)
-                        logger.info(f"   Saved {item_dict['category']}: {item_dict['item']}")
-            else:
-                # Use existing service (session provided to __init__)
-                for item_data in analysis.clothing_items:
-                    item_dict = await self.clothing_service.create_clothing_item(
-                        category=item_data["category"],
-                        item=item_data["item"],
-                        fabric=item_data["fabric"],
-                        color=item_data["color"],
-                        details=item_data["details"],
-                        source_image=str(image_path),
-                        generate_preview=False,  # Don't slow down outfit analysis
-                        background_tasks=None
-                    )
-                    created_items.append(item_dict)
-                    logger.info(f"   Saved {item_dict['category']}: {item_dict['item']}")
+            created_items = await self._save_clothing_items(analysis.clothing_items, image_path)
 
             # Cache the result using combined key (image + template + model)
             if self.use_cache:
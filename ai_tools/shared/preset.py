@@ -4,9 +4,15 @@ Preset Manager
 Manages user-editable presets (promoted artifacts from analyses).
 Presets are curated, reusable building blocks stored as JSON files.
 Uses UUID-based storage with display names for easy renaming.
+
+Preset metadata is served from an in-memory index per preset directory
+(shared by all PresetManager instances in the process), so listing,
+counting and existence checks don't read the preset files.
 """
 
 import json
+import threading
+import time
 import uuid
 from pathlib import Path
 from typing import Optional, List, Type, Dict, Any
@@ -31,6 +37,136 @@ class ValidationResult(BaseModel):
     warnings: List[str] = []
 
 
+def _preset_entry(preset_path: Path, has_preview: bool) -> Optional[Dict[str, Any]]:
+    """Index entry for a preset file (readable=False if it isn't valid JSON), None if gone"""
+    try:
+        stat = preset_path.stat()
+    except OSError:
+        return None
+
+    try:
+        with open(preset_path, 'r') as f:
+            data = json.load(f)
+        metadata = data.get("_metadata")
+        name = data.get("name")
+        readable = True
+    except Exception:
+        metadata = None
+        name = None
+        readable = False
+
+    return {
+        "preset_id": preset_path.stem,
+        "metadata": metadata,
+        "name": name,
+        "readable": readable,
+        "size_bytes": stat.st_size,
+        "modified": stat.st_mtime,
+        "has_preview": has_preview,
+    }
+
+
+class PresetIndex:
+    """
+    In-memory metadata of one preset directory: preset_id -> entry
+
+    Rebuilt when the directory mtime changes (a preset or preview was added,
+    removed or atomically replaced) or after max_age seconds (catches files
+    edited in place by other processes). Writes through PresetManager
+    update it in place instead.
+    """
+
+    def __init__(self, preset_dir: Path, max_age: float = 60.0):
+        self.preset_dir = preset_dir
+        self.max_age = max_age
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._mtime: Optional[int] = None
+        self._built_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _dir_mtime(self) -> Optional[int]:
+        try:
+            return self.preset_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _is_current(self, mtime: Optional[int]) -> bool:
+        return (
+            self._built_at is not None
+            and self._mtime == mtime
+            and time.monotonic() - self._built_at < self.max_age
+        )
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Current entries, rescanning the directory if it changed"""
+        mtime = self._dir_mtime()
+        if self._is_current(mtime):
+            return self._entries
+
+        with self._lock:
+            if not self._is_current(mtime):
+                previews = {path.name[:-len("_preview.png")] for path in self.preset_dir.glob("*_preview.png")}
+                entries = {}
+                for preset_path in self.preset_dir.glob("*.json"):
+                    entry = _preset_entry(preset_path, preset_path.stem in previews)
+                    if entry is not None:
+                        entries[entry["preset_id"]] = entry
+                self._entries = entries
+                self._mtime = mtime
+                self._built_at = time.monotonic()
+        return self._entries
+
+    def _after_write(self, update):
+        # Our own write changed the directory mtime; don't rescan because of it
+        with self._lock:
+            if self._built_at is None:
+                return
+            entries = dict(self._entries)
+            update(entries)
+            self._entries = entries
+            self._mtime = self._dir_mtime()
+
+    def put(self, preset_id: str):
+        """Re-read one preset file after it was written"""
+        preset_path = self.preset_dir / f"{preset_id}.json"
+        preview_path = self.preset_dir / f"{preset_id}_preview.png"
+        entry = _preset_entry(preset_path, preview_path.exists())
+
+        def update(entries):
+            if entry is None:
+                entries.pop(preset_id, None)
+            else:
+                entries[preset_id] = entry
+
+        self._after_write(update)
+
+    def remove(self, preset_id: str):
+        """Drop a deleted preset"""
+        self._after_write(lambda entries: entries.pop(preset_id, None))
+
+    def set_preview(self, preset_id: str, has_preview: bool):
+        """Record that a preview image was written or deleted"""
+        def update(entries):
+            if preset_id in entries:
+                entries[preset_id] = {**entries[preset_id], "has_preview": has_preview}
+
+        self._after_write(update)
+
+
+_indexes: Dict[Path, PresetIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_preset_index(preset_dir: Path) -> PresetIndex:
+    """Get the process-wide index of a preset directory"""
+    key = preset_dir.resolve()
+    index = _indexes.get(key)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.setdefault(key, PresetIndex(key))
+    return index
+
+
 class PresetManager:
     """
     Manages user-editable presets
@@ -67,15 +203,33 @@ class PresetManager:
         preset_dir.mkdir(parents=True, exist_ok=True)
         return preset_dir
 
-    def _get_preset_path(self, tool_type: str, preset_id: str) -> Path:
-        """Get the full path to a preset file by ID"""
+    def _clean_preset_id(self, preset_id: str) -> str:
+        """Preset ID as stored on disk"""
         # Remove .json extension if provided
         preset_id = preset_id.replace(".json", "")
 
         # Sanitize preset_id: replace spaces with dashes, remove unsafe characters
-        preset_id = preset_id.replace(" ", "-")
+        return preset_id.replace(" ", "-")
+
+    def _get_preset_path(self, tool_type: str, preset_id: str) -> Path:
+        """Get the full path to a preset file by ID"""
+        return self._get_preset_dir(tool_type) / f"{self._clean_preset_id(preset_id)}.json"
+
+    def _index(self, tool_type: str) -> PresetIndex:
+        """In-memory metadata index of a tool type's presets"""
+        return get_preset_index(self._get_preset_dir(tool_type))
 
-        return self._get_preset_dir(tool_type) / f"{preset_id}.json"
+    def _get_entry(self, tool_type: str, preset_id: str) -> Dict[str, Any]:
+        """
+        Index entry of a preset
+
+        Raises:
+            PresetNotFoundError: If preset doesn't exist
+        """
+        entry = self._index(tool_type).entries().get(self._clean_preset_id(preset_id))
+        if entry is None:
+            raise PresetNotFoundError(f"Preset not found: {tool_type}/{preset_id}")
+        return entry
 
     def save(
         self,
@@ -135,6 +289,8 @@ class PresetManager:
         with open(preset_path, 'w') as f:
             json.dump(preset_dict, f, indent=2, default=str)
 
+        self._index(tool_type).put(preset_path.stem)
+
         return preset_path, preset_id
 
     def load(
@@ -205,8 +361,11 @@ class PresetManager:
         Returns:
             True if preset exists
         """
-        preset_path = self._get_preset_path(tool_type, preset_id)
-        return preset_path.exists()
+        return self._clean_preset_id(preset_id) in self._index(tool_type).entries()
+
+    def count(self, tool_type: str) -> int:
+        """Number of presets of a tool type (corrupted files are not counted, as in list)"""
+        return sum(1 for entry in self._index(tool_type).entries().values() if entry["readable"])
 
     def list(self, tool_type: str) -> List[Dict[str, Any]]:
         """
@@ -218,33 +377,21 @@ class PresetManager:
         Returns:
             List of dicts with preset_id, display_name, and other metadata
         """
-        preset_dir = self._get_preset_dir(tool_type)
-
-        if not preset_dir.exists():
-            return []
-
-        # Get all .json files
         presets = []
-        for preset_file in preset_dir.glob("*.json"):
-            preset_id = preset_file.stem
-
-            # Load metadata
-            try:
-                with open(preset_file, 'r') as f:
-                    data = json.load(f)
-                    metadata = data.get("_metadata", {})
-
-                    presets.append({
-                        "preset_id": preset_id,
-                        "display_name": metadata.get("display_name"),
-                        "created_at": metadata.get("created_at"),
-                        "tool": metadata.get("tool"),
-                        "notes": metadata.get("notes")
-                    })
-            except Exception:
+        for entry in self._index(tool_type).entries().values():
+            if not entry["readable"]:
                 # Skip corrupted files
                 continue
 
+            metadata = entry["metadata"] or {}
+            presets.append({
+                "preset_id": entry["preset_id"],
+                "display_name": metadata.get("display_name"),
+                "created_at": metadata.get("created_at"),
+                "tool": metadata.get("tool"),
+                "notes": metadata.get("notes")
+            })
+
         return sorted(presets, key=lambda x: x.get("created_at") or "", reverse=True)
 
     def list_all(self) -> Dict[str, List[str]]:
@@ -285,6 +432,7 @@ class PresetManager:
 
         # Delete preset file
         preset_path.unlink()
+        self._index(tool_type).remove(preset_path.stem)
 
         # Also delete preview image if it exists
         self.delete_preview_image(tool_type, preset_id)
@@ -323,8 +471,14 @@ class PresetManager:
         with open(preset_path, 'w') as f:
             json.dump(data, f, indent=2, default=str)
 
+        self._index(tool_type).put(preset_path.stem)
+
         return True
 
+    def refresh(self, tool_type: str, preset_id: str):
+        """Update the index after a preset file was written without the manager"""
+        self._index(tool_type).put(self._clean_preset_id(preset_id))
+
     def get_metadata(self, tool_type: str, preset_id: str) -> Optional[Dict[str, Any]]:
         """
         Get metadata for a preset without loading the full spec
@@ -336,15 +490,14 @@ class PresetManager:
         Returns:
             Metadata dict or None if no metadata
         """
-        preset_path = self._get_preset_path(tool_type, preset_id)
+        entry = self._get_entry(tool_type, preset_id)
 
-        if not preset_path.exists():
-            raise PresetNotFoundError(f"Preset not found: {tool_type}/{preset_id}")
-
-        with open(preset_path, 'r') as f:
-            preset_data = json.load(f)
+        if not entry["readable"]:
+            # Surface the parse error
+            with open(self._get_preset_path(tool_type, preset_id), 'r') as f:
+                return json.load(f).get("_metadata")
 
-        return preset_data.get("_metadata")
+        return entry["metadata"]
 
     def validate(
         self,
@@ -431,20 +584,14 @@ class PresetManager:
         Returns:
             Dictionary with preset info
         """
-        preset_path = self._get_preset_path(tool_type, name)
-
-        if not preset_path.exists():
-            raise PresetNotFoundError(f"Preset not found: {tool_type}/{name}")
-
-        # Get file stats
-        stat = preset_path.stat()
+        entry = self._get_entry(tool_type, name)
 
         info = {
             "name": name,
             "tool_type": tool_type,
-            "path": str(preset_path),
-            "size_bytes": stat.st_size,
-            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            "path": str(self._get_preset_path(tool_type, name)),
+            "size_bytes": entry["size_bytes"],
+            "modified": datetime.fromtimestamp(entry["modified"]).isoformat(),
         }
 
         # Add metadata if present
@@ -491,6 +638,8 @@ class PresetManager:
         with open(preview_path, 'wb') as f:
             f.write(image_data)
 
+        self._index(tool_type).set_preview(self._clean_preset_id(preset_id), True)
+
         return preview_path
 
     def has_preview_image(self, tool_type: str, preset_id: str) -> bool:
@@ -504,8 +653,12 @@ class PresetManager:
         Returns:
             True if preview image exists
         """
-        preview_path = self.get_preview_image_path(tool_type, preset_id)
-        return preview_path.exists()
+        entry = self._index(tool_type).entries().get(self._clean_preset_id(preset_id))
+        if entry is not None:
+            return entry["has_preview"]
+
+        # Preview without a preset file
+        return self.get_preview_image_path(tool_type, preset_id).exists()
 
     def delete_preview_image(self, tool_type: str, preset_id: str) -> bool:
         """
@@ -524,6 +677,7 @@ class PresetManager:
             return False
 
         preview_path.unlink()
+        self._index(tool_type).set_preview(self._clean_preset_id(preset_id), False)
         return True
 
 
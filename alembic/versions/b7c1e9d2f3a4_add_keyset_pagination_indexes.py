@@ -0,0 +1,36 @@
+"""Add (created_at, id) indexes for keyset pagination
+
+Revision ID: b7c1e9d2f3a4
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c1e9d2f3a4'
+down_revision: Union[str, Sequence[str], None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - add indexes backing newest-first cursor pagination."""
+    op.create_index('ix_character_created_id', 'characters', ['created_at', 'id'], unique=False)
+    op.create_index('ix_character_user_created_id', 'characters', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_clothing_created_id', 'clothing_items', ['created_at', 'id'], unique=False)
+    op.create_index('ix_clothing_user_created_id', 'clothing_items', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_image_created_id', 'images', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema - remove keyset pagination indexes."""
+    op.drop_index('ix_image_created_id', table_name='images')
+    op.drop_index('ix_clothing_user_created_id', table_name='clothing_items')
+    op.drop_index('ix_clothing_created_id', table_name='clothing_items')
+    op.drop_index('ix_character_user_created_id', table_name='characters')
+    op.drop_index('ix_character_created_id', table_name='characters')
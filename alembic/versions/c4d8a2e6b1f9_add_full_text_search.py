@@ -0,0 +1,81 @@
+"""Add full-text (tsvector) and trigram search indexes
+
+Revision ID: c4d8a2e6b1f9
+Revises: b7c1e9d2f3a4
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d8a2e6b1f9'
+down_revision: Union[str, Sequence[str], None] = 'b7c1e9d2f3a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> ((column, weight), ...), most important first (must match api/models/db.py)
+SEARCH_COLUMNS = {
+    'characters': (('name', 'A'), ('personality', 'B'), ('visual_description', 'C')),
+    'clothing_items': (('item', 'A'), ('color', 'B'), ('fabric', 'B'), ('details', 'C')),
+    'board_games': (('name', 'A'), ('designer', 'B'), ('publisher', 'B'), ('description', 'C')),
+}
+
+# (index name, table, column) for pg_trgm fuzzy/substring matching
+TRIGRAM_INDEXES = [
+    ('ix_character_name_trgm', 'characters', 'name'),
+    ('ix_clothing_item_trgm', 'clothing_items', 'item'),
+    ('ix_boardgame_name_trgm', 'board_games', 'name'),
+]
+
+SEARCH_VECTOR_INDEXES = {
+    'characters': 'ix_character_search_vector',
+    'clothing_items': 'ix_clothing_search_vector',
+    'board_games': 'ix_boardgame_search_vector',
+}
+
+
+def _weighted_tsvector(weighted_columns) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('english', coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted_columns
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema - add generated search_vector columns with GIN and trigram indexes."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    for table, weighted_columns in SEARCH_COLUMNS.items():
+        # STORED generated column: computed for existing rows by the ALTER
+        op.add_column(table, sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(_weighted_tsvector(weighted_columns), persisted=True),
+            nullable=True
+        ))
+        op.create_index(
+            SEARCH_VECTOR_INDEXES[table], table, ['search_vector'],
+            unique=False, postgresql_using='gin'
+        )
+
+    for index_name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            index_name, table, [column],
+            unique=False, postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema - remove search columns and indexes (pg_trgm is left installed)."""
+    for index_name, table, _column in reversed(TRIGRAM_INDEXES):
+        op.drop_index(index_name, table_name=table)
+
+    for table in reversed(list(SEARCH_COLUMNS)):
+        op.drop_index(SEARCH_VECTOR_INDEXES[table], table_name=table)
+        op.drop_column(table, 'search_vector')
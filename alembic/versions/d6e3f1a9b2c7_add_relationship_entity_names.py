@@ -0,0 +1,98 @@
+"""Add denormalized entity_name/preset_category to image_entity_relationships
+
+Revision ID: d6e3f1a9b2c7
+Revises: c4d8a2e6b1f9
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+import json
+from typing import Dict, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from api.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6e3f1a9b2c7'
+down_revision: Union[str, Sequence[str], None] = 'c4d8a2e6b1f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# entity_type -> (table, id column, name column) for database-backed entities
+ENTITY_NAME_SOURCES = {
+    'character': ('characters', 'character_id', 'name'),
+    'clothing_item': ('clothing_items', 'item_id', 'item'),
+}
+
+# Snapshot of api.services.image_service at the time of this revision
+# (importing api.services pulls in every AI tool)
+PRESET_ENTITY_TYPES = ('visual_style', 'preset')
+PRESET_NAME_CATEGORIES = [
+    'visual_styles', 'expressions', 'accessories', 'art_styles',
+    'hair_colors', 'hair_styles', 'makeup', 'story_themes',
+    'story_prose_styles', 'story_audiences'
+]
+
+
+def read_preset_names() -> Dict[str, Tuple[str, str]]:
+    """preset_id -> (category, display name); the first category containing an ID wins"""
+    names: Dict[str, Tuple[str, str]] = {}
+    for category in PRESET_NAME_CATEGORIES:
+        category_dir = settings.presets_dir / category
+        if not category_dir.is_dir():
+            continue
+        for preset_path in sorted(category_dir.glob("*.json")):
+            preset_id = preset_path.stem
+            if preset_id in names:
+                continue
+            try:
+                preset_data = json.loads(preset_path.read_text())
+            except (OSError, ValueError):
+                continue
+            metadata = preset_data.get('_metadata', {})
+            names[preset_id] = (category, metadata.get('display_name') or preset_data.get('name', preset_id))
+    return names
+
+
+def upgrade() -> None:
+    """Upgrade schema - add the name columns and backfill existing relationships."""
+    op.add_column('image_entity_relationships', sa.Column('entity_name', sa.String(length=500), nullable=True))
+    op.add_column('image_entity_relationships', sa.Column('preset_category', sa.String(length=100), nullable=True))
+
+    for entity_type, (table, id_column, name_column) in ENTITY_NAME_SOURCES.items():
+        op.execute(sa.text(f"""
+            UPDATE image_entity_relationships AS r
+            SET entity_name = e.{name_column}
+            FROM {table} AS e
+            WHERE r.entity_type = :entity_type
+              AND r.entity_id = e.{id_column}
+              AND e.{name_column} IS NOT NULL AND e.{name_column} <> ''
+        """).bindparams(entity_type=entity_type))
+
+    # Preset names live in the preset JSON files
+    preset_names = read_preset_names()
+    if preset_names:
+        preset_types = ", ".join(f"'{entity_type}'" for entity_type in PRESET_ENTITY_TYPES)
+        op.get_bind().execute(
+            sa.text(f"""
+                UPDATE image_entity_relationships
+                SET entity_name = :entity_name, preset_category = :preset_category
+                WHERE entity_type IN ({preset_types}) AND entity_id = :entity_id
+            """),
+            [
+                {'entity_id': preset_id, 'entity_name': name, 'preset_category': category}
+                for preset_id, (category, name) in preset_names.items()
+            ]
+        )
+
+    # Entities that no longer exist are shown by ID, as before
+    op.execute("UPDATE image_entity_relationships SET entity_name = entity_id WHERE entity_name IS NULL")
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop the denormalized name columns."""
+    op.drop_column('image_entity_relationships', 'preset_category')
+    op.drop_column('image_entity_relationships', 'entity_name')
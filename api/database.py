@@ -5,7 +5,11 @@ Provides async database connection, session management, and base models
 for PostgreSQL using SQLAlchemy 2.0+ async API.
 """
 
-from typing import AsyncGenerator, Optional
+import contextvars
+import re
+import time
+from collections import Counter
+from typing import AsyncGenerator, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import (
@@ -15,7 +19,8 @@ from sqlalchemy.ext.asyncio import (
     AsyncEngine
 )
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import MetaData
+from sqlalchemy.pool import NullPool
+from sqlalchemy import MetaData, event, text
 
 from api.config import settings
 from api.logging_config import get_logger
@@ -71,9 +76,137 @@ def create_engine() -> AsyncEngine:
         pool_recycle=3600,  # Recycle connections after 1 hour
     )
 
+    install_query_instrumentation(engine)
+
     return engine
 
 
+# Query instrumentation
+#
+# Engine events time every statement and attribute it to the current
+# request (held in a context variable; SQLAlchemy's greenlet bridge runs the
+# hooks in the calling task's context), so the request middleware can log
+# query counts, DB time, the slowest statement and repeated statement
+# shapes (N+1 patterns).
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Longest statement text kept for logs
+STATEMENT_LOG_LENGTH = 300
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalize a statement for grouping
+
+    Values are bound parameters, so statements issued by the same code path
+    share their text; only whitespace needs normalizing.
+    """
+    return _WHITESPACE_RE.sub(" ", statement).strip()
+
+
+class QueryStats:
+    """Database activity of one request"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, elapsed_ms: float):
+        """Add one executed statement"""
+        shape = statement_shape(statement)
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.shapes[shape] += 1
+        if elapsed_ms >= self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = shape
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed more than threshold times, most frequent first"""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+_query_stats_var: contextvars.ContextVar[Optional[QueryStats]] = contextvars.ContextVar('query_stats', default=None)
+
+
+def start_query_stats() -> QueryStats:
+    """Start collecting query stats for the current request"""
+    stats = QueryStats()
+    _query_stats_var.set(stats)
+    return stats
+
+
+def finish_query_stats() -> Optional[QueryStats]:
+    """Stop collecting query stats for the current request and return them"""
+    stats = _query_stats_var.get()
+    _query_stats_var.set(None)
+    return stats
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    """Query stats of the current request, if it is being instrumented"""
+    return _query_stats_var.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = getattr(context, "_query_started_at", None)
+    if started_at is None:
+        return
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+
+    if elapsed_ms >= settings.sql_slow_query_ms:
+        logger.warning("Slow query", extra={'extra_fields': {
+            'duration_ms': round(elapsed_ms, 1),
+            'statement': statement_shape(statement)[:STATEMENT_LOG_LENGTH]
+        }})
+
+    stats = get_query_stats()
+    if stats is not None:
+        stats.record(statement, elapsed_ms)
+
+
+def install_query_instrumentation(engine):
+    """Attach the timing hooks to an engine (async or sync)"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def report_query_stats(method: str, path: str, stats: QueryStats):
+    """Log a request's query stats when they exceed the configured thresholds"""
+    if stats.count == 0:
+        return
+
+    summary = {
+        'method': method,
+        'path': path,
+        'query_count': stats.count,
+        'db_time_ms': round(stats.total_ms, 1),
+        'slowest_query_ms': round(stats.slowest_ms, 1),
+        'slowest_statement': (stats.slowest_statement or "")[:STATEMENT_LOG_LENGTH],
+    }
+
+    if stats.count > settings.sql_slow_request_queries or stats.total_ms > settings.sql_slow_request_ms:
+        logger.warning(f"Database-heavy request: {method} {path}", extra={'extra_fields': summary})
+
+    for shape, count in stats.repeated(settings.sql_repeated_query_threshold):
+        logger.warning(f"Repeated query in {method} {path} (possible N+1): {count}x", extra={'extra_fields': {
+            'method': method,
+            'path': path,
+            'repeat_count': count,
+            'statement': shape[:STATEMENT_LOG_LENGTH],
+        }})
+
+
 def get_engine() -> AsyncEngine:
     """
     Get or create global async engine
@@ -130,6 +263,31 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+@asynccontextmanager
+async def get_standalone_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get async database session on a one-off engine, disposed on exit
+
+    For sync code that runs async work under its own event loop
+    (asyncio.run): the global engine's pooled connections belong to the
+    loop that opened them and can't be reused from another.
+
+    Yields:
+        AsyncSession for database operations
+    """
+    engine = create_async_engine(get_database_url(), poolclass=NullPool)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False, autoflush=False) as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+    finally:
+        await engine.dispose()
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI dependency for database sessions
@@ -169,6 +327,9 @@ async def init_db():
             ImageEntityRelationship
         )
 
+        # Trigram indexes (search) need the pg_trgm extension
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
 
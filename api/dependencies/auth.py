@@ -1,15 +1,22 @@
 """Authentication Dependencies
 
 FastAPI dependencies for route protection and user authentication.
+
+Resolved users are cached per worker for a short TTL, keyed by username
+and token id, so hot authenticated endpoints don't open a database session
+per request. The cache is separate from the response cache's L1 (so the two
+don't evict each other) and is evicted by AuthServiceDB.update_user/delete_user
+(which covers disabling an account) through the cache service's tag
+invalidations.
 """
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.services.auth_service_db import AuthServiceDB
-from api.database import get_db
+from api.services.auth_service_db import AuthServiceDB, user_cache_tag
+from api.services.cache_service import LocalCache, get_cache_service
+from api.database import get_session
 from api.models.auth import User, TokenData
 from api.config import settings
 
@@ -17,17 +24,73 @@ from api.config import settings
 # HTTP Bearer token security scheme
 security = HTTPBearer(auto_error=False)
 
+# Resolved users per worker (see module docstring)
+_resolved_users = LocalCache(max_size=settings.auth_user_cache_size)
+
+
+def _get_user_cache() -> LocalCache:
+    """The resolved-user cache, registered for this worker's user invalidations"""
+    get_cache_service().register_local_cache(_resolved_users)
+    return _resolved_users
+
+
+def _user_cache_key(token_data: TokenData) -> str:
+    return f"auth:user:{token_data.username}:{token_data.token_id}"
+
+
+async def _resolve_user(token_data: TokenData) -> Optional[User]:
+    """
+    Get the user a verified token belongs to
+
+    Served from the per-worker cache when possible; a database session is
+    only opened on a miss.
+
+    Args:
+        token_data: Verified token data
+
+    Returns:
+        User (possibly disabled), or None if the user doesn't exist
+    """
+    ttl = settings.auth_user_cache_ttl_seconds
+    local_cache = _get_user_cache()
+    cache_key = _user_cache_key(token_data)
+
+    if ttl > 0:
+        cached_user = local_cache.get(cache_key)
+        if cached_user is not None:
+            return cached_user
+
+    async with get_session() as session:
+        user = await AuthServiceDB(session).get_user(username=token_data.username)
+
+    if user is None:
+        return None
+
+    # Convert UserInDB to User (remove hashed_password)
+    resolved = User(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        full_name=user.full_name,
+        disabled=user.disabled,
+        created_at=user.created_at,
+        last_login=user.last_login
+    )
+
+    if ttl > 0:
+        local_cache.set(cache_key, resolved, ttl, tags=[user_cache_tag(user.username)])
+
+    return resolved
+
 
 async def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    db: AsyncSession = Depends(get_db)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> Optional[User]:
     """
     Get current authenticated user from JWT token
 
     Args:
         credentials: HTTP Authorization credentials
-        db: Database session
 
     Returns:
         User object if authenticated
@@ -46,9 +109,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    token = credentials.credentials
-    auth_service = AuthServiceDB(db)
-    token_data = auth_service.verify_token(token, token_type="access")
+    token_data = AuthServiceDB.verify_token(credentials.credentials, token_type="access")
 
     if token_data is None or token_data.username is None:
         raise HTTPException(
@@ -57,7 +118,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = await auth_service.get_user(username=token_data.username)
+    user = await _resolve_user(token_data)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -71,16 +132,7 @@ async def get_current_user(
             detail="User account is disabled"
         )
 
-    # Convert UserInDB to User (remove hashed_password)
-    return User(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        full_name=user.full_name,
-        disabled=user.disabled,
-        created_at=user.created_at,
-        last_login=user.last_login
-    )
+    return user
 
 
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
@@ -105,8 +157,7 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
 
 
 async def optional_authentication(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    db: AsyncSession = Depends(get_db)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> Optional[User]:
     """
     Optional authentication - returns user if authenticated, None otherwise
@@ -114,7 +165,6 @@ async def optional_authentication(
 
     Args:
         credentials: HTTP Authorization credentials
-        db: Database session
 
     Returns:
         User object if authenticated, None otherwise
@@ -125,23 +175,13 @@ async def optional_authentication(
     if credentials is None:
         return None
 
-    token = credentials.credentials
-    auth_service = AuthServiceDB(db)
-    token_data = auth_service.verify_token(token, token_type="access")
+    token_data = AuthServiceDB.verify_token(credentials.credentials, token_type="access")
 
     if token_data is None or token_data.username is None:
         return None
 
-    user = await auth_service.get_user(username=token_data.username)
+    user = await _resolve_user(token_data)
     if user is None or user.disabled:
         return None
 
-    return User(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        full_name=user.full_name,
-        disabled=user.disabled,
-        created_at=user.created_at,
-        last_login=user.last_login
-    )
+    return user
@@ -7,7 +7,6 @@ Main API application with routes for analyzers, generators, and preset managemen
 import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-# from starlette.middleware.gzip import GZIPMiddleware  # Will add back with correct import
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse
 
@@ -15,8 +14,9 @@ from api.config import settings
 from api.logging_config import setup_logging, get_logger
 from api.models.responses import APIInfo, HealthResponse
 from api.services import AnalyzerService, GeneratorService, PresetService
-from api.routes import discovery, analyzers, generators, presets, jobs, auth, favorites, compositions, workflows, story_tools, characters, configs, tool_configs, local_models, board_games, documents, qa, clothing_items, outfits, visualization_configs, images, cache, tools
+from api.routes import discovery, analyzers, generators, presets, jobs, auth, favorites, compositions, workflows, story_tools, characters, configs, tool_configs, local_models, board_games, documents, qa, clothing_items, outfits, visualization_configs, images, cache, tools, search
 from api.middleware.request_id import RequestIDMiddleware
+from api.middleware.compression import CompressionMiddleware
 
 # Initialize logging
 setup_logging(log_dir=settings.base_dir / "logs", log_level="INFO")
@@ -40,9 +40,39 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("Database initialized")
 
+    # Connect response cache (non-blocking; degraded mode if Redis is down)
+    from api.services.cache_service import get_cache_service
+    await get_cache_service().connect()
+    await get_cache_service().start_invalidation_listener()
+
+    # Receive job updates published by other workers (Redis pub/sub)
+    from api.services.job_queue import get_job_queue_manager
+    await get_job_queue_manager().start_event_listener()
+
+    # Apply job retention periodically
+    await get_job_queue_manager().start_retention_sweeper(
+        interval_seconds=settings.job_cleanup_interval_minutes * 60,
+        max_age_hours=settings.job_retention_hours
+    )
+
+    # Resume batch jobs left behind by crashed/restarted workers
+    await get_job_queue_manager().start_recovery_monitor(
+        heartbeat_seconds=settings.job_worker_heartbeat_seconds
+    )
+
     yield
 
     # Shutdown
+    await get_job_queue_manager().stop_recovery_monitor()
+    await get_job_queue_manager().stop_retention_sweeper()
+    await get_job_queue_manager().stop_event_listener()
+
+    await get_cache_service().stop_invalidation_listener()
+    await get_cache_service().close()
+
+    from api.services.password_hasher import get_password_hasher
+    get_password_hasher().shutdown()
+
     from api.database import close_db
     await close_db()
     logger.info("Application shutdown complete")
@@ -73,13 +103,18 @@ app.add_middleware(
 # Request ID middleware for log correlation
 app.add_middleware(RequestIDMiddleware)
 
-# GZIP compression middleware (60-80% bandwidth reduction)
-# TODO: Add GZIP middleware with correct import
-# app.add_middleware(GZIPMiddleware, minimum_size=1000)
+# Response compression (60-80% bandwidth reduction on JSON)
+# Streams gzip/brotli; skips SSE, media and precompressed cache hits
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_min_size,
+    gzip_level=settings.compression_gzip_level,
+    brotli_quality=settings.compression_brotli_quality,
+)
 
 # Log CORS configuration on startup
 logger.info(f"CORS configured for origins: {settings.cors_origins}")
-# logger.info("GZIP compression enabled (min size: 1KB)")
+logger.info(f"Response compression enabled (min size: {settings.compression_min_size} bytes)")
 
 # Log authentication status
 if settings.require_authentication:
@@ -137,6 +172,7 @@ app.include_router(compositions.router, prefix="/compositions", tags=["compositi
 app.include_router(workflows.router, prefix="/workflows", tags=["workflows"])
 app.include_router(story_tools.router, prefix="/story-tools", tags=["story-tools"])
 app.include_router(images.router, prefix="/images", tags=["images"])
+app.include_router(search.router, prefix="/search", tags=["search"])
 app.include_router(cache.router, tags=["cache"])
 
 
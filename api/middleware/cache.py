@@ -5,23 +5,115 @@ Provides decorators and utilities for response caching:
 - @cached() decorator for read endpoints
 - @invalidates_cache() decorator for write endpoints
 - Automatic cache key generation from request
+- Invalidation tags (entity type/id, endpoint, user) registered on every write
+- Stale-while-revalidate, single-flight recompute and probabilistic early refresh
+- Hits served from stored body bytes (precompressed when the client accepts it)
+- @etag() decorator and If-None-Match -> 304 Not Modified handling
 """
 
-from functools import wraps
-from typing import Optional, Callable, List
+import hashlib
+import time
+from functools import lru_cache, wraps
+from typing import Any, Optional, Callable, List
 from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
-from api.services.cache_service import get_cache_service
+from pydantic import TypeAdapter
+from api.services.cache_service import CachedEntry, get_cache_service, make_etag, render_json
+from api.middleware.compression import negotiate_encoding
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+def _entity_type_from_path(path: str) -> Optional[str]:
+    """Derive the entity type from an endpoint path (/clothing-items/... -> clothing_items)"""
+    segments = [segment for segment in path.split("/") if segment and segment != "api"]
+    return segments[0].replace("-", "_") if segments else None
+
+
+def _entity_id_from_request(request: Request, entity_id_param: Optional[str]) -> Optional[str]:
+    """Get the ID of the entity a detail endpoint shows from its path params"""
+    path_params = getattr(request, "path_params", None) or {}
+    if entity_id_param:
+        value = path_params.get(entity_id_param)
+        return str(value) if value is not None else None
+
+    for name, value in reversed(list(path_params.items())):
+        if name.endswith("_id"):
+            return str(value)
+    return None
+
+
+def _user_id_from(request: Request, kwargs: dict) -> Optional[str]:
+    """Get the requesting user's ID (auth middleware state, else the current_user dependency)"""
+    user_id = getattr(request.state, "user_id", None)
+    if user_id is None:
+        user = kwargs.get("current_user")
+        user_id = getattr(user, "id", None) or getattr(user, "username", None)
+    return str(user_id) if user_id is not None else None
+
+
+def _opaque_tag(tag: str) -> str:
+    """Normalize an entity tag for weak comparison (drops W/ and -<coding> suffixes)"""
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    tag = tag.strip('"')
+    for suffix in ("-gzip", "-br"):
+        if tag.endswith(suffix):
+            return tag[:-len(suffix)]
+    return tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag
+
+    Uses weak comparison (as RFC 9110 requires for If-None-Match) and treats
+    the compressed variants of a body as the same entity.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = _opaque_tag(etag)
+    return any(_opaque_tag(candidate) == opaque for candidate in if_none_match.split(","))
+
+
+def _etag_for_encoding(etag: str, encoding: Optional[str]) -> str:
+    """ETag of a compressed variant (different bytes need a different strong ETag)"""
+    return f'{etag[:-1]}-{encoding}"' if encoding else etag
+
+
+def _cached_response(entry: CachedEntry, request: Request) -> Response:
+    """Build a response straight from a cached body, without any JSON work"""
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""), entry.encodings)
+    headers = {"ETag": _etag_for_encoding(entry.etag, encoding), "Vary": "Accept-Encoding"}
+
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+
+    body = entry.body
+    if encoding:
+        body = entry.encodings[encoding]
+        headers["Content-Encoding"] = encoding
+
+    return Response(content=body, media_type=entry.media_type, headers=headers)
+
+
 def cached(
     cache_type: str = "default",
     ttl: Optional[int] = None,
     key_prefix: Optional[str] = None,
-    include_user: bool = False
+    include_user: bool = False,
+    entity_type: Optional[str] = None,
+    entity_id_param: Optional[str] = None,
+    local_ttl: Optional[int] = None,
+    stale_ttl: Optional[int] = None,
+    early_refresh_beta: float = 1.0,
+    lock_timeout: float = 30.0
 ):
     """
     Decorator to cache GET endpoint responses
@@ -37,6 +129,23 @@ def cached(
         ttl: Optional explicit TTL in seconds (overrides cache_type)
         key_prefix: Optional key prefix (defaults to endpoint path)
         include_user: Include user ID in cache key (for user-specific data)
+        entity_type: Entity type used for invalidation tags (defaults to the
+            first path segment, e.g. /clothing-items/ -> clothing_items)
+        entity_id_param: Path parameter holding the entity ID (defaults to
+            the last path parameter ending in "_id")
+        local_ttl: TTL of the per-worker in-memory copy (defaults to the
+            service's local_ttl; 0 always goes to Redis)
+        stale_ttl: Seconds past the TTL a stale response may still be served
+            while one request recomputes it (defaults per cache_type; 0 disables)
+        early_refresh_beta: Probabilistic early refresh aggressiveness
+            (0 disables; >1 refreshes earlier)
+        lock_timeout: Max seconds one request may hold the recompute lock;
+            concurrent misses wait up to this long for its result
+
+    On a miss, only one request per key (across workers) runs the endpoint;
+    the others wait for its result. Once an entry is stale - or, randomly,
+    shortly before, weighted by how long it took to compute - one request
+    recomputes it while the others keep getting the cached copy.
     """
     def decorator(func: Callable):
         @wraps(func)
@@ -57,8 +166,8 @@ def cached(
 
             # Get cache service
             cache = get_cache_service()
-            if not cache.redis:
-                # Redis not available, skip caching
+            if not await cache.ensure_available():
+                # Redis not available (degraded mode), skip caching
                 return await func(*args, **kwargs)
 
             # Generate cache key
@@ -67,53 +176,217 @@ def cached(
             user_id = None
 
             if include_user:
-                # Try to get user from request state (set by auth middleware)
-                user_id = getattr(request.state, "user_id", None)
+                user_id = _user_id_from(request, kwargs)
+
+            tag_entity_type = entity_type or _entity_type_from_path(request.url.path)
+            generation = await cache.get_generation(tag_entity_type)
+            cache_key = cache.generate_cache_key(endpoint, params, user_id, generation)
+            tags = cache.build_tags(
+                endpoint,
+                entity_type=tag_entity_type,
+                entity_id=_entity_id_from_request(request, entity_id_param),
+                user_id=user_id
+            )
+
+            # Try to get from cache (in-memory L1, then Redis)
+            entry = await cache.get_entry(cache_key, tags=tags, local_ttl=local_ttl)
+            if entry is not None and not entry.needs_refresh(early_refresh_beta):
+                logger.info(f"Cache HIT for {endpoint} (key: {cache_key})")
+                return _cached_response(entry, request)
+
+            # Single-flight: one request recomputes, everyone else gets the
+            # stale copy or waits for the new one
+            locked = await cache.acquire_fill_lock(cache_key, lock_timeout)
+            if not locked:
+                if entry is None:
+                    entry = await cache.wait_for_entry(cache_key, timeout=lock_timeout)
+                if entry is not None:
+                    logger.info(f"Cache HIT (revalidating) for {endpoint} (key: {cache_key})")
+                    return _cached_response(entry, request)
+
+            if entry is None:
+                logger.info(f"Cache MISS for {endpoint} (key: {cache_key})")
+            else:
+                logger.info(f"Cache REFRESH for {endpoint} (key: {cache_key})")
 
-            cache_key = cache.generate_cache_key(endpoint, params, user_id)
+            try:
+                started = time.monotonic()
+                result = await func(*args, **kwargs)
+                compute_time = time.monotonic() - started
+                stored = await _store_result(
+                    cache, cache_key, result, endpoint, request,
+                    ttl=ttl, cache_type=cache_type, tags=tags, local_ttl=local_ttl,
+                    stale_ttl=stale_ttl, compute_time=compute_time
+                )
+            finally:
+                if locked:
+                    await cache.release_fill_lock(cache_key)
+
+            if stored is not None:
+                # Serve the bytes (and compressed variants) that were cached, so
+                # hits and misses share an ETag and nothing is compressed twice
+                return _cached_response(stored, request)
+            return result
+
+        return wrapper
+    return decorator
+
+
+@lru_cache(maxsize=None)
+def _response_adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
 
-            # Try to get from cache
-            cached_response = await cache.get(cache_key)
-            if cached_response is not None:
-                logger.info(f"Cache HIT for {endpoint} (key: {cache_key})")
-                return JSONResponse(content=cached_response)
 
-            logger.info(f"Cache MISS for {endpoint} (key: {cache_key})")
+def _response_content(request: Optional[Request], result: Any) -> Any:
+    """
+    JSON-compatible content FastAPI would send for an endpoint's return value
+
+    Like FastAPI, the value is validated against the route's response_model
+    (which drops fields outside the model) and dumped with the route's
+    response_model_* options.
+    """
+    route = request.scope.get("route") if request is not None else None
+    response_model = getattr(route, "response_model", None)
+    if response_model is None:
+        return jsonable_encoder(result)
+
+    options = {
+        "exclude_unset": route.response_model_exclude_unset,
+        "exclude_defaults": route.response_model_exclude_defaults,
+        "exclude_none": route.response_model_exclude_none,
+    }
+    adapter = _response_adapter(response_model)
+    value = adapter.validate_python(jsonable_encoder(result, by_alias=True, **options))
+    return adapter.dump_python(
+        value,
+        mode="json",
+        include=route.response_model_include,
+        exclude=route.response_model_exclude,
+        by_alias=route.response_model_by_alias,
+        **options
+    )
+
+
+def _encode_result(result, request: Optional[Request] = None):
+    """
+    Encode an endpoint result as (body, media_type), as FastAPI would send it
+
+    Returns None for results that can't be served from bytes (streams,
+    files, error responses, ...).
+    """
+    if isinstance(result, Response):
+        # JSONResponse object: its body is already encoded
+        if isinstance(result, JSONResponse) and result.status_code == 200:
+            return bytes(result.body), result.media_type
+        return None
+    return render_json(_response_content(request, result)), "application/json"
+
+
+async def _store_result(cache, cache_key: str, result, endpoint: str, request: Request, **set_kwargs):
+    """
+    Cache an endpoint result's encoded body if it is a cacheable response type
+
+    Returns:
+        CachedEntry that was cached, or None
+    """
+    # Cache the result if it's a successful response
+    try:
+        encoded = _encode_result(result, request)
+        if encoded is None:
+            logger.warning(f"Response type {type(result).__name__} not cacheable for {endpoint}")
+            return None
+
+        body, media_type = encoded
+        return await cache.set_response(cache_key, body, media_type=media_type, **set_kwargs)
+    except Exception as e:
+        logger.error(f"Failed to cache response for {endpoint}: {e}")
+        return None
+
+
+def etag(entity_types: Optional[List[str]] = None, include_user: bool = False):
+    """
+    Decorator adding ETag / If-None-Match support to GET endpoints without @cached
+
+    Usage:
+        @router.get("/jobs")
+        @etag()
+        async def list_jobs(request: Request, ...):
+            ...
+
+        @router.get("/favorites/")
+        @etag(entity_types=["favorites"], include_user=True)
+        async def get_favorites(request: Request, ...):
+            ...
+
+    Without entity_types the ETag is a hash of the response body: the
+    endpoint still runs, but an unchanged payload is answered with 304
+    instead of being re-sent.
+
+    With entity_types the ETag is derived from the URL and the entity types'
+    version counters, which every @invalidates_cache write bumps. A matching
+    If-None-Match is then answered with 304 before the endpoint runs. Only
+    use this for data that changes solely through such writes.
+
+    Args:
+        entity_types: Entity types whose version counters identify the response
+        include_user: Make version-based ETags user-specific
+    """
+    def decorator(func: Callable):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Optional[Request] = kwargs.get("request")
+            if request is None:
+                request = next((arg for arg in args if isinstance(arg, Request)), None)
+            if request is None:
+                logger.warning(f"No request object found for {func.__name__}, skipping ETag")
+                return await func(*args, **kwargs)
+
+            if_none_match = request.headers.get("if-none-match")
+
+            version_etag = None
+            if entity_types:
+                version_etag = await _version_etag(request, entity_types, _user_id_from(request, kwargs) if include_user else None)
+                if version_etag and etag_matches(if_none_match, version_etag):
+                    return Response(status_code=304, headers={"ETag": version_etag})
 
-            # Execute endpoint
             result = await func(*args, **kwargs)
 
-            # Cache the result if it's a successful response
             try:
-                if isinstance(result, (dict, list)):
-                    # Direct dict/list response
-                    await cache.set(cache_key, result, ttl=ttl, cache_type=cache_type)
-                elif isinstance(result, JSONResponse):
-                    # JSONResponse object
-                    import json
-                    content = json.loads(result.body.decode())
-                    await cache.set(cache_key, content, ttl=ttl, cache_type=cache_type)
-                elif hasattr(result, 'model_dump'):
-                    # Pydantic v2 model
-                    content = result.model_dump()
-                    await cache.set(cache_key, content, ttl=ttl, cache_type=cache_type)
-                    logger.info(f"Cached Pydantic v2 model for {endpoint} (ttl: {ttl or cache.ttl_config.get(cache_type, 'default')}s)")
-                elif hasattr(result, 'dict'):
-                    # Pydantic v1 model
-                    content = result.dict()
-                    await cache.set(cache_key, content, ttl=ttl, cache_type=cache_type)
-                    logger.info(f"Cached Pydantic v1 model for {endpoint} (ttl: {ttl or cache.ttl_config.get(cache_type, 'default')}s)")
-                else:
-                    logger.warning(f"Response type {type(result).__name__} not cacheable for {endpoint}")
+                encoded = _encode_result(result, request)
             except Exception as e:
-                logger.error(f"Failed to cache response for {endpoint}: {e}")
-
-            return result
+                # Let FastAPI report the response validation error
+                logger.warning(f"Could not encode response of {func.__name__} for ETag: {e}")
+                return result
+            if encoded is None:
+                return result
+
+            body, media_type = encoded
+            response_etag = version_etag or make_etag(body)
+            if etag_matches(if_none_match, response_etag):
+                return Response(status_code=304, headers={"ETag": response_etag})
+            return Response(content=body, media_type=media_type, headers={"ETag": response_etag})
 
         return wrapper
     return decorator
 
 
+async def _version_etag(request: Request, entity_types: List[str], user_id: Optional[str]) -> Optional[str]:
+    """ETag from the request URL and the current versions of the entity types"""
+    cache = get_cache_service()
+    if not await cache.ensure_available():
+        return None
+
+    versions = []
+    for entity_type in entity_types:
+        version = await cache.get_version(entity_type)
+        if version is None:
+            return None
+        versions.append(f"{entity_type}={version}")
+
+    identity = "|".join([str(request.url), user_id or "", *versions])
+    return f'"v-{hashlib.md5(identity.encode()).hexdigest()}"'
+
+
 def invalidates_cache(
     entity_types: Optional[List[str]] = None,
     endpoints: Optional[List[str]] = None,
@@ -146,7 +419,7 @@ def invalidates_cache(
 
             # Invalidate caches after successful execution
             cache = get_cache_service()
-            if cache.redis:
+            if await cache.ensure_available():
                 try:
                     # Invalidate by entity type
                     if entity_types:
@@ -183,14 +456,8 @@ async def invalidate_user_cache(user_id: str, entity_type: Optional[str] = None)
         entity_type: Optional entity type to limit invalidation
     """
     cache = get_cache_service()
-    if cache.redis:
-        if entity_type:
-            endpoint_path = entity_type.replace("_", "-")
-            pattern = f"{cache.prefix}/api/{endpoint_path}:user:{user_id}:*"
-        else:
-            pattern = f"{cache.prefix}*:user:{user_id}:*"
-
-        await cache.delete_pattern(pattern)
+    if await cache.ensure_available():
+        await cache.invalidate_user(user_id, entity_type)
         logger.info(f"Invalidated all cache for user: {user_id}")
 
 
@@ -0,0 +1,221 @@
+"""
+Response Compression Middleware
+
+Streaming gzip/brotli compression for API responses:
+- Only compresses bodies above a minimum size
+- Only compresses allow-listed content types (JSON, text, SVG, ...)
+- Skips responses that are already encoded (e.g. precompressed cache hits),
+  Server-Sent Events and already-compressed media
+- Prefers brotli when the optional brotli package is installed
+"""
+
+import zlib
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def negotiate_encoding(accept_encoding: str, available: Iterable[str]) -> Optional[str]:
+    """
+    Pick the best available content-coding the client accepts (br over gzip)
+
+    Args:
+        accept_encoding: Accept-Encoding request header
+        available: Content-codings that can be produced
+
+    Returns:
+        "br", "gzip" or None
+    """
+    available = set(available or ())
+    if not available or not accept_encoding:
+        return None
+
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip())
+
+    for encoding in ("br", "gzip"):
+        if encoding in available and (encoding in accepted or "*" in accepted):
+            return encoding
+    return None
+
+
+class _Compressor:
+    """Incremental compressor for one response"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits=31: gzip container
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            # flush() so each streamed chunk reaches the client promptly
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses with gzip or brotli
+
+    The body is streamed through an incremental compressor, so large and
+    streaming responses are never buffered in full. Bodies smaller than
+    minimum_size (known once the first chunk or Content-Length arrives) are
+    passed through unchanged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        compressible_types: Iterable[str] = DEFAULT_COMPRESSIBLE_TYPES
+    ):
+        """
+        Args:
+            app: ASGI application
+            minimum_size: Smallest body (bytes) worth compressing
+            gzip_level: zlib compression level (1-9)
+            brotli_quality: Brotli quality (0-11)
+            compressible_types: Content types (or "type/" prefixes) to compress
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.compressible_types = tuple(compressible_types)
+        self.encodings = ("br", "gzip") if brotli is not None else ("gzip",)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def is_compressible(self, headers: Headers, status: int) -> bool:
+        """Whether a response should be compressed, judging by its headers"""
+        if status < 200 or status in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False  # Already encoded (e.g. precompressed cache variant)
+
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        if not content_type or content_type == "text/event-stream":
+            return False
+        if not any(
+            content_type.startswith(allowed) if allowed.endswith("/") else content_type == allowed
+            for allowed in self.compressible_types
+        ):
+            return False
+
+        content_length = headers.get("content-length")
+        if content_length is not None and int(content_length) < self.minimum_size:
+            return False
+        return True
+
+
+class _CompressionResponder:
+    """Wraps send() for one response, compressing body chunks as they pass"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start_message: Optional[Message] = None
+        self._compressor: Optional[_Compressor] = None
+        self._passthrough = False
+
+    async def send(self, message: Message):
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            if self.middleware.is_compressible(headers, message["status"]):
+                self._start_message = message  # Held until the first body chunk
+            else:
+                self._passthrough = True
+                await self._send(message)
+            return
+
+        if message_type != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._compressor is None:
+            if not more_body and len(body) < self.middleware.minimum_size:
+                # Small single-chunk body: send as-is
+                self._passthrough = True
+                await self._send(self._start_message)
+                await self._send(message)
+                return
+            await self._start_compressed()
+
+        chunk = self._compressor.compress(body) if body else b""
+        if not more_body:
+            chunk += self._compressor.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def _start_compressed(self):
+        """Rewrite headers for the encoded body and send the start message"""
+        self._compressor = _Compressor(
+            self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality
+        )
+
+        headers = MutableHeaders(raw=self._start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if "content-length" in headers:
+            del headers["content-length"]
+
+        # Different bytes need a different strong ETag (matches the response cache)
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/") and etag.endswith('"'):
+            headers["ETag"] = f'{etag[:-1]}-{self.encoding}"'
+
+        await self._send(self._start_message)
@@ -10,6 +10,8 @@ from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
+from api.config import settings
+from api.database import finish_query_stats, report_query_stats, start_query_stats
 from api.logging_config import set_request_id, get_logger
 
 logger = get_logger(__name__)
@@ -19,7 +21,10 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     """
     Middleware to generate and track request IDs
 
-    Adds X-Request-ID header to responses and sets request ID in logging context
+    Adds X-Request-ID header to responses and sets request ID in logging context.
+    Also collects the request's database activity (see api/database.py) and
+    logs database-heavy requests; with sql_debug_headers the totals are
+    returned as X-DB-* headers.
     """
 
     async def dispatch(self, request: Request, call_next):
@@ -30,6 +35,7 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
 
         # Store in context for logging
         set_request_id(request_id)
+        start_query_stats()
 
         # Log incoming request
         logger.info(
@@ -49,6 +55,14 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
             # Add request ID to response headers
             response.headers['X-Request-ID'] = request_id
 
+            stats = finish_query_stats()
+            if stats is not None:
+                report_query_stats(request.method, request.url.path, stats)
+                if settings.sql_debug_headers:
+                    response.headers['X-DB-Query-Count'] = str(stats.count)
+                    response.headers['X-DB-Time-Ms'] = f"{stats.total_ms:.1f}"
+                    response.headers['X-DB-Slowest-Ms'] = f"{stats.slowest_ms:.1f}"
+
             # Log response
             logger.info(
                 f"{request.method} {request.url.path} → {response.status_code}",
@@ -62,6 +76,8 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
             return response
 
         except Exception as e:
+            finish_query_stats()
+
             # Log error
             logger.error(
                 f"{request.method} {request.url.path} → ERROR",
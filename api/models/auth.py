@@ -51,6 +51,7 @@ class TokenData(BaseModel):
     """Data extracted from JWT token"""
     username: Optional[str] = None
     exp: Optional[datetime] = None
+    token_id: Optional[str] = None
 
 
 class LoginRequest(BaseModel):
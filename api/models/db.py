@@ -8,13 +8,22 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
     String, Text, Integer, Float, Boolean, DateTime, JSON,
-    ForeignKey, Index
+    ForeignKey, Index, Computed
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from api.database import Base
 
 
+def _weighted_tsvector(*weighted_columns: tuple) -> str:
+    """SQL for a generated tsvector column: (column, weight) pairs, most important first"""
+    return " || ".join(
+        f"setweight(to_tsvector('english', coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted_columns
+    )
+
+
 # ============================================================================
 # User and Authentication
 # ============================================================================
@@ -73,6 +82,13 @@ class Character(Base):
     # Note: Using 'meta' instead of 'metadata' (reserved by SQLAlchemy)
     meta: Mapped[dict] = mapped_column("metadata", JSON, default=dict, nullable=False)
 
+    # Full-text search (generated by PostgreSQL, not loaded by default)
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(_weighted_tsvector(("name", "A"), ("personality", "B"), ("visual_description", "C")), persisted=True),
+        deferred=True
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -84,6 +100,12 @@ class Character(Base):
     # Indexes for common queries
     __table_args__ = (
         Index("ix_character_user_id_name", "user_id", "name"),
+        # Keyset pagination (newest first)
+        Index("ix_character_created_id", "created_at", "id"),
+        Index("ix_character_user_created_id", "user_id", "created_at", "id"),
+        # Search
+        Index("ix_character_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_character_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
     )
 
     def __repr__(self):
@@ -112,6 +134,13 @@ class ClothingItem(Base):
     source_image: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     preview_image_path: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
+    # Full-text search (generated by PostgreSQL, not loaded by default)
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(_weighted_tsvector(("item", "A"), ("color", "B"), ("fabric", "B"), ("details", "C")), persisted=True),
+        deferred=True
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=True)
@@ -123,6 +152,12 @@ class ClothingItem(Base):
     # Indexes for common queries
     __table_args__ = (
         Index("ix_clothing_user_category", "user_id", "category"),
+        # Keyset pagination (newest first)
+        Index("ix_clothing_created_id", "created_at", "id"),
+        Index("ix_clothing_user_created_id", "user_id", "created_at", "id"),
+        # Search
+        Index("ix_clothing_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_clothing_item_trgm", "item", postgresql_using="gin", postgresql_ops={"item": "gin_trgm_ops"}),
     )
 
     def __repr__(self):
@@ -161,6 +196,13 @@ class BoardGame(Base):
     # Note: Using 'meta' instead of 'metadata' (reserved by SQLAlchemy)
     meta: Mapped[dict] = mapped_column("metadata", JSON, default=dict, nullable=False)
 
+    # Full-text search (generated by PostgreSQL, not loaded by default)
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(_weighted_tsvector(("name", "A"), ("designer", "B"), ("publisher", "B"), ("description", "C")), persisted=True),
+        deferred=True
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -173,6 +215,9 @@ class BoardGame(Base):
     __table_args__ = (
         Index("ix_boardgame_user_name", "user_id", "name"),
         Index("ix_boardgame_bgg_id", "bgg_id"),
+        # Search
+        Index("ix_boardgame_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_boardgame_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
     )
 
     def __repr__(self):
@@ -394,6 +439,8 @@ class Image(Base):
     # Indexes for common queries
     __table_args__ = (
         Index("ix_image_user_created", "user_id", "created_at"),
+        # Keyset pagination (newest first)
+        Index("ix_image_created_id", "created_at", "id"),
     )
 
     def __repr__(self):
@@ -429,6 +476,12 @@ class ImageEntityRelationship(Base):
     # This helps distinguish multiple entities of the same type
     role: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
 
+    # Denormalized display name of the entity (character name, clothing item,
+    # preset display name) and the preset's category, so listing images needs
+    # no lookups. Kept in sync when the entity is renamed.
+    entity_name: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    preset_category: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+
     # Timestamp
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
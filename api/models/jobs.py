@@ -27,8 +27,8 @@ class JobType(str, Enum):
     WORKFLOW = "workflow"
 
 
-class Job(BaseModel):
-    """Job representation"""
+class JobInfo(BaseModel):
+    """Job representation returned by the API"""
     job_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     type: JobType
     status: JobStatus = JobStatus.QUEUED
@@ -60,3 +60,11 @@ class Job(BaseModel):
 
     class Config:
         use_enum_values = True
+
+
+class Job(JobInfo):
+    """Stored job, including the crash recovery state kept out of the API"""
+    worker_id: Optional[str] = None  # Worker process that owns the job
+    checkpoints: Dict[str, Any] = {}  # Completed item key -> item result
+    resume_handler: Optional[str] = None  # Registered handler that can resume the job
+    resume_params: Optional[Dict[str, Any]] = None  # JSON-serializable handler arguments
@@ -131,8 +131,9 @@ class CharacterInfo(BaseModel):
 
 class CharacterListResponse(BaseModel):
     """List of characters"""
-    count: int
+    count: Optional[int] = None
     characters: List[CharacterInfo]
+    next_cursor: Optional[str] = None
 
 
 class CharacterFromSubjectResponse(BaseModel):
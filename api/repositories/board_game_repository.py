@@ -4,11 +4,14 @@ Board Game Repository
 Handles database operations for BoardGame entities.
 """
 
-from typing import Optional, List
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.models.db import BoardGame
+from api.repositories.pagination import fetch_with_total
+from api.repositories.search import prefix_tsquery, ranked_search_query, suggest_query, text_match, text_rank
+from api.repositories.statements import delete_returning, row_exists, update_returning
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -54,6 +57,30 @@ class BoardGameRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_page(
+        self,
+        user_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Tuple[List[BoardGame], Optional[int]]:
+        """
+        Like get_all, plus the total number of matching board games from the same statement
+
+        Returns:
+            Tuple of (board_games, total); total is None for an empty page
+        """
+        query = select(BoardGame).order_by(BoardGame.name)
+
+        if user_id is not None:
+            query = query.where(BoardGame.user_id == user_id)
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        query = query.offset(offset)
+
+        return await fetch_with_total(self.session, query)
+
     async def create(self, game: BoardGame) -> BoardGame:
         """Create new board game"""
         self.session.add(game)
@@ -64,24 +91,44 @@ class BoardGameRepository:
 
     async def update(self, game: BoardGame) -> BoardGame:
         """Update existing board game"""
-        await self.session.merge(game)
+        # add() attaches without the SELECT merge() would issue; the flush
+        # UPDATEs only the changed columns
+        self.session.add(game)
         await self.session.flush()
 
         logger.info(f"Updated board game in database: {game.name} ({game.game_id})")
         return game
 
-    async def delete(self, game_id: str) -> bool:
-        """Delete board game by ID"""
-        game = await self.get_by_id(game_id)
+    async def update_fields(
+        self,
+        game_id: str,
+        values: Dict[str, Any],
+        user_id: Optional[int] = None
+    ) -> Optional[BoardGame]:
+        """
+        Update only the given columns with a single UPDATE ... RETURNING
 
-        if not game:
-            return False
+        Args:
+            game_id: Board game ID
+            values: Attribute name -> new value (or SQL expression, e.g. json_merge)
+            user_id: If set, only a board game owned by this user is updated
 
-        await self.session.delete(game)
-        await self.session.flush()
+        Returns:
+            Updated board game, or None if not found (or not owned by user_id)
+        """
+        game = await update_returning(self.session, BoardGame, BoardGame.game_id, game_id, values, user_id)
+
+        if game is not None:
+            logger.info(f"Updated board game in database: {game_id} ({', '.join(values)})")
+        return game
 
-        logger.info(f"Deleted board game from database: {game_id}")
-        return True
+    async def delete(self, game_id: str, user_id: Optional[int] = None) -> bool:
+        """Delete board game by ID with a single DELETE (optionally only if owned by user_id)"""
+        deleted = await delete_returning(self.session, BoardGame, BoardGame.game_id, game_id, user_id)
+
+        if deleted:
+            logger.info(f"Deleted board game from database: {game_id}")
+        return deleted
 
     async def search(
         self,
@@ -95,7 +142,7 @@ class BoardGameRepository:
         Search board games with optional filters
 
         Args:
-            query: Text search in name, designer, or publisher
+            query: Text search in name, designer, publisher, or description (ranked by relevance)
             designer: Filter by designer
             min_players: Filter by minimum player count
             max_players: Filter by maximum player count
@@ -106,14 +153,9 @@ class BoardGameRepository:
         if user_id is not None:
             stmt = stmt.where(BoardGame.user_id == user_id)
 
-        if query:
-            # Case-insensitive search in name, designer, or publisher
-            search_filter = (
-                BoardGame.name.ilike(f"%{query}%") |
-                BoardGame.designer.ilike(f"%{query}%") |
-                BoardGame.publisher.ilike(f"%{query}%")
-            )
-            stmt = stmt.where(search_filter)
+        if query and prefix_tsquery(query):
+            # Full-text search in name, designer, publisher, or description (GIN indexed)
+            stmt = stmt.where(text_match(BoardGame.search_vector, BoardGame.name, query))
 
         if designer:
             stmt = stmt.where(BoardGame.designer.ilike(f"%{designer}%"))
@@ -126,20 +168,63 @@ class BoardGameRepository:
             # Game supports at most max_players
             stmt = stmt.where(BoardGame.player_count_min <= max_players)
 
-        stmt = stmt.order_by(BoardGame.name)
+        if query and prefix_tsquery(query):
+            stmt = stmt.order_by(text_rank(BoardGame.search_vector, BoardGame.name, query).desc(), BoardGame.name)
+        else:
+            stmt = stmt.order_by(BoardGame.name)
 
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def search_ranked(
+        self,
+        query: str,
+        user_id: Optional[int] = None,
+        limit: int = 20
+    ) -> List[Tuple[BoardGame, float, str]]:
+        """
+        Full-text search returning (game, rank, highlighted snippet), best first
+        """
+        if not prefix_tsquery(query):
+            return []
+
+        stmt = ranked_search_query(
+            BoardGame, BoardGame.name,
+            [BoardGame.name, BoardGame.designer, BoardGame.publisher, BoardGame.description],
+            query
+        )
+
+        if user_id is not None:
+            stmt = stmt.where(BoardGame.user_id == user_id)
+
+        result = await self.session.execute(stmt.limit(limit))
+        return [(row[0], row.rank, row.snippet) for row in result.all()]
+
+    async def suggest(
+        self,
+        query: str,
+        user_id: Optional[int] = None,
+        limit: int = 10
+    ) -> List[Tuple[str, str]]:
+        """Search-as-you-type: (game_id, name) pairs for a partial query"""
+        if not prefix_tsquery(query):
+            return []
+
+        stmt = suggest_query(BoardGame, BoardGame.game_id, BoardGame.name, query)
+
+        if user_id is not None:
+            stmt = stmt.where(BoardGame.user_id == user_id)
+
+        result = await self.session.execute(stmt.limit(limit))
+        return [tuple(row) for row in result.all()]
+
     async def exists(self, game_id: str) -> bool:
         """Check if board game exists"""
-        game = await self.get_by_id(game_id)
-        return game is not None
+        return await row_exists(self.session, BoardGame, BoardGame.game_id == game_id)
 
     async def exists_by_bgg_id(self, bgg_id: int) -> bool:
         """Check if board game exists by BGG ID"""
-        game = await self.get_by_bgg_id(bgg_id)
-        return game is not None
+        return await row_exists(self.session, BoardGame, BoardGame.bgg_id == bgg_id)
 
     async def count(self, user_id: Optional[int] = None) -> int:
         """Count board games"""
@@ -5,11 +5,14 @@ Handles database operations for Character entities.
 Provides clean separation between business logic and data access.
 """
 
-from typing import Optional, List
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.models.db import Character
+from api.repositories.pagination import Cursor, apply_keyset, fetch_with_total
+from api.repositories.search import prefix_tsquery, ranked_search_query, suggest_query, text_match, text_rank
+from api.repositories.statements import delete_returning, row_exists, update_returning
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -32,10 +35,16 @@ class CharacterRepository:
         self,
         user_id: Optional[int] = None,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[Character]:
-        """Get all characters, optionally filtered by user with pagination support"""
-        query = select(Character).order_by(Character.created_at.desc())
+        """
+        Get all characters, newest first, optionally filtered with pagination support
+
+        Pass the decoded cursor of the previous page to seek with an index
+        instead of skipping offset rows.
+        """
+        query = apply_keyset(select(Character), Character, cursor)
 
         if user_id is not None:
             query = query.where(Character.user_id == user_id)
@@ -48,6 +57,32 @@ class CharacterRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_page(
+        self,
+        user_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
+    ) -> Tuple[List[Character], Optional[int]]:
+        """
+        Like get_all, plus the total number of matching characters from the same statement
+
+        Returns:
+            Tuple of (characters, total); total is None for an empty page
+        """
+        filtered = select(Character)
+        if user_id is not None:
+            filtered = filtered.where(Character.user_id == user_id)
+
+        query = apply_keyset(filtered, Character, cursor)
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        query = query.offset(offset)
+
+        return await fetch_with_total(self.session, query, filtered if cursor else None)
+
     async def create(self, character: Character) -> Character:
         """Create new character"""
         self.session.add(character)
@@ -58,24 +93,44 @@ class CharacterRepository:
 
     async def update(self, character: Character) -> Character:
         """Update existing character"""
-        await self.session.merge(character)
+        # add() attaches without the SELECT merge() would issue; the flush
+        # UPDATEs only the changed columns
+        self.session.add(character)
         await self.session.flush()
 
         logger.info(f"Updated character in database: {character.name} ({character.character_id})")
         return character
 
-    async def delete(self, character_id: str) -> bool:
-        """Delete character by ID"""
-        character = await self.get_by_id(character_id)
+    async def update_fields(
+        self,
+        character_id: str,
+        values: Dict[str, Any],
+        user_id: Optional[int] = None
+    ) -> Optional[Character]:
+        """
+        Update only the given columns with a single UPDATE ... RETURNING
 
-        if not character:
-            return False
+        Args:
+            character_id: Character ID
+            values: Attribute name -> new value (or SQL expression, e.g. json_merge)
+            user_id: If set, only a character owned by this user is updated
 
-        await self.session.delete(character)
-        await self.session.flush()
+        Returns:
+            Updated character, or None if not found (or not owned by user_id)
+        """
+        character = await update_returning(self.session, Character, Character.character_id, character_id, values, user_id)
 
-        logger.info(f"Deleted character from database: {character_id}")
-        return True
+        if character is not None:
+            logger.info(f"Updated character in database: {character_id} ({', '.join(values)})")
+        return character
+
+    async def delete(self, character_id: str, user_id: Optional[int] = None) -> bool:
+        """Delete character by ID with a single DELETE (optionally only if owned by user_id)"""
+        deleted = await delete_returning(self.session, Character, Character.character_id, character_id, user_id)
+
+        if deleted:
+            logger.info(f"Deleted character from database: {character_id}")
+        return deleted
 
     async def search(
         self,
@@ -87,7 +142,7 @@ class CharacterRepository:
         Search characters with optional filters
 
         Args:
-            query: Text search in name, personality, or description
+            query: Text search in name, personality, or description (ranked by relevance)
             user_id: Filter by user ID
             tags: Filter by tags (must have all tags)
         """
@@ -96,19 +151,15 @@ class CharacterRepository:
         if user_id is not None:
             stmt = stmt.where(Character.user_id == user_id)
 
-        if query:
-            # Case-insensitive search in name, personality, or visual description
-            search_filter = (
-                Character.name.ilike(f"%{query}%") |
-                Character.personality.ilike(f"%{query}%") |
-                Character.visual_description.ilike(f"%{query}%")
-            )
-            stmt = stmt.where(search_filter)
-
         # Note: Tag filtering with JSON arrays is complex in PostgreSQL
         # For now, we'll do tag filtering in Python after retrieval
 
-        stmt = stmt.order_by(Character.created_at.desc())
+        if query and prefix_tsquery(query):
+            # Full-text search in name, personality, or visual description (GIN indexed)
+            stmt = stmt.where(text_match(Character.search_vector, Character.name, query))
+            stmt = stmt.order_by(text_rank(Character.search_vector, Character.name, query).desc())
+        else:
+            stmt = stmt.order_by(Character.created_at.desc())
 
         result = await self.session.execute(stmt)
         characters = list(result.scalars().all())
@@ -122,10 +173,51 @@ class CharacterRepository:
 
         return characters
 
+    async def search_ranked(
+        self,
+        query: str,
+        user_id: Optional[int] = None,
+        limit: int = 20
+    ) -> List[Tuple[Character, float, str]]:
+        """
+        Full-text search returning (character, rank, highlighted snippet), best first
+        """
+        if not prefix_tsquery(query):
+            return []
+
+        stmt = ranked_search_query(
+            Character, Character.name,
+            [Character.name, Character.personality, Character.visual_description],
+            query
+        )
+
+        if user_id is not None:
+            stmt = stmt.where(Character.user_id == user_id)
+
+        result = await self.session.execute(stmt.limit(limit))
+        return [(row[0], row.rank, row.snippet) for row in result.all()]
+
+    async def suggest(
+        self,
+        query: str,
+        user_id: Optional[int] = None,
+        limit: int = 10
+    ) -> List[Tuple[str, str]]:
+        """Search-as-you-type: (character_id, name) pairs for a partial query"""
+        if not prefix_tsquery(query):
+            return []
+
+        stmt = suggest_query(Character, Character.character_id, Character.name, query)
+
+        if user_id is not None:
+            stmt = stmt.where(Character.user_id == user_id)
+
+        result = await self.session.execute(stmt.limit(limit))
+        return [tuple(row) for row in result.all()]
+
     async def exists(self, character_id: str) -> bool:
         """Check if character exists"""
-        character = await self.get_by_id(character_id)
-        return character is not None
+        return await row_exists(self.session, Character, Character.character_id == character_id)
 
     async def count(self, user_id: Optional[int] = None) -> int:
         """Count characters, optionally filtered by user"""
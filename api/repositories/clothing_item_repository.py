@@ -4,11 +4,14 @@ Clothing Item Repository
 Handles database operations for ClothingItem entities.
 """
 
-from typing import Optional, List
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.models.db import ClothingItem
+from api.repositories.pagination import Cursor, apply_keyset, fetch_with_total
+from api.repositories.search import prefix_tsquery, ranked_search_query, suggest_query, text_match, text_rank
+from api.repositories.statements import delete_returning, row_exists, update_returning
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -27,21 +30,42 @@ class ClothingItemRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_by_ids(self, item_ids: List[str]) -> List[ClothingItem]:
+        """Get several clothing items by ID in one query (missing IDs are omitted)"""
+        if not item_ids:
+            return []
+
+        result = await self.session.execute(
+            select(ClothingItem).where(ClothingItem.item_id.in_(item_ids))
+        )
+        return list(result.scalars().all())
+
+    def _filtered(self, user_id: Optional[int], category: Optional[str]):
+        query = select(ClothingItem)
+
+        if user_id is not None:
+            query = query.where(ClothingItem.user_id == user_id)
+
+        if category:
+            query = query.where(ClothingItem.category == category)
+
+        return query
+
     async def get_all(
         self,
         user_id: Optional[int] = None,
         category: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[ClothingItem]:
-        """Get all clothing items, optionally filtered with pagination support"""
-        query = select(ClothingItem).order_by(ClothingItem.created_at.desc())
-
-        if user_id is not None:
-            query = query.where(ClothingItem.user_id == user_id)
+        """
+        Get all clothing items, newest first, optionally filtered with pagination support
 
-        if category:
-            query = query.where(ClothingItem.category == category)
+        Pass the decoded cursor of the previous page to seek with an index
+        instead of skipping offset rows.
+        """
+        query = apply_keyset(self._filtered(user_id, category), ClothingItem, cursor)
 
         if limit is not None:
             query = query.limit(limit)
@@ -51,6 +75,30 @@ class ClothingItemRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_page(
+        self,
+        user_id: Optional[int] = None,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
+    ) -> Tuple[List[ClothingItem], Optional[int]]:
+        """
+        Like get_all, plus the total number of matching items from the same statement
+
+        Returns:
+            Tuple of (items, total); total is None for an empty page
+        """
+        filtered = self._filtered(user_id, category)
+        query = apply_keyset(filtered, ClothingItem, cursor)
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        query = query.offset(offset)
+
+        return await fetch_with_total(self.session, query, filtered if cursor else None)
+
     async def get_by_category(self, category: str, user_id: Optional[int] = None) -> List[ClothingItem]:
         """Get all items in a specific category"""
         return await self.get_all(user_id=user_id, category=category)
@@ -63,26 +111,62 @@ class ClothingItemRepository:
         logger.info(f"Created clothing item in database: {item.item} ({item.category})")
         return item
 
+    async def create_many(self, items: List[ClothingItem]) -> List[ClothingItem]:
+        """
+        Create several clothing items with a single flush
+
+        The unit of work batches the rows into one multi-row
+        INSERT ... RETURNING, instead of one statement per item.
+        """
+        if not items:
+            return []
+
+        self.session.add_all(items)
+        await self.session.flush()
+
+        logger.info(f"Created {len(items)} clothing items in database")
+        return items
+
     async def update(self, item: ClothingItem) -> ClothingItem:
         """Update existing clothing item"""
-        await self.session.merge(item)
+        # add() attaches without the SELECT merge() would issue; the flush
+        # UPDATEs only the changed columns
+        self.session.add(item)
         await self.session.flush()
 
         logger.info(f"Updated clothing item in database: {item.item} ({item.item_id})")
         return item
 
-    async def delete(self, item_id: str) -> bool:
-        """Delete clothing item by ID"""
-        item = await self.get_by_id(item_id)
+    async def update_fields(
+        self,
+        item_id: str,
+        values: Dict[str, Any],
+        user_id: Optional[int] = None
+    ) -> Optional[ClothingItem]:
+        """
+        Update only the given columns with a single UPDATE ... RETURNING
 
-        if not item:
-            return False
+        Args:
+            item_id: Clothing item ID
+            values: Attribute name -> new value (or SQL expression, e.g. json_merge)
+            user_id: If set, only a clothing item owned by this user is updated
 
-        await self.session.delete(item)
-        await self.session.flush()
+        Returns:
+            Updated clothing item, or None if not found (or not owned by user_id)
+        """
+        item = await update_returning(self.session, ClothingItem, ClothingItem.item_id, item_id, values, user_id)
 
-        logger.info(f"Deleted clothing item from database: {item_id}")
-        return True
+        if item is not None:
+            logger.info(f"Updated clothing item in database: {item_id} ({', '.join(values)})")
+        return item
+
+    async def delete(self, item_id: str, user_id: Optional[int] = None) -> bool:
+        """Delete clothing item by ID with a single DELETE (optionally only if owned by user_id)"""
+        deleted = await delete_returning(self.session, ClothingItem, ClothingItem.item_id, item_id, user_id)
+
+        if deleted:
+            logger.info(f"Deleted clothing item from database: {item_id}")
+        return deleted
 
     async def search(
         self,
@@ -95,7 +179,7 @@ class ClothingItemRepository:
         Search clothing items with optional filters
 
         Args:
-            query: Text search in item name, fabric, or details
+            query: Text search in item name, color, fabric, or details (ranked by relevance)
             category: Filter by category
             color: Filter by color
             user_id: Filter by user ID
@@ -111,20 +195,62 @@ class ClothingItemRepository:
         if color:
             stmt = stmt.where(ClothingItem.color.ilike(f"%{color}%"))
 
-        if query:
-            # Case-insensitive search in item, fabric, or details
-            search_filter = (
-                ClothingItem.item.ilike(f"%{query}%") |
-                ClothingItem.fabric.ilike(f"%{query}%") |
-                ClothingItem.details.ilike(f"%{query}%")
-            )
-            stmt = stmt.where(search_filter)
-
-        stmt = stmt.order_by(ClothingItem.created_at.desc())
+        if query and prefix_tsquery(query):
+            # Full-text search in item, color, fabric, or details (GIN indexed)
+            stmt = stmt.where(text_match(ClothingItem.search_vector, ClothingItem.item, query))
+            stmt = stmt.order_by(text_rank(ClothingItem.search_vector, ClothingItem.item, query).desc())
+        else:
+            stmt = stmt.order_by(ClothingItem.created_at.desc())
 
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def search_ranked(
+        self,
+        query: str,
+        user_id: Optional[int] = None,
+        category: Optional[str] = None,
+        limit: int = 20
+    ) -> List[Tuple[ClothingItem, float, str]]:
+        """
+        Full-text search returning (item, rank, highlighted snippet), best first
+        """
+        if not prefix_tsquery(query):
+            return []
+
+        stmt = ranked_search_query(
+            ClothingItem, ClothingItem.item,
+            [ClothingItem.item, ClothingItem.color, ClothingItem.fabric, ClothingItem.details],
+            query
+        )
+
+        if user_id is not None:
+            stmt = stmt.where(ClothingItem.user_id == user_id)
+
+        if category:
+            stmt = stmt.where(ClothingItem.category == category)
+
+        result = await self.session.execute(stmt.limit(limit))
+        return [(row[0], row.rank, row.snippet) for row in result.all()]
+
+    async def suggest(
+        self,
+        query: str,
+        user_id: Optional[int] = None,
+        limit: int = 10
+    ) -> List[Tuple[str, str]]:
+        """Search-as-you-type: (item_id, item) pairs for a partial query"""
+        if not prefix_tsquery(query):
+            return []
+
+        stmt = suggest_query(ClothingItem, ClothingItem.item_id, ClothingItem.item, query)
+
+        if user_id is not None:
+            stmt = stmt.where(ClothingItem.user_id == user_id)
+
+        result = await self.session.execute(stmt.limit(limit))
+        return [tuple(row) for row in result.all()]
+
     async def get_without_preview(self, user_id: Optional[int] = None) -> List[ClothingItem]:
         """Get all items without preview images"""
         query = select(ClothingItem).where(
@@ -140,8 +266,7 @@ class ClothingItemRepository:
 
     async def exists(self, item_id: str) -> bool:
         """Check if clothing item exists"""
-        item = await self.get_by_id(item_id)
-        return item is not None
+        return await row_exists(self.session, ClothingItem, ClothingItem.item_id == item_id)
 
     async def count(self, user_id: Optional[int] = None, category: Optional[str] = None) -> int:
         """Count clothing items"""
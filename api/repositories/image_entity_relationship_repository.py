@@ -4,11 +4,12 @@ Image Entity Relationship Repository
 Handles database operations for ImageEntityRelationship entities (polymorphic joins).
 """
 
-from typing import Optional, List
-from sqlalchemy import select, func, and_
+from typing import Optional, List, Dict
+from sqlalchemy import delete, select, func, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.models.db import ImageEntityRelationship, Image
+from api.repositories.statements import delete_returning, row_exists
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -36,6 +37,27 @@ class ImageEntityRelationshipRepository:
         )
         return list(result.scalars().all())
 
+    async def get_by_images(self, image_ids: List[str]) -> Dict[str, List[ImageEntityRelationship]]:
+        """
+        Get entity relationships for many images in one query
+
+        Returns dict of image_id -> relationships (ordered by created_at).
+        Images without relationships are absent from the dict.
+        """
+        if not image_ids:
+            return {}
+
+        result = await self.session.execute(
+            select(ImageEntityRelationship)
+            .where(ImageEntityRelationship.image_id.in_(image_ids))
+            .order_by(ImageEntityRelationship.image_id, ImageEntityRelationship.created_at)
+        )
+
+        by_image: Dict[str, List[ImageEntityRelationship]] = {}
+        for rel in result.scalars().all():
+            by_image.setdefault(rel.image_id, []).append(rel)
+        return by_image
+
     async def get_by_entity(
         self,
         entity_type: str,
@@ -113,17 +135,14 @@ class ImageEntityRelationshipRepository:
         return relationships
 
     async def delete(self, relationship_id: int) -> bool:
-        """Delete relationship by ID"""
-        relationship = await self.get_by_id(relationship_id)
-
-        if not relationship:
-            return False
-
-        await self.session.delete(relationship)
-        await self.session.flush()
+        """Delete relationship by ID with a single DELETE"""
+        deleted = await delete_returning(
+            self.session, ImageEntityRelationship, ImageEntityRelationship.id, relationship_id
+        )
 
-        logger.info(f"Deleted image-entity relationship: {relationship_id}")
-        return True
+        if deleted:
+            logger.info(f"Deleted image-entity relationship: {relationship_id}")
+        return deleted
 
     async def delete_by_image(self, image_id: str) -> int:
         """
@@ -131,16 +150,40 @@ class ImageEntityRelationshipRepository:
 
         Returns count of deleted relationships
         """
-        relationships = await self.get_by_image(image_id)
-        count = len(relationships)
-
-        for rel in relationships:
-            await self.session.delete(rel)
+        result = await self.session.execute(
+            delete(ImageEntityRelationship)
+            .where(ImageEntityRelationship.image_id == image_id)
+            .returning(ImageEntityRelationship.id)
+        )
+        count = len(result.all())
 
-        await self.session.flush()
         logger.info(f"Deleted {count} relationships for image: {image_id}")
         return count
 
+    async def update_entity_name(
+        self,
+        entity_types: List[str],
+        entity_id: str,
+        entity_name: str,
+        preset_category: Optional[str] = None
+    ) -> int:
+        """
+        Rewrite the denormalized name on every relationship to an entity
+
+        Returns count of updated relationships
+        """
+        result = await self.session.execute(
+            update(ImageEntityRelationship)
+            .where(
+                ImageEntityRelationship.entity_type.in_(entity_types),
+                ImageEntityRelationship.entity_id == entity_id
+            )
+            .values(entity_name=entity_name, preset_category=preset_category)
+        )
+
+        logger.info(f"Renamed {result.rowcount} relationships to {entity_id}: {entity_name}")
+        return result.rowcount
+
     async def count_by_entity(self, entity_type: str, entity_id: str) -> int:
         """Count how many images used a specific entity"""
         query = select(func.count()).select_from(ImageEntityRelationship).where(and_(
@@ -159,14 +202,13 @@ class ImageEntityRelationshipRepository:
         role: Optional[str] = None
     ) -> bool:
         """Check if a specific relationship exists"""
-        query = select(ImageEntityRelationship).where(and_(
+        criteria = [
             ImageEntityRelationship.image_id == image_id,
             ImageEntityRelationship.entity_type == entity_type,
             ImageEntityRelationship.entity_id == entity_id
-        ))
+        ]
 
         if role is not None:
-            query = query.where(ImageEntityRelationship.role == role)
+            criteria.append(ImageEntityRelationship.role == role)
 
-        result = await self.session.execute(query)
-        return result.scalar_one_or_none() is not None
+        return await row_exists(self.session, ImageEntityRelationship, *criteria)
@@ -4,11 +4,13 @@ Image Repository
 Handles database operations for Image entities.
 """
 
-from typing import Optional, List
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.models.db import Image
+from api.repositories.pagination import Cursor, apply_keyset, fetch_with_total
+from api.repositories.statements import delete_returning, row_exists, update_returning
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -31,10 +33,16 @@ class ImageRepository:
         self,
         user_id: Optional[int] = None,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[Image]:
-        """Get all images, optionally filtered by user"""
-        query = select(Image).order_by(Image.created_at.desc())
+        """
+        Get all images, newest first, optionally filtered with pagination support
+
+        Pass the decoded cursor of the previous page to seek with an index
+        instead of skipping offset rows.
+        """
+        query = apply_keyset(select(Image), Image, cursor)
 
         if user_id is not None:
             query = query.where(Image.user_id == user_id)
@@ -47,6 +55,32 @@ class ImageRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_page(
+        self,
+        user_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
+    ) -> Tuple[List[Image], Optional[int]]:
+        """
+        Like get_all, plus the total number of matching images from the same statement
+
+        Returns:
+            Tuple of (images, total); total is None for an empty page
+        """
+        filtered = select(Image)
+        if user_id is not None:
+            filtered = filtered.where(Image.user_id == user_id)
+
+        query = apply_keyset(filtered, Image, cursor)
+
+        if offset:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+
+        return await fetch_with_total(self.session, query, filtered if cursor else None)
+
     async def create(self, image: Image) -> Image:
         """Create new image"""
         self.session.add(image)
@@ -57,29 +91,51 @@ class ImageRepository:
 
     async def update(self, image: Image) -> Image:
         """Update existing image"""
-        await self.session.merge(image)
+        # add() attaches without the SELECT merge() would issue; the flush
+        # UPDATEs only the changed columns
+        self.session.add(image)
         await self.session.flush()
 
         logger.info(f"Updated image in database: {image.image_id}")
         return image
 
-    async def delete(self, image_id: str) -> bool:
-        """Delete image by ID"""
-        image = await self.get_by_id(image_id)
-
-        if not image:
-            return False
+    async def update_fields(
+        self,
+        image_id: str,
+        values: Dict[str, Any],
+        user_id: Optional[int] = None
+    ) -> Optional[Image]:
+        """
+        Update only the given columns with a single UPDATE ... RETURNING
+
+        Args:
+            image_id: Image ID
+            values: Attribute name -> new value (or SQL expression, e.g. json_merge)
+            user_id: If set, only a image owned by this user is updated
+
+        Returns:
+            Updated image, or None if not found (or not owned by user_id)
+        """
+        image = await update_returning(self.session, Image, Image.image_id, image_id, values, user_id)
+
+        if image is not None:
+            logger.info(f"Updated image in database: {image_id} ({', '.join(values)})")
+        return image
 
-        await self.session.delete(image)
-        await self.session.flush()
+    async def delete(self, image_id: str, user_id: Optional[int] = None) -> bool:
+        """Delete image by ID with a single DELETE (optionally only if owned by user_id)"""
+        deleted = await delete_returning(self.session, Image, Image.image_id, image_id, user_id)
 
-        logger.info(f"Deleted image from database: {image_id}")
-        return True
+        if deleted:
+            logger.info(f"Deleted image from database: {image_id}")
+        return deleted
 
-    async def exists(self, image_id: str) -> bool:
-        """Check if image exists"""
-        image = await self.get_by_id(image_id)
-        return image is not None
+    async def exists(self, image_id: str, user_id: Optional[int] = None) -> bool:
+        """Check if image exists (optionally only if owned by user_id)"""
+        criteria = [Image.image_id == image_id]
+        if user_id is not None:
+            criteria.append(Image.user_id == user_id)
+        return await row_exists(self.session, Image, *criteria)
 
     async def count(self, user_id: Optional[int] = None) -> int:
         """Count images"""
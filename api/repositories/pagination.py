@@ -0,0 +1,134 @@
+"""
+Keyset Pagination Helpers
+
+Cursor-based pagination on (created_at, id), newest first. Instead of
+OFFSET n (which scans and discards n rows), each page seeks past the last
+row of the previous page, so deep pages cost the same as the first one
+when a (created_at, id) index exists.
+
+Cursors are opaque URL-safe strings; clients pass back the next_cursor of
+the previous page.
+
+fetch_with_total() returns a page together with the total row count from
+the same statement, saving the separate COUNT(*) round-trip.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import Select, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class Cursor(NamedTuple):
+    """Position after which the next page starts"""
+    created_at: datetime
+    id: int
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode a (created_at, id) position as an opaque cursor string"""
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    Decode an opaque cursor string
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return Cursor(datetime.fromisoformat(created_at), int(row_id))
+    except Exception:
+        raise ValueError("Invalid pagination cursor")
+
+
+def apply_keyset(query: Select, model: Any, cursor: Optional[Cursor] = None) -> Select:
+    """
+    Order a query newest first and seek past the cursor
+
+    The id tie-breaker makes the order total, so rows sharing a created_at
+    are neither skipped nor repeated across pages.
+    """
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if cursor is not None:
+        query = query.where(
+            tuple_(model.created_at, model.id) < tuple_(cursor.created_at, cursor.id)
+        )
+    return query
+
+
+def split_page(rows: List[Any], limit: Optional[int]) -> Tuple[List[Any], Optional[str]]:
+    """
+    Trim a result fetched with limit + 1 and build the next cursor
+
+    Returns:
+        Tuple of (rows for this page, next_cursor or None on the last page)
+    """
+    if limit is None or len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.id)
+
+
+async def fetch_with_total(
+    session: AsyncSession,
+    query: Select,
+    count_query: Optional[Select] = None
+) -> Tuple[List[Any], Optional[int]]:
+    """
+    Execute an entity query and get the total match count in the same statement
+
+    By default the total is COUNT(*) OVER(), which is evaluated over the
+    filtered rows before LIMIT/OFFSET. A keyset seek is part of the WHERE
+    clause, so cursor pages pass count_query (the filters without the seek)
+    instead; it is wrapped as a derived table (so an unfiltered query keeps
+    its FROM) and added as an uncorrelated scalar subquery, which PostgreSQL
+    evaluates once.
+
+    Returns:
+        Tuple of (entities, total). total is None when the page is empty
+        (there is no row to carry it); callers fall back to a COUNT query.
+    """
+    if count_query is not None:
+        total = select(func.count()).select_from(count_query.order_by(None).subquery()).scalar_subquery()
+    else:
+        total = func.count().over()
+
+    result = await session.execute(query.add_columns(total.label("total_count")))
+    rows = result.all()
+    if not rows:
+        return [], None
+    return [row[0] for row in rows], rows[0][1]
+
+
+async def approximate_count(session: AsyncSession, model: Any) -> Optional[int]:
+    """
+    Estimate a table's row count from planner statistics
+
+    Reads pg_class.reltuples (kept current by autovacuum/ANALYZE) instead of
+    scanning the table. Only meaningful for unfiltered counts.
+
+    Returns:
+        Estimated row count, or None if no estimate is available (table never
+        analyzed, or not PostgreSQL)
+    """
+    if session.bind is None or session.bind.dialect.name != "postgresql":
+        return None
+
+    result = await session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": model.__tablename__}
+    )
+    estimate = result.scalar_one_or_none()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
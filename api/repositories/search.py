@@ -0,0 +1,128 @@
+"""
+Full-Text Search Helpers
+
+Builds PostgreSQL full-text and trigram search expressions shared by the
+repositories:
+- search_vector: a generated, weighted tsvector column with a GIN index
+- pg_trgm GIN indexes on the name columns for fuzzy/substring matching
+- ts_rank ordering and ts_headline snippets (safe HTML: the source text is
+  escaped, only the <mark> highlights are markup)
+
+Queries are turned into prefix tsqueries ("blue jack" -> "blue:* & jack:*")
+so the same expressions serve full searches and search-as-you-type.
+"""
+
+import re
+from typing import Any, List, Optional
+
+from sqlalchemy import ColumnElement, Select, func, or_, select
+
+SEARCH_CONFIG = "english"
+
+# ts_headline options for snippets (<mark> is rendered by the frontend)
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=20, MinWords=8, MaxFragments=2"
+
+# Replacements matching html.escape(), '&' first
+_HTML_ESCAPES = [("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;")]
+
+# Shortest query for which pg_trgm indexes can be used
+TRIGRAM_MIN_LENGTH = 3
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def prefix_tsquery(query: str) -> Optional[str]:
+    """
+    Build a to_tsquery() string matching every word of query as a prefix
+
+    Only word characters are kept, so user input can never produce a
+    tsquery syntax error.
+
+    Returns:
+        tsquery text, or None if query contains no words
+    """
+    words = _WORD_RE.findall(query.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def tsquery(query: str) -> ColumnElement:
+    """to_tsquery() expression for a user query (see prefix_tsquery)"""
+    return func.to_tsquery(SEARCH_CONFIG, prefix_tsquery(query) or "")
+
+
+def text_match(search_vector: Any, name_column: Any, query: str) -> ColumnElement:
+    """
+    Match predicate using the GIN indexes only
+
+    Full-text prefix match on search_vector, or a trigram match on the name
+    column (substring, or similar spelling for typos). Trigram predicates
+    need at least 3 characters to use the index, so shorter queries only
+    use the full-text match.
+    """
+    match = search_vector.op("@@")(tsquery(query))
+    if len(query.strip()) < TRIGRAM_MIN_LENGTH:
+        return match
+    return or_(
+        match,
+        name_column.ilike(f"%{_escape_like(query.strip())}%"),
+        name_column.op("%")(query),
+    )
+
+
+def text_rank(search_vector: Any, name_column: Any, query: str) -> ColumnElement:
+    """Relevance score: weighted ts_rank plus name similarity"""
+    return func.ts_rank(search_vector, tsquery(query)) + func.similarity(name_column, query)
+
+
+def html_escape(text: Any) -> ColumnElement:
+    """SQL equivalent of html.escape() for a text expression"""
+    for char, entity in _HTML_ESCAPES:
+        text = func.replace(text, char, entity)
+    return text
+
+
+def text_headline(columns: List[Any], query: str) -> ColumnElement:
+    """
+    ts_headline snippet over the concatenated text columns
+
+    The text is HTML-escaped before highlighting, so the snippet is safe
+    HTML whose only tags are the <mark> highlights.
+    """
+    document = html_escape(func.concat_ws(" ", *columns))
+    return func.ts_headline(SEARCH_CONFIG, document, tsquery(query), HEADLINE_OPTIONS)
+
+
+def ranked_search_query(model: Any, name_column: Any, text_columns: List[Any], query: str) -> Select:
+    """
+    SELECT (entity, rank, snippet) rows matching query, best first
+
+    Callers add their own filters and LIMIT (ts_headline only runs on the
+    rows that survive the LIMIT).
+    """
+    rank = text_rank(model.search_vector, name_column, query).label("rank")
+    snippet = text_headline(text_columns, query).label("snippet")
+    return (
+        select(model, rank, snippet)
+        .where(text_match(model.search_vector, name_column, query))
+        .order_by(rank.desc(), model.id.desc())
+    )
+
+
+def suggest_query(model: Any, id_column: Any, name_column: Any, query: str) -> Select:
+    """
+    SELECT (id, name) rows for search-as-you-type, most similar names first
+
+    Only two narrow columns are fetched so the query is served from the
+    GIN indexes plus a heap lookup per returned row.
+    """
+    return (
+        select(id_column, name_column)
+        .where(text_match(model.search_vector, name_column, query))
+        .order_by(func.similarity(name_column, query).desc(), name_column)
+    )
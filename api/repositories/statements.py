@@ -0,0 +1,91 @@
+"""
+Targeted Write Helpers
+
+Single-statement update, delete and existence checks shared by the
+repositories, instead of loading the full row first:
+- UPDATE ... SET <changed columns> WHERE <key> RETURNING <row>
+- DELETE ... WHERE <key> RETURNING id
+- SELECT 1 ... LIMIT 1
+
+Ownership filters go into the WHERE clause, so "not found" and "not yours"
+are both answered by the same statement.
+"""
+
+from typing import Any, Dict, Optional
+
+from sqlalchemy import JSON, ColumnElement, cast, delete, func, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _owned_by(model: Any, user_id: Optional[int]) -> list:
+    return [model.user_id == user_id] if user_id is not None else []
+
+
+def json_merge(column: Any, patch: Dict[str, Any]) -> ColumnElement:
+    """
+    SQL expression merging patch into a JSON column (top-level keys, like dict.update)
+
+    Lets metadata updates be part of the UPDATE instead of a read-modify-write.
+    """
+    current = func.coalesce(cast(column, JSONB), literal({}, JSONB))
+    return cast(current.op("||")(literal(patch, JSONB)), JSON)
+
+
+async def update_returning(
+    session: AsyncSession,
+    model: Any,
+    key_column: Any,
+    key: Any,
+    values: Dict[str, Any],
+    user_id: Optional[int] = None
+) -> Optional[Any]:
+    """
+    Update only the given columns of one row and return the updated entity
+
+    Args:
+        values: Attribute name -> new value (or SQL expression)
+        user_id: If set, only a row owned by this user is updated
+
+    Returns:
+        Updated entity, or None if no row matched
+    """
+    stmt = (
+        update(model)
+        .where(key_column == key, *_owned_by(model, user_id))
+        .values(**values)
+        .returning(model)
+        .execution_options(populate_existing=True)
+    )
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def delete_returning(
+    session: AsyncSession,
+    model: Any,
+    key_column: Any,
+    key: Any,
+    user_id: Optional[int] = None
+) -> bool:
+    """
+    Delete one row without loading it first
+
+    Returns:
+        True if a row was deleted
+    """
+    stmt = (
+        delete(model)
+        .where(key_column == key, *_owned_by(model, user_id))
+        .returning(model.id)
+    )
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none() is not None
+
+
+async def row_exists(session: AsyncSession, model: Any, *criteria: Any) -> bool:
+    """Whether any row matches, via SELECT 1 ... LIMIT 1"""
+    result = await session.execute(
+        select(literal(1)).select_from(model).where(*criteria).limit(1)
+    )
+    return result.scalar_one_or_none() is not None
@@ -4,12 +4,13 @@ Analyzer Routes
 Endpoints for running image analyzers.
 """
 
+import asyncio
 import time
 import tempfile
 import base64
 from pathlib import Path
 from fastapi import APIRouter, HTTPException, UploadFile, File, BackgroundTasks, Query, Depends, Request
-from typing import List, Optional
+from typing import List, Optional, Union
 import aiofiles
 
 from api.models.requests import AnalyzeRequest
@@ -17,7 +18,7 @@ from api.models.responses import AnalyzeResponse, ToolInfo
 from api.models.jobs import JobType
 from api.models.auth import User
 from api.services import AnalyzerService
-from api.services.job_queue import get_job_queue_manager
+from api.services.job_queue import get_job_queue_manager, resumable
 from api.dependencies.auth import get_current_active_user
 from api.config import settings
 from api.logging_config import get_logger
@@ -126,25 +127,30 @@ async def upload_image(request: ImageUploadRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def run_analyzer_job(
+@resumable("analyzer")
+async def run_analyzer_job(
     job_id: str,
     analyzer_name: str,
-    image_path: Path,
-    request: AnalyzeRequest
+    image_path: str,
+    save_as_preset: Optional[Union[str, bool]] = None,
+    skip_cache: bool = False,
+    selected_analyses: Optional[dict] = None
 ):
     """Background task to run analyzer and update job"""
+    image_path = Path(image_path)
     try:
         get_job_queue_manager().start_job(job_id)
         get_job_queue_manager().update_progress(job_id, 0.1, "Starting analysis...")
 
-        # Run analyzer
-        result = analyzer_service.analyze(
+        # Run analyzer (synchronous) off the event loop
+        result = await asyncio.to_thread(
+            analyzer_service.analyze,
             analyzer_name,
             image_path,
-            save_as_preset=request.save_as_preset,
-            skip_cache=request.skip_cache,
+            save_as_preset=save_as_preset,
+            skip_cache=skip_cache,
             background_tasks=None,  # No nested background tasks in async mode
-            selected_analyses=request.selected_analyses
+            selected_analyses=selected_analyses
         )
 
         get_job_queue_manager().update_progress(job_id, 0.9, "Finalizing...")
@@ -162,26 +168,12 @@ def run_analyzer_job(
                 }})
 
                 # Import here to avoid circular dependency
-                from api.routes.clothing_items import run_preview_generation_job
+                from api.routes.clothing_items import queue_clothing_item_preview
 
                 for item in clothing_items:
                     item_id = item.get("item_id")
                     if item_id:
-                        # Create job for this item's preview
-                        preview_job_id = get_job_queue_manager().create_job(
-                            job_type=JobType.GENERATE_IMAGE,
-                            title=f"Preview: {item.get('item', 'Clothing Item')}",
-                            description=f"Category: {item.get('category', 'unknown')}"
-                        )
-
-                        # Run preview generation in a thread to avoid blocking
-                        import threading
-                        thread = threading.Thread(
-                            target=run_preview_generation_job,
-                            args=(preview_job_id, item_id)
-                        )
-                        thread.daemon = True
-                        thread.start()
+                        preview_job_id = queue_clothing_item_preview(item)
 
                         logger.info(f"Queued preview generation", extra={'extra_fields': {
                             'item_name': item.get('item'),
@@ -243,17 +235,19 @@ async def analyze_image(
         job_id = get_job_queue_manager().create_job(
             job_type=job_type,
             title=title,
-            description=f"Image: {image_path.name}"
+            description=f"Image: {image_path.name}",
+            resume_handler="analyzer",
+            resume_params={
+                "analyzer_name": analyzer_name,
+                "image_path": str(image_path),
+                "save_as_preset": request.save_as_preset,
+                "skip_cache": request.skip_cache,
+                "selected_analyses": request.selected_analyses
+            }
         )
 
         # Queue background task
-        background_tasks.add_task(
-            run_analyzer_job,
-            job_id,
-            analyzer_name,
-            image_path,
-            request
-        )
+        get_job_queue_manager().dispatch_job(job_id, background_tasks)
 
         # Return job info
         return {
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.models.auth import Token, LoginRequest, UserCreate, User, RefreshTokenRequest
 from api.services.auth_service_db import AuthServiceDB
+from api.services.password_hasher import PasswordHasherBusyError
 from api.database import get_db
 from api.dependencies.auth import get_current_active_user
 from api.config import settings
@@ -18,6 +19,15 @@ from api.config import settings
 router = APIRouter()
 
 
+def _too_many_logins() -> HTTPException:
+    """429 for when the password hashing pool is saturated"""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many login attempts, try again shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/login", response_model=Token)
 async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_db)):
     """
@@ -26,7 +36,10 @@ async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_db)):
     Authenticates user credentials and returns JWT tokens for API access.
     """
     auth_service = AuthServiceDB(db)
-    user = await auth_service.authenticate_user(login_data.username, login_data.password)
+    try:
+        user = await auth_service.authenticate_user(login_data.username, login_data.password)
+    except PasswordHasherBusyError:
+        raise _too_many_logins()
 
     if not user:
         raise HTTPException(
@@ -63,7 +76,10 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
     Standard OAuth2 password flow for compatibility with OAuth2 clients.
     """
     auth_service = AuthServiceDB(db)
-    user = await auth_service.authenticate_user(form_data.username, form_data.password)
+    try:
+        user = await auth_service.authenticate_user(form_data.username, form_data.password)
+    except PasswordHasherBusyError:
+        raise _too_many_logins()
 
     if not user:
         raise HTTPException(
@@ -150,6 +166,8 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except PasswordHasherBusyError:
+        raise _too_many_logins()
 
 
 @router.get("/me", response_model=User)
@@ -48,9 +48,8 @@ async def list_board_games(
     """
     service = BoardGameServiceDB(db, user_id=current_user.id if current_user else None)
 
-    # Get both games and total count
-    games = await service.list_board_games(limit=limit, offset=offset)
-    total_count = await service.count_board_games()
+    # Games and total count come from the same query
+    games, total_count = await service.list_board_games_page(limit=limit, offset=offset)
 
     game_infos = [
         BoardGameInfo(
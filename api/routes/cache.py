@@ -19,6 +19,10 @@ router = APIRouter(prefix="/api/cache", tags=["cache"])
 class CacheStats(BaseModel):
     """Cache statistics response"""
     hits: int
+    l1_hits: int = 0
+    l2_hits: int = 0
+    stale_hits: int = 0
+    l1_size: int = 0
     misses: int
     sets: int
     invalidations: int
@@ -30,6 +34,7 @@ class CacheStats(BaseModel):
 class CacheInvalidateRequest(BaseModel):
     """Cache invalidation request"""
     entity_type: Optional[str] = None
+    entity_id: Optional[str] = None
     endpoint: Optional[str] = None
     pattern: Optional[str] = None
 
@@ -39,7 +44,8 @@ async def cache_statistics():
     """
     Get cache statistics
 
-    Returns hit/miss counts, hit rate, and connection status.
+    Returns hit/miss counts (split into in-memory L1 and Redis L2 hits),
+    hit rate, and connection status.
     """
     stats = await get_cache_stats()
     return CacheStats(**stats)
@@ -52,26 +58,28 @@ async def invalidate_cache(request: CacheInvalidateRequest):
 
     Supports invalidation by:
     - entity_type: Invalidate all caches for an entity (e.g., "characters")
+    - entity_type + entity_id: Invalidate caches for a single entity
     - endpoint: Invalidate specific endpoint (e.g., "/api/characters/")
     - pattern: Invalidate by Redis key pattern (e.g., "cache:characters:*")
     """
     cache = get_cache_service()
 
-    if not cache.redis:
+    if not await cache.ensure_available():
         raise HTTPException(status_code=503, detail="Cache service not available")
 
     invalidated_count = 0
 
     try:
-        if request.entity_type:
-            await cache.invalidate_entity_type(request.entity_type)
+        if request.entity_type and request.entity_id:
+            invalidated_count += await cache.invalidate_entity(request.entity_type, request.entity_id)
+            logger.info(f"Invalidated cache for entity: {request.entity_type}/{request.entity_id}")
+        elif request.entity_type:
+            invalidated_count += await cache.invalidate_entity_type(request.entity_type)
             logger.info(f"Invalidated cache for entity type: {request.entity_type}")
-            invalidated_count += 1
 
         if request.endpoint:
-            await cache.invalidate_endpoint(request.endpoint)
+            invalidated_count += await cache.invalidate_endpoint(request.endpoint)
             logger.info(f"Invalidated cache for endpoint: {request.endpoint}")
-            invalidated_count += 1
 
         if request.pattern:
             count = await cache.delete_pattern(request.pattern)
@@ -97,7 +105,7 @@ async def clear_cache():
     """
     cache = get_cache_service()
 
-    if not cache.redis:
+    if not await cache.ensure_available():
         raise HTTPException(status_code=503, detail="Cache service not available")
 
     try:
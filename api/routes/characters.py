@@ -6,7 +6,7 @@ Endpoints for managing character entities.
 
 from fastapi import APIRouter, HTTPException, Depends, File, UploadFile, Form, BackgroundTasks, Query, Request
 from fastapi.responses import FileResponse
-from typing import Optional, List
+from typing import Optional, List, Literal
 import base64
 import json
 from pathlib import Path
@@ -34,7 +34,9 @@ logger = get_logger(__name__)
 async def list_characters(
     request: Request,
     limit: Optional[int] = Query(None, description="Maximum number of characters to return"),
-    offset: int = Query(0, description="Number of characters to skip"),
+    offset: int = Query(0, description="Number of characters to skip (prefer cursor)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    count_mode: Literal["exact", "approximate", "none"] = Query("exact", description="How to compute count"),
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_active_user)
 ):
@@ -42,15 +44,20 @@ async def list_characters(
     List all characters
 
     Returns a list of character entities with their metadata.
-    Supports pagination via limit/offset parameters.
+    Supports pagination via limit + cursor (pass the returned next_cursor,
+    null on the last page); limit/offset still works. Use count_mode=none on
+    follow-up pages to skip the COUNT query.
 
     **Cached**: 60 seconds (user-specific)
     """
     service = CharacterServiceDB(db, user_id=current_user.id if current_user else None)
 
-    # Get both characters and total count
-    characters = await service.list_characters(limit=limit, offset=offset)
-    total_count = await service.count_characters()
+    try:
+        characters, next_cursor, total_count = await service.list_characters_page(
+            limit=limit, cursor=cursor, offset=offset, count_mode=count_mode
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     character_infos = []
     for char in characters:
@@ -78,7 +85,8 @@ async def list_characters(
 
     return CharacterListResponse(
         count=total_count,
-        characters=character_infos
+        characters=character_infos,
+        next_cursor=next_cursor
     )
 
 
@@ -427,6 +435,7 @@ async def get_character(
 async def update_character(
     character_id: str,
     request: CharacterUpdate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_active_user)
 ):
@@ -456,7 +465,8 @@ async def update_character(
         visual_description=request.visual_description,
         personality=request.personality,
         reference_image_path=reference_image_path,
-        tags=request.tags
+        tags=request.tags,
+        background_tasks=background_tasks
     )
 
     if not character_data:
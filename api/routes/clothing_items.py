@@ -6,7 +6,7 @@ Clothing items are extracted from outfit images and can be composed into outfits
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks, Request
-from typing import Optional, List
+from typing import Optional, List, Literal
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +15,7 @@ from api.database import get_db
 from api.models.auth import User
 from api.dependencies.auth import get_current_active_user
 from api.middleware.cache import cached, invalidates_cache
+from api.services.job_queue import resumable
 
 router = APIRouter()
 
@@ -53,11 +54,25 @@ class ClothingItemInfo(BaseModel):
     created_at: str
 
 
+class ClothingItemBulkCreate(BaseModel):
+    """Request to create several clothing items at once"""
+    items: List[ClothingItemCreate]
+    source_image: Optional[str] = None  # Default for items without their own
+
+
+class ClothingItemBulkResponse(BaseModel):
+    """Response for bulk clothing item creation"""
+    count: int
+    items: List[ClothingItemInfo]
+    preview_job_id: Optional[str] = None
+
+
 class ClothingItemListResponse(BaseModel):
     """Response for listing clothing items"""
-    count: int
+    count: Optional[int] = None
     items: List[ClothingItemInfo]
     category_filter: Optional[str] = None
+    next_cursor: Optional[str] = None
 
 
 class CategoriesSummaryResponse(BaseModel):
@@ -73,7 +88,9 @@ async def list_clothing_items(
     request: Request,
     category: Optional[str] = Query(None, description="Filter by category (e.g., 'tops', 'bottoms')"),
     limit: Optional[int] = Query(None, description="Maximum number of items to return"),
-    offset: int = Query(0, description="Number of items to skip"),
+    offset: int = Query(0, description="Number of items to skip (prefer cursor)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    count_mode: Literal["exact", "approximate", "none"] = Query("exact", description="How to compute count"),
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_active_user)
 ):
@@ -83,13 +100,20 @@ async def list_clothing_items(
     Optionally filter by category and paginate results.
     Returns items sorted by created_at (newest first).
 
+    Pagination: pass the returned next_cursor as cursor to get the next page
+    (null on the last page). Use count_mode=none on follow-up pages to skip
+    the COUNT query.
+
     **Cached**: 60 seconds (user-specific)
     """
     service = ClothingItemServiceDB(db, user_id=current_user.id if current_user else None)
 
-    # Get both items and total count
-    items = await service.list_clothing_items(category=category, limit=limit, offset=offset)
-    total_count = await service.count_clothing_items(category=category)
+    try:
+        items, next_cursor, total_count = await service.list_clothing_items_page(
+            category=category, limit=limit, cursor=cursor, offset=offset, count_mode=count_mode
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     item_infos = [
         ClothingItemInfo(
@@ -109,7 +133,8 @@ async def list_clothing_items(
     return ClothingItemListResponse(
         count=total_count,
         items=item_infos,
-        category_filter=category
+        category_filter=category,
+        next_cursor=next_cursor
     )
 
 
@@ -217,11 +242,59 @@ async def create_clothing_item(
     )
 
 
+@router.post("/bulk", response_model=ClothingItemBulkResponse)
+@invalidates_cache(entity_types=["clothing_items"])
+async def create_clothing_items_bulk(
+    request: ClothingItemBulkCreate,
+    background_tasks: BackgroundTasks,
+    generate_preview: bool = Query(True, description="Generate preview images automatically"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_active_user)
+):
+    """
+    Create several clothing items at once
+
+    All items are written with a single insert and commit. When previews are
+    requested they are queued as one parent job (preview_job_id) with a child
+    job per item.
+
+    **Cache Invalidation**: Clears all clothing_items caches
+    """
+    service = ClothingItemServiceDB(db, user_id=current_user.id if current_user else None)
+
+    items, preview_job_id = await service.create_many(
+        [item.model_dump() for item in request.items],
+        source_image=request.source_image,
+        generate_previews=generate_preview,
+        background_tasks=background_tasks if generate_preview else None
+    )
+
+    return ClothingItemBulkResponse(
+        count=len(items),
+        items=[
+            ClothingItemInfo(
+                item_id=item['item_id'],
+                category=item['category'],
+                item=item['item'],
+                fabric=item['fabric'],
+                color=item['color'],
+                details=item['details'],
+                source_image=item.get('source_image'),
+                preview_image_path=item.get('preview_image_path'),
+                created_at=item.get('created_at', '')
+            )
+            for item in items
+        ],
+        preview_job_id=preview_job_id
+    )
+
+
 @router.put("/{item_id}", response_model=ClothingItemInfo)
 @invalidates_cache(entity_types=["clothing_items"])
 async def update_clothing_item(
     item_id: str,
     request: ClothingItemUpdate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_active_user)
 ):
@@ -241,7 +314,8 @@ async def update_clothing_item(
         fabric=request.fabric,
         color=request.color,
         details=request.details,
-        source_image=request.source_image
+        source_image=request.source_image,
+        background_tasks=background_tasks
     )
 
     if not item:
@@ -284,8 +358,14 @@ async def delete_clothing_item(
     return {"message": f"Clothing item {item_id} deleted successfully"}
 
 
+@resumable("clothing_item_preview")
 async def run_preview_generation_job(job_id: str, item_id: str):
-    """Background task to generate preview and update job"""
+    """
+    Background task to generate preview and update job
+
+    Batch preview requests queue one job per item, so each item's job is its
+    own checkpoint: after a crash only the unfinished items are resumed.
+    """
     from api.services.job_queue import get_job_queue_manager
     from api.database import get_session
 
@@ -326,6 +406,31 @@ async def run_preview_generation_job(job_id: str, item_id: str):
         get_job_queue_manager().fail_job(job_id, str(e))
 
 
+def queue_clothing_item_preview(item: dict) -> str:
+    """
+    Queue preview generation for a clothing item created by another job
+
+    Runs the "clothing_item_preview" handler through dispatch_job, so it can
+    go to the worker tier and be resumed after a crash. Call from async code.
+
+    Returns:
+        The preview job's ID
+    """
+    from api.services.job_queue import get_job_queue_manager
+    from api.models.jobs import JobType
+
+    job_manager = get_job_queue_manager()
+    job_id = job_manager.create_job(
+        job_type=JobType.GENERATE_IMAGE,
+        title=f"Preview: {item.get('item', 'Clothing Item')}",
+        description=f"Category: {item.get('category', 'unknown')}",
+        resume_handler="clothing_item_preview",
+        resume_params={"item_id": item["item_id"]}
+    )
+    job_manager.dispatch_job(job_id)
+    return job_id
+
+
 class BatchGenerateRequest(BaseModel):
     """Request to batch generate previews for specific items"""
     item_ids: List[str]
@@ -349,8 +454,6 @@ async def batch_generate_previews_by_ids(
 
     Returns summary of queued jobs.
     """
-    from api.services.job_queue import get_job_queue_manager
-    from api.models.jobs import JobType
     from api.logging_config import get_logger
 
     logger = get_logger(__name__)
@@ -371,37 +474,24 @@ async def batch_generate_previews_by_ids(
         }}
     )
 
-    # Queue preview generation jobs
-    job_ids = []
-    not_found = []
-
-    for item_id in request.item_ids:
-        # Verify item exists
-        item = await service.get_clothing_item(item_id)
-        if not item:
-            not_found.append(item_id)
-            continue
+    # Verify items exist (one query), then queue one preview job group
+    found = {item['item_id']: item for item in await service.get_clothing_items(request.item_ids)}
+    items = [found[item_id] for item_id in request.item_ids if item_id in found]
+    not_found = [item_id for item_id in request.item_ids if item_id not in found]
 
-        # Create job
-        job_id = get_job_queue_manager().create_job(
-            job_type=JobType.GENERATE_IMAGE,
-            title=f"Generate preview: {item['item']}",
-            description=f"{item['category']} - {item['color']} {item['fabric']}"
-        )
-
-        # Queue background task
-        background_tasks.add_task(
-            run_preview_generation_job,
-            job_id,
-            item_id
-        )
-
-        job_ids.append({
-            "job_id": job_id,
-            "item_id": item_id,
-            "item_name": item['item'],
-            "category": item['category']
-        })
+    job_ids = []
+    parent_job_id = None
+    if items:
+        parent_job_id, child_job_ids = service.queue_preview_jobs(items, background_tasks)
+        job_ids = [
+            {
+                "job_id": job_id,
+                "item_id": item['item_id'],
+                "item_name": item['item'],
+                "category": item['category']
+            }
+            for job_id, item in zip(child_job_ids, items)
+        ]
 
     logger.info(
         f"Queued {len(job_ids)} preview generation jobs",
@@ -414,6 +504,7 @@ async def batch_generate_previews_by_ids(
     return {
         "message": f"Queued {len(job_ids)} preview generation jobs",
         "jobs_queued": len(job_ids),
+        "parent_job_id": parent_job_id,
         "job_ids": job_ids,
         "not_found": not_found if not_found else None,
         "note": "Use /jobs endpoint to monitor progress"
@@ -441,8 +532,6 @@ async def batch_generate_previews(
 
     Returns summary of queued jobs.
     """
-    from api.services.job_queue import get_job_queue_manager
-    from api.models.jobs import JobType
     from api.logging_config import get_logger
 
     logger = get_logger(__name__)
@@ -479,31 +568,17 @@ async def batch_generate_previews(
         }}
     )
 
-    # Queue preview generation jobs
-    job_ids = []
-    for item in items_without_previews:
-        item_id = item['item_id']
-
-        # Create job
-        job_id = get_job_queue_manager().create_job(
-            job_type=JobType.GENERATE_IMAGE,
-            title=f"Generate preview: {item['item']}",
-            description=f"{item['category']} - {item['color']} {item['fabric']}"
-        )
-
-        # Queue background task
-        background_tasks.add_task(
-            run_preview_generation_job,
-            job_id,
-            item_id
-        )
-
-        job_ids.append({
+    # Queue preview generation jobs as one group
+    parent_job_id, child_job_ids = service.queue_preview_jobs(items_without_previews, background_tasks)
+    job_ids = [
+        {
             "job_id": job_id,
-            "item_id": item_id,
+            "item_id": item['item_id'],
             "item_name": item['item'],
             "category": item['category']
-        })
+        }
+        for job_id, item in zip(child_job_ids, items_without_previews)
+    ]
 
     logger.info(
         f"Queued {len(job_ids)} preview generation jobs",
@@ -518,6 +593,7 @@ async def batch_generate_previews(
         "total_items": len(all_items),
         "items_without_previews": len(items_without_previews),
         "jobs_queued": len(job_ids),
+        "parent_job_id": parent_job_id,
         "job_ids": job_ids,
         "note": "Use /jobs endpoint to monitor progress"
     }
@@ -549,15 +625,13 @@ async def generate_clothing_item_preview(
         job_id = get_job_queue_manager().create_job(
             job_type=JobType.GENERATE_IMAGE,
             title="Generating clothing item preview",
-            description=f"Item ID: {item_id}"
+            description=f"Item ID: {item_id}",
+            resume_handler="clothing_item_preview",
+            resume_params={"item_id": item_id}
         )
 
         # Queue background task
-        background_tasks.add_task(
-            run_preview_generation_job,
-            job_id,
-            item_id
-        )
+        get_job_queue_manager().dispatch_job(job_id, background_tasks)
 
         # Return job info
         return {
@@ -4,13 +4,14 @@ Composition Routes
 Endpoints for saving and loading preset combinations (compositions).
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from pydantic import BaseModel
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.models.auth import User
 from api.dependencies.auth import get_current_active_user
+from api.middleware.cache import etag
 from api.services.composition_service_db import CompositionServiceDB
 from api.database import get_db
 from api.logging_config import get_logger
@@ -56,7 +57,9 @@ async def save_composition(
 
 
 @router.get("/list")
+@etag()
 async def list_compositions(
+    request: Request,
     limit: Optional[int] = Query(None, description="Maximum number of compositions to return"),
     offset: int = Query(0, description="Number of compositions to skip"),
     db: AsyncSession = Depends(get_db),
@@ -4,7 +4,7 @@ Favorites Routes
 Endpoints for managing user favorite presets.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from typing import List
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,6 +13,7 @@ from api.services.favorites_service_db import FavoritesServiceDB
 from api.database import get_db
 from api.models.auth import User
 from api.dependencies.auth import get_current_active_user
+from api.middleware.cache import etag, invalidates_cache
 
 router = APIRouter()
 
@@ -31,7 +32,9 @@ class FavoriteResponse(BaseModel):
 
 
 @router.get("/", response_model=List[str])
+@etag(entity_types=["favorites"], include_user=True)
 async def get_favorites(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -41,7 +44,9 @@ async def get_favorites(
 
 
 @router.get("/{category}", response_model=List[str])
+@etag(entity_types=["favorites"], include_user=True)
 async def get_category_favorites(
+    request: Request,
     category: str,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -52,6 +57,7 @@ async def get_category_favorites(
 
 
 @router.post("/add", response_model=FavoriteResponse)
+@invalidates_cache(entity_types=["favorites"])
 async def add_favorite(
     request: FavoriteRequest,
     db: AsyncSession = Depends(get_db),
@@ -72,6 +78,7 @@ async def add_favorite(
 
 
 @router.post("/remove", response_model=FavoriteResponse)
+@invalidates_cache(entity_types=["favorites"])
 async def remove_favorite(
     request: FavoriteRequest,
     db: AsyncSession = Depends(get_db),
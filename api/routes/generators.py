@@ -13,7 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from api.models.requests import GenerateRequest, ModularGenerateRequest
 from api.models.responses import GenerateResponse, ToolInfo
 from api.services import GeneratorService, PresetService
-from api.services.job_queue import get_job_queue_manager
+from api.services.job_queue import get_job_queue_manager, resumable
 from api.models.jobs import JobType
 from api.config import settings
 from api.routes.analyzers import download_or_decode_image
@@ -25,6 +25,19 @@ generator_service = GeneratorService()
 preset_service = PresetService()
 logger = get_logger(__name__)
 
+# Clothing item categories accepted by modular generation
+CLOTHING_CATEGORIES = [
+    'headwear', 'eyewear', 'earrings', 'neckwear', 'tops', 'overtops',
+    'outerwear', 'one_piece', 'bottoms', 'belts', 'hosiery', 'footwear',
+    'bags', 'wristwear', 'handwear'
+]
+
+# Style preset categories accepted by modular generation
+STYLE_CATEGORIES = [
+    'visual_style', 'art_style', 'hair_style', 'hair_color',
+    'makeup', 'expression', 'accessories'
+]
+
 
 @router.get("/", response_model=List[ToolInfo])
 async def list_generators():
@@ -46,7 +59,6 @@ async def generate_modular(
     Also supports character IDs in the format "character:{character_id}".
     Generates multiple variations in the background.
     """
-    from ai_tools.modular_image_generator.tool import ModularImageGenerator
     from api.services.character_service_db import CharacterServiceDB
 
     # Resolve subject image path
@@ -86,16 +98,6 @@ async def generate_modular(
         elif not subject_path.exists():
             raise HTTPException(status_code=404, detail=f"Subject image not found: {request.subject_image}")
 
-    # Create job for tracking
-    job_manager = get_job_queue_manager()
-    job_id = job_manager.create_job(
-        job_type=JobType.BATCH_GENERATE,
-        title=f"Generate {request.variations} variation(s)",
-        description=f"Modular generation from {request.subject_image}",
-        total_steps=request.variations,
-        cancelable=True
-    )
-
     # Build kwargs for generator
     kwargs = {
         "subject_image": str(subject_path),
@@ -103,21 +105,7 @@ async def generate_modular(
     }
 
     # Add preset IDs and clothing item IDs for enabled categories
-    # Clothing item categories
-    clothing_categories = [
-        'headwear', 'eyewear', 'earrings', 'neckwear', 'tops', 'overtops',
-        'outerwear', 'one_piece', 'bottoms', 'belts', 'hosiery', 'footwear',
-        'bags', 'wristwear', 'handwear'
-    ]
-
-    # Style preset categories
-    style_categories = [
-        'visual_style', 'art_style', 'hair_style', 'hair_color',
-        'makeup', 'expression', 'accessories'
-    ]
-
-    # Add all categories dynamically
-    for category in clothing_categories + style_categories:
+    for category in CLOTHING_CATEGORIES + STYLE_CATEGORIES:
         value = getattr(request, category, None)
         if value is not None:
             kwargs[category] = value
@@ -130,177 +118,211 @@ async def generate_modular(
         'kwargs_keys': list(kwargs.keys())
     }})
 
-    # Define background task
-    async def generate_variations():
-        """Generate all requested variations with resilient error handling (async)"""
-        job_manager = get_job_queue_manager()
+    # Create job for tracking (resumable from per-variation checkpoints)
+    job_manager = get_job_queue_manager()
+    job_id = job_manager.create_job(
+        job_type=JobType.BATCH_GENERATE,
+        title=f"Generate {request.variations} variation(s)",
+        description=f"Modular generation from {request.subject_image}",
+        total_steps=request.variations,
+        cancelable=True,
+        resume_handler="generate_modular",
+        resume_params={
+            "request_data": request.model_dump(),
+            "generator_kwargs": kwargs
+        }
+    )
 
-        try:
-            job_manager.start_job(job_id)
-            job_manager.update_progress(job_id, 0.0, "Starting generation...")
+    # Start generation in background
+    job_manager.dispatch_job(job_id, background_tasks)
 
-            generator = ModularImageGenerator()
-            successful_paths = []
-            failed_items = []
+    return {
+        "message": "Modular generation started",
+        "status": "queued",
+        "job_id": job_id,
+        "variations": request.variations,
+        "output_dir": "output/generated"
+    }
 
-            for i in range(request.variations):
-                try:
-                    # Update progress
-                    progress = i / request.variations
-                    job_manager.update_progress(
-                        job_id,
-                        progress,
-                        message=f"Generating variation {i + 1}/{request.variations}...",
-                        current_step=i
-                    )
-                    logger.info(f"Generating variation {i + 1}/{request.variations}", extra={'extra_fields': {
-                        'job_id': job_id,
-                        'variation': i + 1,
-                        'total_variations': request.variations
-                    }})
 
-                    result = await generator.agenerate(**kwargs)
-                    successful_paths.append(str(result.file_path))
-                    logger.info(f"Variation {i + 1} complete", extra={'extra_fields': {
-                        'job_id': job_id,
-                        'variation': i + 1,
-                        'file_path': str(result.file_path)
-                    }})
+@resumable("generate_modular")
+async def run_modular_generation_job(job_id: str, request_data: dict, generator_kwargs: dict):
+    """
+    Generate all requested variations with resilient error handling (async)
 
-                    # Save image and entity relationships to database
-                    try:
-                        from api.database import get_session
-                        from api.services.image_service import ImageService
+    Each finished variation is checkpointed on the job, so a job resumed after
+    a crash skips variations that were already generated and paid for.
+    """
+    from ai_tools.modular_image_generator.tool import ModularImageGenerator
 
-                        # Build entity relationships from request parameters
-                        entities = []
+    request = ModularGenerateRequest(**request_data)
+    kwargs = generator_kwargs
+    job_manager = get_job_queue_manager()
 
-                        # Add character as subject
-                        if request.subject_image.startswith("character:"):
-                            character_id = request.subject_image.split(":", 1)[1]
-                            entities.append({
-                                "entity_type": "character",
-                                "entity_id": character_id,
-                                "role": "subject"
-                            })
+    try:
+        checkpoints = job_manager.get_checkpoints(job_id)
+        job_manager.start_job(job_id)
+        job_manager.update_progress(job_id, len(checkpoints) / request.variations, "Starting generation...")
+
+        generator = ModularImageGenerator()
+        successful_paths = []
+        failed_items = []
+
+        for i in range(request.variations):
+            checkpoint = checkpoints.get(str(i))
+            if checkpoint is not None:
+                # Already generated before a restart
+                successful_paths.append(checkpoint["file_path"])
+                continue
+
+            try:
+                # Update progress
+                progress = i / request.variations
+                job_manager.update_progress(
+                    job_id,
+                    progress,
+                    message=f"Generating variation {i + 1}/{request.variations}...",
+                    current_step=i
+                )
+                logger.info(f"Generating variation {i + 1}/{request.variations}", extra={'extra_fields': {
+                    'job_id': job_id,
+                    'variation': i + 1,
+                    'total_variations': request.variations
+                }})
 
-                        # Add clothing items (from all categories)
-                        for category in clothing_categories:
-                            value = getattr(request, category, None)
-                            if value:
-                                # Handle both single ID and list of IDs
-                                item_ids = value if isinstance(value, list) else [value]
-                                for item_id in item_ids:
-                                    entities.append({
-                                        "entity_type": "clothing_item",
-                                        "entity_id": item_id,
-                                        "role": category
-                                    })
-
-                        # Add style presets
-                        for category in style_categories:
-                            value = getattr(request, category, None)
-                            if value:
+                result = await generator.agenerate(**kwargs)
+                successful_paths.append(str(result.file_path))
+                logger.info(f"Variation {i + 1} complete", extra={'extra_fields': {
+                    'job_id': job_id,
+                    'variation': i + 1,
+                    'file_path': str(result.file_path)
+                }})
+
+                # Save image and entity relationships to database
+                try:
+                    from api.database import get_session
+                    from api.services.image_service import ImageService
+
+                    # Build entity relationships from request parameters
+                    entities = []
+
+                    # Add character as subject
+                    if request.subject_image.startswith("character:"):
+                        character_id = request.subject_image.split(":", 1)[1]
+                        entities.append({
+                            "entity_type": "character",
+                            "entity_id": character_id,
+                            "role": "subject"
+                        })
+
+                    # Add clothing items (from all categories)
+                    for category in CLOTHING_CATEGORIES:
+                        value = getattr(request, category, None)
+                        if value:
+                            # Handle both single ID and list of IDs
+                            item_ids = value if isinstance(value, list) else [value]
+                            for item_id in item_ids:
                                 entities.append({
-                                    "entity_type": "preset",
-                                    "entity_id": value,
+                                    "entity_type": "clothing_item",
+                                    "entity_id": item_id,
                                     "role": category
                                 })
 
-                        # Save to database
-                        async with get_session() as session:
-                            image_service = ImageService(session)
-                            await image_service.create_image_with_relationships(
-                                file_path=str(result.file_path),
-                                entities=entities,
-                                generation_metadata={
-                                    "job_id": job_id,
-                                    "variation": i + 1,
-                                    "generator": "modular",
-                                    "subject_image": request.subject_image
-                                }
-                            )
-
-                        logger.info(f"Saved image to database with {len(entities)} entity relationships", extra={'extra_fields': {
-                            'file_path': str(result.file_path),
-                            'entity_count': len(entities)
-                        }})
-
-                    except Exception as e:
-                        # Log error but don't fail the generation
-                        logger.error(f"Failed to save image to database: {e}", extra={'extra_fields': {
-                            'file_path': str(result.file_path),
-                            'error': str(e)
-                        }})
+                    # Add style presets
+                    for category in STYLE_CATEGORIES:
+                        value = getattr(request, category, None)
+                        if value:
+                            entities.append({
+                                "entity_type": "preset",
+                                "entity_id": value,
+                                "role": category
+                            })
+
+                    # Save to database
+                    async with get_session() as session:
+                        image_service = ImageService(session)
+                        await image_service.create_image_with_relationships(
+                            file_path=str(result.file_path),
+                            entities=entities,
+                            generation_metadata={
+                                "job_id": job_id,
+                                "variation": i + 1,
+                                "generator": "modular",
+                                "subject_image": request.subject_image
+                            }
+                        )
+
+                    logger.info(f"Saved image to database with {len(entities)} entity relationships", extra={'extra_fields': {
+                        'file_path': str(result.file_path),
+                        'entity_count': len(entities)
+                    }})
 
                 except Exception as e:
-                    # Log the error but continue with remaining variations
-                    error_msg = str(e)
-                    failed_items.append({
-                        "variation": i + 1,
-                        "error": error_msg
-                    })
-                    logger.warning(f"Variation {i + 1} failed, continuing with remaining", extra={'extra_fields': {
-                        'job_id': job_id,
-                        'variation': i + 1,
-                        'error': error_msg
+                    # Log error but don't fail the generation
+                    logger.error(f"Failed to save image to database: {e}", extra={'extra_fields': {
+                        'file_path': str(result.file_path),
+                        'error': str(e)
                     }})
 
-            # Determine final status
-            if len(successful_paths) == 0:
-                # All variations failed
-                error_summary = f"All {request.variations} variations failed. Errors: " + "; ".join([f"Variation {item['variation']}: {item['error']}" for item in failed_items])
-                job_manager.fail_job(job_id, error_summary)
-                logger.error(f"All variations failed", extra={'extra_fields': {
-                    'job_id': job_id,
-                    'total_variations': request.variations,
-                    'failed_count': len(failed_items)
-                }})
-            elif len(failed_items) == 0:
-                # All variations succeeded
-                job_manager.complete_job(
-                    job_id,
-                    result={"file_paths": successful_paths}
-                )
-                logger.info(f"All variations generated successfully", extra={'extra_fields': {
-                    'job_id': job_id,
-                    'variations_count': request.variations
-                }})
-            else:
-                # Partial success
-                job_manager.complete_job(
-                    job_id,
-                    result={
-                        "file_paths": successful_paths,
-                        "failed": failed_items,
-                        "summary": f"{len(successful_paths)}/{request.variations} succeeded, {len(failed_items)} failed"
-                    }
-                )
-                logger.warning(f"Partial success", extra={'extra_fields': {
+                job_manager.record_checkpoint(job_id, str(i), {"file_path": str(result.file_path)})
+
+            except Exception as e:
+                # Log the error but continue with remaining variations
+                error_msg = str(e)
+                failed_items.append({
+                    "variation": i + 1,
+                    "error": error_msg
+                })
+                logger.warning(f"Variation {i + 1} failed, continuing with remaining", extra={'extra_fields': {
                     'job_id': job_id,
-                    'succeeded': len(successful_paths),
-                    'failed': len(failed_items),
-                    'total': request.variations
+                    'variation': i + 1,
+                    'error': error_msg
                 }})
 
-        except Exception as e:
-            # Unexpected error in the generation loop itself
-            job_manager.fail_job(job_id, f"Generation failed: {str(e)}")
-            logger.error(f"Generation failed with unexpected error", exc_info=e, extra={'extra_fields': {
+        # Determine final status
+        if len(successful_paths) == 0:
+            # All variations failed
+            error_summary = f"All {request.variations} variations failed. Errors: " + "; ".join([f"Variation {item['variation']}: {item['error']}" for item in failed_items])
+            job_manager.fail_job(job_id, error_summary)
+            logger.error(f"All variations failed", extra={'extra_fields': {
                 'job_id': job_id,
-                'error': str(e)
+                'total_variations': request.variations,
+                'failed_count': len(failed_items)
+            }})
+        elif len(failed_items) == 0:
+            # All variations succeeded
+            job_manager.complete_job(
+                job_id,
+                result={"file_paths": successful_paths}
+            )
+            logger.info(f"All variations generated successfully", extra={'extra_fields': {
+                'job_id': job_id,
+                'variations_count': request.variations
+            }})
+        else:
+            # Partial success
+            job_manager.complete_job(
+                job_id,
+                result={
+                    "file_paths": successful_paths,
+                    "failed": failed_items,
+                    "summary": f"{len(successful_paths)}/{request.variations} succeeded, {len(failed_items)} failed"
+                }
+            )
+            logger.warning(f"Partial success", extra={'extra_fields': {
+                'job_id': job_id,
+                'succeeded': len(successful_paths),
+                'failed': len(failed_items),
+                'total': request.variations
             }})
 
-    # Start generation in background
-    background_tasks.add_task(generate_variations)
-
-    return {
-        "message": "Modular generation started",
-        "status": "queued",
-        "job_id": job_id,
-        "variations": request.variations,
-        "output_dir": "output/generated"
-    }
+    except Exception as e:
+        # Unexpected error in the generation loop itself
+        job_manager.fail_job(job_id, f"Generation failed: {str(e)}")
+        logger.error(f"Generation failed with unexpected error", exc_info=e, extra={'extra_fields': {
+            'job_id': job_id,
+            'error': str(e)
+        }})
 
 
 @router.get("/modular/status/{job_id}")
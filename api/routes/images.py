@@ -4,9 +4,9 @@ Image Routes
 Endpoints for querying generated images and their entity relationships.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Literal
 
 from api.database import get_db
 from api.services.image_service import ImageService
@@ -23,6 +23,8 @@ async def list_images(
     request: Request,
     limit: int = 100,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    count_mode: Literal["exact", "approximate", "none"] = Query("exact"),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -30,17 +32,20 @@ async def list_images(
 
     Args:
         limit: Maximum number of images to return (default: 100)
-        offset: Number of images to skip for pagination (default: 0)
+        offset: Number of images to skip for pagination (default: 0, prefer cursor)
+        cursor: next_cursor from the previous page
+        count_mode: "exact", "approximate" (planner estimate) or "none" (skip counting)
 
     Returns:
-        Dict with images list and metadata
+        Dict with images list and metadata (next_cursor is null on the last page)
 
     **Cached**: 60 seconds
     """
     try:
         image_service = ImageService(db)
-        images = await image_service.list_all_images(limit=limit, offset=offset)
-        total = await image_service.count_all_images()
+        images, next_cursor, total = await image_service.list_images_page(
+            limit=limit, cursor=cursor, offset=offset, count_mode=count_mode
+        )
 
         logger.info(f"Retrieved {len(images)} images", extra={'extra_fields': {
             'count': len(images),
@@ -53,9 +58,12 @@ async def list_images(
             "images": images,
             "total": total,
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": next_cursor
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to list images: {e}", extra={'extra_fields': {
             'error': str(e)
@@ -2,18 +2,21 @@
 
 import asyncio
 import json
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from typing import Optional, List
 
-from api.models.jobs import Job, JobStatus
+from api.models.jobs import JobInfo, JobStatus
 from api.services.job_queue import get_job_queue_manager
+from api.middleware.cache import etag
 
 router = APIRouter()
 
 
-@router.get("", response_model=List[Job])
+@router.get("", response_model=List[JobInfo])
+@etag()
 async def list_jobs(
+    request: Request,
     status: Optional[JobStatus] = Query(None, description="Filter by status"),
     limit: Optional[int] = Query(50, description="Maximum number of jobs to return")
 ):
@@ -23,6 +26,8 @@ async def list_jobs(
     Query params:
     - status: Filter by job status (queued, running, completed, failed, cancelled)
     - limit: Maximum number of jobs to return (default: 50)
+
+    Supports If-None-Match: unchanged lists are answered with 304.
     """
     jobs = get_job_queue_manager().list_jobs(status=status, limit=limit)
     return jobs
@@ -50,7 +55,7 @@ async def stream_jobs():
                     job = await asyncio.wait_for(queue.get(), timeout=30.0)
 
                     # Send job update (mode='json' handles datetime serialization)
-                    job_data = job.model_dump(mode='json')
+                    job_data = job.model_dump(mode='json', include=set(JobInfo.model_fields))
                     yield f"data: {json.dumps(job_data)}\n\n".encode('utf-8')
 
                 except asyncio.TimeoutError:
@@ -75,8 +80,9 @@ async def stream_jobs():
     )
 
 
-@router.get("/{job_id}", response_model=Job)
-async def get_job(job_id: str):
+@router.get("/{job_id}", response_model=JobInfo)
+@etag()
+async def get_job(request: Request, job_id: str):
     """Get specific job details"""
     try:
         job = get_job_queue_manager().get_job(job_id)
@@ -85,7 +91,7 @@ async def get_job(job_id: str):
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.post("/{job_id}/cancel", response_model=Job)
+@router.post("/{job_id}/cancel", response_model=JobInfo)
 async def cancel_job(job_id: str):
     """Cancel a running job"""
     try:
@@ -4,7 +4,7 @@ Preset Routes
 Endpoints for managing presets (CRUD operations).
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request
 from fastapi.responses import FileResponse
 from typing import List
 from pathlib import Path
@@ -13,12 +13,15 @@ from api.logging_config import get_logger
 from api.models.requests import PresetCreate, PresetUpdate
 from api.models.responses import PresetListResponse, PresetInfo
 from api.services import PresetService
+from api.services.job_queue import resumable
+from api.middleware.cache import etag
 
 router = APIRouter()
 logger = get_logger(__name__)
 preset_service = PresetService()
 
 
+@resumable("preset_preview")
 async def run_preview_generation_job(job_id: str, category: str, preset_id: str):
     """Background task to generate preview and update job"""
     from ai_tools.shared.visualizer import PresetVisualizer
@@ -80,6 +83,32 @@ async def run_preview_generation_job(job_id: str, category: str, preset_id: str)
         get_job_queue_manager().fail_job(job_id, str(e))
 
 
+def queue_preset_preview(category: str, preset_id: str, preset_name: str) -> str:
+    """
+    Queue preview generation for a preset created by another job or route
+
+    Runs the "preset_preview" handler through dispatch_job, so it can go to
+    the worker tier and be resumed after a crash. Call from async code.
+
+    Returns:
+        The preview job's ID
+    """
+    from api.services.job_queue import get_job_queue_manager
+    from api.models.jobs import JobType
+
+    job_manager = get_job_queue_manager()
+    job_id = job_manager.create_job(
+        job_type=JobType.GENERATE_IMAGE,
+        title=f"Preview: {preset_name}",
+        description=f"Category: {category}",
+        resume_handler="preset_preview",
+        resume_params={"category": category, "preset_id": preset_id}
+    )
+    job_manager.dispatch_job(job_id)
+    return job_id
+
+
+@resumable("preset_test_image")
 async def run_test_generation_job(job_id: str, category: str, preset_id: str):
     """Background task to generate test image and update job"""
     from ai_tools.modular_image_generator.tool import ModularImageGenerator
@@ -130,7 +159,8 @@ async def run_test_generation_job(job_id: str, category: str, preset_id: str):
 
 
 @router.get("/batch")
-async def get_all_presets():
+@etag()
+async def get_all_presets(request: Request):
     """
     Get all presets across all categories in a single request
 
@@ -168,7 +198,8 @@ async def list_categories():
 
 
 @router.get("/{category}", response_model=PresetListResponse)
-async def list_presets_in_category(category: str):
+@etag()
+async def list_presets_in_category(request: Request, category: str):
     """
     List all presets in a category
 
@@ -263,14 +294,14 @@ async def update_preset(
 
 
 @router.delete("/{category}/{preset_id}", response_model=dict)
-async def delete_preset(category: str, preset_id: str):
+async def delete_preset(category: str, preset_id: str, background_tasks: BackgroundTasks):
     """
     Delete a preset by ID
 
     Permanently deletes the specified preset.
     """
     try:
-        preset_service.delete_preset(category, preset_id)
+        preset_service.delete_preset(category, preset_id, background_tasks=background_tasks)
         return {
             "message": "Preset deleted successfully",
             "category": category,
@@ -361,12 +392,14 @@ async def generate_preset_preview(
     job_id = get_job_queue_manager().create_job(
         job_type=JobType.GENERATE_IMAGE,
         title=f"Generating {category} preview",
-        description=f"Preset ID: {preset_id}"
+        description=f"Preset ID: {preset_id}",
+        resume_handler="preset_preview",
+        resume_params={"category": category, "preset_id": preset_id}
     )
     logger.info(f"Created job {job_id} for preview generation")
 
     # Queue background task
-    background_tasks.add_task(run_preview_generation_job, job_id, category, preset_id)
+    get_job_queue_manager().dispatch_job(job_id, background_tasks)
     logger.info(f"Queued preview generation task for {category}/{preset_id} (Job: {job_id})")
 
     return {
@@ -412,11 +445,13 @@ async def generate_test_image(
     job_id = get_job_queue_manager().create_job(
         job_type=JobType.GENERATE_IMAGE,
         title=f"Test image: {category}",
-        description=f"Preset ID: {preset_id}"
+        description=f"Preset ID: {preset_id}",
+        resume_handler="preset_test_image",
+        resume_params={"category": category, "preset_id": preset_id}
     )
 
     # Queue background task
-    background_tasks.add_task(run_test_generation_job, job_id, category, preset_id)
+    get_job_queue_manager().dispatch_job(job_id, background_tasks)
 
     return {
         "job_id": job_id,
@@ -4,13 +4,14 @@ Q&A Routes
 Generic Q&A endpoints supporting document-grounded and general knowledge questions.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
 from api.services.qa_service import QAService
 from api.models.auth import User
 from api.dependencies.auth import get_current_active_user
+from api.middleware.cache import etag
 from ai_tools.document_qa import DocumentQA
 
 router = APIRouter()
@@ -151,7 +152,9 @@ async def ask_question(
 
 
 @router.get("/", response_model=QAListResponse)
+@etag()
 async def list_qas(
+    request: Request,
     game_id: Optional[str] = None,
     context_type: Optional[str] = None,
     is_favorite: Optional[bool] = None,
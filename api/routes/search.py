@@ -0,0 +1,98 @@
+"""
+Search Routes
+
+Ranked full-text search and search-as-you-type across characters, clothing
+items and board games.
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import Optional, List, Dict
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.database import get_db
+from api.models.auth import User
+from api.dependencies.auth import get_current_active_user
+from api.services.search_service import SearchService
+
+router = APIRouter()
+
+
+class SearchResult(BaseModel):
+    """One ranked search hit"""
+    entity_id: str
+    name: str
+    rank: float
+    snippet: Optional[str] = None
+
+
+class SearchResponse(BaseModel):
+    """Ranked search results per entity type"""
+    query: str
+    results: Dict[str, List[SearchResult]]
+
+
+class Suggestion(BaseModel):
+    """Search-as-you-type suggestion"""
+    entity_type: str
+    entity_id: str
+    name: str
+
+
+class SuggestResponse(BaseModel):
+    """Search-as-you-type suggestions"""
+    query: str
+    suggestions: List[Suggestion]
+
+
+def _parse_types(types: Optional[str]) -> Optional[List[str]]:
+    return [t.strip() for t in types.split(",") if t.strip()] if types else None
+
+
+@router.get("/", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    types: Optional[str] = Query(None, description="Comma-separated entity types (characters, clothing_items, board_games)"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum results per entity type"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_active_user)
+):
+    """
+    Ranked full-text search
+
+    Results are ordered by relevance (ts_rank plus name similarity) and
+    include a snippet with matches wrapped in <mark>. Snippets are safe
+    HTML: the entity text in them is escaped.
+    """
+    service = SearchService(db, user_id=current_user.id if current_user else None)
+
+    try:
+        results = await service.search(q, entity_types=_parse_types(types), limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return SearchResponse(query=q, results=results)
+
+
+@router.get("/suggest", response_model=SuggestResponse)
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100, description="Partial search text"),
+    types: Optional[str] = Query(None, description="Comma-separated entity types (characters, clothing_items, board_games)"),
+    limit: int = Query(8, ge=1, le=25, description="Maximum suggestions per entity type"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_active_user)
+):
+    """
+    Search-as-you-type suggestions
+
+    Returns names only (no snippets) so each keystroke is a cheap GIN
+    index lookup.
+    """
+    service = SearchService(db, user_id=current_user.id if current_user else None)
+
+    try:
+        suggestions = await service.suggest(q, entity_types=_parse_types(types), limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return SuggestResponse(query=q, suggestions=suggestions)
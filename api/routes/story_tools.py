@@ -11,7 +11,7 @@ from pydantic import BaseModel
 
 from api.models.jobs import JobType
 from api.models.auth import User
-from api.services.job_queue import get_job_queue_manager
+from api.services.job_queue import get_job_queue_manager, resumable
 from api.dependencies.auth import get_current_active_user
 from api.agents.story_planner import StoryPlannerAgent
 from api.agents.story_writer import StoryWriterAgent
@@ -89,8 +89,10 @@ async def list_story_tools():
 
 
 # Story Planner
-async def run_planner_job(job_id: str, request: StoryPlannerRequest):
+@resumable("story_planner")
+async def run_planner_job(job_id: str, request_data: Dict[str, Any]):
     """Background task to run story planner"""
+    request = StoryPlannerRequest(**request_data)
     job_manager = get_job_queue_manager()
 
     try:
@@ -135,10 +137,12 @@ async def plan_story(
         job_id = get_job_queue_manager().create_job(
             job_type=JobType.WORKFLOW,
             title=f"Plan Story: {character_name}",
-            description=f"{request.theme.capitalize()} story planning"
+            description=f"{request.theme.capitalize()} story planning",
+            resume_handler="story_planner",
+            resume_params={"request_data": request.model_dump()}
         )
 
-        background_tasks.add_task(run_planner_job, job_id, request)
+        get_job_queue_manager().dispatch_job(job_id, background_tasks)
 
         return ToolResponse(
             status="queued",
@@ -174,8 +178,10 @@ async def plan_story(
 
 
 # Story Writer
-async def run_writer_job(job_id: str, request: StoryWriterRequest):
+@resumable("story_writer")
+async def run_writer_job(job_id: str, request_data: Dict[str, Any]):
     """Background task to run story writer"""
+    request = StoryWriterRequest(**request_data)
     job_manager = get_job_queue_manager()
 
     try:
@@ -216,10 +222,12 @@ async def write_story(
         job_id = get_job_queue_manager().create_job(
             job_type=JobType.WORKFLOW,
             title=f"Write Story: {outline_title}",
-            description="Writing full narrative"
+            description="Writing full narrative",
+            resume_handler="story_writer",
+            resume_params={"request_data": request.model_dump()}
         )
 
-        background_tasks.add_task(run_writer_job, job_id, request)
+        get_job_queue_manager().dispatch_job(job_id, background_tasks)
 
         return ToolResponse(
             status="queued",
@@ -254,8 +262,10 @@ async def write_story(
 
 
 # Story Illustrator
-async def run_illustrator_job(job_id: str, request: StoryIllustratorRequest):
+@resumable("story_illustrator")
+async def run_illustrator_job(job_id: str, request_data: Dict[str, Any]):
     """Background task to run story illustrator"""
+    request = StoryIllustratorRequest(**request_data)
     job_manager = get_job_queue_manager()
 
     try:
@@ -297,10 +307,12 @@ async def illustrate_story(
         job_id = get_job_queue_manager().create_job(
             job_type=JobType.WORKFLOW,
             title=f"Illustrate Story: {story_title}",
-            description=f"Generating {request.max_illustrations} illustrations"
+            description=f"Generating {request.max_illustrations} illustrations",
+            resume_handler="story_illustrator",
+            resume_params={"request_data": request.model_dump()}
         )
 
-        background_tasks.add_task(run_illustrator_job, job_id, request)
+        get_job_queue_manager().dispatch_job(job_id, background_tasks)
 
         return ToolResponse(
             status="queued",
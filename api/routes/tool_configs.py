@@ -11,13 +11,12 @@ from typing import Optional, Dict, Any, List
 from pathlib import Path
 import yaml
 import aiofiles
-import threading
 
 from api.logging_config import get_logger
 from api.models.auth import User
 from api.models.jobs import JobType
 from api.dependencies.auth import get_current_active_user
-from api.services.job_queue import get_job_queue_manager
+from api.services.job_queue import get_job_queue_manager, resumable
 from api.config import settings
 
 router = APIRouter()
@@ -244,13 +243,15 @@ async def update_tool_config(
     return {"message": "Tool configuration updated successfully"}
 
 
+@resumable("tool_test")
 async def run_tool_test_job(
     job_id: str,
     tool_name: str,
-    temp_path: Path,
+    temp_path: str,
     user_id: Optional[int] = None
 ):
     """Background task to run tool test and update job"""
+    temp_path = Path(temp_path)
     try:
         get_job_queue_manager().start_job(job_id)
         get_job_queue_manager().update_progress(job_id, 0.1, "Loading tool configuration...")
@@ -326,7 +327,7 @@ async def run_tool_test_job(
         })
 
         # Auto-generate preview for preset-based analyzers
-        from api.routes.tools import PRESET_ANALYZERS, run_preset_preview_generation_job
+        from api.routes.tools import PRESET_ANALYZERS
         if tool_name in PRESET_ANALYZERS and isinstance(result_dict, dict):
             preset_id = result_dict.get("preset_id")
             name = result_dict.get("name") or result_dict.get("title", "Preset")
@@ -339,18 +340,8 @@ async def run_tool_test_job(
                     'preset_id': preset_id
                 }})
 
-                preview_job_id = get_job_queue_manager().create_job(
-                    job_type=JobType.GENERATE_IMAGE,
-                    title=f"Preview: {name}",
-                    description=f"Category: {category}"
-                )
-
-                thread = threading.Thread(
-                    target=run_preset_preview_generation_job,
-                    args=(preview_job_id, category, preset_id, name)
-                )
-                thread.daemon = True
-                thread.start()
+                from api.routes.presets import queue_preset_preview
+                queue_preset_preview(category, preset_id, name)
 
         # For outfit analyzer, automatically queue preview generation for clothing items
         if tool_name == "outfit_analyzer" and isinstance(result_dict, dict):
@@ -359,27 +350,11 @@ async def run_tool_test_job(
                 logger.info("Auto-generating previews for clothing items", extra={'extra_fields': {'item_count': len(clothing_items)}})
 
                 # Import here to avoid circular dependency
-                from api.routes.clothing_items import run_preview_generation_job
+                from api.routes.clothing_items import queue_clothing_item_preview
 
                 for item in clothing_items:
-                    item_id = item.get("item_id")
-                    if item_id:
-                        # Create job for this item's preview
-                        preview_job_id = get_job_queue_manager().create_job(
-                            job_type=JobType.GENERATE_IMAGE,
-                            title=f"Preview: {item.get('item', 'Clothing Item')}",
-                            description=f"Category: {item.get('category', 'unknown')}"
-                        )
-
-                        # Run preview generation in a thread to avoid blocking
-                        import threading
-                        thread = threading.Thread(
-                            target=run_preview_generation_job,
-                            args=(preview_job_id, item_id)
-                        )
-                        thread.daemon = True
-                        thread.start()
-
+                    if item.get("item_id"):
+                        preview_job_id = queue_clothing_item_preview(item)
                         logger.info(f"   Queued preview for {item.get('item')} (job: {preview_job_id[:8]}...)")
 
     except Exception as e:
@@ -431,17 +406,17 @@ async def test_tool(
         job_id = get_job_queue_manager().create_job(
             job_type=JobType.ANALYZE,
             title=f"Testing {display_name}",
-            description=f"Image: {image.filename}"
+            description=f"Image: {image.filename}",
+            resume_handler="tool_test",
+            resume_params={
+                "tool_name": tool_name,
+                "temp_path": str(temp_path),
+                "user_id": current_user.id if current_user else None
+            }
         )
 
         # Queue background task
-        background_tasks.add_task(
-            run_tool_test_job,
-            job_id,
-            tool_name,
-            temp_path,
-            current_user.id if current_user else None
-        )
+        get_job_queue_manager().dispatch_job(job_id, background_tasks)
 
         # Return job info
         return {
@@ -511,7 +486,7 @@ async def test_tool(
         result_dict = result.model_dump()
 
         # Auto-generate preview for preset-based analyzers (sync mode)
-        from api.routes.tools import PRESET_ANALYZERS, run_preset_preview_generation_job
+        from api.routes.tools import PRESET_ANALYZERS
         if tool_name in PRESET_ANALYZERS and isinstance(result_dict, dict):
             preset_id = result_dict.get("preset_id")
             name = result_dict.get("name") or result_dict.get("title", "Preset")
@@ -524,18 +499,8 @@ async def test_tool(
                     'preset_id': preset_id
                 }})
 
-                preview_job_id = get_job_queue_manager().create_job(
-                    job_type=JobType.GENERATE_IMAGE,
-                    title=f"Preview: {name}",
-                    description=f"Category: {category}"
-                )
-
-                thread = threading.Thread(
-                    target=run_preset_preview_generation_job,
-                    args=(preview_job_id, category, preset_id, name)
-                )
-                thread.daemon = True
-                thread.start()
+                from api.routes.presets import queue_preset_preview
+                queue_preset_preview(category, preset_id, name)
 
         return {
             "status": "success",
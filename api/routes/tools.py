@@ -10,12 +10,11 @@ from typing import Optional
 from pathlib import Path
 import aiofiles
 import uuid
-import threading
 
 from api.models.auth import User
 from api.models.jobs import JobType
 from api.dependencies.auth import get_current_active_user
-from api.services.job_queue import get_job_queue_manager
+from api.services.job_queue import get_job_queue_manager, resumable
 from api.config import settings
 from api.logging_config import get_logger
 
@@ -35,79 +34,15 @@ PRESET_ANALYZERS = {
 }
 
 
-def run_preset_preview_generation_job(job_id: str, category: str, preset_id: str, preset_name: str):
-    """Background task to generate preset preview image"""
-    try:
-        get_job_queue_manager().start_job(job_id)
-        get_job_queue_manager().update_progress(job_id, 0.2, "Loading preset...")
-
-        # Import here to avoid circular imports
-        from ai_tools.shared.visualizer import PresetVisualizer
-        from api.services.visualization_config_service import VisualizationConfigService
-
-        # Load preset data
-        preset_path = settings.presets_dir / category / f"{preset_id}.json"
-        if not preset_path.exists():
-            get_job_queue_manager().fail_job(job_id, f"Preset not found: {preset_id}")
-            return
-
-        import json
-        with open(preset_path, 'r') as f:
-            preset_data = json.load(f)
-
-        get_job_queue_manager().update_progress(job_id, 0.3, "Loading visualization config...")
-
-        # Load visualization config for this entity type
-        viz_service = VisualizationConfigService()
-
-        # Convert category to entity_type (e.g., "expressions" -> "expression")
-        entity_type = category.rstrip('s') if category.endswith('s') else category
-
-        # Get default visualization config for this entity type
-        viz_config = viz_service.get_default_config(entity_type)
-
-        if not viz_config:
-            logger.warning(f"No visualization config found for {entity_type}, using defaults")
-            viz_config = None
-
-        get_job_queue_manager().update_progress(job_id, 0.4, "Generating preview image...")
-
-        # Generate preview using visualizer with config
-        visualizer = PresetVisualizer()
-        output_path = settings.presets_dir / category / f"{preset_id}_preview.png"
-
-        visualizer.create_preset_preview(
-            preset_data=preset_data,
-            output_path=str(output_path),
-            category=category,
-            viz_config=viz_config  # Pass the visualization config
-        )
-
-        get_job_queue_manager().update_progress(job_id, 0.9, "Finalizing...")
-        get_job_queue_manager().complete_job(job_id, {
-            "status": "success",
-            "preview_path": str(output_path),
-            "preset_id": preset_id
-        })
-
-        logger.info(f"Generated preview for {category}/{preset_id}", extra={'extra_fields': {
-            'category': category,
-            'preset_id': preset_id,
-            'output_path': str(output_path)
-        }})
-
-    except Exception as e:
-        logger.error(f"Preview generation failed: {e}", exc_info=e)
-        get_job_queue_manager().fail_job(job_id, str(e))
-
-
+@resumable("tool_analyzer")
 async def run_analyzer_job(
     job_id: str,
     tool_name: str,
-    temp_path: Path,
+    temp_path: str,
     user_id: Optional[int] = None
 ):
     """Background task to run analyzer and update job"""
+    temp_path = Path(temp_path)
     try:
         get_job_queue_manager().start_job(job_id)
         get_job_queue_manager().update_progress(job_id, 0.1, "Loading configuration...")
@@ -196,18 +131,8 @@ async def run_analyzer_job(
                     'preset_id': preset_id
                 }})
 
-                preview_job_id = get_job_queue_manager().create_job(
-                    job_type=JobType.GENERATE_IMAGE,
-                    title=f"Preview: {name}",
-                    description=f"Category: {category}"
-                )
-
-                thread = threading.Thread(
-                    target=run_preset_preview_generation_job,
-                    args=(preview_job_id, category, preset_id, name)
-                )
-                thread.daemon = True
-                thread.start()
+                from api.routes.presets import queue_preset_preview
+                queue_preset_preview(category, preset_id, name)
 
         # For outfit analyzer, automatically queue preview generation for clothing items
         if tool_name == "outfit_analyzer" and isinstance(result_dict, dict):
@@ -215,24 +140,11 @@ async def run_analyzer_job(
             if clothing_items:
                 logger.info("Auto-generating previews for clothing items", extra={'extra_fields': {'item_count': len(clothing_items)}})
 
-                from api.routes.clothing_items import run_preview_generation_job
-                import threading
+                from api.routes.clothing_items import queue_clothing_item_preview
 
                 for item in clothing_items:
-                    item_id = item.get("item_id")
-                    if item_id:
-                        preview_job_id = get_job_queue_manager().create_job(
-                            job_type=JobType.GENERATE_IMAGE,
-                            title=f"Preview: {item.get('item', 'Clothing Item')}",
-                            description=f"Category: {item.get('category', 'unknown')}"
-                        )
-
-                        thread = threading.Thread(
-                            target=run_preview_generation_job,
-                            args=(preview_job_id, item_id)
-                        )
-                        thread.daemon = True
-                        thread.start()
+                    if item.get("item_id"):
+                        queue_clothing_item_preview(item)
 
     except Exception as e:
         logger.error(f"Analyzer job failed: {e}", exc_info=e)
@@ -292,16 +204,16 @@ async def run_analyzer(
         job_id = get_job_queue_manager().create_job(
             job_type=JobType.ANALYZE,
             title=f"{display_name} Analysis",
-            description=f"Image: {image.filename}"
+            description=f"Image: {image.filename}",
+            resume_handler="tool_analyzer",
+            resume_params={
+                "tool_name": tool_name,
+                "temp_path": str(temp_path),
+                "user_id": current_user.id if current_user else None
+            }
         )
 
-        background_tasks.add_task(
-            run_analyzer_job,
-            job_id,
-            tool_name,
-            temp_path,
-            current_user.id if current_user else None
-        )
+        get_job_queue_manager().dispatch_job(job_id, background_tasks)
 
         return {
             "job_id": job_id,
@@ -376,18 +288,8 @@ async def run_analyzer(
                     'preset_id': preset_id
                 }})
 
-                preview_job_id = get_job_queue_manager().create_job(
-                    job_type=JobType.GENERATE_IMAGE,
-                    title=f"Preview: {name}",
-                    description=f"Category: {category}"
-                )
-
-                thread = threading.Thread(
-                    target=run_preset_preview_generation_job,
-                    args=(preview_job_id, category, preset_id, name)
-                )
-                thread.daemon = True
-                thread.start()
+                from api.routes.presets import queue_preset_preview
+                queue_preset_preview(category, preset_id, name)
 
         return {"status": "success", "result": result_dict}
 
@@ -3,7 +3,9 @@
 Handles user authentication, password hashing, and JWT token management using PostgreSQL.
 """
 
-import bcrypt
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +16,27 @@ from api.config import settings
 from api.models.auth import UserInDB, TokenData, User
 from api.models.db import User as DBUser
 from api.repositories.user_repository import UserRepository
+from api.services.cache_service import LocalCache, get_cache_service
+from api.services.password_hasher import (
+    PasswordHasherBusyError,
+    get_password_hasher,
+    hash_password_sync,
+    verify_password_sync
+)
+from api.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Verified tokens (signature + claims) per worker, so hot requests skip jwt.decode
+_verified_tokens = LocalCache(max_size=settings.auth_token_cache_size)
+
+# Longest a verified token stays memoized (it never outlives its exp claim)
+TOKEN_CACHE_MAX_SECONDS = 300
+
+
+def user_cache_tag(username: str) -> str:
+    """L1 cache tag for everything cached about a user's identity"""
+    return f"auth-user:{username}"
 
 
 class AuthServiceDB:
@@ -23,28 +46,9 @@ class AuthServiceDB:
         self.session = session
         self.repository = UserRepository(session)
 
-    def _truncate_password(self, password: str) -> bytes:
-        """
-        Truncate password to 72 bytes for bcrypt compatibility
-
-        Bcrypt has a maximum password length of 72 bytes. This method
-        automatically truncates longer passwords to prevent errors.
-
-        Args:
-            password: Plain text password
-
-        Returns:
-            Password as bytes, truncated to 72 bytes if necessary
-        """
-        # Encode to bytes and truncate to 72 bytes
-        password_bytes = password.encode('utf-8')
-        if len(password_bytes) > 72:
-            password_bytes = password_bytes[:72]
-        return password_bytes
-
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
-        Verify a password against its hash
+        Verify a password against its hash (blocking - use averify_password in async code)
 
         Automatically handles bcrypt's 72-byte limit by truncating if necessary.
 
@@ -55,16 +59,11 @@ class AuthServiceDB:
         Returns:
             True if password matches, False otherwise
         """
-        try:
-            password_bytes = self._truncate_password(plain_password)
-            hash_bytes = hashed_password.encode('utf-8')
-            return bcrypt.checkpw(password_bytes, hash_bytes)
-        except Exception:
-            return False
+        return verify_password_sync(plain_password, hashed_password)
 
     def get_password_hash(self, password: str) -> str:
         """
-        Hash a password using bcrypt
+        Hash a password using bcrypt (blocking - use aget_password_hash in async code)
 
         Automatically handles bcrypt's 72-byte limit by truncating if necessary.
 
@@ -74,10 +73,25 @@ class AuthServiceDB:
         Returns:
             Bcrypt hash string
         """
-        password_bytes = self._truncate_password(password)
-        salt = bcrypt.gensalt()
-        hash_bytes = bcrypt.hashpw(password_bytes, salt)
-        return hash_bytes.decode('utf-8')
+        return hash_password_sync(password, settings.bcrypt_rounds)
+
+    async def averify_password(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password on the password hashing thread pool
+
+        Raises:
+            PasswordHasherBusyError: If too many password operations are in flight
+        """
+        return await get_password_hasher().verify(plain_password, hashed_password)
+
+    async def aget_password_hash(self, password: str) -> str:
+        """
+        Hash a password on the password hashing thread pool
+
+        Raises:
+            PasswordHasherBusyError: If too many password operations are in flight
+        """
+        return await get_password_hasher().hash(password)
 
     def _user_to_dict(self, user: DBUser, include_password: bool = False) -> Dict[str, Any]:
         """Convert User model to dict"""
@@ -143,7 +157,7 @@ class AuthServiceDB:
             username=username,
             email=email or f"{username}@example.com",  # Email is required in DB
             full_name=full_name,
-            hashed_password=self.get_password_hash(password),
+            hashed_password=await self.aget_password_hash(password),
             disabled=False,
             created_at=datetime.utcnow(),
             last_login=None
@@ -165,15 +179,27 @@ class AuthServiceDB:
 
         Returns:
             User object if authentication successful, None otherwise
+
+        Raises:
+            PasswordHasherBusyError: If too many password operations are in flight
         """
         user = await self.repository.get_by_username(username)
         if not user:
             return None
-        if not self.verify_password(password, user.hashed_password):
+        if not await self.averify_password(password, user.hashed_password):
             return None
         if user.disabled:
             return None
 
+        # Upgrade hashes made with a different work factor while we have the password
+        if get_password_hasher().needs_rehash(user.hashed_password):
+            try:
+                user.hashed_password = await self.aget_password_hash(password)
+                logger.info(f"Rehashed password for {username} with cost {settings.bcrypt_rounds}")
+            except PasswordHasherBusyError:
+                # The credentials were correct; upgrade on a later login instead of failing this one
+                logger.warning(f"Password hasher busy, deferring rehash for {username}")
+
         # Update last login
         user.last_login = datetime.utcnow()
         await self.repository.update(user)
@@ -202,7 +228,7 @@ class AuthServiceDB:
                 minutes=settings.jwt_access_token_expire_minutes
             )
 
-        to_encode.update({"exp": expire, "type": "access"})
+        to_encode.update({"exp": expire, "type": "access", "jti": uuid.uuid4().hex})
         encoded_jwt = jwt.encode(
             to_encode,
             settings.jwt_secret_key,
@@ -222,7 +248,7 @@ class AuthServiceDB:
         """
         to_encode = data.copy()
         expire = datetime.utcnow() + timedelta(days=settings.jwt_refresh_token_expire_days)
-        to_encode.update({"exp": expire, "type": "refresh"})
+        to_encode.update({"exp": expire, "type": "refresh", "jti": uuid.uuid4().hex})
         encoded_jwt = jwt.encode(
             to_encode,
             settings.jwt_secret_key,
@@ -230,7 +256,8 @@ class AuthServiceDB:
         )
         return encoded_jwt
 
-    def verify_token(self, token: str, token_type: str = "access") -> Optional[TokenData]:
+    @staticmethod
+    def verify_token(token: str, token_type: str = "access") -> Optional[TokenData]:
         """
         Verify and decode JWT token
 
@@ -238,9 +265,17 @@ class AuthServiceDB:
             token: JWT token string
             token_type: Expected token type ("access" or "refresh")
 
+        Successful verifications are memoized per worker until the token
+        expires (at most TOKEN_CACHE_MAX_SECONDS).
+
         Returns:
             TokenData if valid, None otherwise
         """
+        cache_key = f"{token_type}:{token}"
+        token_data = _verified_tokens.get(cache_key)
+        if token_data is not None:
+            return token_data
+
         try:
             payload = jwt.decode(
                 token,
@@ -249,7 +284,8 @@ class AuthServiceDB:
             )
 
             username: str = payload.get("sub")
-            exp: datetime = datetime.fromtimestamp(payload.get("exp"))
+            exp_timestamp = payload.get("exp")
+            exp: datetime = datetime.fromtimestamp(exp_timestamp)
             token_type_in_payload: str = payload.get("type")
 
             if username is None:
@@ -257,7 +293,15 @@ class AuthServiceDB:
             if token_type_in_payload != token_type:
                 return None
 
-            return TokenData(username=username, exp=exp)
+            # Tokens issued before jti was added are identified by their hash
+            token_id = payload.get("jti") or hashlib.sha256(token.encode()).hexdigest()[:32]
+            token_data = TokenData(username=username, exp=exp, token_id=token_id)
+
+            ttl = min(exp_timestamp - time.time(), TOKEN_CACHE_MAX_SECONDS)
+            if ttl > 0:
+                _verified_tokens.set(cache_key, token_data, ttl)
+
+            return token_data
 
         except JWTError:
             return None
@@ -284,6 +328,7 @@ class AuthServiceDB:
         if user:
             await self.repository.delete(user)
             await self.session.commit()
+            await self.invalidate_cached_user(username)
             return True
         return False
 
@@ -310,6 +355,16 @@ class AuthServiceDB:
 
         await self.repository.update(user)
         await self.session.commit()
+        await self.invalidate_cached_user(username)
 
         user_dict = self._user_to_dict(user)
         return User(**user_dict)
+
+    async def invalidate_cached_user(self, username: str):
+        """
+        Evict a user's cached identity in every worker
+
+        Called after update/delete/disable so get_current_user stops serving
+        the old record (other workers are told through Redis when available).
+        """
+        await get_cache_service().invalidate_local([user_cache_tag(username)])
@@ -7,12 +7,13 @@ Replaces JSON file storage with relational database.
 
 import uuid
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.models.db import BoardGame
 from api.repositories import BoardGameRepository
+from api.repositories.statements import json_merge
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -186,6 +187,32 @@ class BoardGameServiceDB:
         )
         return [self._board_game_to_dict(game) for game in board_games]
 
+    async def list_board_games_page(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        List board games together with the total count, in a single query
+
+        Args:
+            limit: Maximum number of board games to return
+            offset: Number of board games to skip
+
+        Returns:
+            Tuple of (board game data dicts, total number of board games)
+        """
+        board_games, total = await self.repository.get_page(
+            user_id=self.user_id,
+            limit=limit,
+            offset=offset
+        )
+        if total is None:
+            # Empty page: nothing carried the total
+            total = await self.count_board_games() if offset else 0
+
+        return [self._board_game_to_dict(game) for game in board_games], total
+
     async def update_board_game(
         self,
         game_id: str,
@@ -221,42 +248,29 @@ class BoardGameServiceDB:
         Returns:
             Updated board game data dict or None if not found
         """
-        board_game = await self.repository.get_by_id(game_id)
+        # Update only the provided fields (user filter makes other users' games "not found")
+        changes = {
+            "name": name,
+            "designer": designer,
+            "publisher": publisher,
+            "year": year,
+            "description": description,
+            "player_count_min": player_count_min,
+            "player_count_max": player_count_max,
+            "playtime_min": playtime_min,
+            "playtime_max": playtime_max,
+            "complexity": complexity,
+        }
+        values = {field: value for field, value in changes.items() if value is not None}
+        if metadata is not None:
+            values["meta"] = json_merge(BoardGame.meta, metadata)  # Merged into existing metadata
+        values["updated_at"] = datetime.utcnow()
 
-        if not board_game:
-            return None
+        board_game = await self.repository.update_fields(game_id, values, user_id=self.user_id)
 
-        # Check user permission
-        if self.user_id and board_game.user_id != self.user_id:
+        if not board_game:
             return None
 
-        # Update fields if provided
-        if name is not None:
-            board_game.name = name
-        if designer is not None:
-            board_game.designer = designer
-        if publisher is not None:
-            board_game.publisher = publisher
-        if year is not None:
-            board_game.year = year
-        if description is not None:
-            board_game.description = description
-        if player_count_min is not None:
-            board_game.player_count_min = player_count_min
-        if player_count_max is not None:
-            board_game.player_count_max = player_count_max
-        if playtime_min is not None:
-            board_game.playtime_min = playtime_min
-        if playtime_max is not None:
-            board_game.playtime_max = playtime_max
-        if complexity is not None:
-            board_game.complexity = complexity
-        if metadata is not None:
-            board_game.meta.update(metadata)  # Note: 'meta' in DB
-
-        board_game.updated_at = datetime.utcnow()
-
-        board_game = await self.repository.update(board_game)
         await self.session.commit()
 
         logger.info(f"Updated board game: {game_id}", extra={'extra_fields': {
@@ -275,16 +289,8 @@ class BoardGameServiceDB:
         Returns:
             True if deleted, False if not found
         """
-        board_game = await self.repository.get_by_id(game_id)
-
-        if not board_game:
-            return False
-
-        # Check user permission
-        if self.user_id and board_game.user_id != self.user_id:
-            return False
-
-        success = await self.repository.delete(game_id)
+        # Single DELETE; the user filter makes other users' games "not found"
+        success = await self.repository.delete(game_id, user_id=self.user_id)
 
         if success:
             await self.session.commit()
@@ -2,37 +2,254 @@
 Response Caching Service
 
 Provides Redis-based caching for API responses with:
+- Process-local L1 LRU in front of Redis (L2) with short TTLs
+- Non-blocking redis.asyncio client on a shared connection pool
+- Degraded mode (caching skipped) while Redis is unreachable
 - Automatic cache key generation
 - TTL configuration per endpoint type
-- Cache invalidation patterns
+- Pre-serialized response bodies (plus gzip/brotli variants and ETag), so
+  hits are served without any JSON work
+- Tag-based invalidation (entity type, entity id, endpoint, user)
+- Optional generation-counter namespacing per entity type
 - Hit/miss metrics tracking
+
+Every cached entry is registered in Redis tag sets when it is written, so
+invalidation deletes exactly the tagged keys (O(affected keys)) instead of
+scanning the keyspace, and works for long keys that were MD5-hashed.
+Invalidations are also broadcast over Redis pub/sub so every worker evicts
+the affected entries from its L1.
 """
 
+import asyncio
+import fnmatch
+import gzip
 import json
 import hashlib
-from typing import Optional, Any, Dict, List
+import math
+import random
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional, Any, Dict, List, Iterable
 from datetime import datetime, timedelta
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Deletes a lock only if it is still held by the caller's token
+_RELEASE_LOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Deletes every key listed in the given tag sets, then the tag sets themselves.
+# Runs atomically so an entry cached concurrently can't lose its tag membership.
+_INVALIDATE_TAGS_LUA = """
+local deleted = 0
+for _, tag in ipairs(KEYS) do
+    local members = redis.call('SMEMBERS', tag)
+    for i = 1, #members, 500 do
+        deleted = deleted + redis.call('DEL', unpack(members, i, math.min(i + 499, #members)))
+    end
+    redis.call('DEL', tag)
+end
+return deleted
+"""
+
+
+def render_json(content: Any) -> bytes:
+    """Encode content the way JSONResponse does (default=str handles datetime)"""
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8")
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a response body (compressed variants append -<coding>)"""
+    return f'"{hashlib.md5(body).hexdigest()}"'
+
+
+class CachedEntry:
+    """A cached response body with its freshness metadata"""
+
+    __slots__ = ("body", "media_type", "etag", "encodings", "fresh_until", "delta")
+
+    def __init__(
+        self,
+        body: bytes,
+        fresh_until: float,
+        delta: float = 0.0,
+        media_type: str = "application/json",
+        etag: Optional[str] = None,
+        encodings: Optional[Dict[str, bytes]] = None
+    ):
+        """
+        Args:
+            body: Encoded response body
+            fresh_until: Unix timestamp after which the value is stale
+            delta: Seconds it took to compute the value
+            media_type: Response content type
+            etag: Entity tag of the body (computed if not given)
+            encodings: Precompressed bodies by content-coding (gzip, br)
+        """
+        self.body = body
+        self.fresh_until = fresh_until
+        self.delta = delta
+        self.media_type = media_type
+        self.etag = etag or make_etag(body)
+        self.encodings = encodings or {}
+
+    @property
+    def value(self) -> Any:
+        """Decoded JSON body"""
+        return json.loads(self.body)
+
+    @property
+    def is_stale(self) -> bool:
+        return time.time() >= self.fresh_until
+
+    def needs_refresh(self, beta: float = 1.0) -> bool:
+        """
+        Whether the entry should be recomputed now
+
+        True once stale, and with rising probability shortly before that
+        (probabilistic early expiration / "XFetch"): expensive entries
+        (large delta) start refreshing earlier. beta=0 disables early refresh.
+        """
+        if beta <= 0:
+            return self.is_stale
+        return time.time() - self.delta * beta * math.log(1.0 - random.random()) >= self.fresh_until
+
+
+class LocalCache:
+    """Process-local LRU cache with per-entry expiry and invalidation tags"""
+
+    def __init__(self, max_size: int = 1000):
+        """
+        Initialize local cache
+
+        Args:
+            max_size: Maximum number of entries before least recently used are evicted
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, value, tags)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a live entry, or None if missing/expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float, tags: Iterable[str] = ()):
+        """Store an entry for ttl seconds"""
+        self._entries[key] = (time.monotonic() + ttl, value, frozenset(tags))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """Remove entries by key"""
+        return sum(1 for key in keys if self._entries.pop(key, None) is not None)
+
+    def invalidate_tags(self, tags: Iterable[str], match_all: bool = False) -> int:
+        """Remove entries carrying any (or, with match_all, every) of the tags"""
+        tags = frozenset(tags)
+        if match_all:
+            victims = [key for key, (_, _, entry_tags) in self._entries.items() if tags <= entry_tags]
+        else:
+            victims = [key for key, (_, _, entry_tags) in self._entries.items() if tags & entry_tags]
+        return self.delete(victims)
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Remove entries whose key matches a glob pattern"""
+        return self.delete([key for key in self._entries if fnmatch.fnmatchcase(key, pattern)])
+
+    def clear(self):
+        """Remove all entries"""
+        self._entries.clear()
+
 
 class CacheService:
     """Redis-based response caching service"""
 
-    def __init__(self, redis_url: str = "redis://redis:6379/0", prefix: str = "cache:"):
+    def __init__(
+        self,
+        redis_url: str = "redis://redis:6379/0",
+        prefix: str = "cache:",
+        max_connections: int = 50,
+        socket_timeout: float = 2.0,
+        retry_interval: float = 30.0,
+        invalidation_strategy: str = "tags",
+        local_max_size: int = 1000,
+        local_ttl: int = 5,
+        invalidation_channel: str = "cache:invalidate",
+        compress_encodings: Iterable[str] = ("gzip", "br"),
+        compress_min_size: int = 1024
+    ):
         """
         Initialize cache service
 
+        No I/O happens here; call connect() (done at app startup) or let the
+        first cache operation connect lazily.
+
         Args:
             redis_url: Redis connection URL
             prefix: Key prefix for cache entries
+            max_connections: Size of the shared connection pool
+            socket_timeout: Connect/read timeout in seconds
+            retry_interval: Seconds to stay in degraded mode before reconnecting
+            invalidation_strategy: "tags" (delete tagged keys) or "generation"
+                (bump a per-entity-type counter that is part of every key)
+            local_max_size: Maximum entries in the process-local L1 cache
+            local_ttl: Default L1 TTL in seconds (0 disables the L1)
+            invalidation_channel: Redis pub/sub channel for L1 invalidations
+            compress_encodings: Precompressed variants to store with each body
+                ("br" requires the optional brotli package)
+            compress_min_size: Bodies smaller than this are stored uncompressed only
         """
         self.prefix = prefix
         self.redis_url = redis_url
-        self.redis = None
+        self.max_connections = max_connections
+        self.socket_timeout = socket_timeout
+        self.retry_interval = retry_interval
+        self.invalidation_strategy = invalidation_strategy
+        self.redis = None  # redis.asyncio client (shared pool)
+        self._available = False
+        self._next_connect_attempt = 0.0
+        self._connection_errors: tuple = ()
+        self._invalidate_tags_script = None
+        self._release_lock_script = None
+        self._fill_events: Dict[str, asyncio.Event] = {}  # keys being recomputed in this worker
+        self.local = LocalCache(max_size=local_max_size)
+        self.local_ttl = local_ttl
+        self._tagged_local_caches: List[LocalCache] = []  # other L1s evicted by tag invalidations
+        self.invalidation_channel = invalidation_channel
+        self.instance_id = uuid.uuid4().hex
+        self.compress_min_size = compress_min_size
+        self.compress_encodings = self._supported_encodings(compress_encodings)
+        self._invalidation_listener: Optional[asyncio.Task] = None
         self._stats = {
-            "hits": 0,
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "stale_hits": 0,
             "misses": 0,
             "sets": 0,
             "invalidations": 0,
@@ -46,21 +263,183 @@ class CacheService:
             "default": 120,      # 2 minutes default
         }
 
-        self._connect()
+        # How long past its TTL an entry may be served while one request
+        # recomputes it (stale-while-revalidate), per cache type
+        self.stale_ttl_config = dict(self.ttl_config)
 
-    def _connect(self):
-        """Connect to Redis"""
+        self._create_client()
+
+    def _create_client(self):
+        """Create the async Redis client (connections are opened on demand)"""
         try:
-            import redis
-            self.redis = redis.from_url(self.redis_url, decode_responses=True)
-            self.redis.ping()
-            logger.info(f"✅ Cache service connected to Redis: {self.redis_url}")
+            import redis.asyncio as aioredis
+            from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
         except ImportError:
             logger.error("❌ Redis package not installed. Install with: pip install redis")
             self.redis = None
+            return
+
+        pool = aioredis.ConnectionPool.from_url(
+            self.redis_url,
+            decode_responses=False,  # Bodies are stored as raw (possibly compressed) bytes
+            max_connections=self.max_connections,
+            socket_connect_timeout=self.socket_timeout,
+            socket_timeout=self.socket_timeout,
+            health_check_interval=30,
+        )
+        self.redis = aioredis.Redis(connection_pool=pool)
+        self._invalidate_tags_script = self.redis.register_script(_INVALIDATE_TAGS_LUA)
+        self._release_lock_script = self.redis.register_script(_RELEASE_LOCK_LUA)
+        self._connection_errors = (RedisConnectionError, RedisTimeoutError, OSError)
+
+    @property
+    def available(self) -> bool:
+        """Whether Redis is currently usable (False in degraded mode)"""
+        return self.redis is not None and self._available
+
+    async def connect(self) -> bool:
+        """
+        Check the Redis connection
+
+        On failure the service enters degraded mode: cache operations are
+        skipped until retry_interval has passed.
+
+        Returns:
+            True if Redis is reachable
+        """
+        if self.redis is None:
+            return False
+
+        try:
+            await self.redis.ping()
+            if not self._available:
+                logger.info(f"✅ Cache service connected to Redis: {self.redis_url}")
+            self._available = True
         except Exception as e:
-            logger.error(f"❌ Failed to connect to Redis: {e}")
-            self.redis = None
+            self._mark_unavailable(e)
+
+        return self._available
+
+    async def ensure_available(self) -> bool:
+        """Return True if Redis is usable, reconnecting once the retry interval passes"""
+        if self.available:
+            return True
+        if self.redis is None or time.monotonic() < self._next_connect_attempt:
+            return False
+        return await self.connect()
+
+    def _mark_unavailable(self, error: Exception):
+        """Enter degraded mode after a connection failure"""
+        if self._available or self._next_connect_attempt == 0.0:
+            logger.error(f"❌ Cache unavailable, running without response cache: {error}")
+        self._available = False
+        self._next_connect_attempt = time.monotonic() + self.retry_interval
+
+    def _handle_error(self, operation: str, error: Exception):
+        """Log a cache error, entering degraded mode on connection problems"""
+        if isinstance(error, self._connection_errors):
+            self._mark_unavailable(error)
+        else:
+            logger.error(f"Cache {operation} error: {error}")
+
+    async def close(self):
+        """Close pooled connections (called on app shutdown)"""
+        if self.redis is not None:
+            await self.redis.aclose()
+            self._available = False
+
+    async def _broadcast_invalidation(self, message: Dict[str, Any]):
+        """
+        Evict from this worker's L1 and tell other workers to do the same
+
+        Call after the Redis write/delete: evicting first leaves a window in
+        which a concurrent request refills L1 from the old L2 entry, which
+        is then served for the full local TTL.
+        """
+        self._apply_invalidation(message)
+
+        try:
+            await self.redis.publish(
+                self.invalidation_channel,
+                json.dumps({**message, "origin": self.instance_id})
+            )
+        except Exception as e:
+            self._handle_error("publish invalidation", e)
+
+    def register_local_cache(self, cache: LocalCache):
+        """
+        Have tag invalidations (including invalidate_local) also evict from
+        another per-worker LocalCache, such as the resolved-user cache
+
+        Registering the same cache again is a no-op.
+        """
+        if not any(registered is cache for registered in self._tagged_local_caches):
+            self._tagged_local_caches.append(cache)
+
+    def _apply_invalidation(self, message: Dict[str, Any]):
+        """Evict L1 entries described by an invalidation message"""
+        if message.get("clear"):
+            self.local.clear()
+        if message.get("keys"):
+            self.local.delete(message["keys"])
+        if message.get("pattern"):
+            self.local.delete_pattern(message["pattern"])
+        if message.get("tags"):
+            match_all = message.get("match_all", False)
+            self.local.invalidate_tags(message["tags"], match_all=match_all)
+            for cache in self._tagged_local_caches:
+                cache.invalidate_tags(message["tags"], match_all=match_all)
+
+    async def start_invalidation_listener(self):
+        """Start receiving L1 invalidations from other workers (called on app startup)"""
+        if self.redis is None or self._invalidation_listener is not None:
+            return
+
+        self._invalidation_listener = asyncio.create_task(self._consume_invalidations())
+        logger.info("Cache invalidation listener started")
+
+    async def stop_invalidation_listener(self):
+        """Stop receiving L1 invalidations (called on app shutdown)"""
+        if self._invalidation_listener is None:
+            return
+
+        self._invalidation_listener.cancel()
+        try:
+            await self._invalidation_listener
+        except asyncio.CancelledError:
+            pass
+        self._invalidation_listener = None
+        logger.info("Cache invalidation listener stopped")
+
+    async def _consume_invalidations(self):
+        """Apply invalidations from other workers, reconnecting on errors"""
+        import redis.asyncio as aioredis
+
+        while True:
+            client = aioredis.from_url(self.redis_url, decode_responses=True)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(self.invalidation_channel)
+                # Invalidations may have been missed while disconnected
+                self.local.clear()
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        data = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        logger.warning(f"Ignoring malformed cache invalidation on {self.invalidation_channel}")
+                        continue
+                    if data.get("origin") != self.instance_id:
+                        self._apply_invalidation(data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error, reconnecting: {e}")
+                await asyncio.sleep(self.retry_interval if not self.available else 1.0)
+            finally:
+                await pubsub.aclose()
+                await client.aclose()
 
     def _make_key(self, key_parts: List[str]) -> str:
         """
@@ -86,7 +465,8 @@ class CacheService:
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        user_id: Optional[str] = None
+        user_id: Optional[str] = None,
+        generation: Optional[int] = None
     ) -> str:
         """
         Generate cache key for an endpoint
@@ -95,12 +475,16 @@ class CacheService:
             endpoint: API endpoint path (e.g., "/api/characters")
             params: Query parameters and filters
             user_id: Optional user ID for user-specific caching
+            generation: Entity type generation (see get_generation)
 
         Returns:
             Cache key
         """
         key_parts = [endpoint]
 
+        if generation is not None:
+            key_parts.append(f"gen:{generation}")
+
         if user_id:
             key_parts.append(f"user:{user_id}")
 
@@ -114,39 +498,239 @@ class CacheService:
 
         return self._make_key(key_parts)
 
-    async def get(self, key: str) -> Optional[Any]:
+    def _tag_key(self, tag: str) -> str:
+        """Redis key of the set holding all cache keys with a tag"""
+        return f"{self.prefix}tag:{tag}"
+
+    def _version_key(self, entity_type: str) -> str:
+        """Redis key of an entity type's version counter"""
+        return f"{self.prefix}version:{entity_type}"
+
+    def build_tags(
+        self,
+        endpoint: str,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> List[str]:
         """
-        Get cached value
+        Build the invalidation tags for a cached response
+
+        Args:
+            endpoint: API endpoint path
+            entity_type: Entity type the response belongs to (e.g., "clothing_items")
+            entity_id: ID of the single entity the response shows, if any
+            user_id: User the response was cached for, if user-specific
+
+        Returns:
+            List of tags
+        """
+        tags = [f"endpoint:{endpoint}"]
+
+        if entity_type:
+            tags.append(f"entity:{entity_type}")
+            if entity_id:
+                tags.append(f"entity:{entity_type}:{entity_id}")
+
+        if user_id:
+            tags.append(f"user:{user_id}")
+
+        return tags
+
+    async def get_version(self, entity_type: str) -> Optional[int]:
+        """
+        Get the version counter of an entity type
+
+        The counter is bumped by every invalidate_entity_type() call, i.e. by
+        every @invalidates_cache write, so it changes whenever data of that
+        type is written through the API.
+
+        Args:
+            entity_type: Entity type
+
+        Returns:
+            Version number, or None if Redis is unavailable
+        """
+        version_key = self._version_key(entity_type)
+        version = self.local.get(version_key)
+        if version is not None:
+            return version
+
+        if not await self.ensure_available():
+            return None
+
+        try:
+            version = int(await self.redis.get(version_key) or 0)
+            if self.local_ttl:
+                self.local.set(version_key, version, self.local_ttl)
+            return version
+        except Exception as e:
+            self._handle_error(f"get version ({entity_type})", e)
+            return None
+
+    async def bump_version(self, entity_type: str):
+        """Increment an entity type's version counter on every worker"""
+        if not await self.ensure_available():
+            return
+
+        try:
+            await self.redis.incr(self._version_key(entity_type))
+            logger.debug(f"Cache VERSION BUMP: {entity_type}")
+        except Exception as e:
+            self._handle_error(f"bump version ({entity_type})", e)
+
+        await self._broadcast_invalidation({"keys": [self._version_key(entity_type)]})
+
+    async def get_generation(self, entity_type: Optional[str]) -> Optional[int]:
+        """
+        Get the current generation of an entity type
+
+        Only used with the "generation" invalidation strategy, where the
+        entity type's version is part of every key; bumping it orphans every
+        key built with the previous value.
+
+        Args:
+            entity_type: Entity type
+
+        Returns:
+            Generation number, or None when generations are not in use
+        """
+        if self.invalidation_strategy != "generation" or not entity_type:
+            return None
+        return await self.get_version(entity_type)
+
+    @staticmethod
+    def _supported_encodings(encodings: Iterable[str]) -> List[str]:
+        """Filter requested content-codings down to the ones available here"""
+        supported = []
+        for encoding in encodings:
+            if encoding == "br":
+                try:
+                    import brotli  # noqa: F401
+                except ImportError:
+                    logger.info("brotli not installed, caching gzip variants only. Install with: pip install brotli")
+                    continue
+            if encoding in ("gzip", "br"):
+                supported.append(encoding)
+        return supported
+
+    def _compress(self, body: bytes) -> Dict[str, bytes]:
+        """
+        Build the precompressed variants of a body
+
+        Uses the configured levels, the same ones the compression middleware
+        applies to uncached responses.
+        """
+        if len(body) < self.compress_min_size:
+            return {}
+
+        from api.config import settings
+
+        variants = {}
+        for encoding in self.compress_encodings:
+            if encoding == "gzip":
+                variants["gzip"] = gzip.compress(body, compresslevel=settings.compression_gzip_level)
+            elif encoding == "br":
+                import brotli
+                variants["br"] = brotli.compress(body, quality=settings.compression_brotli_quality)
+        return variants
+
+    def _read_entry(self, fields: Optional[Dict[bytes, bytes]]) -> Optional[CachedEntry]:
+        """Decode a stored entry hash (None for missing entries)"""
+        if not fields or b"body" not in fields:
+            return None
+
+        return CachedEntry(
+            body=fields[b"body"],
+            fresh_until=float(fields[b"fresh_until"]),
+            delta=float(fields.get(b"delta", 0.0)),
+            media_type=fields.get(b"media_type", b"application/json").decode(),
+            etag=fields[b"etag"].decode() if b"etag" in fields else None,
+            encodings={
+                encoding: fields[encoding.encode()]
+                for encoding in ("gzip", "br")
+                if encoding.encode() in fields
+            },
+        )
+
+    async def get_entry(
+        self,
+        key: str,
+        tags: Optional[List[str]] = None,
+        local_ttl: Optional[int] = None
+    ) -> Optional[CachedEntry]:
+        """
+        Get a cached entry (fresh or stale), checking the process-local L1 before Redis
 
         Args:
             key: Cache key
+            tags: Invalidation tags of the entry (used when promoting it to L1)
+            local_ttl: L1 TTL in seconds (defaults to local_ttl, 0 skips L1)
 
         Returns:
-            Cached value or None if not found/expired
+            CachedEntry or None if not found/expired
         """
-        if not self.redis:
+        local_ttl = self.local_ttl if local_ttl is None else local_ttl
+        if local_ttl:
+            entry = self.local.get(key)
+            if entry is not None:
+                self._stats["l1_hits"] += 1
+                if entry.is_stale:
+                    self._stats["stale_hits"] += 1
+                logger.debug(f"Cache L1 HIT: {key}")
+                return entry
+
+        if not await self.ensure_available():
             return None
 
         try:
-            value = self.redis.get(key)
-            if value:
-                self._stats["hits"] += 1
+            entry = self._read_entry(await self.redis.hgetall(key))
+            if entry is not None:
+                self._stats["l2_hits"] += 1
+                if entry.is_stale:
+                    self._stats["stale_hits"] += 1
                 logger.debug(f"Cache HIT: {key}")
-                return json.loads(value)
+                if local_ttl:
+                    self.local.set(key, entry, local_ttl, tags or ())
+                return entry
             else:
                 self._stats["misses"] += 1
                 logger.debug(f"Cache MISS: {key}")
                 return None
         except Exception as e:
-            logger.error(f"Cache get error for key {key}: {e}")
+            self._handle_error(f"get ({key})", e)
             return None
 
+    async def get(
+        self,
+        key: str,
+        tags: Optional[List[str]] = None,
+        local_ttl: Optional[int] = None
+    ) -> Optional[Any]:
+        """
+        Get cached value
+
+        Args:
+            key: Cache key
+            tags: Invalidation tags of the entry (used when promoting it to L1)
+            local_ttl: L1 TTL in seconds (defaults to local_ttl, 0 skips L1)
+
+        Returns:
+            Cached value (possibly stale) or None if not found/expired
+        """
+        entry = await self.get_entry(key, tags=tags, local_ttl=local_ttl)
+        return entry.value if entry is not None else None
+
     async def set(
         self,
         key: str,
         value: Any,
         ttl: Optional[int] = None,
-        cache_type: str = "default"
+        cache_type: str = "default",
+        tags: Optional[List[str]] = None,
+        local_ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+        compute_time: float = 0.0
     ) -> bool:
         """
         Set cached value
@@ -156,28 +740,182 @@ class CacheService:
             value: Value to cache (must be JSON serializable)
             ttl: Optional TTL in seconds (overrides cache_type)
             cache_type: Cache type for TTL lookup (list, detail, static, default)
+            tags: Invalidation tags to register the key under (see build_tags)
+            local_ttl: L1 TTL in seconds (defaults to local_ttl, 0 skips L1)
+            stale_ttl: Seconds the entry may be served stale after ttl while
+                it is recomputed (defaults to stale_ttl_config for cache_type)
+            compute_time: Seconds it took to compute value (drives early refresh)
 
         Returns:
             True if cached successfully
         """
-        if not self.redis:
-            return False
+        entry = await self.set_response(
+            key, render_json(value), ttl=ttl, cache_type=cache_type, tags=tags,
+            local_ttl=local_ttl, stale_ttl=stale_ttl, compute_time=compute_time
+        )
+        return entry is not None
+
+    async def set_response(
+        self,
+        key: str,
+        body: bytes,
+        media_type: str = "application/json",
+        ttl: Optional[int] = None,
+        cache_type: str = "default",
+        tags: Optional[List[str]] = None,
+        local_ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+        compute_time: float = 0.0
+    ) -> Optional[CachedEntry]:
+        """
+        Cache an encoded response body
+
+        The body is stored as-is together with its content type, ETag and
+        precompressed variants, so hits can be served without re-encoding.
+
+        Args:
+            key: Cache key
+            body: Encoded response body
+            media_type: Response content type
+            (other args as for set)
+
+        Returns:
+            The stored CachedEntry (with its compressed variants), or None
+        """
+        if not await self.ensure_available():
+            return None
 
         try:
             # Determine TTL
             ttl_seconds = ttl if ttl is not None else self.ttl_config.get(cache_type, self.ttl_config["default"])
+            if stale_ttl is None:
+                stale_ttl = self.stale_ttl_config.get(cache_type, self.stale_ttl_config["default"])
+            expire_seconds = ttl_seconds + stale_ttl
 
-            # Serialize and store
-            serialized = json.dumps(value, default=str)  # default=str handles datetime
-            self.redis.setex(key, ttl_seconds, serialized)
+            # Large bodies are compressed off the event loop
+            if len(body) >= 64 * 1024:
+                encodings = await asyncio.to_thread(self._compress, body)
+            else:
+                encodings = self._compress(body)
+
+            entry = CachedEntry(
+                body, time.time() + ttl_seconds, compute_time,
+                media_type=media_type, encodings=encodings
+            )
+            fields = {
+                "body": body,
+                "media_type": media_type,
+                "etag": entry.etag,
+                "fresh_until": entry.fresh_until,
+                "delta": compute_time,
+                **encodings,
+            }
+            # Tag sets outlive their members; stale members are harmless to delete
+            tag_ttl = max(expire_seconds, *self.ttl_config.values())
+
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.hset(key, mapping=fields)
+                pipe.expire(key, expire_seconds)
+                for tag in tags or []:
+                    tag_key = self._tag_key(tag)
+                    pipe.sadd(tag_key, key)
+                    pipe.expire(tag_key, tag_ttl)
+                await pipe.execute()
+
+            local_ttl = self.local_ttl if local_ttl is None else local_ttl
+            if local_ttl:
+                self.local.set(key, entry, min(local_ttl, expire_seconds), tags or ())
 
             self._stats["sets"] += 1
-            logger.debug(f"Cache SET: {key} (TTL: {ttl_seconds}s)")
-            return True
+            logger.debug(f"Cache SET: {key} ({len(body)} bytes, TTL: {ttl_seconds}s, stale: {stale_ttl}s)")
+            return entry
         except Exception as e:
-            logger.error(f"Cache set error for key {key}: {e}")
+            self._handle_error(f"set ({key})", e)
+            return None
+
+    def _lock_key(self, key: str) -> str:
+        """Redis key of the recompute lock for a cache key"""
+        return f"{self.prefix}lock:{key}"
+
+    async def acquire_fill_lock(self, key: str, ttl: float = 30.0) -> bool:
+        """
+        Claim the right to recompute a cache entry (single-flight)
+
+        Only one request per key, across all workers, gets True until
+        release_fill_lock() is called or ttl seconds pass.
+
+        Args:
+            key: Cache key
+            ttl: Lock lifetime in seconds (upper bound on recompute time)
+
+        Returns:
+            True if this caller should recompute the entry
+        """
+        if key in self._fill_events:
             return False
 
+        try:
+            acquired = await self.redis.set(self._lock_key(key), self.instance_id, nx=True, px=int(ttl * 1000))
+        except Exception as e:
+            self._handle_error(f"acquire lock ({key})", e)
+            acquired = True  # Without Redis, fall back to uncoordinated recompute
+
+        if acquired and key not in self._fill_events:
+            self._fill_events[key] = asyncio.Event()
+            return True
+        return False
+
+    async def release_fill_lock(self, key: str):
+        """Release a lock taken with acquire_fill_lock and wake local waiters"""
+        event = self._fill_events.pop(key, None)
+        if event is not None:
+            event.set()
+
+        try:
+            await self._release_lock_script(keys=[self._lock_key(key)], args=[self.instance_id])
+        except Exception as e:
+            self._handle_error(f"release lock ({key})", e)
+
+    async def wait_for_entry(self, key: str, timeout: float = 30.0) -> Optional[CachedEntry]:
+        """
+        Wait for another request's recompute of a missing entry
+
+        Args:
+            key: Cache key
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The new entry, or None if it did not appear in time
+        """
+        deadline = time.monotonic() + timeout
+
+        event = self._fill_events.get(key)
+        if event is not None:
+            # Recompute running in this worker
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+            entry = self.local.get(key)
+            if entry is not None:
+                return entry
+
+        # Recompute running in another worker: poll Redis
+        while time.monotonic() < deadline:
+            try:
+                entry = self._read_entry(await self.redis.hgetall(key))
+                if entry is not None:
+                    return entry
+                if not await self.redis.exists(self._lock_key(key)):
+                    return None  # Recompute finished without caching (error/uncacheable)
+            except Exception as e:
+                self._handle_error(f"wait ({key})", e)
+                return None
+            await asyncio.sleep(0.05)
+
+        return None
+
     async def delete(self, key: str) -> bool:
         """
         Delete cached value
@@ -188,61 +926,142 @@ class CacheService:
         Returns:
             True if deleted
         """
-        if not self.redis:
+        if not await self.ensure_available():
             return False
 
         try:
-            deleted = self.redis.delete(key)
+            deleted = await self.redis.delete(key)
             if deleted:
                 self._stats["invalidations"] += 1
                 logger.debug(f"Cache DELETE: {key}")
-            return deleted > 0
         except Exception as e:
-            logger.error(f"Cache delete error for key {key}: {e}")
-            return False
+            self._handle_error(f"delete ({key})", e)
+            deleted = 0
+
+        await self._broadcast_invalidation({"keys": [key]})
+        return deleted > 0
 
     async def delete_pattern(self, pattern: str) -> int:
         """
         Delete all keys matching pattern
 
+        Scans the keyspace, so it is only meant for manual/admin use; request
+        paths invalidate through tags instead.
+
         Args:
             pattern: Key pattern (e.g., "cache:characters:*")
 
         Returns:
             Number of keys deleted
         """
-        if not self.redis:
+        if not await self.ensure_available():
             return 0
 
+        deleted = 0
         try:
             # Get all matching keys
-            keys = self.redis.keys(pattern)
+            keys = [key async for key in self.redis.scan_iter(match=pattern, count=500)]
             if keys:
-                deleted = self.redis.delete(*keys)
+                deleted = await self.redis.delete(*keys)
                 self._stats["invalidations"] += deleted
                 logger.info(f"Cache DELETE PATTERN: {pattern} ({deleted} keys)")
-                return deleted
+        except Exception as e:
+            self._handle_error(f"delete pattern ({pattern})", e)
+
+        await self._broadcast_invalidation({"pattern": pattern})
+        return deleted
+
+    async def _delete_keys(self, keys) -> int:
+        """Delete a batch of cache keys and count them as invalidations"""
+        keys = list(keys)
+        if not keys:
             return 0
+
+        deleted = await self.redis.delete(*keys)
+        self._stats["invalidations"] += deleted
+        return deleted
+
+    async def invalidate_tags(self, tags: List[str]) -> int:
+        """
+        Delete every cache entry registered under any of the given tags
+
+        Args:
+            tags: Tags to invalidate (e.g., ["entity:characters"])
+
+        Returns:
+            Number of keys deleted
+        """
+        if not tags or not await self.ensure_available():
+            return 0
+
+        try:
+            deleted = await self._invalidate_tags_script(keys=[self._tag_key(tag) for tag in tags])
+            self._stats["invalidations"] += deleted
+            logger.debug(f"Cache INVALIDATE TAGS: {tags} ({deleted} keys)")
         except Exception as e:
-            logger.error(f"Cache delete pattern error for {pattern}: {e}")
+            self._handle_error(f"invalidate tags ({tags})", e)
+            deleted = 0
+
+        await self._broadcast_invalidation({"tags": list(tags)})
+        return deleted
+
+    async def invalidate_local(self, tags: List[str]):
+        """
+        Evict L1-only entries (never stored in Redis) in every worker
+
+        Args:
+            tags: Tags to invalidate (e.g., ["auth-user:alice"])
+        """
+        if not tags:
+            return
+
+        if self.available:
+            await self._broadcast_invalidation({"tags": list(tags)})
+        else:
+            self._apply_invalidation({"tags": list(tags)})
+
+    async def invalidate_tagged(self, *tags: str) -> int:
+        """
+        Delete cache entries registered under all of the given tags
+
+        Args:
+            tags: Tags that must all be present (e.g., "user:123", "entity:outfits")
+
+        Returns:
+            Number of keys deleted
+        """
+        if len(tags) == 1:
+            return await self.invalidate_tags(list(tags))
+        if not tags or not await self.ensure_available():
             return 0
 
-    async def invalidate_endpoint(self, endpoint: str, user_id: Optional[str] = None):
+        try:
+            keys = await self.redis.sinter(*[self._tag_key(tag) for tag in tags])
+            deleted = await self._delete_keys(keys)
+            logger.debug(f"Cache INVALIDATE TAGGED: {tags} ({deleted} keys)")
+        except Exception as e:
+            self._handle_error(f"invalidate tagged ({tags})", e)
+            deleted = 0
+
+        await self._broadcast_invalidation({"tags": list(tags), "match_all": True})
+        return deleted
+
+    async def invalidate_endpoint(self, endpoint: str, user_id: Optional[str] = None) -> int:
         """
         Invalidate all cache entries for an endpoint
 
         Args:
             endpoint: API endpoint path
             user_id: Optional user ID to invalidate only user-specific caches
+
+        Returns:
+            Number of keys deleted
         """
         if user_id:
-            pattern = f"{self.prefix}{endpoint}:user:{user_id}:*"
-        else:
-            pattern = f"{self.prefix}{endpoint}:*"
-
-        await self.delete_pattern(pattern)
+            return await self.invalidate_tagged(f"endpoint:{endpoint}", f"user:{user_id}")
+        return await self.invalidate_tags([f"endpoint:{endpoint}"])
 
-    async def invalidate_entity_type(self, entity_type: str):
+    async def invalidate_entity_type(self, entity_type: str) -> int:
         """
         Invalidate all caches for an entity type
 
@@ -253,29 +1072,63 @@ class CacheService:
 
         Args:
             entity_type: Entity type (characters, stories, etc.)
+
+        Returns:
+            Number of keys deleted (0 with generation counters, where old
+            entries are left to expire)
         """
-        # Convert entity_type to endpoint path
-        # characters -> /characters
-        # clothing_items -> /clothing-items
-        # visualization_configs -> /visualization-configs
-        endpoint_path = entity_type.replace("_", "-")
-        pattern = f"{self.prefix}/{endpoint_path}*"
-        await self.delete_pattern(pattern)
+        await self.bump_version(entity_type)
+
+        if self.invalidation_strategy == "generation":
+            self._stats["invalidations"] += 1
+            return 0
+
+        return await self.invalidate_tags([f"entity:{entity_type}"])
+
+    async def invalidate_entity(self, entity_type: str, entity_id: str) -> int:
+        """
+        Invalidate cached responses for a single entity
+
+        Args:
+            entity_type: Entity type (characters, stories, etc.)
+            entity_id: Entity ID
+
+        Returns:
+            Number of keys deleted
+        """
+        return await self.invalidate_tags([f"entity:{entity_type}:{entity_id}"])
+
+    async def invalidate_user(self, user_id: str, entity_type: Optional[str] = None) -> int:
+        """
+        Invalidate cached responses for a user
+
+        Args:
+            user_id: User ID
+            entity_type: Optional entity type to limit invalidation
+
+        Returns:
+            Number of keys deleted
+        """
+        if entity_type:
+            return await self.invalidate_tagged(f"user:{user_id}", f"entity:{entity_type}")
+        return await self.invalidate_tags([f"user:{user_id}"])
 
     async def clear_all(self):
         """Clear all cache entries (dangerous!)"""
-        if not self.redis:
+        if not await self.ensure_available():
             return
 
         try:
             pattern = f"{self.prefix}*"
-            keys = self.redis.keys(pattern)
+            keys = [key async for key in self.redis.scan_iter(match=pattern, count=500)]
             if keys:
-                deleted = self.redis.delete(*keys)
+                deleted = await self.redis.delete(*keys)
                 logger.warning(f"Cache CLEAR ALL: {deleted} keys deleted")
                 self._stats["invalidations"] += deleted
         except Exception as e:
-            logger.error(f"Cache clear all error: {e}")
+            self._handle_error("clear all", e)
+
+        await self._broadcast_invalidation({"clear": True})
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -284,23 +1137,30 @@ class CacheService:
         Returns:
             Dict with hit/miss ratio, counts, etc.
         """
-        total_requests = self._stats["hits"] + self._stats["misses"]
-        hit_rate = (self._stats["hits"] / total_requests * 100) if total_requests > 0 else 0
+        hits = self._stats["l1_hits"] + self._stats["l2_hits"]
+        total_requests = hits + self._stats["misses"]
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
 
         return {
-            "hits": self._stats["hits"],
+            "hits": hits,
+            "l1_hits": self._stats["l1_hits"],
+            "l2_hits": self._stats["l2_hits"],
+            "stale_hits": self._stats["stale_hits"],
+            "l1_size": len(self.local),
             "misses": self._stats["misses"],
             "sets": self._stats["sets"],
             "invalidations": self._stats["invalidations"],
             "total_requests": total_requests,
             "hit_rate_percent": round(hit_rate, 2),
-            "connected": self.redis is not None,
+            "connected": self.available,
         }
 
     def reset_stats(self):
         """Reset statistics counters"""
         self._stats = {
-            "hits": 0,
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "stale_hits": 0,
             "misses": 0,
             "sets": 0,
             "invalidations": 0,
@@ -317,6 +1177,15 @@ def get_cache_service() -> CacheService:
 
     if _cache_service is None:
         from api.config import settings
-        _cache_service = CacheService(redis_url=settings.redis_url)
+        _cache_service = CacheService(
+            redis_url=settings.redis_url,
+            max_connections=settings.cache_redis_max_connections,
+            invalidation_strategy=settings.cache_invalidation_strategy,
+            local_max_size=settings.cache_local_max_size,
+            local_ttl=settings.cache_local_ttl_seconds,
+            invalidation_channel=settings.cache_invalidation_channel,
+            compress_encodings=[e.strip() for e in settings.cache_compress_encodings.split(",") if e.strip()],
+            compress_min_size=settings.compression_min_size
+        )
 
     return _cache_service
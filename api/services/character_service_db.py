@@ -15,7 +15,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.config import settings
 from api.models.db import Character, User
-from api.repositories import CharacterRepository
+from api.repositories import CharacterRepository, ImageEntityRelationshipRepository
+from api.repositories.pagination import approximate_count, decode_cursor, split_page
+from api.repositories.statements import json_merge
+from api.services.image_service import propagate_entity_name
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -162,6 +165,52 @@ class CharacterServiceDB:
         )
         return [self._character_to_dict(char) for char in characters]
 
+    async def list_characters_page(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        count_mode: str = "none"
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[int]]:
+        """
+        List one page of characters using keyset pagination
+
+        Args:
+            limit: Page size
+            cursor: Opaque cursor from the previous page (takes precedence over offset)
+            offset: Number of characters to skip (legacy, used only without a cursor)
+            count_mode: "exact" (total from the page query itself),
+                        "approximate" (planner estimate) or "none"
+
+        Returns:
+            Tuple of (character data dicts, next_cursor or None on the last page,
+            total count or None if not requested)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        page_args = dict(
+            user_id=self.user_id,
+            limit=limit + 1 if limit is not None else None,
+            offset=0 if cursor else offset,
+            cursor=decode_cursor(cursor) if cursor else None
+        )
+
+        total = None
+        if count_mode == "exact":
+            characters, total = await self.repository.get_page(**page_args)
+            if total is None:
+                # Empty page: nothing carried the total
+                total = await self.count_characters() if cursor or offset else 0
+        else:
+            characters = await self.repository.get_all(**page_args)
+            if count_mode == "approximate":
+                total = await self.count_characters(approximate=True)
+
+        characters, next_cursor = split_page(characters, limit)
+
+        return [self._character_to_dict(char) for char in characters], next_cursor, total
+
     async def update_character(
         self,
         character_id: str,
@@ -176,7 +225,8 @@ class CharacterServiceDB:
         skin_tone: Optional[str] = None,
         face_description: Optional[str] = None,
         hair_description: Optional[str] = None,
-        body_description: Optional[str] = None
+        body_description: Optional[str] = None,
+        background_tasks = None
     ) -> Optional[Dict[str, Any]]:
         """
         Update a character
@@ -195,50 +245,45 @@ class CharacterServiceDB:
             face_description: Facial description (optional)
             hair_description: Hair description (optional)
             body_description: Body/physique description (optional)
+            background_tasks: Optional FastAPI BackgroundTasks; a new name is then
+                              copied to the character's image relationships after
+                              the response instead of in this transaction
 
         Returns:
             Updated character data dict or None if not found
         """
-        character = await self.repository.get_by_id(character_id)
+        # Update only the provided fields (user filter makes other users' characters "not found")
+        changes = {
+            "name": name,
+            "visual_description": visual_description,
+            "personality": personality,
+            "physical_description": physical_description,
+            "reference_image_path": reference_image_path,
+            "tags": tags,
+            "age": age,
+            "skin_tone": skin_tone,
+            "face_description": face_description,
+            "hair_description": hair_description,
+            "body_description": body_description,
+        }
+        values = {field: value for field, value in changes.items() if value is not None}
+        if metadata is not None:
+            values["meta"] = json_merge(Character.meta, metadata)  # Merged into existing metadata
+        values["updated_at"] = datetime.utcnow()
 
-        if not character:
-            return None
+        character = await self.repository.update_fields(character_id, values, user_id=self.user_id)
 
-        # Check user permission
-        if self.user_id and character.user_id != self.user_id:
+        if not character:
             return None
 
-        # Update fields if provided
         if name is not None:
-            character.name = name
-        if visual_description is not None:
-            character.visual_description = visual_description
-        if personality is not None:
-            character.personality = personality
-        if physical_description is not None:
-            character.physical_description = physical_description
-        if reference_image_path is not None:
-            character.reference_image_path = reference_image_path
-        if tags is not None:
-            character.tags = tags
-        if metadata is not None:
-            character.meta.update(metadata)  # Note: 'meta' in DB
-
-        # Update appearance fields if provided
-        if age is not None:
-            character.age = age
-        if skin_tone is not None:
-            character.skin_tone = skin_tone
-        if face_description is not None:
-            character.face_description = face_description
-        if hair_description is not None:
-            character.hair_description = hair_description
-        if body_description is not None:
-            character.body_description = body_description
-
-        character.updated_at = datetime.utcnow()
-
-        character = await self.repository.update(character)
+            if background_tasks is not None:
+                background_tasks.add_task(propagate_entity_name, ['character'], character_id, name)
+            else:
+                await ImageEntityRelationshipRepository(self.session).update_entity_name(
+                    ['character'], character_id, name
+                )
+
         await self.session.commit()
 
         return self._character_to_dict(character)
@@ -253,19 +298,14 @@ class CharacterServiceDB:
         Returns:
             True if deleted, False if not found
         """
-        character = await self.repository.get_by_id(character_id)
-
-        if not character:
-            return False
-
-        # Check user permission
-        if self.user_id and character.user_id != self.user_id:
-            return False
-
-        # Delete from database
-        success = await self.repository.delete(character_id)
+        # Delete from database (the user filter makes other users' characters "not found")
+        success = await self.repository.delete(character_id, user_id=self.user_id)
 
         if success:
+            # Images that used it show the ID, as for any missing entity
+            await ImageEntityRelationshipRepository(self.session).update_entity_name(
+                ['character'], character_id, character_id
+            )
             await self.session.commit()
 
             # Delete reference image if exists
@@ -431,11 +471,20 @@ class CharacterServiceDB:
 
         return [self._character_to_dict(char) for char in characters]
 
-    async def count_characters(self) -> int:
+    async def count_characters(self, approximate: bool = False) -> int:
         """
         Count total characters (filtered by user if specified)
 
+        Args:
+            approximate: Use the planner's table estimate instead of COUNT(*)
+                         (only possible without a user filter)
+
         Returns:
             Total number of characters
         """
+        if approximate and self.user_id is None:
+            estimate = await approximate_count(self.session, Character)
+            if estimate is not None:
+                return estimate
+
         return await self.repository.count(user_id=self.user_id)
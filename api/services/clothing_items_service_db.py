@@ -9,13 +9,15 @@ import uuid
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.config import settings
 from api.models.db import ClothingItem
-from api.repositories import ClothingItemRepository
+from api.repositories import ClothingItemRepository, ImageEntityRelationshipRepository
+from api.repositories.pagination import approximate_count, decode_cursor, split_page
+from api.services.image_service import propagate_entity_name
 from api.logging_config import get_logger
 
 # Add project to path for importing ItemVisualizer
@@ -84,6 +86,55 @@ class ClothingItemServiceDB:
         # Convert to dicts
         return [self._clothing_item_to_dict(item) for item in items]
 
+    async def list_clothing_items_page(
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        count_mode: str = "none"
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[int]]:
+        """
+        List one page of clothing items using keyset pagination
+
+        Args:
+            category: Optional category filter
+            limit: Page size
+            cursor: Opaque cursor from the previous page (takes precedence over offset)
+            offset: Number of items to skip (legacy, used only without a cursor)
+            count_mode: "exact" (total from the page query itself),
+                        "approximate" (planner estimate) or "none"
+
+        Returns:
+            Tuple of (clothing item dicts, next_cursor or None on the last page,
+            total count or None if not requested)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        page_args = dict(
+            user_id=self.user_id,
+            category=category,
+            limit=limit + 1 if limit is not None else None,
+            offset=0 if cursor else offset,
+            cursor=decode_cursor(cursor) if cursor else None
+        )
+
+        total = None
+        if count_mode == "exact":
+            items, total = await self.repository.get_page(**page_args)
+            if total is None:
+                # Empty page: nothing carried the total
+                total = await self.count_clothing_items(category=category) if cursor or offset else 0
+        else:
+            items = await self.repository.get_all(**page_args)
+            if count_mode == "approximate":
+                total = await self.count_clothing_items(category=category, approximate=True)
+
+        items, next_cursor = split_page(items, limit)
+
+        return [self._clothing_item_to_dict(item) for item in items], next_cursor, total
+
     async def get_clothing_item(self, item_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a single clothing item by ID
@@ -105,6 +156,24 @@ class ClothingItemServiceDB:
 
         return self._clothing_item_to_dict(item)
 
+    async def get_clothing_items(self, item_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get several clothing items by ID in one query
+
+        Args:
+            item_ids: UUIDs of the clothing items
+
+        Returns:
+            Clothing item dicts for the IDs that exist (and belong to the user)
+        """
+        items = await self.repository.get_by_ids(item_ids)
+
+        # Filter by user if specified
+        if self.user_id:
+            items = [item for item in items if item.user_id == self.user_id]
+
+        return [self._clothing_item_to_dict(item) for item in items]
+
     async def create_clothing_item(
         self,
         category: str,
@@ -175,6 +244,104 @@ class ClothingItemServiceDB:
 
         return self._clothing_item_to_dict(clothing_item)
 
+    async def create_many(
+        self,
+        items: List[Dict[str, Any]],
+        source_image: Optional[str] = None,
+        generate_previews: bool = False,
+        background_tasks = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Create several clothing items with one insert and one commit
+
+        Args:
+            items: Item fields (category, item, fabric, color, details and
+                optionally source_image)
+            source_image: Source image for items that don't set their own
+            generate_previews: Whether to queue preview generation
+            background_tasks: Optional FastAPI BackgroundTasks to run preview jobs
+
+        Returns:
+            Tuple of (created clothing item dicts, preview parent job_id or None)
+        """
+        clothing_items = [
+            ClothingItem(
+                item_id=str(uuid.uuid4()),
+                category=data["category"],
+                item=data["item"],
+                fabric=data["fabric"],
+                color=data["color"],
+                details=data["details"],
+                source_image=data.get("source_image") or source_image,
+                user_id=self.user_id
+            )
+            for data in items
+        ]
+
+        clothing_items = await self.repository.create_many(clothing_items)
+        await self.session.commit()
+
+        created = [self._clothing_item_to_dict(item) for item in clothing_items]
+
+        logger.info(f"Created {len(created)} clothing items", extra={'extra_fields': {
+            'item_ids': [item["item_id"] for item in created][:10],
+            'source_image': source_image
+        }})
+
+        preview_job_id = None
+        if generate_previews and created:
+            preview_job_id, _ = self.queue_preview_jobs(created, background_tasks)
+
+        return created, preview_job_id
+
+    def queue_preview_jobs(
+        self,
+        items: List[Dict[str, Any]],
+        background_tasks = None
+    ) -> Tuple[str, List[str]]:
+        """
+        Queue preview generation for several items as one parent job
+
+        Each item gets its own resumable child job (so a crash only reruns
+        unfinished items), but the whole group is written to the job store
+        at once.
+
+        Args:
+            items: Clothing item dicts
+            background_tasks: Optional FastAPI BackgroundTasks to run the jobs
+
+        Returns:
+            Tuple of (parent job_id, child job_ids in item order)
+        """
+        from api.services.job_queue import get_job_queue_manager
+        from api.models.jobs import JobType
+
+        job_queue = get_job_queue_manager()
+        parent_job_id, child_job_ids = job_queue.create_job_group(
+            job_type=JobType.BATCH_GENERATE,
+            title=f"Generate {len(items)} clothing item previews",
+            children=[
+                {
+                    "job_type": JobType.GENERATE_IMAGE,
+                    "title": f"Generate preview: {item['item']}",
+                    "description": f"{item['category']} - {item['color']} {item['fabric']}",
+                    "resume_handler": "clothing_item_preview",
+                    "resume_params": {"item_id": item["item_id"]}
+                }
+                for item in items
+            ]
+        )
+
+        for job_id in child_job_ids:
+            job_queue.dispatch_job(job_id, background_tasks)
+
+        logger.info(f"Queued {len(child_job_ids)} preview jobs", extra={'extra_fields': {
+            'parent_job_id': parent_job_id,
+            'job_count': len(child_job_ids)
+        }})
+
+        return parent_job_id, child_job_ids
+
     async def update_clothing_item(
         self,
         item_id: str,
@@ -183,7 +350,8 @@ class ClothingItemServiceDB:
         fabric: Optional[str] = None,
         color: Optional[str] = None,
         details: Optional[str] = None,
-        source_image: Optional[str] = None
+        source_image: Optional[str] = None,
+        background_tasks = None
     ) -> Optional[Dict[str, Any]]:
         """
         Update a clothing item
@@ -196,36 +364,38 @@ class ClothingItemServiceDB:
             color: Optional new color
             details: Optional new details
             source_image: Optional new source image
+            background_tasks: Optional FastAPI BackgroundTasks; a new item name is
+                              then copied to the item's image relationships after
+                              the response instead of in this transaction
 
         Returns:
             Updated clothing item dict or None if not found
         """
-        clothing_item = await self.repository.get_by_id(item_id)
+        # Update only the provided fields (user filter makes other users' items "not found")
+        changes = {
+            "category": category,
+            "item": item,
+            "fabric": fabric,
+            "color": color,
+            "details": details,
+            "source_image": source_image,
+        }
+        values = {field: value for field, value in changes.items() if value is not None}
+        values["updated_at"] = datetime.utcnow()
 
-        if not clothing_item:
-            return None
+        clothing_item = await self.repository.update_fields(item_id, values, user_id=self.user_id)
 
-        # Check user permission
-        if self.user_id and clothing_item.user_id != self.user_id:
+        if not clothing_item:
             return None
 
-        # Update fields if provided
-        if category is not None:
-            clothing_item.category = category
         if item is not None:
-            clothing_item.item = item
-        if fabric is not None:
-            clothing_item.fabric = fabric
-        if color is not None:
-            clothing_item.color = color
-        if details is not None:
-            clothing_item.details = details
-        if source_image is not None:
-            clothing_item.source_image = source_image
-
-        clothing_item.updated_at = datetime.utcnow()
-
-        clothing_item = await self.repository.update(clothing_item)
+            if background_tasks is not None:
+                background_tasks.add_task(propagate_entity_name, ['clothing_item'], item_id, item)
+            else:
+                await ImageEntityRelationshipRepository(self.session).update_entity_name(
+                    ['clothing_item'], item_id, item
+                )
+
         await self.session.commit()
 
         logger.info(f"Updated clothing item: {item_id}", extra={'extra_fields': {
@@ -244,18 +414,14 @@ class ClothingItemServiceDB:
         Returns:
             True if deleted, False if not found
         """
-        clothing_item = await self.repository.get_by_id(item_id)
-
-        if not clothing_item:
-            return False
-
-        # Check user permission
-        if self.user_id and clothing_item.user_id != self.user_id:
-            return False
-
-        success = await self.repository.delete(item_id)
+        # Single DELETE; the user filter makes other users' items "not found"
+        success = await self.repository.delete(item_id, user_id=self.user_id)
 
         if success:
+            # Images that used it show the ID, as for any missing entity
+            await ImageEntityRelationshipRepository(self.session).update_entity_name(
+                ['clothing_item'], item_id, item_id
+            )
             await self.session.commit()
             logger.info(f"Deleted clothing item: {item_id}", extra={'extra_fields': {
                 'item_id': item_id
@@ -276,16 +442,23 @@ class ClothingItemServiceDB:
         # Convert list of tuples to dict
         return {category: count for category, count in categories}
 
-    async def count_clothing_items(self, category: Optional[str] = None) -> int:
+    async def count_clothing_items(self, category: Optional[str] = None, approximate: bool = False) -> int:
         """
         Count total clothing items (filtered by user and optionally by category)
 
         Args:
             category: Optional category filter
+            approximate: Use the planner's table estimate instead of COUNT(*)
+                         (only possible without user/category filters)
 
         Returns:
             Total number of clothing items
         """
+        if approximate and self.user_id is None and not category:
+            estimate = await approximate_count(self.session, ClothingItem)
+            if estimate is not None:
+                return estimate
+
         return await self.repository.count(user_id=self.user_id, category=category)
 
     def _generate_preview_safe(self, item_id: str):
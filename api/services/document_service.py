@@ -3,6 +3,7 @@ Document Service
 
 Handles document entity storage, retrieval, and management.
 Documents can be PDFs, URLs, or text, and are associated with board games.
+Each document is a JSON file; listing goes through a SQLite index of them.
 """
 
 import json
@@ -12,6 +13,7 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from api.config import settings
+from api.services.record_index import RecordIndex
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +26,12 @@ class DocumentService:
         """Initialize document service"""
         self.documents_dir = Path(settings.base_dir) / "data" / "documents"
         self.documents_dir.mkdir(parents=True, exist_ok=True)
+        self.index = RecordIndex(
+            self.documents_dir,
+            table="documents",
+            id_field="document_id",
+            filter_fields=["game_id"]
+        )
 
     def _get_document_path(self, document_id: str) -> Path:
         """Get path to document JSON file"""
@@ -80,6 +88,7 @@ class DocumentService:
         document_file = self._get_document_path(document_id)
         with open(document_file, 'w') as f:
             json.dump(document_data, f, indent=2)
+        self.index.put(document_data)
 
         return document_data
 
@@ -109,31 +118,9 @@ class DocumentService:
             game_id: Filter by board game ID (optional)
 
         Returns:
-            List of document data dicts
+            List of document data dicts (newest first)
         """
-        documents = []
-
-        for file_path in self.documents_dir.glob("*.json"):
-            try:
-                with open(file_path, 'r') as f:
-                    document_data = json.load(f)
-
-                    # Filter by game_id if provided
-                    if game_id and document_data.get('game_id') != game_id:
-                        continue
-
-                    documents.append(document_data)
-            except Exception as e:
-                logger.error(f"Error loading document {file_path}: {e}")
-                continue
-
-        # Sort by created_at (newest first)
-        documents.sort(
-            key=lambda x: x.get('created_at', ''),
-            reverse=True
-        )
-
-        return documents
+        return self.index.list(game_id=game_id or None)
 
     def update_document(
         self,
@@ -183,6 +170,7 @@ class DocumentService:
         document_file = self._get_document_path(document_id)
         with open(document_file, 'w') as f:
             json.dump(document_data, f, indent=2)
+        self.index.put(document_data)
 
         return document_data
 
@@ -203,6 +191,7 @@ class DocumentService:
 
         # Delete document file
         document_file.unlink()
+        self.index.remove(document_id)
 
         # TODO: Also delete associated files (PDF, markdown, etc.)
         # and remove vectors from ChromaDB
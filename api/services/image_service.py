@@ -4,19 +4,153 @@ Image Service
 Handles business logic for generated images and their relationships to entities.
 """
 
+import asyncio
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Set, Tuple
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.models.db import Image, ImageEntityRelationship
+from ai_tools.shared.preset import get_preset_index
+from api.config import settings
+from api.database import get_session, get_standalone_session
+from api.models.db import Image, ImageEntityRelationship, Character, ClothingItem
 from api.repositories import ImageRepository, ImageEntityRelationshipRepository
+from api.repositories.pagination import approximate_count, decode_cursor, split_page
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Preset categories searched (in order) for visual_style/preset relationships
+PRESET_NAME_CATEGORIES = [
+    'visual_styles', 'expressions', 'accessories', 'art_styles',
+    'hair_colors', 'hair_styles', 'makeup', 'story_themes',
+    'story_prose_styles', 'story_audiences'
+]
+
+# Relationship entity types whose entity_id is a preset ID
+PRESET_ENTITY_TYPES = ['visual_style', 'preset']
+
+
+def preset_display_name(preset_id: str, preset_data: Dict[str, Any]) -> str:
+    """Display name of a preset: _metadata.display_name, then name, then its ID"""
+    metadata = preset_data.get('_metadata', {})
+    return metadata.get('display_name') or preset_data.get('name', preset_id)
+
+
+class PresetNameIndex:
+    """
+    preset_id -> (category, display name) across the preset categories
+
+    A view over the PresetIndex of each category directory (the cache that
+    PresetManager reads and writes through), rebuilt only when one of those
+    indexes changes, so listing images doesn't read preset files.
+    """
+
+    def __init__(self, presets_dir: Path, categories: List[str] = PRESET_NAME_CATEGORIES):
+        self.presets_dir = Path(presets_dir)
+        self.categories = list(categories)
+        self._names: Dict[str, Tuple[str, str]] = {}
+        self._sources: Optional[Tuple[Dict[str, Dict[str, Any]], ...]] = None
+
+    def _build(self) -> Dict[str, Tuple[str, str]]:
+        # PresetIndex replaces its entries dict on every change
+        sources = tuple(get_preset_index(self.presets_dir / category).entries() for category in self.categories)
+        if self._sources is not None and all(a is b for a, b in zip(sources, self._sources)):
+            return self._names
+
+        names: Dict[str, Tuple[str, str]] = {}
+        for category, entries in zip(self.categories, sources):
+            for preset_id, entry in sorted(entries.items()):
+                # The first category containing an ID wins
+                if preset_id in names or not entry["readable"]:
+                    continue
+                metadata = entry["metadata"] or {}
+                names[preset_id] = (category, metadata.get('display_name') or entry["name"] or preset_id)
+        self._names = names
+        self._sources = sources
+        return names
+
+    async def get_names(self) -> Dict[str, Tuple[str, str]]:
+        """Get the index, rescanning changed category directories off the event loop"""
+        return await asyncio.to_thread(self._build)
+
+
+_preset_name_index: Optional[PresetNameIndex] = None
+
+
+def get_preset_name_index() -> PresetNameIndex:
+    """Get the process-wide preset name index"""
+    global _preset_name_index
+    if _preset_name_index is None:
+        _preset_name_index = PresetNameIndex(settings.presets_dir)
+    return _preset_name_index
+
+
+async def propagate_entity_name(
+    entity_types: List[str],
+    entity_id: str,
+    entity_name: str,
+    preset_category: Optional[str] = None,
+    standalone: bool = False
+):
+    """
+    Update the denormalized name on an entity's image relationships
+
+    Runs after the rename has been committed (as a background task, in its
+    own session), so renaming an entity used by many images stays fast.
+    standalone uses a one-off engine, for runs under a private event loop.
+    """
+    session_scope = get_standalone_session if standalone else get_session
+    try:
+        async with session_scope() as session:
+            await ImageEntityRelationshipRepository(session).update_entity_name(
+                entity_types, entity_id, entity_name, preset_category
+            )
+    except Exception as e:
+        logger.warning(f"Failed to propagate new name of {entity_id} to image relationships: {e}", extra={'extra_fields': {
+            'entity_id': entity_id,
+            'entity_types': entity_types,
+            'error': str(e)
+        }})
+
+
+# Name updates started without BackgroundTasks (kept referenced until done)
+_name_update_tasks: Set[asyncio.Task] = set()
+
+
+def schedule_entity_name_update(
+    entity_types: List[str],
+    entity_id: str,
+    entity_name: str,
+    preset_category: Optional[str] = None,
+    background_tasks = None
+):
+    """
+    Run propagate_entity_name for a caller without a database session
+
+    Goes through background_tasks when given, otherwise is started as a task
+    on the running event loop; with no loop (scripts) it runs to completion
+    here on a one-off engine, as the global engine's connections are bound to
+    the loop that opened them. Every rename or delete therefore reaches the
+    image relationships.
+    """
+    if background_tasks is not None:
+        background_tasks.add_task(propagate_entity_name, entity_types, entity_id, entity_name, preset_category)
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(propagate_entity_name(entity_types, entity_id, entity_name, preset_category, standalone=True))
+        return
+
+    task = loop.create_task(propagate_entity_name(entity_types, entity_id, entity_name, preset_category))
+    _name_update_tasks.add(task)
+    task.add_done_callback(_name_update_tasks.discard)
+
 
 class ImageService:
     """Service for managing generated images"""
@@ -60,6 +194,8 @@ class ImageService:
             "entity_type": rel.entity_type,
             "entity_id": rel.entity_id,
             "role": rel.role,
+            "entity_name": rel.entity_name,
+            "preset_category": rel.preset_category,
             "created_at": rel.created_at.isoformat() if rel.created_at else None,
         }
 
@@ -136,6 +272,13 @@ class ImageService:
             )
             relationships.append(rel)
 
+        # Store display names now so listing images needs no lookups
+        entity_names = await self._resolve_entity_names(relationships)
+        for rel in relationships:
+            rel.entity_name, rel.preset_category = entity_names.get(
+                (rel.entity_type, rel.entity_id), (rel.entity_id, None)
+            )
+
         created_rels = await self.relationship_repository.create_many(relationships)
         await self.session.commit()
 
@@ -262,16 +405,11 @@ class ImageService:
         Returns:
             True if deleted, False if not found
         """
-        image = await self.image_repository.get_by_id(image_id)
-
-        if not image:
+        # Check existence and user permission without loading the row
+        if not await self.image_repository.exists(image_id, user_id=self.user_id):
             return False
 
-        # Check user permission
-        if self.user_id and image.user_id != self.user_id:
-            return False
-
-        # Delete relationships first (cascade should handle this, but be explicit)
+        # Delete relationships first (the foreign key has no ON DELETE CASCADE)
         await self.relationship_repository.delete_by_image(image_id)
 
         # Delete image
@@ -305,6 +443,54 @@ class ImageService:
             entity_id=entity_id
         )
 
+    async def _resolve_entity_names(
+        self,
+        relationships: List[ImageEntityRelationship]
+    ) -> Dict[Tuple[str, str], Tuple[str, Optional[str]]]:
+        """
+        Resolve display names for a batch of relationships
+
+        One IN query per database-backed entity type; preset names come from
+        the in-memory preset index.
+
+        Returns:
+            Dict of (entity_type, entity_id) -> (entity_name, preset_category)
+        """
+        ids_by_type: Dict[str, set] = {}
+        for rel in relationships:
+            ids_by_type.setdefault(rel.entity_type, set()).add(rel.entity_id)
+
+        names: Dict[Tuple[str, str], Tuple[str, Optional[str]]] = {}
+
+        if ids_by_type.get('character'):
+            result = await self.session.execute(
+                select(Character.character_id, Character.name)
+                .where(Character.character_id.in_(ids_by_type['character']))
+            )
+            for character_id, name in result.all():
+                if name:
+                    names[('character', character_id)] = (name, None)
+
+        if ids_by_type.get('clothing_item'):
+            result = await self.session.execute(
+                select(ClothingItem.item_id, ClothingItem.item)
+                .where(ClothingItem.item_id.in_(ids_by_type['clothing_item']))
+            )
+            for item_id, item in result.all():
+                if item:
+                    names[('clothing_item', item_id)] = (item, None)
+
+        preset_types = [t for t in PRESET_ENTITY_TYPES if ids_by_type.get(t)]
+        if preset_types:
+            preset_names = await get_preset_name_index().get_names()
+            for entity_type in preset_types:
+                for entity_id in ids_by_type[entity_type]:
+                    if entity_id in preset_names:
+                        category, name = preset_names[entity_id]
+                        names[(entity_type, entity_id)] = (name, category)
+
+        return names
+
     async def list_all_images(
         self,
         limit: Optional[int] = None,
@@ -320,65 +506,80 @@ class ImageService:
         Returns:
             List of image dicts with relationships
         """
-        import json
-        import aiofiles
-        from sqlalchemy import select
-        from api.models.db import Character, ClothingItem
-
         images = await self.image_repository.get_all(limit=limit, offset=offset)
+        return await self._images_with_entities(images)
 
-        results = []
-        for image in images:
-            # Get relationships for this image
-            relationships = await self.relationship_repository.get_by_image(image.image_id)
+    async def list_images_page(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        count_mode: str = "none"
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[int]]:
+        """
+        List one page of images with their entity relationships (keyset pagination)
 
-            # Group relationships by entity type and fetch entity details
-            entities_by_type = {}
-            for rel in relationships:
-                if rel.entity_type not in entities_by_type:
-                    entities_by_type[rel.entity_type] = []
+        Args:
+            limit: Page size
+            cursor: Opaque cursor from the previous page (takes precedence over offset)
+            offset: Number of images to skip (legacy, used only without a cursor)
+            count_mode: "exact" (total from the page query itself),
+                        "approximate" (planner estimate) or "none"
 
-                # Fetch entity name based on type
-                entity_name = rel.entity_id
-                preset_category = None  # Track which preset category for routing
+        Returns:
+            Tuple of (image dicts with relationships, next_cursor or None on the
+            last page, total count or None if not requested)
 
-                if rel.entity_type == 'character':
-                    result = await self.session.execute(
-                        select(Character.name).where(Character.character_id == rel.entity_id)
-                    )
-                    char_name = result.scalar_one_or_none()
-                    if char_name:
-                        entity_name = char_name
-                elif rel.entity_type == 'clothing_item':
-                    result = await self.session.execute(
-                        select(ClothingItem.item).where(ClothingItem.item_id == rel.entity_id)
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        page_args = dict(
+            limit=limit + 1 if limit is not None else None,
+            offset=0 if cursor else offset,
+            cursor=decode_cursor(cursor) if cursor else None
+        )
+
+        total = None
+        if count_mode == "exact":
+            images, total = await self.image_repository.get_page(**page_args)
+            if total is None:
+                # Empty page: nothing carried the total
+                total = await self.count_all_images() if cursor or offset else 0
+        else:
+            images = await self.image_repository.get_all(**page_args)
+            if count_mode == "approximate":
+                total = await self.count_all_images(approximate=True)
+
+        images, next_cursor = split_page(images, limit)
+
+        return await self._images_with_entities(images), next_cursor, total
+
+    async def _images_with_entities(self, images: List[Image]) -> List[Dict[str, Any]]:
+        """
+        Convert images to dicts with their entities grouped by type
+
+        Entity names are read from the relationships themselves; only rows
+        created before names were stored need a lookup (one per entity type).
+        """
+        relationships_by_image = await self.relationship_repository.get_by_images(
+            [image.image_id for image in images]
+        )
+        entity_names = await self._resolve_entity_names([
+            rel for rels in relationships_by_image.values() for rel in rels
+            if rel.entity_name is None
+        ])
+
+        results = []
+        for image in images:
+            # Group relationships by entity type
+            entities_by_type = {}
+            for rel in relationships_by_image.get(image.image_id, []):
+                if rel.entity_name is not None:
+                    entity_name, preset_category = rel.entity_name, rel.preset_category
+                else:
+                    entity_name, preset_category = entity_names.get(
+                        (rel.entity_type, rel.entity_id), (rel.entity_id, None)
                     )
-                    item_name = result.scalar_one_or_none()
-                    if item_name:
-                        entity_name = item_name
-                elif rel.entity_type == 'visual_style' or rel.entity_type == 'preset':
-                    # Read preset file to get name - check multiple preset categories
-                    preset_categories = [
-                        'visual_styles', 'expressions', 'accessories', 'art_styles',
-                        'hair_colors', 'hair_styles', 'makeup', 'story_themes',
-                        'story_prose_styles', 'story_audiences'
-                    ]
-
-                    for category in preset_categories:
-                        preset_path = Path(f"/app/presets/{category}/{rel.entity_id}.json")
-                        if preset_path.exists():
-                            try:
-                                async with aiofiles.open(preset_path, 'r') as f:
-                                    content = await f.read()
-                                    preset_data = json.loads(content)
-                                    # Try _metadata.display_name first, then fall back to name
-                                    metadata = preset_data.get('_metadata', {})
-                                    entity_name = metadata.get('display_name') or preset_data.get('name', rel.entity_id)
-                                    preset_category = category
-                                break
-                            except Exception as e:
-                                logger.warning(f"Failed to read preset {rel.entity_id} from {category}: {e}")
-                                continue
 
                 entity_dict = {
                     "entity_id": rel.entity_id,
@@ -390,7 +591,7 @@ class ImageService:
                 if preset_category:
                     entity_dict["preset_category"] = preset_category
 
-                entities_by_type[rel.entity_type].append(entity_dict)
+                entities_by_type.setdefault(rel.entity_type, []).append(entity_dict)
 
             image_dict = self._image_to_dict(image)
             image_dict["entities"] = entities_by_type
@@ -398,11 +599,19 @@ class ImageService:
 
         return results
 
-    async def count_all_images(self) -> int:
+    async def count_all_images(self, approximate: bool = False) -> int:
         """
         Count total number of images
 
+        Args:
+            approximate: Use the planner's table estimate instead of COUNT(*)
+
         Returns:
             Total count of images
         """
+        if approximate:
+            estimate = await approximate_count(self.session, Image)
+            if estimate is not None:
+                return estimate
+
         return await self.image_repository.count_all()
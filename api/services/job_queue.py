@@ -1,14 +1,52 @@
 """Job Queue Manager Service"""
 
 import asyncio
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from api.models.jobs import Job, JobStatus, JobType
 from api.services.storage_backend import StorageBackend, InMemoryBackend
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Registered job handlers: name -> async fn(job_id, **params)
+_resume_handlers: Dict[str, Callable[..., Awaitable[None]]] = {}
+
+# worker_id of jobs waiting in the Celery broker (the broker owns delivery)
+QUEUED_ON_BROKER = "broker"
+
+
+def resumable(name: str):
+    """
+    Register a background job function so it can be dispatched by name
+
+    Registered handlers can be resumed after a crash and run on the
+    out-of-process worker tier (see dispatch_job).
+
+    Usage:
+        @resumable("clothing_item_preview")
+        async def run_preview_generation_job(job_id: str, item_id: str):
+            ...
+
+        job_manager.create_job(..., resume_handler="clothing_item_preview",
+                               resume_params={"item_id": item_id})
+
+    The function is called again with the job's resume_params when the job is
+    found orphaned. Use record_checkpoint()/get_checkpoints() to skip items
+    that already completed.
+    """
+    def decorator(func: Callable[..., Awaitable[None]]):
+        _resume_handlers[name] = func
+        return func
+    return decorator
+
+
+def get_job_handler(name: str) -> Optional[Callable[..., Awaitable[None]]]:
+    """Get a registered job handler by name"""
+    return _resume_handlers.get(name)
+
 
 class JobQueueManager:
     """
@@ -19,44 +57,101 @@ class JobQueueManager:
     - Progress tracking
     - Parent/child job relationships
     - Real-time updates via SSE
-    - Automatic cleanup of old jobs
+    - Cross-worker fan-out of job events (Redis pub/sub)
+    - Bounded LRU job cache (active jobs are never evicted)
+    - Scheduled cleanup of old jobs
+    - Per-item checkpoints and recovery of jobs orphaned by a crashed worker
+    - Optional dispatch to an out-of-process Celery worker tier
     """
 
-    def __init__(self, storage_backend: Optional[StorageBackend] = None):
+    def __init__(
+        self,
+        storage_backend: Optional[StorageBackend] = None,
+        cache_max_size: int = 500,
+        executor: str = "local"
+    ):
         """
         Initialize job queue manager
 
         Args:
             storage_backend: Storage backend for persistence (defaults to in-memory)
+            cache_max_size: Maximum number of inactive jobs kept in the in-memory cache
+            executor: Where dispatched jobs run: "local" (this process) or "celery"
         """
         self.storage = storage_backend or InMemoryBackend()
+        self.executor = executor
         self.active_jobs: Set[str] = set()
         self._subscribers: List[asyncio.Queue] = []  # SSE subscribers
-        self._job_cache: Dict[str, Job] = {}  # In-memory cache for performance
+        self._job_cache: "OrderedDict[str, Job]" = OrderedDict()  # LRU cache for performance
+        self.cache_max_size = cache_max_size
+        self.instance_id = uuid.uuid4().hex  # Identifies this worker's own events
+        self._event_listener: Optional[asyncio.Task] = None
+        self._retention_sweeper: Optional[asyncio.Task] = None
+        self._recovery_monitor: Optional[asyncio.Task] = None
+        self._local_tasks: Set[asyncio.Task] = set()
+        self._worker_ttl_seconds = 60
 
     def _save_job(self, job: Job):
         """Save job to storage backend"""
-        self.storage.set_job(job.job_id, job.model_dump())
-        self._job_cache[job.job_id] = job
+        job_data = job.model_dump()
+        self.storage.set_job(job.job_id, job_data)
+        self._cache_job(job)
+        self._publish_event("saved", job.job_id, job_data)
 
     def _load_job(self, job_id: str) -> Optional[Job]:
         """Load job from cache or storage"""
         # Check cache first
-        if job_id in self._job_cache:
-            return self._job_cache[job_id]
+        job = self._job_cache.get(job_id)
+        if job is not None:
+            self._job_cache.move_to_end(job_id)
+            return job
 
         # Load from storage
         job_data = self.storage.get_job(job_id)
         if job_data:
             job = Job(**job_data)
-            self._job_cache[job_id] = job
+            self._cache_job(job)
             return job
         return None
 
+    def _cache_job(self, job: Job):
+        """Insert job as most recently used and evict inactive jobs over the limit"""
+        self._job_cache[job.job_id] = job
+        self._job_cache.move_to_end(job.job_id)
+
+        if len(self._job_cache) <= self.cache_max_size:
+            return
+
+        # Evict least recently used jobs, skipping active ones (they are pinned)
+        overflow = len(self._job_cache) - self.cache_max_size
+        for cached_id in list(self._job_cache):
+            if overflow <= 0:
+                break
+            cached = self._job_cache[cached_id]
+            if cached_id in self.active_jobs or cached.status in (JobStatus.QUEUED, JobStatus.RUNNING):
+                continue
+            del self._job_cache[cached_id]
+            overflow -= 1
+
+    def _save_jobs(self, jobs: List[Job]):
+        """Save several jobs to storage in one batch"""
+        payloads = {job.job_id: job.model_dump() for job in jobs}
+        events = None
+        if self.storage.supports_events:
+            events = [
+                {"type": "saved", "origin": self.instance_id, "job_id": job_id, "job": job_data}
+                for job_id, job_data in payloads.items()
+            ]
+
+        self.storage.set_jobs(payloads, events)
+        for job in jobs:
+            self._cache_job(job)
+
     def _delete_job_from_storage(self, job_id: str):
         """Delete job from storage and cache"""
         self.storage.delete_job(job_id)
         self._job_cache.pop(job_id, None)
+        self._publish_event("deleted", job_id)
 
     def create_job(
         self,
@@ -65,7 +160,9 @@ class JobQueueManager:
         description: Optional[str] = None,
         parent_job_id: Optional[str] = None,
         total_steps: Optional[int] = None,
-        cancelable: bool = True
+        cancelable: bool = True,
+        resume_handler: Optional[str] = None,
+        resume_params: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Create and queue a new job
@@ -77,6 +174,8 @@ class JobQueueManager:
             parent_job_id: Optional parent job ID for hierarchical jobs
             total_steps: Total number of steps (for progress tracking)
             cancelable: Whether job can be cancelled
+            resume_handler: Name of a @resumable handler to rerun the job after a crash
+            resume_params: JSON-serializable keyword arguments for the resume handler
 
         Returns:
             job_id: Unique job identifier
@@ -87,7 +186,10 @@ class JobQueueManager:
             description=description,
             parent_job_id=parent_job_id,
             total_steps=total_steps,
-            cancelable=cancelable
+            cancelable=cancelable,
+            worker_id=self.instance_id,
+            resume_handler=resume_handler,
+            resume_params=resume_params
         )
 
         self._save_job(job)
@@ -104,6 +206,67 @@ class JobQueueManager:
 
         return job.job_id
 
+    def create_job_group(
+        self,
+        job_type: JobType,
+        title: str,
+        children: List[Dict[str, Any]],
+        description: Optional[str] = None
+    ) -> Tuple[str, List[str]]:
+        """
+        Create a parent job and its child jobs in one storage write
+
+        Creating children one by one with create_job() re-saves the parent
+        for every child; here the parent is built with its full child list
+        and everything is written together. The parent starts out running
+        and completes when its last child finishes.
+
+        Args:
+            job_type: Type of the parent job (and of children that don't set one)
+            title: Parent job title
+            children: Keyword arguments for each child job (title, description,
+                resume_handler, resume_params, job_type, ...)
+            description: Optional parent job description
+
+        Returns:
+            Tuple of (parent job_id, child job_ids in the order given)
+
+        Raises:
+            ValueError: If children is empty
+        """
+        if not children:
+            raise ValueError("A job group needs at least one child job")
+
+        parent = Job(
+            type=job_type,
+            title=title,
+            description=description,
+            status=JobStatus.RUNNING,
+            started_at=datetime.now(),
+            total_steps=len(children),
+            current_step=0,
+            worker_id=self.instance_id
+        )
+
+        child_jobs = []
+        for child in children:
+            child = dict(child)
+            child_jobs.append(Job(
+                type=child.pop("job_type", job_type),
+                parent_job_id=parent.job_id,
+                worker_id=self.instance_id,
+                **child
+            ))
+        parent.child_job_ids = [job.job_id for job in child_jobs]
+
+        self.active_jobs.add(parent.job_id)
+        self._save_jobs([parent] + child_jobs)
+
+        for job in [parent] + child_jobs:
+            self._schedule_notification(job)
+
+        return parent.job_id, parent.child_job_ids
+
     def start_job(self, job_id: str):
         """Mark job as started"""
         job = self._load_job(job_id)
@@ -112,6 +275,7 @@ class JobQueueManager:
 
         job.status = JobStatus.RUNNING
         job.started_at = datetime.now()
+        job.worker_id = self.instance_id
         self.active_jobs.add(job_id)
         self._save_job(job)
 
@@ -153,6 +317,26 @@ class JobQueueManager:
         # Notify subscribers (safe for sync/async contexts)
         self._schedule_notification(job)
 
+    def record_checkpoint(self, job_id: str, item_key: str, result: Any = None):
+        """
+        Record that one item of a batch job finished
+
+        Args:
+            job_id: Job identifier
+            item_key: Stable key of the completed item (e.g. variation index or item ID)
+            result: JSON-serializable item result needed to rebuild the final job result
+        """
+        job = self._load_job(job_id)
+        if not job:
+            raise ValueError(f"Job not found: {job_id}")
+
+        job.checkpoints[item_key] = result
+        self._save_job(job)
+
+    def get_checkpoints(self, job_id: str) -> Dict[str, Any]:
+        """Get completed item checkpoints for a job"""
+        return dict(self.get_job(job_id).checkpoints)
+
     def complete_job(self, job_id: str, result: Optional[Dict] = None):
         """Mark job as completed with result"""
         job = self._load_job(job_id)
@@ -215,13 +399,55 @@ class JobQueueManager:
         # Notify subscribers (safe for sync/async contexts)
         self._schedule_notification(job)
 
-    def get_job(self, job_id: str) -> Job:
-        """Get job by ID"""
+    def get_job(self, job_id: str, refresh: bool = False) -> Job:
+        """
+        Get job by ID
+
+        Args:
+            job_id: Job identifier
+            refresh: Bypass the in-memory cache and reload from storage
+        """
+        if refresh:
+            self._job_cache.pop(job_id, None)
+
         job = self._load_job(job_id)
         if not job:
             raise ValueError(f"Job not found: {job_id}")
         return job
 
+    def dispatch_job(self, job_id: str, background_tasks=None):
+        """
+        Run a job's registered handler
+
+        With the "celery" executor the job is sent to the worker tier, which
+        reports progress through the shared job backend. Otherwise the handler
+        runs in this process, via FastAPI BackgroundTasks when given.
+
+        Args:
+            job_id: Job created with resume_handler/resume_params
+            background_tasks: Optional FastAPI BackgroundTasks for local execution
+        """
+        job = self.get_job(job_id)
+        handler = get_job_handler(job.resume_handler) if job.resume_handler else None
+        if handler is None:
+            raise ValueError(f"Job has no registered handler: {job_id}")
+
+        if self.executor == "celery":
+            from api.workers.tasks import run_job
+
+            job.worker_id = QUEUED_ON_BROKER
+            self._save_job(job)
+            run_job.delay(job_id)
+            return
+
+        params = job.resume_params or {}
+        if background_tasks is not None:
+            background_tasks.add_task(handler, job_id, **params)
+        else:
+            task = asyncio.create_task(handler(job_id, **params))
+            self._local_tasks.add(task)
+            task.add_done_callback(self._local_tasks.discard)
+
     def list_jobs(
         self,
         status: Optional[JobStatus] = None,
@@ -277,29 +503,68 @@ class JobQueueManager:
 
         self._delete_job_from_storage(job_id)
 
-    def cleanup_old_jobs(self, max_age_hours: int = 24):
+    def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
         """
         Remove old completed/failed jobs
 
+        Uses the backend's completion-time index, so only expired jobs are
+        touched rather than every stored job.
+
         Args:
             max_age_hours: Maximum age in hours before cleanup
+
+        Returns:
+            Number of jobs removed
         """
         cutoff = datetime.now() - timedelta(hours=max_age_hours)
-        jobs_to_delete = []
+        removed = 0
 
-        # Load all jobs
-        job_ids = self.storage.list_jobs()
-        for job_id in job_ids:
+        for job_id in self.storage.list_finished_before(cutoff):
             job = self._load_job(job_id)
-            if job and job.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
-                if job.completed_at and job.completed_at < cutoff:
-                    jobs_to_delete.append(job_id)
+            if job is None:
+                # Already expired from storage (e.g. Redis TTL) - drop index entry
+                self.storage.delete_job(job_id)
+                self._job_cache.pop(job_id, None)
+                removed += 1
+                continue
 
-        for job_id in jobs_to_delete:
             try:
                 self.delete_job(job_id)
+                removed += 1
             except ValueError:
-                pass  # Job may have been deleted already
+                pass  # Job may have been deleted or restarted already
+
+        return removed
+
+    async def start_retention_sweeper(self, interval_seconds: int, max_age_hours: int):
+        """Periodically remove old jobs (called on app startup)"""
+        if self._retention_sweeper is not None:
+            return
+
+        async def sweep():
+            while True:
+                try:
+                    removed = self.cleanup_old_jobs(max_age_hours=max_age_hours)
+                    if removed:
+                        logger.info(f"Job retention sweep removed {removed} jobs")
+                except Exception as e:
+                    logger.warning(f"Job retention sweep failed: {e}")
+                await asyncio.sleep(interval_seconds)
+
+        self._retention_sweeper = asyncio.create_task(sweep())
+        logger.info(f"Job retention sweeper started (every {interval_seconds}s, max age {max_age_hours}h)")
+
+    async def stop_retention_sweeper(self):
+        """Stop the periodic cleanup task (called on app shutdown)"""
+        if self._retention_sweeper is None:
+            return
+
+        self._retention_sweeper.cancel()
+        try:
+            await self._retention_sweeper
+        except asyncio.CancelledError:
+            pass
+        self._retention_sweeper = None
 
     # SSE support
 
@@ -349,6 +614,173 @@ class JobQueueManager:
             except:
                 pass  # Ignore errors for dead subscribers
 
+    # Orphaned job recovery
+
+    async def recover_orphaned_jobs(self) -> int:
+        """
+        Resume or fail active jobs whose worker is gone
+
+        Jobs with a registered resume handler are re-dispatched (on this worker
+        or the Celery tier) and skip items already checkpointed; other orphaned
+        jobs are marked failed so they don't stay RUNNING forever.
+
+        Returns:
+            Number of jobs resumed
+        """
+        resumed = 0
+
+        for job_id in self.storage.list_active_jobs():
+            job_data = self.storage.get_job(job_id)
+            if not job_data:
+                continue
+
+            job = Job(**job_data)
+            if job.status not in (JobStatus.QUEUED, JobStatus.RUNNING):
+                continue
+            if job.worker_id in (self.instance_id, QUEUED_ON_BROKER):
+                continue
+            if job.worker_id and self.storage.is_worker_alive(job.worker_id):
+                continue
+            if not self.storage.claim_job(job_id, self.instance_id, self._worker_ttl_seconds):
+                continue  # Another worker is recovering it
+
+            # Storage is authoritative here; replace any stale cached copy
+            self._cache_job(job)
+
+            handler = get_job_handler(job.resume_handler) if job.resume_handler else None
+            if handler is None:
+                logger.warning(f"Failing orphaned job {job_id} (worker {job.worker_id} is gone)")
+                self.fail_job(job_id, "Job interrupted by server restart")
+                continue
+
+            job.worker_id = self.instance_id
+            self._save_job(job)
+
+            logger.info(
+                f"Resuming orphaned job {job_id} from {len(job.checkpoints)} checkpoint(s)",
+                extra={'extra_fields': {
+                    'job_id': job_id,
+                    'resume_handler': job.resume_handler,
+                    'checkpoints': len(job.checkpoints)
+                }}
+            )
+            self.dispatch_job(job_id)
+            resumed += 1
+
+        return resumed
+
+    async def start_recovery_monitor(self, heartbeat_seconds: int):
+        """
+        Heartbeat this worker and recover orphaned jobs (called on app startup)
+
+        A crashed worker's jobs are detected once its heartbeat expires
+        (3 x heartbeat_seconds), so recovery runs on every heartbeat rather
+        than only once at startup.
+        """
+        if self._recovery_monitor is not None:
+            return
+
+        self._worker_ttl_seconds = heartbeat_seconds * 3
+
+        async def monitor():
+            while True:
+                try:
+                    self.storage.heartbeat_worker(self.instance_id, self._worker_ttl_seconds)
+                    await self.recover_orphaned_jobs()
+                except Exception as e:
+                    logger.warning(f"Job recovery pass failed: {e}")
+                await asyncio.sleep(heartbeat_seconds)
+
+        self._recovery_monitor = asyncio.create_task(monitor())
+        logger.info(f"Job recovery monitor started (heartbeat every {heartbeat_seconds}s)")
+
+    async def stop_recovery_monitor(self):
+        """Stop heartbeating so other workers can pick up this worker's jobs"""
+        if self._recovery_monitor is None:
+            return
+
+        self._recovery_monitor.cancel()
+        try:
+            await self._recovery_monitor
+        except asyncio.CancelledError:
+            pass
+        self._recovery_monitor = None
+
+        try:
+            self.storage.remove_worker(self.instance_id)
+        except Exception as e:
+            logger.warning(f"Failed to deregister worker: {e}")
+
+    # Cross-worker events
+
+    def _publish_event(self, event_type: str, job_id: str, job_data: Optional[dict] = None):
+        """Publish job mutation so other workers can update caches and SSE clients"""
+        if not self.storage.supports_events:
+            return
+
+        event = {"type": event_type, "origin": self.instance_id, "job_id": job_id}
+        if job_data is not None:
+            event["job"] = job_data
+
+        try:
+            self.storage.publish_event(event)
+        except Exception as e:
+            logger.warning(f"Failed to publish job event for {job_id}: {e}")
+
+    async def start_event_listener(self):
+        """Start consuming job events from other workers (called on app startup)"""
+        if not self.storage.supports_events or self._event_listener is not None:
+            return
+
+        self._event_listener = asyncio.create_task(self._consume_events())
+        logger.info("Job event listener started")
+
+    async def stop_event_listener(self):
+        """Stop consuming job events (called on app shutdown)"""
+        if self._event_listener is None:
+            return
+
+        self._event_listener.cancel()
+        try:
+            await self._event_listener
+        except asyncio.CancelledError:
+            pass
+        self._event_listener = None
+        logger.info("Job event listener stopped")
+
+    async def _consume_events(self):
+        """Apply events from other workers, reconnecting on errors"""
+        while True:
+            try:
+                async for event in self.storage.listen_events():
+                    await self._apply_event(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Job event listener error, reconnecting: {e}")
+                await asyncio.sleep(1.0)
+
+    async def _apply_event(self, event: dict):
+        """Update local cache and SSE subscribers from another worker's event"""
+        if event.get("origin") == self.instance_id:
+            return  # Already applied locally
+
+        job_id = event.get("job_id")
+        if not job_id:
+            return
+
+        if event.get("type") == "deleted":
+            self._job_cache.pop(job_id, None)
+            return
+
+        job_data = event.get("job")
+        if not job_data:
+            return
+
+        job = Job(**job_data)
+        self._cache_job(job)
+        await self._notify_subscribers(job)
+
     # Private helpers
 
     def _update_parent_progress(self, parent_job_id: str):
@@ -418,18 +850,40 @@ def get_job_queue_manager() -> JobQueueManager:
         from api.config import settings
         from api.services.storage_backend import RedisBackend, InMemoryBackend
 
+        executor = settings.job_executor
+
         if settings.job_storage_backend == "redis":
             try:
-                backend = RedisBackend(redis_url=settings.redis_url)
+                backend = RedisBackend(
+                    redis_url=settings.redis_url,
+                    events_channel=settings.job_events_channel,
+                    terminal_ttl_seconds=settings.job_retention_hours * 3600
+                )
                 logger.info(f"Job queue using Redis: {settings.redis_url}")
             except Exception as e:
                 logger.warning(f"Failed to connect to Redis: {e}")
                 logger.warning("Falling back to in-memory storage")
                 backend = InMemoryBackend()
+            else:
+                # Jobs written before the finished/active indexes existed
+                try:
+                    indexed = backend.backfill_indexes()
+                    if indexed:
+                        logger.info(f"Indexed {indexed} previously stored jobs")
+                except Exception as e:
+                    logger.warning(f"Failed to backfill job indexes: {e}")
         else:
             logger.info("Job queue using in-memory storage")
             backend = InMemoryBackend()
 
-        job_queue_manager = JobQueueManager(storage_backend=backend)
+        if executor == "celery" and not backend.supports_events:
+            logger.warning("Celery executor requires the Redis job backend, running jobs in-process")
+            executor = "local"
+
+        job_queue_manager = JobQueueManager(
+            storage_backend=backend,
+            cache_max_size=settings.job_cache_max_size,
+            executor=executor
+        )
 
     return job_queue_manager
@@ -0,0 +1,144 @@
+"""
+Password Hasher
+
+Runs bcrypt off the event loop. Hashing and verification take ~100-300 ms
+of CPU each; run inline in an async route they freeze the whole worker
+(every request and SSE stream on it) for that long.
+
+- Work runs on a small dedicated thread pool (bcrypt releases the GIL)
+- A cap on in-flight operations bounds CPU spent on logins; callers beyond
+  it wait briefly and are then rejected, which also throttles brute force
+- The work factor is configurable; hashes with a different cost are
+  reported by needs_rehash() so they can be upgraded on next login
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import bcrypt
+
+from api.config import settings
+from api.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# bcrypt only uses the first 72 bytes of a password
+BCRYPT_MAX_BYTES = 72
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when too many password operations are already in flight"""
+
+
+def _password_bytes(password: str) -> bytes:
+    """Encode a password, truncated to bcrypt's 72-byte limit"""
+    return password.encode('utf-8')[:BCRYPT_MAX_BYTES]
+
+
+def hash_password_sync(password: str, rounds: int) -> str:
+    """Hash a password with bcrypt (blocking)"""
+    return bcrypt.hashpw(_password_bytes(password), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+
+def verify_password_sync(password: str, hashed_password: str) -> bool:
+    """Check a password against a bcrypt hash (blocking); False for malformed hashes"""
+    try:
+        return bcrypt.checkpw(_password_bytes(password), hashed_password.encode('utf-8'))
+    except Exception:
+        return False
+
+
+def hash_rounds(hashed_password: str) -> Optional[int]:
+    """Cost factor of a bcrypt hash ("$2b$12$..." -> 12), or None if unparseable"""
+    parts = hashed_password.split('$')
+    if len(parts) < 4:
+        return None
+    try:
+        return int(parts[2])
+    except ValueError:
+        return None
+
+
+class PasswordHasher:
+    """Bounded, non-blocking bcrypt hashing and verification"""
+
+    def __init__(
+        self,
+        rounds: int = 12,
+        max_workers: int = 2,
+        max_in_flight: int = 16,
+        wait_timeout: float = 5.0
+    ):
+        """
+        Args:
+            rounds: bcrypt cost factor for new hashes (4-31)
+            max_workers: Threads doing bcrypt work (CPU cores spent on logins)
+            max_in_flight: Operations allowed running or queued at once
+            wait_timeout: Seconds a caller waits for a slot before being rejected
+        """
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.wait_timeout = wait_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._slots: Optional[asyncio.Semaphore] = None  # Created on the serving event loop
+
+    async def _run(self, func, *args):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.wait_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Password hashing capacity exhausted", extra={'extra_fields': {
+                'max_in_flight': self.max_in_flight
+            }})
+            raise PasswordHasherBusyError("Too many concurrent password operations")
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password with the configured work factor
+
+        Raises:
+            PasswordHasherBusyError: If no slot frees up within wait_timeout
+        """
+        return await self._run(hash_password_sync, password, self.rounds)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Check a password against a bcrypt hash
+
+        Raises:
+            PasswordHasherBusyError: If no slot frees up within wait_timeout
+        """
+        return await self._run(verify_password_sync, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Whether a hash was made with a different work factor than configured"""
+        return hash_rounds(hashed_password) != self.rounds
+
+    def shutdown(self):
+        """Stop the worker threads (called on app shutdown)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_password_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Get the process-wide password hasher"""
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher(
+            rounds=settings.bcrypt_rounds,
+            max_workers=settings.password_hash_workers,
+            max_in_flight=settings.password_hash_max_in_flight,
+            wait_timeout=settings.password_hash_wait_seconds
+        )
+    return _password_hasher
@@ -28,6 +28,11 @@ from ai_capabilities.specs import (
     CharacterAppearanceSpec
 )
 from api.config import settings
+from api.services.image_service import (
+    PRESET_ENTITY_TYPES,
+    preset_display_name,
+    schedule_entity_name_update
+)
 from api.logging_config import (
     get_logger,
     log_background_task_start,
@@ -293,6 +298,7 @@ class PresetService:
             display_name: Optional new display name
             notes: Optional notes
             background_tasks: Optional FastAPI BackgroundTasks for async visualization
+                              (and for copying a new name to image relationships)
         """
         if category not in self.CATEGORIES:
             raise ValueError(f"Invalid category: {category}")
@@ -305,6 +311,7 @@ class PresetService:
         # Load existing data
         with open(preset_path) as f:
             existing_data = json.load(f)
+        old_name = preset_display_name(preset_id, existing_data)
 
         # Check if data actually changed (not just metadata) - BEFORE updating
         should_generate_preview = False
@@ -340,6 +347,13 @@ class PresetService:
         # Write back
         with open(preset_path, 'w') as f:
             json.dump(existing_data, f, indent=2, default=str)
+        self.preset_manager.refresh(category, preset_id)
+
+        new_name = preset_display_name(preset_id, existing_data)
+        if new_name != old_name:
+            schedule_entity_name_update(
+                PRESET_ENTITY_TYPES, preset_id, new_name, category, background_tasks=background_tasks
+            )
 
         if should_generate_preview:
             if background_tasks is not None:
@@ -355,13 +369,15 @@ class PresetService:
                 # Fallback to synchronous generation
                 self._generate_preview(category, preset_id, existing_data)
 
-    def delete_preset(self, category: str, preset_id: str) -> bool:
+    def delete_preset(self, category: str, preset_id: str, background_tasks = None) -> bool:
         """
         Delete a preset by ID (and its preview image if applicable)
 
         Args:
             category: Category name
             preset_id: Preset UUID
+            background_tasks: Optional FastAPI BackgroundTasks for resetting the
+                              name stored on image relationships
 
         Returns:
             True if deleted
@@ -373,7 +389,13 @@ class PresetService:
         if not self.preset_manager.exists(category, preset_id):
             raise FileNotFoundError(f"Preset not found: {category}/{preset_id}")
 
-        return self.preset_manager.delete(category, preset_id)
+        deleted = self.preset_manager.delete(category, preset_id)
+        if deleted:
+            # Images that used it show the ID, as for any missing entity
+            schedule_entity_name_update(
+                PRESET_ENTITY_TYPES, preset_id, preset_id, background_tasks=background_tasks
+            )
+        return deleted
 
     def duplicate_preset(
         self,
@@ -413,15 +435,11 @@ class PresetService:
 
     def get_total_presets(self) -> int:
         """Get total number of presets across all categories"""
-        total = 0
-        for category in self.CATEGORIES:
-            total += len(self.list_presets(category))
-        return total
+        return sum(self.preset_manager.count(category) for category in self.CATEGORIES)
 
     def validate_preset_exists(self, category: str, name: str) -> bool:
         """Check if a preset exists"""
         if category not in self.CATEGORIES:
             return False
 
-        preset_path = self.presets_dir / category / f"{name}.json"
-        return preset_path.exists()
+        return self.preset_manager.exists(category, name)
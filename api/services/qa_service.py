@@ -3,8 +3,10 @@ Q&A Service
 
 Handles Q&A entity storage, retrieval, and management.
 Q&As can be document-grounded, general knowledge, image-based, or comparison.
+Each Q&A is a JSON file; listing and search go through a SQLite index of them.
 """
 
+import asyncio
 import json
 import uuid
 import aiofiles
@@ -13,6 +15,7 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from api.config import settings
+from api.services.record_index import RecordIndex
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -25,6 +28,13 @@ class QAService:
         """Initialize Q&A service"""
         self.qas_dir = Path(settings.base_dir) / "data" / "qas"
         self.qas_dir.mkdir(parents=True, exist_ok=True)
+        self.index = RecordIndex(
+            self.qas_dir,
+            table="qas",
+            id_field="qa_id",
+            filter_fields=["game_id", "context_type", "is_favorite"],
+            text_fields=["question", "answer"]
+        )
 
     def _get_qa_path(self, qa_id: str) -> Path:
         """Get path to Q&A JSON file"""
@@ -84,6 +94,7 @@ class QAService:
         qa_file = self._get_qa_path(qa_id)
         async with aiofiles.open(qa_file, 'w') as f:
             await f.write(json.dumps(qa_data, indent=2))
+        await asyncio.to_thread(self.index.put, qa_data)
 
         return qa_data
 
@@ -121,37 +132,15 @@ class QAService:
             is_favorite: Filter by favorite status (optional)
 
         Returns:
-            List of Q&A data dicts
+            List of Q&A data dicts (newest first)
         """
-        qas = []
-
-        for file_path in self.qas_dir.glob("*.json"):
-            try:
-                async with aiofiles.open(file_path, 'r') as f:
-                    content = await f.read()
-                    qa_data = json.loads(content)
-
-                    # Apply filters
-                    if game_id and qa_data.get('game_id') != game_id:
-                        continue
-                    if context_type and qa_data.get('context_type') != context_type:
-                        continue
-                    if is_favorite is not None and qa_data.get('is_favorite') != is_favorite:
-                        continue
-
-                    qas.append(qa_data)
-            except Exception as e:
-                logger.error(f"Error loading Q&A {file_path}: {e}")
-                continue
-
-        # Sort by created_at (newest first)
-        qas.sort(
-            key=lambda x: x.get('created_at', ''),
-            reverse=True
+        return await asyncio.to_thread(
+            self.index.list,
+            game_id=game_id or None,
+            context_type=context_type or None,
+            is_favorite=is_favorite
         )
 
-        return qas
-
     async def update_qa(
         self,
         qa_id: str,
@@ -198,10 +187,11 @@ class QAService:
         qa_file = self._get_qa_path(qa_id)
         async with aiofiles.open(qa_file, 'w') as f:
             await f.write(json.dumps(qa_data, indent=2))
+        await asyncio.to_thread(self.index.put, qa_data)
 
         return qa_data
 
-    def delete_qa(self, qa_id: str) -> bool:
+    async def delete_qa(self, qa_id: str) -> bool:
         """
         Delete a Q&A
 
@@ -218,6 +208,7 @@ class QAService:
 
         # Delete Q&A file
         qa_file.unlink()
+        await asyncio.to_thread(self.index.remove, qa_id)
 
         return True
 
@@ -230,35 +221,6 @@ class QAService:
             game_id: Filter by board game ID (optional)
 
         Returns:
-            List of matching Q&A data dicts
+            List of matching Q&A data dicts (newest first)
         """
-        query_lower = query.lower()
-        matching_qas = []
-
-        for file_path in self.qas_dir.glob("*.json"):
-            try:
-                async with aiofiles.open(file_path, 'r') as f:
-                    content = await f.read()
-                    qa_data = json.loads(content)
-
-                    # Filter by game_id if provided
-                    if game_id and qa_data.get('game_id') != game_id:
-                        continue
-
-                    # Check if query matches question or answer
-                    question = qa_data.get('question', '').lower()
-                    answer = qa_data.get('answer', '').lower()
-
-                    if query_lower in question or query_lower in answer:
-                        matching_qas.append(qa_data)
-            except Exception as e:
-                logger.error(f"Error searching Q&A {file_path}: {e}")
-                continue
-
-        # Sort by created_at (newest first)
-        matching_qas.sort(
-            key=lambda x: x.get('created_at', ''),
-            reverse=True
-        )
-
-        return matching_qas
+        return await asyncio.to_thread(self.index.search, query, game_id=game_id or None)
@@ -0,0 +1,221 @@
+"""
+Record Index
+
+SQLite index over a directory of JSON records (one <id>.json file per
+record, as used for Q&As and documents). The JSON files stay the source of
+truth; the index lets listing and searching run as indexed queries instead
+of parsing every file on every request:
+
+- Filter columns are copied out of each record and indexed with created_at
+- Text fields go into an FTS5 trigram table, so case-insensitive substring
+  search (the old `query in text` semantics) uses the index
+- On first use in a process the index is reconciled with the directory by
+  file mtime, which also imports records created before the index existed
+
+The services update the index whenever they write or delete a file.
+"""
+
+import json
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from api.config import settings
+from api.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Shortest query the trigram tokenizer can match; shorter ones use LIKE
+MIN_FTS_QUERY_LENGTH = 3
+
+# (db_path, table) pairs already reconciled with their directory in this process
+_synced = set()
+_sync_lock = threading.Lock()
+
+
+class RecordIndex:
+    """Indexed view of one directory of JSON records"""
+
+    def __init__(
+        self,
+        records_dir: Path,
+        table: str,
+        id_field: str,
+        filter_fields: Sequence[str],
+        text_fields: Sequence[str] = (),
+        db_path: Optional[Path] = None
+    ):
+        """
+        Args:
+            records_dir: Directory holding <id>.json files
+            table: Table name for this record type
+            id_field: Record key holding the ID (matches the file stem)
+            filter_fields: Record keys that can be filtered on with equality
+            text_fields: Record keys searched by search()
+            db_path: SQLite file (default: settings.record_index_path)
+        """
+        self.records_dir = Path(records_dir)
+        self.table = table
+        self.id_field = id_field
+        self.filter_fields = list(filter_fields)
+        self.text_fields = list(text_fields)
+        self.db_path = Path(db_path or settings.record_index_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        columns = "".join(f", {field}" for field in self.filter_fields)
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            f"record_id TEXT PRIMARY KEY{columns}, created_at TEXT, "
+            f"file_mtime_ns INTEGER NOT NULL, data TEXT NOT NULL)"
+        )
+        conn.execute(f"CREATE INDEX IF NOT EXISTS ix_{self.table}_created ON {self.table} (created_at)")
+        for field in self.filter_fields:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{self.table}_{field}_created "
+                f"ON {self.table} ({field}, created_at)"
+            )
+        if self.text_fields:
+            conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table}_fts USING fts5("
+                f"record_id UNINDEXED, {', '.join(self.text_fields)}, tokenize='trigram')"
+            )
+
+    def _write(self, conn: sqlite3.Connection, record: Dict[str, Any], mtime_ns: int):
+        record_id = record[self.id_field]
+        fields = self.filter_fields + ["created_at"]
+        conn.execute(
+            f"INSERT OR REPLACE INTO {self.table} "
+            f"(record_id, {', '.join(fields)}, file_mtime_ns, data) "
+            f"VALUES ({', '.join('?' * (len(fields) + 3))})",
+            [record_id, *(record.get(field) for field in fields), mtime_ns, json.dumps(record)]
+        )
+        if self.text_fields:
+            conn.execute(f"DELETE FROM {self.table}_fts WHERE record_id = ?", (record_id,))
+            conn.execute(
+                f"INSERT INTO {self.table}_fts (record_id, {', '.join(self.text_fields)}) "
+                f"VALUES ({', '.join('?' * (len(self.text_fields) + 1))})",
+                [record_id, *(record.get(field) or "" for field in self.text_fields)]
+            )
+
+    def _remove(self, conn: sqlite3.Connection, record_id: str):
+        conn.execute(f"DELETE FROM {self.table} WHERE record_id = ?", (record_id,))
+        if self.text_fields:
+            conn.execute(f"DELETE FROM {self.table}_fts WHERE record_id = ?", (record_id,))
+
+    def sync(self) -> int:
+        """
+        Reconcile the index with the JSON files (new, changed and deleted files)
+
+        Returns:
+            Number of records (re)indexed or removed
+        """
+        files = {path.stem: path for path in self.records_dir.glob("*.json")}
+
+        with closing(self._connect()) as conn, conn:
+            self._create_schema(conn)
+            indexed = dict(conn.execute(f"SELECT record_id, file_mtime_ns FROM {self.table}"))
+
+            changes = 0
+            for record_id, path in files.items():
+                try:
+                    mtime_ns = path.stat().st_mtime_ns
+                    if indexed.get(record_id) == mtime_ns:
+                        continue
+                    with open(path, 'r') as f:
+                        record = json.load(f)
+                    record[self.id_field] = record_id
+                except Exception as e:
+                    logger.error(f"Error indexing {path}: {e}")
+                    continue
+                self._write(conn, record, mtime_ns)
+                changes += 1
+
+            for record_id in indexed.keys() - files.keys():
+                self._remove(conn, record_id)
+                changes += 1
+
+        if changes:
+            logger.info(f"Synced {changes} records into the {self.table} index")
+        return changes
+
+    def _ensure_synced(self):
+        key = (self.db_path, self.table)
+        if key in _synced:
+            return
+        with _sync_lock:
+            if key not in _synced:
+                self.sync()
+                _synced.add(key)
+
+    def put(self, record: Dict[str, Any]):
+        """Index a record right after its JSON file was written"""
+        self._ensure_synced()
+        record_path = self.records_dir / f"{record[self.id_field]}.json"
+        with closing(self._connect()) as conn, conn:
+            self._write(conn, record, record_path.stat().st_mtime_ns)
+
+    def remove(self, record_id: str):
+        """Drop a record after its JSON file was deleted"""
+        self._ensure_synced()
+        with closing(self._connect()) as conn, conn:
+            self._remove(conn, record_id)
+
+    def _where(self, filters: Dict[str, Any], alias: str = "") -> tuple:
+        unknown = set(filters) - set(self.filter_fields)
+        if unknown:
+            raise ValueError(f"Not filterable in {self.table}: {', '.join(sorted(unknown))}")
+
+        clauses = [f"{alias}{field} = ?" for field, value in filters.items() if value is not None]
+        params = [value for value in filters.values() if value is not None]
+        return clauses, params
+
+    def _select(self, sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+        self._ensure_synced()
+        with closing(self._connect()) as conn:
+            return [json.loads(data) for (data,) in conn.execute(sql, params)]
+
+    def list(self, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Records matching all given field values (None means "any"), newest first
+        """
+        clauses, params = self._where(filters)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._select(f"SELECT data FROM {self.table}{where} ORDER BY created_at DESC", params)
+
+    def search(self, query: str, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Records whose text fields contain query (case-insensitive), newest first
+        """
+        clauses, params = self._where(filters, alias="r.")
+
+        if len(query) >= MIN_FTS_QUERY_LENGTH:
+            # Quoted as a single FTS5 string: the trigram tokenizer then
+            # matches it as a substring
+            match = '"' + query.replace('"', '""') + '"'
+            sql = (
+                f"SELECT r.data FROM {self.table} r "
+                f"JOIN {self.table}_fts f ON f.record_id = r.record_id "
+                f"WHERE {self.table}_fts MATCH ?"
+            )
+            params = [match, *params]
+        else:
+            like = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            text_match = " OR ".join(f"f.{field} LIKE ? ESCAPE '\\'" for field in self.text_fields)
+            sql = (
+                f"SELECT r.data FROM {self.table} r "
+                f"JOIN {self.table}_fts f ON f.record_id = r.record_id "
+                f"WHERE ({text_match})"
+            )
+            params = [like] * len(self.text_fields) + params
+
+        for clause in clauses:
+            sql += f" AND {clause}"
+        return self._select(sql + " ORDER BY r.created_at DESC", params)
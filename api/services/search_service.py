@@ -0,0 +1,122 @@
+"""
+Search Service
+
+Cross-entity search over characters, clothing items and board games using
+the PostgreSQL full-text (tsvector) and trigram indexes.
+"""
+
+from typing import Optional, List, Dict, Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.repositories import CharacterRepository, ClothingItemRepository, BoardGameRepository
+from api.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class SearchService:
+    """Service for ranked search and search-as-you-type suggestions"""
+
+    ENTITY_TYPES = ("characters", "clothing_items", "board_games")
+
+    def __init__(self, session: AsyncSession, user_id: Optional[int] = None):
+        """
+        Initialize search service with database session
+
+        Args:
+            session: SQLAlchemy async session
+            user_id: Optional user ID for filtering
+        """
+        self.session = session
+        self.user_id = user_id
+        self.repositories = {
+            "characters": CharacterRepository(session),
+            "clothing_items": ClothingItemRepository(session),
+            "board_games": BoardGameRepository(session),
+        }
+
+    def _entity_id_and_name(self, entity_type: str, entity) -> tuple:
+        if entity_type == "characters":
+            return entity.character_id, entity.name
+        if entity_type == "clothing_items":
+            return entity.item_id, entity.item
+        return entity.game_id, entity.name
+
+    def _validate_types(self, entity_types: Optional[List[str]]) -> List[str]:
+        if not entity_types:
+            return list(self.ENTITY_TYPES)
+        unknown = [t for t in entity_types if t not in self.ENTITY_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown entity types: {', '.join(unknown)}")
+        return entity_types
+
+    async def search(
+        self,
+        query: str,
+        entity_types: Optional[List[str]] = None,
+        limit: int = 20
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Ranked full-text search with highlighted snippets
+
+        Args:
+            query: Search text (every word is matched as a prefix)
+            entity_types: Entity types to search (default: all)
+            limit: Maximum results per entity type
+
+        Returns:
+            Dict of entity_type -> results (entity_id, name, rank, snippet), best first
+
+        Raises:
+            ValueError: If an unknown entity type is requested
+        """
+        results = {}
+        # One AsyncSession can't run queries concurrently; each is an index lookup
+        for entity_type in self._validate_types(entity_types):
+            rows = await self.repositories[entity_type].search_ranked(
+                query, user_id=self.user_id, limit=limit
+            )
+            results[entity_type] = []
+            for entity, rank, snippet in rows:
+                entity_id, name = self._entity_id_and_name(entity_type, entity)
+                results[entity_type].append({
+                    "entity_id": entity_id,
+                    "name": name,
+                    "rank": round(float(rank), 4),
+                    "snippet": snippet,
+                })
+
+        return results
+
+    async def suggest(
+        self,
+        query: str,
+        entity_types: Optional[List[str]] = None,
+        limit: int = 10
+    ) -> List[Dict[str, str]]:
+        """
+        Search-as-you-type suggestions (names only)
+
+        Args:
+            query: Partial search text
+            entity_types: Entity types to search (default: all)
+            limit: Maximum suggestions per entity type
+
+        Returns:
+            List of dicts with entity_type, entity_id and name
+
+        Raises:
+            ValueError: If an unknown entity type is requested
+        """
+        suggestions = []
+        for entity_type in self._validate_types(entity_types):
+            rows = await self.repositories[entity_type].suggest(
+                query, user_id=self.user_id, limit=limit
+            )
+            suggestions.extend(
+                {"entity_type": entity_type, "entity_id": entity_id, "name": name}
+                for entity_id, name in rows
+            )
+
+        return suggestions
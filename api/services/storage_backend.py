@@ -7,12 +7,30 @@ Provides pluggable storage backends for job persistence:
 
 import json
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from datetime import datetime
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Job statuses that will never change again (eligible for retention cleanup)
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+def _is_terminal(job_data: dict) -> bool:
+    """Check whether serialized job data is in a terminal status"""
+    return job_data.get("status") in TERMINAL_STATUSES
+
+
+def _finished_timestamp(job_data: dict) -> float:
+    """Completion time of a job as a UNIX timestamp (falls back to now)"""
+    completed_at = job_data.get("completed_at")
+    if isinstance(completed_at, str):
+        completed_at = datetime.fromisoformat(completed_at)
+    if isinstance(completed_at, datetime):
+        return completed_at.timestamp()
+    return datetime.now().timestamp()
+
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends"""
@@ -42,20 +60,84 @@ class StorageBackend(ABC):
         """Check if job exists"""
         pass
 
+    @abstractmethod
+    def list_finished_before(self, cutoff: datetime) -> List[str]:
+        """List IDs of terminal jobs that completed before cutoff"""
+        pass
+
+    @abstractmethod
+    def list_active_jobs(self) -> List[str]:
+        """List IDs of queued/running jobs"""
+        pass
+
+    # Worker liveness (for orphaned job recovery)
+
+    @abstractmethod
+    def heartbeat_worker(self, worker_id: str, ttl_seconds: int):
+        """Mark a worker as alive for ttl_seconds"""
+        pass
+
+    @abstractmethod
+    def remove_worker(self, worker_id: str):
+        """Mark a worker as gone (graceful shutdown)"""
+        pass
+
+    @abstractmethod
+    def is_worker_alive(self, worker_id: str) -> bool:
+        """Check whether a worker has a current heartbeat"""
+        pass
+
+    @abstractmethod
+    def claim_job(self, job_id: str, worker_id: str, ttl_seconds: int) -> bool:
+        """Atomically claim an orphaned job; False if another worker claimed it"""
+        pass
+
     @abstractmethod
     def clear_all(self):
         """Clear all jobs (for testing)"""
         pass
 
+    # Cross-process job events (optional)
+
+    supports_events: bool = False
+
+    def set_jobs(self, jobs: Dict[str, dict], events: Optional[List[dict]] = None):
+        """
+        Store several jobs and publish their events together
+
+        Backends that can batch writes override this to do it in one
+        round-trip.
+        """
+        for job_id, job_data in jobs.items():
+            self.set_job(job_id, job_data)
+        for event in events or []:
+            self.publish_event(event)
+
+    def publish_event(self, event: dict):
+        """Publish a job event to other processes (no-op by default)"""
+        pass
+
+    async def listen_events(self) -> AsyncIterator[dict]:
+        """Async iterator over job events published by other processes (none by default)"""
+        return
+        yield  # Makes this an (empty) async generator
+
 
 class InMemoryBackend(StorageBackend):
     """In-memory storage backend (no persistence)"""
 
     def __init__(self):
         self.jobs: Dict[str, dict] = {}
+        self.finished: Dict[str, float] = {}  # job_id -> completion timestamp
+        self.workers: Dict[str, float] = {}  # worker_id -> heartbeat expiry timestamp
+        self.claims: Dict[str, str] = {}  # job_id -> claiming worker_id
 
     def set_job(self, job_id: str, job_data: dict):
         self.jobs[job_id] = job_data
+        if _is_terminal(job_data):
+            self.finished[job_id] = _finished_timestamp(job_data)
+        else:
+            self.finished.pop(job_id, None)
 
     def get_job(self, job_id: str) -> Optional[dict]:
         return self.jobs.get(job_id)
@@ -63,6 +145,7 @@ class InMemoryBackend(StorageBackend):
     def delete_job(self, job_id: str):
         if job_id in self.jobs:
             del self.jobs[job_id]
+        self.finished.pop(job_id, None)
 
     def list_jobs(self) -> List[str]:
         return list(self.jobs.keys())
@@ -70,25 +153,68 @@ class InMemoryBackend(StorageBackend):
     def exists(self, job_id: str) -> bool:
         return job_id in self.jobs
 
+    def list_finished_before(self, cutoff: datetime) -> List[str]:
+        cutoff_ts = cutoff.timestamp()
+        return [job_id for job_id, ts in self.finished.items() if ts < cutoff_ts]
+
+    def list_active_jobs(self) -> List[str]:
+        return [job_id for job_id in self.jobs if job_id not in self.finished]
+
+    def heartbeat_worker(self, worker_id: str, ttl_seconds: int):
+        self.workers[worker_id] = datetime.now().timestamp() + ttl_seconds
+
+    def remove_worker(self, worker_id: str):
+        self.workers.pop(worker_id, None)
+
+    def is_worker_alive(self, worker_id: str) -> bool:
+        return self.workers.get(worker_id, 0) > datetime.now().timestamp()
+
+    def claim_job(self, job_id: str, worker_id: str, ttl_seconds: int) -> bool:
+        return self.claims.setdefault(job_id, worker_id) == worker_id
+
     def clear_all(self):
         self.jobs.clear()
+        self.finished.clear()
+        self.claims.clear()
 
 
 class RedisBackend(StorageBackend):
     """Redis storage backend (persistent)"""
 
-    def __init__(self, redis_url: str = "redis://localhost:6379/0", prefix: str = "job:"):
+    supports_events = True
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        prefix: str = "job:",
+        events_channel: str = "jobs:events",
+        finished_index_key: str = "jobs:finished",
+        active_index_key: str = "jobs:active",
+        terminal_ttl_seconds: Optional[int] = None,
+        indexes_marker_key: str = "jobs:indexes_backfilled"
+    ):
         """
         Initialize Redis backend
 
         Args:
             redis_url: Redis connection URL
             prefix: Key prefix for jobs in Redis
+            events_channel: Pub/sub channel for cross-worker job events
+            finished_index_key: Sorted set of terminal job IDs scored by completion time
+            active_index_key: Set of queued/running job IDs
+            terminal_ttl_seconds: Expire terminal jobs after this many seconds (None = keep)
+            indexes_marker_key: Set once jobs stored before the indexes existed were indexed
         """
         try:
             import redis
             self.redis = redis.from_url(redis_url, decode_responses=True)
+            self.redis_url = redis_url
             self.prefix = prefix
+            self.events_channel = events_channel
+            self.finished_index_key = finished_index_key
+            self.active_index_key = active_index_key
+            self.terminal_ttl_seconds = terminal_ttl_seconds
+            self.indexes_marker_key = indexes_marker_key
             # Test connection
             self.redis.ping()
             logger.info(f"Connected to Redis: {redis_url}")
@@ -105,11 +231,39 @@ class RedisBackend(StorageBackend):
         return f"{self.prefix}{job_id}"
 
     def set_job(self, job_id: str, job_data: dict):
-        """Store job in Redis with JSON serialization"""
+        """
+        Store job in Redis with JSON serialization
+
+        Terminal jobs get a TTL and are added to the finished index;
+        re-saving a job as active clears both.
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        self._queue_set_job(pipe, job_id, job_data)
+        pipe.execute()
+
+    def set_jobs(self, jobs: Dict[str, dict], events: Optional[List[dict]] = None):
+        """Store several jobs and publish their events in a single pipeline"""
+        pipe = self.redis.pipeline(transaction=False)
+        for job_id, job_data in jobs.items():
+            self._queue_set_job(pipe, job_id, job_data)
+        for event in events or []:
+            pipe.publish(self.events_channel, json.dumps(self._serialize_datetimes(event)))
+        pipe.execute()
+
+    def _queue_set_job(self, pipe, job_id: str, job_data: dict):
+        """Add the commands storing one job (and its index entries) to a pipeline"""
         key = self._make_key(job_id)
         # Convert datetime objects to ISO strings for JSON
         serialized = self._serialize_datetimes(job_data)
-        self.redis.set(key, json.dumps(serialized))
+
+        if _is_terminal(job_data):
+            pipe.set(key, json.dumps(serialized), ex=self.terminal_ttl_seconds)
+            pipe.zadd(self.finished_index_key, {job_id: _finished_timestamp(job_data)})
+            pipe.srem(self.active_index_key, job_id)
+        else:
+            pipe.set(key, json.dumps(serialized))
+            pipe.zrem(self.finished_index_key, job_id)
+            pipe.sadd(self.active_index_key, job_id)
 
     def get_job(self, job_id: str) -> Optional[dict]:
         """Retrieve job from Redis"""
@@ -123,7 +277,11 @@ class RedisBackend(StorageBackend):
     def delete_job(self, job_id: str):
         """Delete job from Redis"""
         key = self._make_key(job_id)
-        self.redis.delete(key)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.delete(key)
+        pipe.zrem(self.finished_index_key, job_id)
+        pipe.srem(self.active_index_key, job_id)
+        pipe.execute()
 
     def list_jobs(self) -> List[str]:
         """List all job IDs"""
@@ -137,12 +295,124 @@ class RedisBackend(StorageBackend):
         key = self._make_key(job_id)
         return self.redis.exists(key) > 0
 
+    def list_finished_before(self, cutoff: datetime) -> List[str]:
+        """List terminal jobs completed before cutoff (sorted set range query)"""
+        return self.redis.zrangebyscore(self.finished_index_key, "-inf", f"({cutoff.timestamp()}")
+
+    def list_active_jobs(self) -> List[str]:
+        """List queued/running jobs from the active index"""
+        return list(self.redis.smembers(self.active_index_key))
+
+    def backfill_indexes(self, batch_size: int = 500) -> int:
+        """
+        Index jobs stored before the finished/active indexes existed
+
+        Runs until it completes once per Redis database (then a marker key is
+        set). Terminal jobs are added to the finished index and given the
+        terminal TTL if they have none; other jobs are added to the active
+        index. Jobs are not rewritten and every step is idempotent, so this is
+        safe while other workers are running (or backfilling).
+
+        Returns:
+            Number of jobs indexed (0 if already done)
+        """
+        if self.redis.exists(self.indexes_marker_key):
+            return 0
+
+        indexed = 0
+        keys = []
+        for key in self.redis.scan_iter(match=f"{self.prefix}*", count=batch_size):
+            keys.append(key)
+            if len(keys) >= batch_size:
+                indexed += self._index_stored_jobs(keys)
+                keys = []
+        if keys:
+            indexed += self._index_stored_jobs(keys)
+        self.redis.set(self.indexes_marker_key, "1")
+        return indexed
+
+    def _index_stored_jobs(self, keys: List[str]) -> int:
+        """Add one batch of stored jobs to the finished/active indexes"""
+        pipe = self.redis.pipeline(transaction=False)
+        indexed = 0
+        for key, data in zip(keys, self.redis.mget(keys)):
+            if data is None:
+                continue  # Expired or deleted since the scan
+            try:
+                job_data = json.loads(data)
+            except ValueError:
+                logger.warning(f"Skipping unreadable job {key} while backfilling indexes")
+                continue
+
+            job_id = key[len(self.prefix):]
+            if _is_terminal(job_data):
+                pipe.zadd(self.finished_index_key, {job_id: _finished_timestamp(job_data)}, nx=True)
+                if self.terminal_ttl_seconds:
+                    pipe.expire(key, self.terminal_ttl_seconds, nx=True)
+            else:
+                pipe.sadd(self.active_index_key, job_id)
+            indexed += 1
+        pipe.execute()
+        return indexed
+
+    def _worker_key(self, worker_id: str) -> str:
+        return f"jobs:worker:{worker_id}"
+
+    def heartbeat_worker(self, worker_id: str, ttl_seconds: int):
+        """Refresh worker liveness key"""
+        self.redis.set(self._worker_key(worker_id), "1", ex=ttl_seconds)
+
+    def remove_worker(self, worker_id: str):
+        """Delete worker liveness key"""
+        self.redis.delete(self._worker_key(worker_id))
+
+    def is_worker_alive(self, worker_id: str) -> bool:
+        """Check worker liveness key"""
+        return self.redis.exists(self._worker_key(worker_id)) > 0
+
+    def claim_job(self, job_id: str, worker_id: str, ttl_seconds: int) -> bool:
+        """Claim job with SET NX so only one worker resumes it"""
+        return bool(self.redis.set(f"jobs:claim:{job_id}", worker_id, nx=True, ex=ttl_seconds))
+
     def clear_all(self):
         """Clear all jobs (for testing)"""
         pattern = f"{self.prefix}*"
         keys = self.redis.keys(pattern)
         if keys:
             self.redis.delete(*keys)
+        self.redis.delete(self.finished_index_key, self.active_index_key, self.indexes_marker_key)
+
+    def publish_event(self, event: dict):
+        """Publish job event on the Redis events channel"""
+        serialized = self._serialize_datetimes(event)
+        self.redis.publish(self.events_channel, json.dumps(serialized))
+
+    async def listen_events(self) -> AsyncIterator[dict]:
+        """
+        Subscribe to the Redis events channel
+
+        Uses a dedicated async connection so waiting for messages never
+        blocks the event loop.
+        """
+        import redis.asyncio as aioredis
+
+        client = aioredis.from_url(self.redis_url, decode_responses=True)
+        pubsub = client.pubsub()
+        await pubsub.subscribe(self.events_channel)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    event = json.loads(message["data"])
+                except (TypeError, ValueError):
+                    logger.warning(f"Ignoring malformed job event on {self.events_channel}")
+                    continue
+                yield self._deserialize_datetimes(event)
+        finally:
+            await pubsub.unsubscribe(self.events_channel)
+            await pubsub.aclose()
+            await client.aclose()
 
     def _serialize_datetimes(self, obj):
         """Recursively convert datetime objects to ISO strings"""
@@ -0,0 +1 @@
+"""Out-of-process worker tier for heavy AI jobs (optional, Celery-based)"""
@@ -0,0 +1,38 @@
+"""
+Celery Application
+
+Optional worker tier that runs analyzer, generator, visualizer and story jobs
+outside the uvicorn workers. Enable it on the API with JOB_EXECUTOR=celery
+(requires JOB_STORAGE_BACKEND=redis) and start workers with:
+
+    celery -A api.workers.celery_app worker --loglevel=info --concurrency=4
+
+Workers report progress through JobQueueManager, so /jobs and the SSE stream
+work the same as for in-process jobs.
+"""
+
+try:
+    from celery import Celery
+except ImportError:
+    raise ImportError(
+        "Celery worker tier requires 'celery' package. "
+        "Install with: pip install celery[redis]"
+    )
+
+from api.config import settings
+
+celery_app = Celery(
+    "lifeos",
+    broker=settings.celery_broker_url,
+    backend=settings.celery_result_backend,
+    include=["api.workers.tasks"]
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    task_ignore_result=True,  # Results live in the job backend
+    task_default_queue="ai_jobs",
+    worker_prefetch_multiplier=1,  # Jobs are long-running; don't hoard them
+    broker_connection_retry_on_startup=True,
+)
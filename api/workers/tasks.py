@@ -0,0 +1,74 @@
+"""
+Celery Tasks
+
+A single task runs any job registered with @resumable by name. The job's
+handler and arguments are read from the job backend, so the broker message
+only carries the job ID.
+"""
+
+import asyncio
+import threading
+from typing import Optional
+
+from api.config import settings
+from api.logging_config import get_logger
+from api.services.job_queue import get_job_queue_manager, get_job_handler
+from api.workers.celery_app import celery_app
+
+# Import route modules so their job handlers are registered
+import api.routes.analyzers  # noqa: F401
+import api.routes.clothing_items  # noqa: F401
+import api.routes.generators  # noqa: F401
+import api.routes.presets  # noqa: F401
+import api.routes.story_tools  # noqa: F401
+import api.routes.tool_configs  # noqa: F401
+import api.routes.tools  # noqa: F401
+
+logger = get_logger(__name__)
+
+# One event loop per worker process, so async DB engines/pools stay usable
+# across tasks (asyncio.run would bind them to a loop it then closes)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+@celery_app.task(name="lifeos.run_job")
+def run_job(job_id: str):
+    """Run a queued job's handler on this worker"""
+    manager = get_job_queue_manager()
+    job = manager.get_job(job_id, refresh=True)
+
+    handler = get_job_handler(job.resume_handler) if job.resume_handler else None
+    if handler is None:
+        manager.fail_job(job_id, f"No handler registered for job: {job.resume_handler}")
+        return
+
+    # Heartbeat while running so the API can recover the job if this worker dies
+    heartbeat_seconds = settings.job_worker_heartbeat_seconds
+    ttl_seconds = heartbeat_seconds * 3
+    stop = threading.Event()
+
+    def heartbeat():
+        while not stop.wait(heartbeat_seconds):
+            try:
+                manager.storage.heartbeat_worker(manager.instance_id, ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Worker heartbeat failed: {e}")
+
+    manager.storage.heartbeat_worker(manager.instance_id, ttl_seconds)
+    beat = threading.Thread(target=heartbeat, daemon=True)
+    beat.start()
+
+    logger.info(f"Running job {job_id} ({job.resume_handler}) on worker {manager.instance_id}")
+    try:
+        _get_loop().run_until_complete(handler(job_id, **(job.resume_params or {})))
+    finally:
+        stop.set()
+        beat.join()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Image Listing Benchmark
+
+Measures SQL queries and wall time per page of ImageService.list_all_images
+against the configured database, to verify the query count stays constant
+as the page size grows (no N+1).
+
+Usage:
+    python scripts/benchmark_image_listing.py [page_size ...]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import event
+from api.database import get_session, get_engine
+from api.services.image_service import ImageService
+
+
+async def benchmark(page_sizes):
+    """Run list_all_images once per page size and report queries/time"""
+
+    print("\n" + "="*60)
+    print("⏱️  BENCHMARKING IMAGE LISTING")
+    print("="*60 + "\n")
+
+    query_count = 0
+
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        nonlocal query_count
+        query_count += 1
+
+    sync_engine = get_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", count_query)
+
+    try:
+        async with get_session() as session:
+            service = ImageService(session)
+
+            # Warm up (connection, preset name index)
+            await service.list_all_images(limit=1)
+
+            print(f"  {'Page size':>10} {'Images':>8} {'Entities':>9} {'Queries':>8} {'Time (ms)':>10}")
+            for page_size in page_sizes:
+                query_count = 0
+                start = time.perf_counter()
+                images = await service.list_all_images(limit=page_size)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                entities = sum(
+                    len(items) for image in images for items in image["entities"].values()
+                )
+                print(f"  {page_size:>10} {len(images):>8} {entities:>9} {query_count:>8} {elapsed_ms:>10.1f}")
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count_query)
+
+    print("\n✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10, 50, 100, 200]
+    asyncio.run(benchmark(sizes))
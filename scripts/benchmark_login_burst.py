@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Login Burst Benchmark
+
+Shows how password hashing affects unrelated requests on the same worker.
+A burst of logins is fired at an in-process app while a steady stream of
+cheap /ping requests is measured, once with bcrypt run inline on the event
+loop (the old behaviour) and once through PasswordHasher's thread pool.
+
+No database is needed: the login route only verifies a bcrypt hash.
+
+Usage:
+    python scripts/benchmark_login_burst.py [logins] [rounds]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+from fastapi import FastAPI
+
+from api.services.password_hasher import PasswordHasher, hash_password_sync, verify_password_sync
+
+PASSWORD = "correct horse battery staple"
+
+
+def build_app(hashed_password: str, hasher: PasswordHasher) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.post("/login-inline")
+    async def login_inline():
+        return {"ok": verify_password_sync(PASSWORD, hashed_password)}
+
+    @app.post("/login-offloaded")
+    async def login_offloaded():
+        return {"ok": await hasher.verify(PASSWORD, hashed_password)}
+
+    return app
+
+
+async def run_burst(client: httpx.AsyncClient, login_path: str, logins: int):
+    """Fire logins concurrently while pinging; return ping latencies (ms) and burst time"""
+    latencies = []
+    done = asyncio.Event()
+
+    async def pinger():
+        # Latency is measured from when each ping was due, so pings delayed by
+        # a blocked event loop count against it (no coordinated omission)
+        interval = 0.005
+        started = time.perf_counter()
+        sent = 0
+        while not done.is_set():
+            due = started + sent * interval
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+            await client.get("/ping")
+            latencies.append((time.perf_counter() - due) * 1000)
+            sent += 1
+
+    ping_task = asyncio.create_task(pinger())
+    await asyncio.sleep(0.05)  # Baseline pings before the burst
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client.post(login_path) for _ in range(logins)))
+    burst_seconds = time.perf_counter() - start
+
+    done.set()
+    await ping_task
+    return latencies, burst_seconds
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def benchmark(logins: int, rounds: int):
+    print("\n" + "="*60)
+    print("🔐 BENCHMARKING LOGIN BURST")
+    print("="*60 + "\n")
+    print(f"  {logins} concurrent logins, bcrypt cost {rounds}\n")
+
+    hashed_password = hash_password_sync(PASSWORD, rounds)
+    hasher = PasswordHasher(rounds=rounds, max_in_flight=max(logins, 1))
+    app = build_app(hashed_password, hasher)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"  {'Mode':<12} {'Pings':>6} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9} {'Burst (s)':>10}")
+        for mode, path in (("inline", "/login-inline"), ("offloaded", "/login-offloaded")):
+            latencies, burst_seconds = await run_burst(client, path, logins)
+            print(
+                f"  {mode:<12} {len(latencies):>6} {statistics.median(latencies):>9.1f} "
+                f"{percentile(latencies, 99):>9.1f} {max(latencies):>9.1f} {burst_seconds:>10.2f}"
+            )
+
+    hasher.shutdown()
+    print("\n✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    asyncio.run(benchmark(logins, rounds))
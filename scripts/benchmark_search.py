@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Search Benchmark
+
+Measures search-as-you-type latency (p50/p95) against the configured
+database by replaying every prefix of a few queries, the way a search box
+sends them while typing. Target: under 20 ms per request at 100k items.
+
+Usage:
+    python scripts/benchmark_search.py [query ...]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select, func
+from api.database import get_session
+from api.models.db import Character, ClothingItem, BoardGame
+from api.services.search_service import SearchService
+
+
+async def benchmark(queries):
+    """Time suggest() and search() for every prefix of each query"""
+
+    print("\n" + "="*60)
+    print("🔎 BENCHMARKING SEARCH")
+    print("="*60 + "\n")
+
+    async with get_session() as session:
+        for model in (Character, ClothingItem, BoardGame):
+            count = await session.scalar(select(func.count()).select_from(model))
+            print(f"  {model.__tablename__}: {count} rows")
+
+        service = SearchService(session)
+        await service.suggest("warmup")
+
+        for label, method in (("suggest", service.suggest), ("search", service.search)):
+            timings = []
+            for query in queries:
+                for end in range(1, len(query) + 1):
+                    start = time.perf_counter()
+                    await method(query[:end])
+                    timings.append((time.perf_counter() - start) * 1000)
+
+            timings.sort()
+            p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+            print(f"\n⏱️  {label}: {len(timings)} requests")
+            print(f"  p50: {statistics.median(timings):.1f} ms")
+            print(f"  p95: {p95:.1f} ms")
+            print(f"  max: {timings[-1]:.1f} ms")
+            print(f"  {'✅' if p95 < 20 else '❌'} p95 {'under' if p95 < 20 else 'over'} 20 ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(benchmark(sys.argv[1:] or ["leather jacket", "luna", "catan"]))
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Build the Q&A / document record index
+
+Imports data/qas/*.json and data/documents/*.json into the SQLite index
+used for listing and searching (settings.record_index_path). The services
+also do this on first use in each process; run this ahead of a deploy so
+the first request doesn't pay for the import, or with --rebuild after
+restoring JSON files from a backup.
+
+Usage:
+    python3 scripts/build_record_index.py [--rebuild]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.config import settings
+from api.services.document_service import DocumentService
+from api.services.qa_service import QAService
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the Q&A / document record index")
+    parser.add_argument("--rebuild", action="store_true", help="Delete the index first and re-import everything")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{settings.record_index_path}{suffix}").unlink(missing_ok=True)
+        print(f"🗑️  Deleted {settings.record_index_path}")
+
+    for name, index in (("Q&As", QAService().index), ("Documents", DocumentService().index)):
+        started = time.perf_counter()
+        changes = index.sync()
+        print(f"✅ {name}: {changes} records indexed or removed in {time.perf_counter() - started:.2f}s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
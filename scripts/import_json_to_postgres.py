@@ -5,339 +5,386 @@ JSON to PostgreSQL Import Script
 Migrates existing JSON file data to PostgreSQL database.
 Imports users, characters, clothing items, and board games.
 
+Files are parsed in batches on a worker thread while the previous batch is
+being written, and each batch is written with a single
+INSERT ... ON CONFLICT DO NOTHING (or COPY into a staging table plus an
+INSERT ... SELECT merge with --copy). Existing rows are skipped by the
+unique keys, so the import can be re-run safely. Commits happen every
+--commit-every rows instead of once per record.
+
 Usage:
     python scripts/import_json_to_postgres.py [--dry-run] [--entity=characters]
+    python scripts/import_json_to_postgres.py --batch-size=1000 --commit-every=10000 --copy
 """
 
 import asyncio
 import json
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 import argparse
 
 # Add parent directory to path to import from api
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import select
-from api.database import get_session, Base, get_engine
+from sqlalchemy import JSON, Table, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from api.database import get_session, close_db
 from api.models.db import User, Character, ClothingItem, BoardGame
 from api.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Parsed batches waiting to be written (bounds memory while parsing runs ahead)
+QUEUE_DEPTH = 4
+
+
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Split a list into consecutive chunks of at most size items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _parse_datetime(dt_str: Optional[str]) -> Optional[datetime]:
+    """Parse datetime string, handling multiple formats"""
+    if not dt_str:
+        return None
+
+    # Try common formats
+    formats = [
+        "%Y-%m-%dT%H:%M:%S.%f",  # 2025-10-22T18:04:31.012095
+        "%Y-%m-%d %H:%M:%S.%f",  # 2025-10-22 18:04:31.012095
+        "%Y-%m-%dT%H:%M:%S",     # 2025-10-22T18:04:31
+        "%Y-%m-%d %H:%M:%S",     # 2025-10-22 18:04:31
+    ]
+
+    for fmt in formats:
+        try:
+            return datetime.strptime(dt_str, fmt)
+        except ValueError:
+            continue
+
+    logger.warning(f"Could not parse datetime: {dt_str}")
+    return datetime.utcnow()
+
+
+def _timestamps(data: Dict[str, Any]) -> Dict[str, datetime]:
+    """created_at/updated_at columns (both NOT NULL, so default to now)"""
+    now = datetime.utcnow()
+    created_at = _parse_datetime(data.get('created_at')) or now
+    return {
+        'created_at': created_at,
+        'updated_at': _parse_datetime(data.get('updated_at')) or created_at,
+    }
+
+
+# Row builders: JSON document -> dict keyed by table column name.
+# Missing required fields raise KeyError and are counted as errors.
+
+def build_user_row(data: Dict[str, Any], user_id: Optional[int]) -> Dict[str, Any]:
+    return {
+        'username': data['username'],
+        'email': data['email'],
+        'full_name': data.get('full_name'),
+        'hashed_password': data['hashed_password'],
+        'disabled': data.get('disabled', False),
+        'created_at': _parse_datetime(data.get('created_at')) or datetime.utcnow(),
+        'last_login': _parse_datetime(data.get('last_login')),
+    }
+
+
+def build_character_row(data: Dict[str, Any], user_id: Optional[int]) -> Dict[str, Any]:
+    return {
+        'character_id': data['character_id'],
+        'name': data['name'],
+        'visual_description': data.get('visual_description'),
+        'physical_description': data.get('physical_description'),
+        'personality': data.get('personality'),
+        'reference_image_path': data.get('reference_image_path'),
+        'age': data.get('age'),
+        'skin_tone': data.get('skin_tone'),
+        'face_description': data.get('face_description'),
+        'hair_description': data.get('hair_description'),
+        'body_description': data.get('body_description'),
+        'tags': data.get('tags') or [],
+        'metadata': data.get('metadata') or {},
+        **_timestamps(data),
+        'user_id': user_id,
+    }
+
+
+def build_clothing_item_row(data: Dict[str, Any], user_id: Optional[int]) -> Dict[str, Any]:
+    return {
+        'item_id': data['item_id'],
+        'category': data['category'],
+        'item': data['item'],
+        'fabric': data.get('fabric'),
+        'color': data.get('color'),
+        'details': data.get('details'),
+        'source_image': data.get('source_image'),
+        'preview_image_path': data.get('preview_image_path'),
+        **_timestamps(data),
+        'user_id': user_id,
+    }
+
+
+def build_board_game_row(data: Dict[str, Any], user_id: Optional[int]) -> Dict[str, Any]:
+    return {
+        'game_id': data['game_id'],
+        'name': data['name'],
+        'bgg_id': data.get('bgg_id'),
+        'designer': data.get('designer'),
+        'publisher': data.get('publisher'),
+        'year': data.get('year'),
+        'description': data.get('description'),
+        'player_count_min': data.get('player_count_min'),
+        'player_count_max': data.get('player_count_max'),
+        'playtime_min': data.get('playtime_min'),
+        'playtime_max': data.get('playtime_max'),
+        'complexity': data.get('complexity'),
+        'metadata': data.get('metadata') or {},
+        **_timestamps(data),
+        'user_id': user_id,
+    }
+
+
+class EntitySource(NamedTuple):
+    """Where an entity type's JSON lives and how it maps to its table"""
+    model: Any
+    key: str  # Unique column identifying a record (existing rows are skipped)
+    build_row: Callable[[Dict[str, Any], Optional[int]], Dict[str, Any]]
+    directory: Optional[str] = None  # data/<directory>/*.json, one record per file
+    filename: Optional[str] = None  # data/<filename>, a dict of records
+
+
+ENTITY_SOURCES: Dict[str, EntitySource] = {
+    'users': EntitySource(User, 'username', build_user_row, filename='users.json'),
+    'characters': EntitySource(Character, 'character_id', build_character_row, directory='characters'),
+    'clothing_items': EntitySource(ClothingItem, 'item_id', build_clothing_item_row, directory='clothing_items'),
+    'board_games': EntitySource(BoardGame, 'game_id', build_board_game_row, directory='board_games'),
+}
+
+
+def parse_files(source: EntitySource, files: List[Path], user_id: Optional[int]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Read and convert one batch of per-record JSON files (blocking)
+
+    Returns:
+        Tuple of (rows, number of files that failed to parse)
+    """
+    rows = []
+    errors = 0
+    for path in files:
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            data.setdefault(source.key, path.stem)
+            rows.append(source.build_row(data, user_id))
+        except Exception as e:
+            logger.error(f"Error reading {path}: {e}")
+            errors += 1
+    return rows, errors
+
+
+def parse_records(source: EntitySource, records: Dict[str, Dict[str, Any]], user_id: Optional[int]) -> Tuple[List[Dict[str, Any]], int]:
+    """Convert a dict of records keyed by their unique key (blocking)"""
+    rows = []
+    errors = 0
+    for key, data in records.items():
+        try:
+            data.setdefault(source.key, key)
+            rows.append(source.build_row(data, user_id))
+        except Exception as e:
+            logger.error(f"Error reading record '{key}': {e}")
+            errors += 1
+    return rows, errors
+
+
+def _copy_value(value: Any, column_type: Any) -> Any:
+    """Adapt a value for asyncpg's binary COPY (json columns are sent as text)"""
+    if value is not None and isinstance(column_type, JSON):
+        return json.dumps(value)
+    return value
+
 
 class DataImporter:
     """Handles importing JSON data to PostgreSQL"""
 
-    def __init__(self, dry_run: bool = False):
+    def __init__(
+        self,
+        dry_run: bool = False,
+        batch_size: int = 500,
+        commit_every: int = 5000,
+        use_copy: bool = False
+    ):
         self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.commit_every = max(commit_every, batch_size)
+        self.use_copy = use_copy
         self.stats = {
-            'users': {'imported': 0, 'skipped': 0, 'errors': 0},
-            'characters': {'imported': 0, 'skipped': 0, 'errors': 0},
-            'clothing_items': {'imported': 0, 'skipped': 0, 'errors': 0},
-            'board_games': {'imported': 0, 'skipped': 0, 'errors': 0}
+            name: {'imported': 0, 'skipped': 0, 'errors': 0, 'seconds': 0.0}
+            for name in ENTITY_SOURCES
         }
 
-    def _parse_datetime(self, dt_str: Optional[str]) -> Optional[datetime]:
-        """Parse datetime string, handling multiple formats"""
-        if not dt_str:
-            return None
-
-        # Try common formats
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%f",  # 2025-10-22T18:04:31.012095
-            "%Y-%m-%d %H:%M:%S.%f",  # 2025-10-22 18:04:31.012095
-            "%Y-%m-%dT%H:%M:%S",     # 2025-10-22T18:04:31
-            "%Y-%m-%d %H:%M:%S",     # 2025-10-22 18:04:31
+    async def _default_user_id(self) -> Optional[int]:
+        """ID of the owner for entities without user_id (the first user)"""
+        async with get_session() as session:
+            result = await session.execute(select(User.id).order_by(User.id).limit(1))
+            return result.scalar_one_or_none()
+
+    async def _produce(self, name: str, source: EntitySource, data_dir: Path, user_id: Optional[int], queue: asyncio.Queue):
+        """Parse JSON in batches on a worker thread and queue the rows"""
+        stats = self.stats[name]
+        try:
+            if source.filename:
+                path = data_dir / source.filename
+                if not path.exists():
+                    logger.warning(f"{name} file not found: {path}")
+                    return
+                records = await asyncio.to_thread(lambda: json.loads(path.read_text()))
+                rows, errors = await asyncio.to_thread(parse_records, source, records, user_id)
+                stats['errors'] += errors
+                for batch in _chunks(rows, self.batch_size):
+                    await queue.put(batch)
+                return
+
+            directory = data_dir / source.directory
+            if not directory.exists():
+                logger.warning(f"{name} directory not found: {directory}")
+                return
+
+            # Skip reference images stored next to character files
+            files = sorted(p for p in directory.glob("*.json") if not p.stem.endswith('_ref'))
+            logger.info(f"Found {len(files)} {name} files")
+
+            for file_batch in _chunks(files, self.batch_size):
+                rows, errors = await asyncio.to_thread(parse_files, source, file_batch, user_id)
+                stats['errors'] += errors
+                if rows:
+                    await queue.put(rows)
+        finally:
+            await queue.put(None)
+
+    async def _existing_keys(self, session: AsyncSession, source: EntitySource, rows: List[Dict[str, Any]]) -> set:
+        """Keys of rows already in the table (one query per batch)"""
+        key_column = source.model.__table__.c[source.key]
+        keys = [row[source.key] for row in rows]
+        result = await session.execute(select(key_column).where(key_column.in_(keys)))
+        return set(result.scalars().all())
+
+    async def _insert_batch(self, session: AsyncSession, table: Table, rows: List[Dict[str, Any]]) -> int:
+        """Multi-row INSERT ... ON CONFLICT DO NOTHING; returns rows inserted"""
+        stmt = pg_insert(table).on_conflict_do_nothing().returning(table.c.id)
+        # executemany with RETURNING is batched into multi-VALUES statements
+        # by SQLAlchemy ("insertmanyvalues"), within the bind parameter limit
+        result = await session.execute(stmt, rows)
+        return len(result.all())
+
+    async def _copy_batch(self, session: AsyncSession, table: Table, rows: List[Dict[str, Any]]) -> int:
+        """COPY rows into a temporary staging table and merge; returns rows inserted"""
+        columns = list(rows[0].keys())
+        column_list = ", ".join(f'"{c}"' for c in columns)
+        stage = f"import_stage_{table.name}"
+
+        await session.execute(text(
+            f'CREATE TEMP TABLE IF NOT EXISTS {stage} '
+            f'(LIKE "{table.name}" INCLUDING DEFAULTS) ON COMMIT DROP'
+        ))
+
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        records = [
+            tuple(_copy_value(row[c], table.c[c].type) for c in columns)
+            for row in rows
         ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(dt_str, fmt)
-            except ValueError:
-                continue
-
-        logger.warning(f"Could not parse datetime: {dt_str}")
-        return datetime.utcnow()
-
-    async def import_users(self, data_dir: Path):
-        """Import users from users.json"""
-        users_file = data_dir / "users.json"
-
-        if not users_file.exists():
-            logger.warning(f"Users file not found: {users_file}")
-            return
-
-        logger.info(f"Importing users from {users_file}")
-
-        with open(users_file, 'r') as f:
-            users_data = json.load(f)
+        await raw.driver_connection.copy_records_to_table(stage, records=records, columns=columns)
+
+        result = await session.execute(text(
+            f'INSERT INTO "{table.name}" ({column_list}) '
+            f'SELECT {column_list} FROM {stage} '
+            f'ON CONFLICT DO NOTHING RETURNING id'
+        ))
+        inserted = len(result.all())
+        await session.execute(text(f"TRUNCATE {stage}"))
+        return inserted
+
+    async def _consume(self, name: str, source: EntitySource, queue: asyncio.Queue):
+        """Write queued batches, committing every commit_every rows"""
+        stats = self.stats[name]
+        table = source.model.__table__
+        write_batch = self._copy_batch if self.use_copy else self._insert_batch
 
         async with get_session() as session:
-            for username, user_data in users_data.items():
-                try:
-                    # Check if user already exists
-                    result = await session.execute(
-                        select(User).where(User.username == username)
-                    )
-                    existing_user = result.scalar_one_or_none()
-
-                    if existing_user:
-                        logger.info(f"User '{username}' already exists, skipping")
-                        self.stats['users']['skipped'] += 1
-                        continue
-
-                    if self.dry_run:
-                        logger.info(f"[DRY RUN] Would import user: {username}")
-                        self.stats['users']['imported'] += 1
-                        continue
-
-                    # Create new user
-                    user = User(
-                        username=user_data['username'],
-                        email=user_data['email'],
-                        full_name=user_data.get('full_name'),
-                        hashed_password=user_data['hashed_password'],
-                        disabled=user_data.get('disabled', False),
-                        created_at=self._parse_datetime(user_data.get('created_at')),
-                        last_login=self._parse_datetime(user_data.get('last_login'))
-                    )
-
-                    session.add(user)
-                    await session.commit()
-
-                    logger.info(f"✅ Imported user: {username}")
-                    self.stats['users']['imported'] += 1
+            pending = 0
+            while True:
+                rows = await queue.get()
+                if rows is None:
+                    break
+
+                if self.dry_run:
+                    existing = await self._existing_keys(session, source, rows)
+                    stats['skipped'] += len(existing)
+                    stats['imported'] += len(rows) - len(existing)
+                    logger.info(f"[DRY RUN] Would import {len(rows) - len(existing)} {name}")
+                    continue
 
+                try:
+                    # Savepoint so a bad batch doesn't discard uncommitted good ones
+                    async with session.begin_nested():
+                        inserted = await write_batch(session, table, rows)
                 except Exception as e:
-                    logger.error(f"Error importing user '{username}': {e}")
-                    self.stats['users']['errors'] += 1
-                    if not self.dry_run:
-                        await session.rollback()
-
-    async def import_characters(self, data_dir: Path):
-        """Import characters from data/characters/*.json"""
-        characters_dir = data_dir / "characters"
-
-        if not characters_dir.exists():
-            logger.warning(f"Characters directory not found: {characters_dir}")
-            return
-
-        logger.info(f"Importing characters from {characters_dir}")
-
-        # Get default user ID (for entities without user_id)
-        async with get_session() as session:
-            result = await session.execute(select(User).limit(1))
-            default_user = result.scalar_one_or_none()
-            default_user_id = default_user.id if default_user else None
-
-        character_files = list(characters_dir.glob("*.json"))
-        logger.info(f"Found {len(character_files)} character files")
-
-        async with get_session() as session:
-            for char_file in character_files:
-                # Skip reference images
-                if char_file.stem.endswith('_ref'):
+                    logger.error(f"Error importing batch of {len(rows)} {name}: {e}")
+                    stats['errors'] += len(rows)
                     continue
 
-                try:
-                    with open(char_file, 'r') as f:
-                        char_data = json.load(f)
-
-                    character_id = char_data.get('character_id', char_file.stem)
-
-                    # Check if character already exists
-                    result = await session.execute(
-                        select(Character).where(Character.character_id == character_id)
-                    )
-                    existing_char = result.scalar_one_or_none()
-
-                    if existing_char:
-                        logger.info(f"Character '{character_id}' already exists, skipping")
-                        self.stats['characters']['skipped'] += 1
-                        continue
-
-                    if self.dry_run:
-                        logger.info(f"[DRY RUN] Would import character: {char_data.get('name', character_id)}")
-                        self.stats['characters']['imported'] += 1
-                        continue
-
-                    # Create new character
-                    character = Character(
-                        character_id=character_id,
-                        name=char_data['name'],
-                        visual_description=char_data.get('visual_description'),
-                        physical_description=char_data.get('physical_description'),
-                        personality=char_data.get('personality'),
-                        reference_image_path=char_data.get('reference_image_path'),
-                        age=char_data.get('age'),
-                        skin_tone=char_data.get('skin_tone'),
-                        face_description=char_data.get('face_description'),
-                        hair_description=char_data.get('hair_description'),
-                        body_description=char_data.get('body_description'),
-                        tags=char_data.get('tags', []),
-                        meta=char_data.get('metadata', {}),
-                        created_at=self._parse_datetime(char_data.get('created_at')),
-                        updated_at=self._parse_datetime(char_data.get('updated_at')),
-                        user_id=default_user_id
-                    )
-
-                    session.add(character)
+                stats['imported'] += inserted
+                stats['skipped'] += len(rows) - inserted
+                pending += len(rows)
+
+                if pending >= self.commit_every:
                     await session.commit()
+                    pending = 0
+                    logger.info(f"Committed {stats['imported']} {name} so far")
+
+    async def import_entity(self, name: str, data_dir: Path, user_id: Optional[int] = None):
+        """Import one entity type, parsing and writing concurrently"""
+        source = ENTITY_SOURCES[name]
+        logger.info(f"Importing {name} from {data_dir}")
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_DEPTH)
+        producer = asyncio.ensure_future(self._produce(name, source, data_dir, user_id, queue))
+        consumer = asyncio.ensure_future(self._consume(name, source, queue))
+
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(producer, consumer)
+        except Exception:
+            # Don't leave the other side blocked on a full/empty queue
+            producer.cancel()
+            consumer.cancel()
+            await asyncio.gather(producer, consumer, return_exceptions=True)
+            raise
+        finally:
+            self.stats[name]['seconds'] = time.perf_counter() - started
 
-                    logger.info(f"✅ Imported character: {char_data['name']} ({character_id})")
-                    self.stats['characters']['imported'] += 1
+    async def import_users(self, data_dir: Path):
+        """Import users from users.json"""
+        await self.import_entity('users', data_dir)
 
-                except Exception as e:
-                    logger.error(f"Error importing character from {char_file}: {e}")
-                    self.stats['characters']['errors'] += 1
-                    if not self.dry_run:
-                        await session.rollback()
+    async def import_characters(self, data_dir: Path):
+        """Import characters from data/characters/*.json"""
+        await self.import_entity('characters', data_dir, await self._default_user_id())
 
     async def import_clothing_items(self, data_dir: Path):
         """Import clothing items from data/clothing_items/*.json"""
-        items_dir = data_dir / "clothing_items"
-
-        if not items_dir.exists():
-            logger.warning(f"Clothing items directory not found: {items_dir}")
-            return
-
-        logger.info(f"Importing clothing items from {items_dir}")
-
-        # Get default user ID
-        async with get_session() as session:
-            result = await session.execute(select(User).limit(1))
-            default_user = result.scalar_one_or_none()
-            default_user_id = default_user.id if default_user else None
-
-        item_files = list(items_dir.glob("*.json"))
-        logger.info(f"Found {len(item_files)} clothing item files")
-
-        async with get_session() as session:
-            for item_file in item_files:
-                try:
-                    with open(item_file, 'r') as f:
-                        item_data = json.load(f)
-
-                    item_id = item_data.get('item_id', item_file.stem)
-
-                    # Check if item already exists
-                    result = await session.execute(
-                        select(ClothingItem).where(ClothingItem.item_id == item_id)
-                    )
-                    existing_item = result.scalar_one_or_none()
-
-                    if existing_item:
-                        self.stats['clothing_items']['skipped'] += 1
-                        continue
-
-                    if self.dry_run:
-                        logger.info(f"[DRY RUN] Would import item: {item_data.get('item', item_id)}")
-                        self.stats['clothing_items']['imported'] += 1
-                        continue
-
-                    # Create new clothing item
-                    clothing_item = ClothingItem(
-                        item_id=item_id,
-                        category=item_data['category'],
-                        item=item_data['item'],
-                        fabric=item_data.get('fabric'),
-                        color=item_data.get('color'),
-                        details=item_data.get('details'),
-                        source_image=item_data.get('source_image'),
-                        preview_image_path=item_data.get('preview_image_path'),
-                        created_at=self._parse_datetime(item_data.get('created_at')),
-                        updated_at=self._parse_datetime(item_data.get('updated_at')),
-                        user_id=default_user_id
-                    )
-
-                    session.add(clothing_item)
-                    await session.commit()
-
-                    logger.info(f"✅ Imported item: {item_data['item']} ({item_data['category']})")
-                    self.stats['clothing_items']['imported'] += 1
-
-                except Exception as e:
-                    logger.error(f"Error importing item from {item_file}: {e}")
-                    self.stats['clothing_items']['errors'] += 1
-                    if not self.dry_run:
-                        await session.rollback()
+        await self.import_entity('clothing_items', data_dir, await self._default_user_id())
 
     async def import_board_games(self, data_dir: Path):
         """Import board games from data/board_games/*.json"""
-        games_dir = data_dir / "board_games"
-
-        if not games_dir.exists():
-            logger.warning(f"Board games directory not found: {games_dir}")
-            return
-
-        logger.info(f"Importing board games from {games_dir}")
-
-        # Get default user ID
-        async with get_session() as session:
-            result = await session.execute(select(User).limit(1))
-            default_user = result.scalar_one_or_none()
-            default_user_id = default_user.id if default_user else None
-
-        game_files = list(games_dir.glob("*.json"))
-        logger.info(f"Found {len(game_files)} board game files")
-
-        async with get_session() as session:
-            for game_file in game_files:
-                try:
-                    with open(game_file, 'r') as f:
-                        game_data = json.load(f)
-
-                    game_id = game_data.get('game_id', game_file.stem)
-
-                    # Check if game already exists
-                    result = await session.execute(
-                        select(BoardGame).where(BoardGame.game_id == game_id)
-                    )
-                    existing_game = result.scalar_one_or_none()
-
-                    if existing_game:
-                        self.stats['board_games']['skipped'] += 1
-                        continue
-
-                    if self.dry_run:
-                        logger.info(f"[DRY RUN] Would import game: {game_data.get('name', game_id)}")
-                        self.stats['board_games']['imported'] += 1
-                        continue
-
-                    # Create new board game
-                    board_game = BoardGame(
-                        game_id=game_id,
-                        name=game_data['name'],
-                        bgg_id=game_data.get('bgg_id'),
-                        designer=game_data.get('designer'),
-                        publisher=game_data.get('publisher'),
-                        year=game_data.get('year'),
-                        description=game_data.get('description'),
-                        player_count_min=game_data.get('player_count_min'),
-                        player_count_max=game_data.get('player_count_max'),
-                        playtime_min=game_data.get('playtime_min'),
-                        playtime_max=game_data.get('playtime_max'),
-                        complexity=game_data.get('complexity'),
-                        meta=game_data.get('metadata', {}),
-                        created_at=self._parse_datetime(game_data.get('created_at')),
-                        updated_at=self._parse_datetime(game_data.get('updated_at')),
-                        user_id=default_user_id
-                    )
-
-                    session.add(board_game)
-                    await session.commit()
-
-                    logger.info(f"✅ Imported game: {game_data['name']}")
-                    self.stats['board_games']['imported'] += 1
-
-                except Exception as e:
-                    logger.error(f"Error importing game from {game_file}: {e}")
-                    self.stats['board_games']['errors'] += 1
-                    if not self.dry_run:
-                        await session.rollback()
+        await self.import_entity('board_games', data_dir, await self._default_user_id())
 
     def print_summary(self):
         """Print import statistics"""
@@ -348,7 +395,8 @@ class DataImporter:
         for entity_type, stats in self.stats.items():
             total = stats['imported'] + stats['skipped'] + stats['errors']
             if total > 0:
-                print(f"\n{entity_type.upper()}: {total} total")
+                rate = total / stats['seconds'] if stats['seconds'] > 0 else 0.0
+                print(f"\n{entity_type.upper()}: {total} total in {stats['seconds']:.2f}s ({rate:,.0f} rows/sec)")
                 print(f"  ✅ Imported: {stats['imported']}")
                 print(f"  ⏭️  Skipped:  {stats['skipped']}")
                 if stats['errors'] > 0:
@@ -379,16 +427,40 @@ async def main():
         default=Path('/app/data'),
         help="Path to data directory (default: /app/data)"
     )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=500,
+        help="Records parsed and written per statement (default: 500)"
+    )
+    parser.add_argument(
+        '--commit-every',
+        type=int,
+        default=5000,
+        help="Commit after this many rows (default: 5000)"
+    )
+    parser.add_argument(
+        '--copy',
+        action='store_true',
+        help="Load batches with COPY into a staging table, then merge"
+    )
 
     args = parser.parse_args()
 
     if args.dry_run:
         print("\n🔍 DRY RUN MODE - No data will be imported\n")
 
-    importer = DataImporter(dry_run=args.dry_run)
+    importer = DataImporter(
+        dry_run=args.dry_run,
+        batch_size=args.batch_size,
+        commit_every=args.commit_every,
+        use_copy=args.copy
+    )
 
     print(f"📁 Data directory: {args.data_dir}")
-    print(f"🎯 Importing: {args.entity}\n")
+    print(f"🎯 Importing: {args.entity}")
+    print(f"📦 Batch size: {args.batch_size}, commit every: {importer.commit_every} rows"
+          f"{', COPY mode' if args.copy else ''}\n")
 
     try:
         # Import entities based on selection
@@ -417,6 +489,9 @@ async def main():
         print(f"\n❌ Import failed: {e}\n")
         sys.exit(1)
 
+    finally:
+        await close_db()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -4,7 +4,11 @@ PostgreSQL to JSON Rollback Script
 
 Exports data from PostgreSQL back to JSON files in case of migration failure.
 This script reads all entities from the database and writes them to JSON files
-in the original data/ directory structure.
+in the original data/ directory structure, in the same format that
+import_json_to_postgres.py reads.
+
+Tables are read through server-side cursors in batches of --batch-size rows,
+so memory use stays flat regardless of table size.
 
 Usage:
     python3 scripts/rollback_to_json.py [--dry-run] [--backup-first]
@@ -13,6 +17,7 @@ Options:
     --dry-run       Show what would be exported without writing files
     --backup-first  Create backup of current JSON files before rollback
     --entity-type   Only rollback specific entity type (e.g., 'characters')
+    --batch-size    Rows fetched per round-trip (default: 500)
 """
 
 import sys
@@ -22,229 +27,209 @@ import asyncio
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, Optional
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Import services
-from api.services.character_service_db import CharacterServiceDB
-from api.services.clothing_items_service_db import ClothingItemServiceDB
-from api.services.outfit_service_db import OutfitServiceDB
-from api.services.composition_service_db import CompositionServiceDB
-from api.services.favorites_service_db import FavoritesServiceDB
-from api.services.board_game_service_db import BoardGameServiceDB
-from api.database import init_db, close_db
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.database import get_session, close_db
+from api.models.db import BoardGame, Character, ClothingItem, Composition, Favorite, Outfit, User
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def character_document(char: Character) -> Dict[str, Any]:
+    return {
+        "character_id": char.character_id,
+        "name": char.name,
+        "visual_description": char.visual_description,
+        "personality": char.personality,
+        "physical_description": char.physical_description,
+        "reference_image_path": char.reference_image_path,
+        "tags": char.tags or [],
+        "created_at": _iso(char.created_at),
+        "updated_at": _iso(char.updated_at),
+        "metadata": char.meta or {},
+        "age": char.age,
+        "skin_tone": char.skin_tone,
+        "face_description": char.face_description,
+        "hair_description": char.hair_description,
+        "body_description": char.body_description,
+    }
 
 
-async def export_characters(output_dir: Path, dry_run: bool = False) -> int:
-    """Export all characters from PostgreSQL to JSON files"""
-    service = CharacterServiceDB()
-    characters = await service.list_characters(limit=10000)  # Get all
+def clothing_item_document(item: ClothingItem) -> Dict[str, Any]:
+    return {
+        "item_id": item.item_id,
+        "category": item.category,
+        "item": item.item,
+        "fabric": item.fabric,
+        "color": item.color,
+        "details": item.details,
+        "source_image": item.source_image,
+        "preview_image_path": item.preview_image_path,
+        "created_at": _iso(item.created_at),
+        "updated_at": _iso(item.updated_at),
+    }
 
-    char_dir = output_dir / "characters"
-    if not dry_run:
-        char_dir.mkdir(parents=True, exist_ok=True)
 
-    count = 0
-    for char in characters:
-        filename = f"{char['character_id']}.json"
-        filepath = char_dir / filename
-
-        # Convert to original JSON format
-        char_data = {
-            "character_id": char["character_id"],
-            "name": char["name"],
-            "description": char.get("description"),
-            "appearance": char.get("appearance"),
-            "reference_image_path": char.get("reference_image_path"),
-            "created_at": char.get("created_at").isoformat() if char.get("created_at") else None,
-            "updated_at": char.get("updated_at").isoformat() if char.get("updated_at") else None,
-        }
+def outfit_document(outfit: Outfit) -> Dict[str, Any]:
+    return {
+        "outfit_id": outfit.outfit_id,
+        "name": outfit.name,
+        "description": outfit.description,
+        "style_genre": outfit.style_genre,
+        "formality": outfit.formality,
+        "clothing_item_ids": outfit.clothing_item_ids or [],
+        "source_image": outfit.source_image,
+        "preview_image_path": outfit.preview_image_path,
+        "metadata": outfit.meta or {},
+        "created_at": _iso(outfit.created_at),
+        "updated_at": _iso(outfit.updated_at),
+    }
 
-        if dry_run:
-            print(f"  Would write: {filepath}")
-        else:
-            with open(filepath, 'w') as f:
-                json.dump(char_data, f, indent=2)
-        count += 1
 
-    print(f"✅ Characters: {count} files")
-    return count
+def composition_document(comp: Composition) -> Dict[str, Any]:
+    return {
+        "composition_id": comp.composition_id,
+        "name": comp.name,
+        "subject": comp.subject,
+        "presets": comp.presets or [],
+        "created_at": _iso(comp.created_at),
+        "updated_at": _iso(comp.updated_at),
+    }
 
 
-async def export_clothing_items(output_dir: Path, dry_run: bool = False) -> int:
-    """Export all clothing items from PostgreSQL to JSON files"""
-    service = ClothingItemServiceDB()
-    items = await service.list_clothing_items(limit=10000)  # Get all
+def board_game_document(game: BoardGame) -> Dict[str, Any]:
+    return {
+        "game_id": game.game_id,
+        "name": game.name,
+        "bgg_id": game.bgg_id,
+        "designer": game.designer,
+        "publisher": game.publisher,
+        "year": game.year,
+        "description": game.description,
+        "player_count_min": game.player_count_min,
+        "player_count_max": game.player_count_max,
+        "playtime_min": game.playtime_min,
+        "playtime_max": game.playtime_max,
+        "complexity": game.complexity,
+        "metadata": game.meta or {},
+        "created_at": _iso(game.created_at),
+        "updated_at": _iso(game.updated_at),
+    }
+
 
-    item_dir = output_dir / "clothing_items"
+async def export_table(
+    session: AsyncSession,
+    query: Select,
+    directory: Path,
+    file_key: str,
+    to_document: Callable[[Any], Dict[str, Any]],
+    dry_run: bool,
+    batch_size: int
+) -> int:
+    """
+    Stream a table through a server-side cursor into one JSON file per row
+
+    Returns:
+        Number of files written
+    """
     if not dry_run:
-        item_dir.mkdir(parents=True, exist_ok=True)
+        directory.mkdir(parents=True, exist_ok=True)
+
+    result = await session.stream_scalars(query.execution_options(yield_per=batch_size))
 
     count = 0
-    for item in items:
-        filename = f"{item['item_id']}.json"
-        filepath = item_dir / filename
-
-        # Convert to original JSON format
-        item_data = {
-            "item_id": item["item_id"],
-            "name": item["name"],
-            "category": item.get("category"),
-            "subcategory": item.get("subcategory"),
-            "description": item.get("description"),
-            "brand": item.get("brand"),
-            "color": item.get("color"),
-            "material": item.get("material"),
-            "season": item.get("season"),
-            "tags": item.get("tags", []),
-            "reference_image_path": item.get("reference_image_path"),
-            "created_at": item.get("created_at").isoformat() if item.get("created_at") else None,
-            "updated_at": item.get("updated_at").isoformat() if item.get("updated_at") else None,
-        }
+    async for entity in result:
+        document = to_document(entity)
+        filepath = directory / f"{document[file_key]}.json"
 
         if dry_run:
             print(f"  Would write: {filepath}")
         else:
             with open(filepath, 'w') as f:
-                json.dump(item_data, f, indent=2)
+                json.dump(document, f, indent=2)
         count += 1
 
-    print(f"✅ Clothing Items: {count} files")
     return count
 
 
-async def export_outfits(output_dir: Path, dry_run: bool = False) -> int:
-    """Export all outfits from PostgreSQL to JSON files"""
-    service = OutfitServiceDB()
-    outfits = await service.list_outfits(limit=10000)  # Get all
+async def export_characters(session: AsyncSession, output_dir: Path, dry_run: bool = False, batch_size: int = 500) -> int:
+    """Export all characters from PostgreSQL to JSON files"""
+    count = await export_table(
+        session, select(Character).order_by(Character.id), output_dir / "characters",
+        "character_id", character_document, dry_run, batch_size
+    )
+    print(f"✅ Characters: {count} files")
+    return count
 
-    outfit_dir = output_dir / "outfits"
-    if not dry_run:
-        outfit_dir.mkdir(parents=True, exist_ok=True)
 
-    count = 0
-    for outfit in outfits:
-        filename = f"{outfit['outfit_id']}.json"
-        filepath = outfit_dir / filename
-
-        # Convert to original JSON format
-        outfit_data = {
-            "outfit_id": outfit["outfit_id"],
-            "name": outfit["name"],
-            "description": outfit.get("description"),
-            "clothing_items": outfit.get("clothing_items", []),
-            "tags": outfit.get("tags", []),
-            "created_at": outfit.get("created_at").isoformat() if outfit.get("created_at") else None,
-            "updated_at": outfit.get("updated_at").isoformat() if outfit.get("updated_at") else None,
-        }
+async def export_clothing_items(session: AsyncSession, output_dir: Path, dry_run: bool = False, batch_size: int = 500) -> int:
+    """Export all clothing items from PostgreSQL to JSON files"""
+    count = await export_table(
+        session, select(ClothingItem).order_by(ClothingItem.id), output_dir / "clothing_items",
+        "item_id", clothing_item_document, dry_run, batch_size
+    )
+    print(f"✅ Clothing Items: {count} files")
+    return count
 
-        if dry_run:
-            print(f"  Would write: {filepath}")
-        else:
-            with open(filepath, 'w') as f:
-                json.dump(outfit_data, f, indent=2)
-        count += 1
 
+async def export_outfits(session: AsyncSession, output_dir: Path, dry_run: bool = False, batch_size: int = 500) -> int:
+    """Export all outfits from PostgreSQL to JSON files"""
+    count = await export_table(
+        session, select(Outfit).order_by(Outfit.id), output_dir / "outfits",
+        "outfit_id", outfit_document, dry_run, batch_size
+    )
     print(f"✅ Outfits: {count} files")
     return count
 
 
-async def export_compositions(output_dir: Path, dry_run: bool = False) -> int:
+async def export_compositions(session: AsyncSession, output_dir: Path, dry_run: bool = False, batch_size: int = 500) -> int:
     """Export all compositions from PostgreSQL to JSON files"""
-    service = CompositionServiceDB()
-    compositions = await service.list_compositions(limit=10000)  # Get all
-
-    comp_dir = output_dir / "compositions"
-    if not dry_run:
-        comp_dir.mkdir(parents=True, exist_ok=True)
-
-    count = 0
-    for comp in compositions:
-        filename = f"{comp['composition_id']}.json"
-        filepath = comp_dir / filename
-
-        # Convert to original JSON format
-        comp_data = {
-            "composition_id": comp["composition_id"],
-            "name": comp["name"],
-            "description": comp.get("description"),
-            "presets": comp.get("presets", {}),
-            "created_at": comp.get("created_at").isoformat() if comp.get("created_at") else None,
-            "updated_at": comp.get("updated_at").isoformat() if comp.get("updated_at") else None,
-        }
-
-        if dry_run:
-            print(f"  Would write: {filepath}")
-        else:
-            with open(filepath, 'w') as f:
-                json.dump(comp_data, f, indent=2)
-        count += 1
-
+    count = await export_table(
+        session, select(Composition).order_by(Composition.id), output_dir / "compositions",
+        "composition_id", composition_document, dry_run, batch_size
+    )
     print(f"✅ Compositions: {count} files")
     return count
 
 
-async def export_board_games(output_dir: Path, dry_run: bool = False) -> int:
+async def export_board_games(session: AsyncSession, output_dir: Path, dry_run: bool = False, batch_size: int = 500) -> int:
     """Export all board games from PostgreSQL to JSON files"""
-    service = BoardGameServiceDB()
-    games = await service.list_board_games(limit=10000)  # Get all
-
-    game_dir = output_dir / "board_games"
-    if not dry_run:
-        game_dir.mkdir(parents=True, exist_ok=True)
-
-    count = 0
-    for game in games:
-        filename = f"{game['game_id']}.json"
-        filepath = game_dir / filename
-
-        # Convert to original JSON format
-        game_data = {
-            "game_id": game["game_id"],
-            "name": game["name"],
-            "bgg_id": game.get("bgg_id"),
-            "description": game.get("description"),
-            "designers": game.get("designers", []),
-            "year_published": game.get("year_published"),
-            "min_players": game.get("min_players"),
-            "max_players": game.get("max_players"),
-            "playing_time": game.get("playing_time"),
-            "min_age": game.get("min_age"),
-            "complexity": game.get("complexity"),
-            "created_at": game.get("created_at").isoformat() if game.get("created_at") else None,
-            "updated_at": game.get("updated_at").isoformat() if game.get("updated_at") else None,
-        }
-
-        if dry_run:
-            print(f"  Would write: {filepath}")
-        else:
-            with open(filepath, 'w') as f:
-                json.dump(game_data, f, indent=2)
-        count += 1
-
+    count = await export_table(
+        session, select(BoardGame).order_by(BoardGame.id), output_dir / "board_games",
+        "game_id", board_game_document, dry_run, batch_size
+    )
     print(f"✅ Board Games: {count} files")
     return count
 
 
-async def export_favorites(output_dir: Path, dry_run: bool = False) -> int:
-    """Export favorites to JSON file"""
-    service = FavoritesServiceDB()
-
-    # Note: This assumes a simple structure. Adjust if needed.
+async def export_favorites(session: AsyncSession, output_dir: Path, dry_run: bool = False, batch_size: int = 500) -> int:
+    """Export favorites to favorites.json ({username: ["category:preset_id", ...]})"""
     favorites_path = output_dir / "favorites.json"
 
-    # Get all favorites (this may need user context)
-    # For now, just create empty structure
-    favorites_data = {
-        "items": [],
-        "exported_at": datetime.now().isoformat()
-    }
+    query = (
+        select(User.username, Favorite.category, Favorite.preset_id)
+        .join(User, User.id == Favorite.user_id)
+        .order_by(User.username, Favorite.id)
+        .execution_options(yield_per=batch_size)
+    )
+    result = await session.stream(query)
+
+    favorites_data: Dict[str, list] = {}
+    async for username, category, preset_id in result:
+        favorites_data.setdefault(username, []).append(f"{category}:{preset_id}")
 
     if dry_run:
         print(f"  Would write: {favorites_path}")
     else:
+        output_dir.mkdir(parents=True, exist_ok=True)
         with open(favorites_path, 'w') as f:
             json.dump(favorites_data, f, indent=2)
 
@@ -252,12 +237,23 @@ async def export_favorites(output_dir: Path, dry_run: bool = False) -> int:
     return 1
 
 
+EXPORTERS = {
+    "characters": export_characters,
+    "clothing_items": export_clothing_items,
+    "outfits": export_outfits,
+    "compositions": export_compositions,
+    "board_games": export_board_games,
+    "favorites": export_favorites,
+}
+
+
 async def main():
     parser = argparse.ArgumentParser(description="Rollback PostgreSQL data to JSON files")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be exported")
     parser.add_argument("--backup-first", action="store_true", help="Backup current JSON files first")
-    parser.add_argument("--entity-type", help="Only export specific entity type")
+    parser.add_argument("--entity-type", choices=list(EXPORTERS), help="Only export specific entity type")
     parser.add_argument("--output-dir", default="data", help="Output directory (default: data)")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows fetched per round-trip (default: 500)")
     args = parser.parse_args()
 
     print("🔄 PostgreSQL to JSON Rollback Script")
@@ -277,12 +273,6 @@ async def main():
             return 1
         print("")
 
-    # Initialize database
-    print("🔌 Connecting to PostgreSQL...")
-    await init_db()
-    print("✅ Connected")
-    print("")
-
     output_dir = Path(args.output_dir)
     total_files = 0
 
@@ -290,25 +280,11 @@ async def main():
         print("📤 Exporting entities...")
         print("")
 
-        entity_type = args.entity_type
-
-        if not entity_type or entity_type == "characters":
-            total_files += await export_characters(output_dir, args.dry_run)
-
-        if not entity_type or entity_type == "clothing_items":
-            total_files += await export_clothing_items(output_dir, args.dry_run)
-
-        if not entity_type or entity_type == "outfits":
-            total_files += await export_outfits(output_dir, args.dry_run)
-
-        if not entity_type or entity_type == "compositions":
-            total_files += await export_compositions(output_dir, args.dry_run)
-
-        if not entity_type or entity_type == "board_games":
-            total_files += await export_board_games(output_dir, args.dry_run)
-
-        if not entity_type or entity_type == "favorites":
-            total_files += await export_favorites(output_dir, args.dry_run)
+        async with get_session() as session:
+            for entity_type, exporter in EXPORTERS.items():
+                if args.entity_type and args.entity_type != entity_type:
+                    continue
+                total_files += await exporter(session, output_dir, args.dry_run, args.batch_size)
 
         print("")
         print("=" * 50)
@@ -0,0 +1,91 @@
+"""
+Tests for authenticated-user and verified-token caching (api/dependencies/auth.py)
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+
+from api.dependencies import auth as auth_dependencies
+from api.models.auth import TokenData, User
+from api.services import auth_service_db
+from api.services.auth_service_db import AuthServiceDB, user_cache_tag
+from api.services.cache_service import CacheService, LocalCache
+
+
+UNREACHABLE_REDIS = "redis://127.0.0.1:1/0"
+
+
+@pytest.mark.unit
+class TestTokenVerificationCache:
+    """Tests for memoized JWT verification"""
+
+    def test_verified_token_is_decoded_once(self, monkeypatch):
+        """Test that repeat verifications of a token skip jwt.decode"""
+        token = AuthServiceDB(None).create_access_token({"sub": "alice"})
+        decode = auth_service_db.jwt.decode
+        calls = []
+
+        def counting_decode(*args, **kwargs):
+            calls.append(args)
+            return decode(*args, **kwargs)
+
+        monkeypatch.setattr(auth_service_db.jwt, "decode", counting_decode)
+
+        first = AuthServiceDB.verify_token(token)
+        second = AuthServiceDB.verify_token(token)
+
+        assert first == second
+        assert first.username == "alice"
+        assert first.token_id
+        assert len(calls) == 1
+        # Memoized per token type: an access token is never a refresh token
+        assert AuthServiceDB.verify_token(token, token_type="refresh") is None
+
+
+@pytest.mark.unit
+class TestUserCache:
+    """Tests for the per-worker resolved-user cache"""
+
+    def _cache_with_user(self, monkeypatch):
+        cache = CacheService(redis_url=UNREACHABLE_REDIS)
+        monkeypatch.setattr(auth_dependencies, "get_cache_service", lambda: cache)
+        monkeypatch.setattr(auth_service_db, "get_cache_service", lambda: cache)
+        monkeypatch.setattr(auth_dependencies, "_resolved_users", LocalCache())
+
+        token_data = TokenData(username="alice", token_id="t1")
+        user = User(id=1, username="alice", created_at=datetime(2025, 1, 1))
+        auth_dependencies._get_user_cache().set(
+            auth_dependencies._user_cache_key(token_data), user, ttl=60,
+            tags=[user_cache_tag("alice")]
+        )
+        return cache, token_data, user
+
+    def test_cached_user_skips_database(self, monkeypatch):
+        """Test that a cache hit resolves the user without opening a session"""
+        cache, token_data, user = self._cache_with_user(monkeypatch)
+
+        def no_session():
+            raise AssertionError("database session opened on a cache hit")
+
+        monkeypatch.setattr(auth_dependencies, "get_session", no_session)
+
+        assert asyncio.run(auth_dependencies._resolve_user(token_data)) is user
+        # Kept out of the response cache's L1
+        assert len(cache.local) == 0
+
+    def test_update_evicts_cached_user(self, monkeypatch):
+        """Test that invalidating a user drops every cached token for them"""
+        cache, token_data, _ = self._cache_with_user(monkeypatch)
+
+        asyncio.run(AuthServiceDB(None).invalidate_cached_user("alice"))
+
+        assert auth_dependencies._resolved_users.get(auth_dependencies._user_cache_key(token_data)) is None
+
+    def test_remote_invalidation_evicts_cached_user(self, monkeypatch):
+        """Test that another worker's user invalidation reaches the user cache"""
+        cache, token_data, _ = self._cache_with_user(monkeypatch)
+
+        cache._apply_invalidation({"origin": "other-worker", "tags": [user_cache_tag("alice")]})
+
+        assert auth_dependencies._resolved_users.get(auth_dependencies._user_cache_key(token_data)) is None
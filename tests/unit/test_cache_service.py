@@ -0,0 +1,383 @@
+"""
+Tests for api/services/cache_service.py (CacheService)
+"""
+
+import asyncio
+import time
+import pytest
+
+from api.services.cache_service import CacheService, CachedEntry, LocalCache
+
+
+UNREACHABLE_REDIS = "redis://127.0.0.1:1/0"
+
+
+@pytest.mark.unit
+class TestCacheServiceDegradedMode:
+    """Tests for running without a reachable Redis"""
+
+    def test_init_does_not_connect(self):
+        """Test that constructing the service performs no network I/O"""
+        cache = CacheService(redis_url=UNREACHABLE_REDIS)
+
+        assert cache.redis is not None
+        assert cache.available is False
+
+    def test_unreachable_redis_enters_degraded_mode(self):
+        """Test that a failed connect makes cache operations no-ops"""
+        cache = CacheService(redis_url=UNREACHABLE_REDIS, socket_timeout=0.5)
+
+        async def run():
+            connected = await cache.connect()
+            value = await cache.get("cache:missing")
+            stored = await cache.set("cache:key", {"a": 1})
+            return connected, value, stored
+
+        assert asyncio.run(run()) == (False, None, False)
+        assert cache.get_stats()["connected"] is False
+
+    def test_reconnect_waits_for_retry_interval(self):
+        """Test that degraded mode does not retry Redis on every request"""
+        cache = CacheService(redis_url=UNREACHABLE_REDIS, socket_timeout=0.5, retry_interval=60)
+        asyncio.run(cache.connect())
+        attempt_at = cache._next_connect_attempt
+
+        assert asyncio.run(cache.ensure_available()) is False
+        assert cache._next_connect_attempt == attempt_at
+        assert attempt_at > time.monotonic()
+
+
+@pytest.mark.unit
+class TestCacheTags:
+    """Tests for invalidation tags and key namespacing"""
+
+    def test_build_tags(self):
+        """Test that entries are tagged by endpoint, entity type, entity id and user"""
+        cache = CacheService(redis_url=UNREACHABLE_REDIS)
+
+        tags = cache.build_tags("/clothing-items/abc", entity_type="clothing_items", entity_id="abc", user_id="u1")
+
+        assert tags == [
+            "endpoint:/clothing-items/abc",
+            "entity:clothing_items",
+            "entity:clothing_items:abc",
+            "user:u1",
+        ]
+
+    def test_generation_namespaces_key(self):
+        """Test that bumping a generation produces a different key"""
+        cache = CacheService(redis_url=UNREACHABLE_REDIS, invalidation_strategy="generation")
+
+        key_v0 = cache.generate_cache_key("/outfits/", {"limit": 50}, generation=0)
+        key_v1 = cache.generate_cache_key("/outfits/", {"limit": 50}, generation=1)
+
+        assert key_v0 != key_v1
+
+    def test_entity_type_from_path(self):
+        """Test that the entity type is derived from the first path segment"""
+        from api.middleware.cache import _entity_type_from_path
+
+        assert _entity_type_from_path("/clothing-items/abc") == "clothing_items"
+        assert _entity_type_from_path("/api/characters/") == "characters"
+
+
+@pytest.mark.unit
+class TestLocalCache:
+    """Tests for the process-local L1 cache"""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted at max size"""
+        local = LocalCache(max_size=2)
+        local.set("a", 1, ttl=60)
+        local.set("b", 2, ttl=60)
+        local.get("a")
+        local.set("c", 3, ttl=60)
+
+        assert local.get("a") == 1
+        assert local.get("b") is None
+        assert local.get("c") == 3
+
+    def test_expired_entries_are_misses(self):
+        """Test that entries past their TTL are not returned"""
+        local = LocalCache()
+        local.set("a", 1, ttl=0)
+
+        assert local.get("a") is None
+        assert len(local) == 0
+
+    def test_invalidate_tags(self):
+        """Test eviction by any tag and by all tags"""
+        local = LocalCache()
+        local.set("list", [1], ttl=60, tags=["entity:outfits", "user:u1"])
+        local.set("other", [2], ttl=60, tags=["entity:outfits", "user:u2"])
+        local.set("chars", [3], ttl=60, tags=["entity:characters", "user:u1"])
+
+        assert local.invalidate_tags(["entity:outfits", "user:u1"], match_all=True) == 1
+        assert local.get("other") == [2]
+
+        assert local.invalidate_tags(["entity:outfits", "entity:characters"]) == 2
+        assert len(local) == 0
+
+    def test_remote_invalidation_message_evicts(self):
+        """Test that another worker's invalidation evicts matching L1 entries"""
+        cache = CacheService(redis_url=UNREACHABLE_REDIS)
+        cache.local.set("cache:/outfits/", [1], ttl=60, tags=["entity:outfits"])
+        cache.local.set("cache:/characters/", [2], ttl=60, tags=["entity:characters"])
+
+        cache._apply_invalidation({"origin": "other-worker", "tags": ["entity:outfits"]})
+
+        assert cache.local.get("cache:/outfits/") is None
+        assert cache.local.get("cache:/characters/") == [2]
+
+    def test_l1_is_evicted_after_redis_write(self):
+        """Test that deletes and version bumps hit Redis before evicting L1"""
+        events = []
+
+        class RecordingRedis:
+            async def delete(self, *keys):
+                events.append(("delete", cache.local.get("cache:/outfits/")))
+                return len(keys)
+
+            async def incr(self, key):
+                events.append(("incr", cache.local.get(key)))
+
+            async def publish(self, channel, message):
+                events.append(("publish", None))
+
+        cache = CacheService(redis_url=UNREACHABLE_REDIS)
+        cache.redis = RecordingRedis()
+        cache._available = True
+        cache.local.set("cache:/outfits/", [1], ttl=60)
+        cache.local.set(cache._version_key("outfits"), 3, ttl=60)
+
+        asyncio.run(cache.delete("cache:/outfits/"))
+        asyncio.run(cache.bump_version("outfits"))
+
+        assert events == [("delete", [1]), ("publish", None), ("incr", 3), ("publish", None)]
+        assert cache.local.get("cache:/outfits/") is None
+        assert cache.local.get(cache._version_key("outfits")) is None
+
+
+@pytest.mark.unit
+class TestCachedEntry:
+    """Tests for entry freshness and early refresh"""
+
+    def test_fresh_entry_does_not_need_refresh(self):
+        """Test that a cheap entry far from expiry is served as-is"""
+        entry = CachedEntry(b'{"a":1}', fresh_until=time.time() + 60, delta=0.01)
+
+        assert entry.is_stale is False
+        assert entry.needs_refresh() is False
+
+    def test_stale_entry_needs_refresh(self):
+        """Test that an entry past its TTL is recomputed"""
+        entry = CachedEntry(b'{"a":1}', fresh_until=time.time() - 1)
+
+        assert entry.is_stale is True
+        assert entry.needs_refresh(beta=0) is True
+
+    def test_expensive_entry_refreshes_early(self):
+        """Test that entries that are slow to compute refresh before expiring"""
+        entry = CachedEntry(b'{"a":1}', fresh_until=time.time() + 1, delta=1000.0)
+
+        refreshes = sum(entry.needs_refresh() for _ in range(100))
+
+        assert refreshes > 90
+        assert entry.needs_refresh(beta=0) is False
+
+
+@pytest.mark.unit
+class TestCachedBodies:
+    """Tests for pre-serialized and precompressed cached bodies"""
+
+    def test_render_json_matches_json_response(self):
+        """Test that stored bodies are byte-identical to JSONResponse output"""
+        from fastapi.responses import JSONResponse
+        from api.services.cache_service import render_json
+
+        content = {"items": [{"name": "Café", "count": 2}], "total": 1}
+
+        assert render_json(content) == JSONResponse(content=content).body
+
+    def test_large_bodies_get_gzip_variant(self):
+        """Test that only bodies above the size threshold are precompressed"""
+        import gzip
+
+        cache = CacheService(redis_url=UNREACHABLE_REDIS, compress_encodings=["gzip"], compress_min_size=100)
+        body = b'{"data":"' + b"x" * 1000 + b'"}'
+
+        variants = cache._compress(body)
+
+        assert gzip.decompress(variants["gzip"]) == body
+        assert cache._compress(b"{}") == {}
+
+    def test_cached_response_negotiates_encoding(self):
+        """Test that hits serve the precompressed body only to clients that accept it"""
+        from starlette.requests import Request
+        from api.middleware.cache import _cached_response
+
+        entry = CachedEntry(b'{"a":1}', fresh_until=time.time() + 60, encodings={"gzip": b"gz"})
+
+        def request(accept_encoding):
+            return Request({"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]})
+
+        compressed = _cached_response(entry, request("gzip, deflate"))
+        plain = _cached_response(entry, request("gzip;q=0, identity"))
+
+        assert compressed.body == b"gz"
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.headers["etag"] == entry.etag[:-1] + '-gzip"'
+        assert plain.body == b'{"a":1}'
+        assert plain.headers["etag"] == entry.etag
+        assert "content-encoding" not in plain.headers
+
+
+    def test_bodies_are_filtered_by_the_route_response_model(self):
+        """Test that stored bodies go through the route's response_model like FastAPI responses"""
+        from typing import List
+        from fastapi.routing import APIRoute
+        from pydantic import BaseModel
+        from starlette.requests import Request
+        from api.middleware.cache import _encode_result
+
+        class Item(BaseModel):
+            name: str
+
+        def endpoint():
+            pass
+
+        route = APIRoute("/items", endpoint, response_model=List[Item])
+        request = Request({"type": "http", "headers": [], "route": route})
+
+        body, _ = _encode_result([{"name": "a", "secret": "s"}], request)
+
+        assert body == b'[{"name":"a"}]'
+
+@pytest.mark.unit
+class TestConditionalRequests:
+    """Tests for ETag / If-None-Match handling"""
+
+    def test_etag_matches(self):
+        """Test weak comparison, lists, wildcards and compressed variants"""
+        from api.middleware.cache import etag_matches
+
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('W/"abc"', '"abc"')
+        assert etag_matches('"x", "abc-gzip"', '"abc"')
+        assert etag_matches('*', '"abc"')
+        assert not etag_matches('"abd"', '"abc"')
+        assert not etag_matches(None, '"abc"')
+
+    def test_cached_hit_answers_304(self):
+        """Test that a matching If-None-Match on a cached entry returns 304 without a body"""
+        from starlette.requests import Request
+        from api.middleware.cache import _cached_response
+
+        entry = CachedEntry(b'{"a":1}', fresh_until=time.time() + 60)
+        request = Request({"type": "http", "headers": [(b"if-none-match", entry.etag.encode())]})
+
+        response = _cached_response(entry, request)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == entry.etag
+
+    def test_etag_decorator_returns_304_for_unchanged_body(self):
+        """Test that an uncached endpoint answers 304 when its payload did not change"""
+        from fastapi import FastAPI, Request
+        from fastapi.testclient import TestClient
+        from api.middleware.cache import etag
+
+        app = FastAPI()
+
+        @app.get("/items")
+        @etag()
+        async def list_items(request: Request):
+            return [{"id": 1}]
+
+        client = TestClient(app)
+        first = client.get("/items")
+        second = client.get("/items", headers={"If-None-Match": first.headers["etag"]})
+
+        assert first.status_code == 200
+        assert first.json() == [{"id": 1}]
+        assert second.status_code == 304
+
+    def test_etag_decorator_applies_response_model(self):
+        """Test that @etag responses are filtered by the route's response_model"""
+        from typing import List
+        from fastapi import FastAPI, Request
+        from fastapi.testclient import TestClient
+        from pydantic import BaseModel
+        from api.middleware.cache import etag
+
+        class Item(BaseModel):
+            id: int
+
+        app = FastAPI()
+
+        @app.get("/items", response_model=List[Item])
+        @etag()
+        async def list_items(request: Request):
+            return [{"id": 1, "resume_params": {"prompt": "secret"}}]
+
+        response = TestClient(app).get("/items")
+
+        assert response.json() == [{"id": 1}]
+        assert "etag" in response.headers
+
+
+@pytest.mark.unit
+class TestCompressionMiddleware:
+    """Tests for api/middleware/compression.py"""
+
+    def _client(self):
+        from fastapi import FastAPI
+        from fastapi.responses import Response, StreamingResponse
+        from fastapi.testclient import TestClient
+        from api.middleware.compression import CompressionMiddleware
+
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+        @app.get("/large")
+        async def large():
+            return {"data": "x" * 1000}
+
+        @app.get("/small")
+        async def small():
+            return {"ok": True}
+
+        @app.get("/stream")
+        async def stream():
+            async def events():
+                yield b"data: " + b"x" * 1000 + b"\n\n"
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        @app.get("/png")
+        async def png():
+            return Response(b"\x89PNG" + b"\x00" * 1000, media_type="image/png")
+
+        return TestClient(app)
+
+    def test_large_json_is_gzipped(self):
+        """Test that large JSON responses are compressed and still decode"""
+        response = self._client().get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json() == {"data": "x" * 1000}
+
+    def test_small_sse_and_media_are_not_compressed(self):
+        """Test the size threshold, SSE and content-type allow-list"""
+        client = self._client()
+
+        for path in ("/small", "/stream", "/png"):
+            response = client.get(path, headers={"Accept-Encoding": "gzip"})
+            assert "content-encoding" not in response.headers, path
+
+    def test_client_without_gzip_gets_identity(self):
+        """Test that clients that don't accept gzip get the plain body"""
+        response = self._client().get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
@@ -0,0 +1,128 @@
+"""
+Tests for api/services/image_service.py (ImageService)
+"""
+
+import asyncio
+import json
+import pytest
+
+from ai_tools.shared.preset import PresetManager
+from api.models.db import Image, ImageEntityRelationship
+from api.services import image_service
+from api.services.image_service import ImageService, PresetNameIndex, schedule_entity_name_update
+
+
+def write_preset(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+@pytest.mark.unit
+class TestPresetNameIndex:
+    """Tests for the in-memory preset name index used by image listing"""
+
+    def test_display_name_and_first_category_wins(self, tmp_path):
+        """Test name fallbacks and that categories are searched in order"""
+        write_preset(tmp_path / "visual_styles" / "noir.json", {"_metadata": {"display_name": "Film Noir"}})
+        write_preset(tmp_path / "visual_styles" / "plain.json", {"name": "Plain"})
+        write_preset(tmp_path / "expressions" / "noir.json", {"name": "Noir Face"})
+        (tmp_path / "expressions" / "broken.json").write_text("{not json")
+
+        index = PresetNameIndex(tmp_path, categories=["visual_styles", "expressions"])
+        names = asyncio.run(index.get_names())
+
+        assert names == {
+            "noir": ("visual_styles", "Film Noir"),
+            "plain": ("visual_styles", "Plain"),
+        }
+
+    def test_rebuilds_when_directory_changes(self, tmp_path):
+        """Test that adding a preset is picked up without waiting for max_age"""
+        write_preset(tmp_path / "makeup" / "a.json", {"name": "A"})
+        index = PresetNameIndex(tmp_path, categories=["makeup"])
+
+        assert "b" not in asyncio.run(index.get_names())
+
+        write_preset(tmp_path / "makeup" / "b.json", {"name": "B"})
+
+        assert asyncio.run(index.get_names())["b"] == ("makeup", "B")
+
+    def test_follows_preset_manager_writes(self, tmp_path):
+        """Test that a rename written through PresetManager is seen without a rescan"""
+        write_preset(tmp_path / "makeup" / "a.json", {"_metadata": {"display_name": "Old"}})
+        index = PresetNameIndex(tmp_path, categories=["makeup"])
+        assert asyncio.run(index.get_names())["a"] == ("makeup", "Old")
+
+        write_preset(tmp_path / "makeup" / "a.json", {"_metadata": {"display_name": "New"}})
+        PresetManager(tmp_path).refresh("makeup", "a")
+
+        assert asyncio.run(index.get_names())["a"] == ("makeup", "New")
+
+
+class NoQuerySession:
+    """Fails the test if the service issues a query"""
+
+    async def execute(self, statement):
+        raise AssertionError(f"Unexpected query: {statement}")
+
+
+@pytest.mark.unit
+class TestImageListing:
+    """Tests for assembling image listings from relationships"""
+
+    def test_stored_entity_names_need_no_lookups(self):
+        """Test that denormalized names on relationships are used as-is"""
+        service = ImageService(NoQuerySession())
+        image = Image(image_id="img-1", file_path="output/a.png", filename="a.png")
+        relationships = [
+            ImageEntityRelationship(
+                image_id="img-1", entity_type="character", entity_id="luna",
+                role="subject", entity_name="Luna"
+            ),
+            ImageEntityRelationship(
+                image_id="img-1", entity_type="visual_style", entity_id="noir",
+                role="visual_style", entity_name="Film Noir", preset_category="visual_styles"
+            ),
+        ]
+
+        async def get_by_images(image_ids):
+            return {"img-1": relationships}
+
+        service.relationship_repository.get_by_images = get_by_images
+
+        [result] = asyncio.run(service._images_with_entities([image]))
+
+        assert result["entities"] == {
+            "character": [{"entity_id": "luna", "entity_name": "Luna", "role": "subject"}],
+            "visual_style": [{
+                "entity_id": "noir", "entity_name": "Film Noir",
+                "role": "visual_style", "preset_category": "visual_styles"
+            }],
+        }
+
+
+@pytest.mark.unit
+class TestEntityNamePropagation:
+    """Tests for copying renamed entities' names to image relationships"""
+
+    def test_update_runs_without_background_tasks(self, monkeypatch):
+        """Test that a rename without BackgroundTasks is still propagated"""
+        calls = []
+
+        async def record(*args, standalone=False):
+            calls.append((*args, standalone))
+
+        monkeypatch.setattr(image_service, "propagate_entity_name", record)
+
+        async def rename():
+            schedule_entity_name_update(["preset"], "noir", "Film Noir", "visual_styles")
+            await asyncio.sleep(0)
+
+        asyncio.run(rename())
+        schedule_entity_name_update(["preset"], "noir", "noir")
+
+        # Without a running loop the update gets its own engine
+        assert calls == [
+            (["preset"], "noir", "Film Noir", "visual_styles", False),
+            (["preset"], "noir", "noir", None, True),
+        ]
@@ -0,0 +1,334 @@
+"""
+Tests for api/services/job_queue.py (JobQueueManager)
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+
+from api.models.jobs import Job, JobInfo, JobStatus, JobType
+from api.services.job_queue import JobQueueManager, resumable
+from api.services.storage_backend import InMemoryBackend
+
+
+class EventRecordingBackend(InMemoryBackend):
+    """In-memory backend that records published job events"""
+
+    supports_events = True
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def publish_event(self, event: dict):
+        self.events.append(event)
+
+
+@pytest.mark.unit
+class TestJobEvents:
+    """Tests for cross-worker job event fan-out"""
+
+    def test_save_publishes_event(self):
+        """Test that job mutations are published with this worker's origin"""
+        backend = EventRecordingBackend()
+        manager = JobQueueManager(storage_backend=backend)
+
+        job_id = manager.create_job(JobType.ANALYZE, "Test job")
+
+        assert backend.events[-1]["type"] == "saved"
+        assert backend.events[-1]["job_id"] == job_id
+        assert backend.events[-1]["origin"] == manager.instance_id
+
+    def test_delete_publishes_event(self):
+        """Test that deletions are published"""
+        backend = EventRecordingBackend()
+        manager = JobQueueManager(storage_backend=backend)
+
+        job_id = manager.create_job(JobType.ANALYZE, "Test job")
+        manager.complete_job(job_id)
+        manager.delete_job(job_id)
+
+        assert backend.events[-1] == {
+            "type": "deleted",
+            "origin": manager.instance_id,
+            "job_id": job_id,
+        }
+
+    def test_backend_without_events_yields_nothing(self):
+        """Test that listening on a backend without job events ends immediately"""
+        async def listen():
+            return [event async for event in InMemoryBackend().listen_events()]
+
+        assert asyncio.run(listen()) == []
+
+    def test_remote_event_updates_cache_and_subscribers(self):
+        """Test that another worker's event refreshes the cache and reaches SSE queues"""
+        manager = JobQueueManager(storage_backend=EventRecordingBackend())
+        job = Job(type=JobType.ANALYZE, title="Remote job", status=JobStatus.RUNNING, progress=0.5)
+
+        async def run():
+            queue = await manager.subscribe()
+            await manager._apply_event({
+                "type": "saved",
+                "origin": "other-worker",
+                "job_id": job.job_id,
+                "job": job.model_dump(),
+            })
+            return queue.get_nowait()
+
+        received = asyncio.run(run())
+
+        assert received.job_id == job.job_id
+        assert manager.get_job(job.job_id).progress == 0.5
+
+    def test_own_events_are_ignored(self):
+        """Test that a worker does not re-apply its own events"""
+        manager = JobQueueManager(storage_backend=EventRecordingBackend())
+        job = Job(type=JobType.ANALYZE, title="Local job")
+
+        asyncio.run(manager._apply_event({
+            "type": "saved",
+            "origin": manager.instance_id,
+            "job_id": job.job_id,
+            "job": job.model_dump(),
+        }))
+
+        assert job.job_id not in manager._job_cache
+
+    def test_remote_delete_evicts_cache(self):
+        """Test that a remote deletion evicts the cached job"""
+        manager = JobQueueManager(storage_backend=EventRecordingBackend())
+        job_id = manager.create_job(JobType.ANALYZE, "Test job")
+
+        asyncio.run(manager._apply_event({
+            "type": "deleted",
+            "origin": "other-worker",
+            "job_id": job_id,
+        }))
+
+        assert job_id not in manager._job_cache
+
+
+@pytest.mark.unit
+class TestJobCache:
+    """Tests for the bounded job cache"""
+
+    def test_cache_is_bounded(self):
+        """Test that finished jobs are evicted beyond the cache limit"""
+        manager = JobQueueManager(cache_max_size=3)
+
+        for i in range(10):
+            job_id = manager.create_job(JobType.ANALYZE, f"Job {i}")
+            manager.complete_job(job_id)
+
+        assert len(manager._job_cache) == 3
+        # Evicted jobs are still available from storage
+        assert len(manager.list_jobs()) == 10
+
+    def test_active_jobs_are_pinned(self):
+        """Test that running jobs are never evicted"""
+        manager = JobQueueManager(cache_max_size=2)
+
+        running_id = manager.create_job(JobType.ANALYZE, "Running job")
+        manager.start_job(running_id)
+
+        for i in range(5):
+            job_id = manager.create_job(JobType.ANALYZE, f"Job {i}")
+            manager.complete_job(job_id)
+
+        assert running_id in manager._job_cache
+
+
+@pytest.mark.unit
+class TestJobRetention:
+    """Tests for retention cleanup"""
+
+    def test_cleanup_removes_only_expired_jobs(self):
+        """Test that only terminal jobs older than the cutoff are removed"""
+        manager = JobQueueManager()
+
+        old_id = manager.create_job(JobType.ANALYZE, "Old job")
+        manager.complete_job(old_id)
+        old_job = manager.get_job(old_id)
+        old_job.completed_at = datetime.now() - timedelta(hours=48)
+        manager._save_job(old_job)
+
+        recent_id = manager.create_job(JobType.ANALYZE, "Recent job")
+        manager.complete_job(recent_id)
+
+        running_id = manager.create_job(JobType.ANALYZE, "Running job")
+        manager.start_job(running_id)
+
+        assert manager.cleanup_old_jobs(max_age_hours=24) == 1
+        assert not manager.storage.exists(old_id)
+        assert manager.storage.exists(recent_id)
+        assert manager.storage.exists(running_id)
+
+    def test_restarted_job_leaves_finished_index(self):
+        """Test that re-saving a job as active removes it from the finished index"""
+        backend = InMemoryBackend()
+        manager = JobQueueManager(storage_backend=backend)
+
+        job_id = manager.create_job(JobType.ANALYZE, "Job")
+        manager.complete_job(job_id)
+        assert job_id in backend.finished
+
+        manager.start_job(job_id)
+        assert job_id not in backend.finished
+
+
+@pytest.mark.unit
+class TestJobRecovery:
+    """Tests for checkpoints and orphaned job recovery"""
+
+    def test_checkpoints_persist_in_storage(self):
+        """Test that checkpoints are saved with the job"""
+        backend = InMemoryBackend()
+        manager = JobQueueManager(storage_backend=backend)
+
+        job_id = manager.create_job(JobType.BATCH_GENERATE, "Batch")
+        manager.record_checkpoint(job_id, "0", {"file_path": "a.png"})
+
+        assert backend.get_job(job_id)["checkpoints"] == {"0": {"file_path": "a.png"}}
+
+    def test_recovery_state_is_not_part_of_the_api_model(self):
+        """Test that resume data stays out of the job representation returned by the API"""
+        manager = JobQueueManager(storage_backend=InMemoryBackend())
+        job_id = manager.create_job(
+            JobType.BATCH_GENERATE, "Batch",
+            resume_handler="test_batch", resume_params={"items": ["a"]}
+        )
+
+        data = JobInfo.model_validate(manager.get_job(job_id).model_dump()).model_dump()
+
+        assert data["job_id"] == job_id
+        assert not {"worker_id", "checkpoints", "resume_handler", "resume_params"} & data.keys()
+
+    def test_orphaned_job_is_resumed_on_new_worker(self):
+        """Test that a job from a dead worker is resumed with its checkpoints"""
+        backend = InMemoryBackend()
+        crashed = JobQueueManager(storage_backend=backend)
+        calls = []
+
+        @resumable("test_batch")
+        async def run_batch(job_id: str, items: list):
+            calls.append((job_id, items, recovering.get_checkpoints(job_id)))
+
+        job_id = crashed.create_job(
+            JobType.BATCH_GENERATE, "Batch",
+            resume_handler="test_batch", resume_params={"items": ["a", "b"]}
+        )
+        crashed.start_job(job_id)
+        crashed.record_checkpoint(job_id, "a", {"file_path": "a.png"})
+
+        recovering = JobQueueManager(storage_backend=backend)
+
+        async def run():
+            resumed = await recovering.recover_orphaned_jobs()
+            await asyncio.gather(*recovering._local_tasks)
+            return resumed
+
+        assert asyncio.run(run()) == 1
+        assert calls == [(job_id, ["a", "b"], {"a": {"file_path": "a.png"}})]
+        assert recovering.get_job(job_id).worker_id == recovering.instance_id
+
+    def test_orphaned_job_without_handler_is_failed(self):
+        """Test that non-resumable orphaned jobs don't stay RUNNING forever"""
+        backend = InMemoryBackend()
+        crashed = JobQueueManager(storage_backend=backend)
+        job_id = crashed.create_job(JobType.ANALYZE, "Analysis")
+        crashed.start_job(job_id)
+
+        recovering = JobQueueManager(storage_backend=backend)
+        assert asyncio.run(recovering.recover_orphaned_jobs()) == 0
+        assert recovering.get_job(job_id).status == JobStatus.FAILED
+
+    def test_jobs_of_live_workers_are_left_alone(self):
+        """Test that jobs owned by a worker with a current heartbeat are not recovered"""
+        backend = InMemoryBackend()
+        owner = JobQueueManager(storage_backend=backend)
+        backend.heartbeat_worker(owner.instance_id, ttl_seconds=60)
+        job_id = owner.create_job(JobType.ANALYZE, "Analysis")
+        owner.start_job(job_id)
+
+        other = JobQueueManager(storage_backend=backend)
+        asyncio.run(other.recover_orphaned_jobs())
+
+        assert other.get_job(job_id).status == JobStatus.RUNNING
+
+
+@pytest.mark.unit
+class TestJobDispatch:
+    """Tests for dispatching jobs to registered handlers"""
+
+    def test_local_dispatch_uses_background_tasks(self):
+        """Test that local execution queues the handler with the job's params"""
+        from fastapi import BackgroundTasks
+
+        @resumable("test_dispatch")
+        async def run_dispatch(job_id: str, value: int):
+            pass
+
+        manager = JobQueueManager()
+        job_id = manager.create_job(
+            JobType.GENERATE_IMAGE, "Dispatch",
+            resume_handler="test_dispatch", resume_params={"value": 3}
+        )
+        background_tasks = BackgroundTasks()
+        manager.dispatch_job(job_id, background_tasks)
+
+        task = background_tasks.tasks[0]
+        assert task.func is run_dispatch
+        assert task.args == (job_id,)
+        assert task.kwargs == {"value": 3}
+
+    def test_dispatch_requires_registered_handler(self):
+        """Test that jobs without a handler cannot be dispatched"""
+        manager = JobQueueManager()
+        job_id = manager.create_job(JobType.ANALYZE, "No handler")
+
+        with pytest.raises(ValueError):
+            manager.dispatch_job(job_id)
+
+
+@pytest.mark.unit
+class TestJobGroups:
+    """Tests for creating parent/child jobs together"""
+
+    def test_group_is_written_in_one_batch(self):
+        """Test that the parent and its children are stored with a single set_jobs call"""
+        class BatchRecordingBackend(EventRecordingBackend):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def set_jobs(self, jobs, events=None):
+                self.batches.append(list(jobs))
+                super().set_jobs(jobs, events)
+
+        backend = BatchRecordingBackend()
+        manager = JobQueueManager(storage_backend=backend)
+
+        parent_id, child_ids = manager.create_job_group(
+            JobType.BATCH_GENERATE, "Previews",
+            children=[{"title": "A"}, {"title": "B", "job_type": JobType.GENERATE_IMAGE}]
+        )
+
+        assert backend.batches == [[parent_id] + child_ids]
+        assert [event["job_id"] for event in backend.events] == [parent_id] + child_ids
+        assert manager.get_job(parent_id).child_job_ids == child_ids
+        assert manager.get_job(child_ids[1]).type == JobType.GENERATE_IMAGE
+        assert manager.get_job(child_ids[0]).parent_job_id == parent_id
+
+    def test_parent_completes_with_its_children(self):
+        """Test that the parent finishes once every child has finished"""
+        manager = JobQueueManager()
+        parent_id, child_ids = manager.create_job_group(
+            JobType.BATCH_GENERATE, "Previews", children=[{"title": "A"}, {"title": "B"}]
+        )
+
+        manager.complete_job(child_ids[0])
+        assert manager.get_job(parent_id).status == JobStatus.RUNNING
+
+        manager.fail_job(child_ids[1], "boom")
+        assert manager.get_job(parent_id).status == JobStatus.COMPLETED
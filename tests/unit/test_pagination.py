@@ -0,0 +1,110 @@
+"""
+Tests for api/repositories/pagination.py (keyset pagination)
+"""
+
+import asyncio
+
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from api.models.db import Image
+from api.repositories.pagination import (
+    Cursor,
+    apply_keyset,
+    decode_cursor,
+    encode_cursor,
+    fetch_with_total,
+    split_page,
+)
+
+
+class RecordingSession:
+    """Stands in for AsyncSession; returns canned rows and keeps the statement"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statement = None
+
+    async def execute(self, statement):
+        self.statement = statement
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+@pytest.mark.unit
+class TestKeysetPagination:
+    """Tests for cursor encoding and page assembly"""
+
+    def test_cursor_round_trip(self):
+        """Test that cursors are opaque URL-safe strings that decode to the position"""
+        created_at = datetime(2025, 10, 22, 19, 30, 0, 123456)
+
+        cursor = encode_cursor(created_at, 42)
+
+        assert cursor.replace("-", "").replace("_", "").isalnum()
+        assert decode_cursor(cursor) == Cursor(created_at, 42)
+
+    def test_malformed_cursor_raises_value_error(self):
+        """Test that tampered cursors are rejected"""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+    def test_split_page_builds_next_cursor_from_last_row(self):
+        """Test that the extra row is dropped and the cursor points at the last kept row"""
+        rows = [SimpleNamespace(created_at=datetime(2025, 1, day), id=day) for day in (3, 2, 1)]
+
+        page, next_cursor = split_page(rows, limit=2)
+
+        assert [row.id for row in page] == [3, 2]
+        assert decode_cursor(next_cursor) == Cursor(datetime(2025, 1, 2), 2)
+        assert split_page(rows, limit=3) == (rows, None)
+
+    def test_apply_keyset_seeks_with_row_comparison(self):
+        """Test that the query seeks past the cursor with a total newest-first order"""
+        query = apply_keyset(select(Image), Image, Cursor(datetime(2025, 1, 1), 7))
+
+        sql = str(query.compile(dialect=postgresql.dialect()))
+
+        assert "(images.created_at, images.id) < (" in sql
+        assert "ORDER BY images.created_at DESC, images.id DESC" in sql
+        assert "OFFSET" not in sql
+
+    def test_fetch_with_total_uses_window_count(self):
+        """Test that offset pages read the total from COUNT(*) OVER() on the same statement"""
+        session = RecordingSession([("a", 12), ("b", 12)])
+
+        rows, total = asyncio.run(fetch_with_total(session, apply_keyset(select(Image), Image).limit(2).offset(4)))
+
+        sql = str(session.statement.compile(dialect=postgresql.dialect()))
+        assert "count(*) OVER () AS total_count" in sql
+        assert (rows, total) == (["a", "b"], 12)
+
+    def test_fetch_with_total_counts_cursor_pages_without_the_seek(self):
+        """Test that cursor pages count with a scalar subquery that ignores the cursor"""
+        filtered = select(Image).where(Image.user_id == 1)
+        query = apply_keyset(filtered, Image, Cursor(datetime(2025, 1, 1), 7)).limit(2)
+        session = RecordingSession([])
+
+        rows, total = asyncio.run(fetch_with_total(session, query, filtered))
+
+        sql = str(session.statement.compile(dialect=postgresql.dialect()))
+        subquery = sql[sql.index("(SELECT count(*)"):sql.index("AS total_count")]
+        assert "images.user_id" in subquery
+        assert "images.created_at, images.id" not in subquery
+        assert (rows, total) == ([], None)
+
+    def test_fetch_with_total_counts_unfiltered_cursor_pages_over_the_table(self):
+        """Test that an unfiltered cursor page still counts rows from the table"""
+        query = apply_keyset(select(Image), Image, Cursor(datetime(2025, 1, 1), 7)).limit(2)
+        session = RecordingSession([("a", 30)])
+
+        rows, total = asyncio.run(fetch_with_total(session, query, select(Image)))
+
+        sql = str(session.statement.compile(dialect=postgresql.dialect()))
+        subquery = sql[sql.index("(SELECT count(*)"):sql.index("AS total_count")]
+        assert "FROM images" in subquery
+        assert "images.created_at, images.id" not in subquery
+        assert (rows, total) == (["a"], 30)
@@ -0,0 +1,107 @@
+"""
+Tests for api/services/password_hasher.py (PasswordHasher)
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+
+from api.models.db import User as DBUser
+from api.services import auth_service_db
+from api.services.auth_service_db import AuthServiceDB
+from api.services.password_hasher import (
+    PasswordHasher,
+    PasswordHasherBusyError,
+    hash_password_sync,
+    hash_rounds,
+)
+
+
+@pytest.mark.unit
+class TestPasswordHasher:
+    """Tests for off-loop bcrypt hashing"""
+
+    def test_hash_and_verify(self):
+        """Test that hashes made on the pool verify, and wrong passwords don't"""
+        hasher = PasswordHasher(rounds=4)
+
+        async def run():
+            hashed = await hasher.hash("s3cret-password")
+            return hashed, await hasher.verify("s3cret-password", hashed), await hasher.verify("wrong", hashed)
+
+        hashed, ok, wrong = asyncio.run(run())
+        hasher.shutdown()
+
+        assert hash_rounds(hashed) == 4
+        assert ok is True
+        assert wrong is False
+
+    def test_needs_rehash_on_cost_change(self):
+        """Test that hashes with a different work factor are flagged for upgrade"""
+        hasher = PasswordHasher(rounds=5)
+
+        assert hasher.needs_rehash(hash_password_sync("pw", rounds=4)) is True
+        assert hasher.needs_rehash(hash_password_sync("pw", rounds=5)) is False
+        assert hasher.needs_rehash("not-a-bcrypt-hash") is True
+
+    def test_rejects_beyond_in_flight_cap(self):
+        """Test that callers beyond the concurrency cap are rejected after waiting"""
+        hasher = PasswordHasher(rounds=12, max_workers=1, max_in_flight=1, wait_timeout=0.01)
+
+        async def run():
+            return await asyncio.gather(
+                hasher.hash("first"), hasher.hash("second"), return_exceptions=True
+            )
+
+        first, second = asyncio.run(run())
+        hasher.shutdown()
+
+        assert isinstance(first, str)
+        assert isinstance(second, PasswordHasherBusyError)
+
+
+class BusyHashHasher(PasswordHasher):
+    """Verifies normally but has no capacity left to hash"""
+
+    async def hash(self, password: str) -> str:
+        raise PasswordHasherBusyError("Too many concurrent password operations")
+
+
+class FakeUserRepository:
+    def __init__(self, user):
+        self.user = user
+
+    async def get_by_username(self, username):
+        return self.user
+
+    async def update(self, user):
+        return user
+
+
+class FakeSession:
+    async def commit(self):
+        pass
+
+
+@pytest.mark.unit
+class TestLoginRehash:
+    """Tests for upgrading password hashes on login"""
+
+    def test_busy_hasher_does_not_fail_correct_login(self, monkeypatch):
+        """Test that a busy pool defers the rehash instead of rejecting valid credentials"""
+        old_hash = hash_password_sync("s3cret-password", rounds=4)
+        user = DBUser(
+            id=1, username="alice", hashed_password=old_hash,
+            disabled=False, created_at=datetime(2025, 1, 1)
+        )
+        hasher = BusyHashHasher(rounds=5)
+        monkeypatch.setattr(auth_service_db, "get_password_hasher", lambda: hasher)
+
+        service = AuthServiceDB(FakeSession())
+        service.repository = FakeUserRepository(user)
+
+        authenticated = asyncio.run(service.authenticate_user("alice", "s3cret-password"))
+        hasher.shutdown()
+
+        assert authenticated.username == "alice"
+        assert user.hashed_password == old_hash
@@ -305,6 +305,40 @@ class TestPresetManager:
         assert loaded._metadata.model_used == original._metadata.model_used
 
 
+@pytest.mark.unit
+class TestPresetIndex:
+    """Tests for the in-memory preset metadata index"""
+
+    def test_writes_update_index_shared_by_managers(self, presets_dir, sample_outfit_data):
+        """Test that renames through one manager are seen by another without rescanning"""
+        writer = PresetManager(presets_root=presets_dir)
+        reader = PresetManager(presets_root=presets_dir)
+        writer.save("outfits", OutfitSpec(**sample_outfit_data), "suit", display_name="Suit")
+        assert reader.count("outfits") == 1
+
+        writer.update_display_name("outfits", "suit", "Grey Suit")
+
+        assert reader.list("outfits")[0]["display_name"] == "Grey Suit"
+        assert reader.get_metadata("outfits", "suit")["display_name"] == "Grey Suit"
+
+        writer.save_preview_image("outfits", "suit", b"png")
+        assert reader.has_preview_image("outfits", "suit")
+
+        writer.delete("outfits", "suit")
+        assert not reader.exists("outfits", "suit")
+        assert reader.count("outfits") == 0
+
+    def test_files_added_outside_manager_are_picked_up(self, presets_dir):
+        """Test that a changed directory mtime triggers a rescan"""
+        manager = PresetManager(presets_root=presets_dir)
+        assert manager.list("makeup") == []
+
+        (presets_dir / "makeup" / "glam.json").write_text(json.dumps({"_metadata": {"display_name": "Glam"}}))
+
+        assert manager.exists("makeup", "glam")
+        assert manager.list("makeup")[0]["display_name"] == "Glam"
+
+
 @pytest.mark.unit
 class TestConvenienceFunctions:
     """Tests for convenience functions"""
@@ -0,0 +1,91 @@
+"""
+Tests for the query instrumentation in api/database.py
+"""
+
+import asyncio
+import contextvars
+import logging
+import pytest
+
+from sqlalchemy import create_engine, text
+
+from api.database import (
+    finish_query_stats,
+    install_query_instrumentation,
+    report_query_stats,
+    start_query_stats,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    install_query_instrumentation(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.unit
+class TestQueryStats:
+    """Tests for per-request query counting and N+1 detection"""
+
+    def test_queries_are_attributed_to_the_current_request(self, engine):
+        """Test that statements run while a request is instrumented are counted and timed"""
+        def request():
+            start_query_stats()
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+            return finish_query_stats()
+
+        stats = contextvars.copy_context().run(request)
+
+        assert stats.count == 2
+        assert stats.total_ms >= stats.slowest_ms > 0
+        assert stats.slowest_statement in ("SELECT 1", "SELECT 2")
+
+    def test_queries_outside_a_request_are_ignored(self, engine):
+        """Test that statements without an instrumented request are not recorded"""
+        stats = contextvars.copy_context().run(start_query_stats)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert stats.count == 0
+
+    def test_repeated_statement_shapes_are_reported(self, engine, caplog):
+        """Test that one statement repeated past the threshold logs an N+1 warning"""
+        def request():
+            start_query_stats()
+            with engine.connect() as conn:
+                for i in range(12):
+                    conn.execute(text("SELECT :n"), {"n": i})
+            return finish_query_stats()
+
+        stats = contextvars.copy_context().run(request)
+
+        logger = logging.getLogger("api.database")
+        logger.addHandler(caplog.handler)
+        try:
+            report_query_stats("GET", "/images/", stats)
+        finally:
+            logger.removeHandler(caplog.handler)
+
+        assert stats.repeated(10) == [("SELECT ?", 12)]
+        assert any("possible N+1" in record.getMessage() for record in caplog.records)
+
+    def test_concurrent_requests_keep_separate_stats(self, engine):
+        """Test that overlapping requests (even with the same X-Request-ID) don't share stats"""
+        async def request(queries):
+            start_query_stats()
+            for i in range(queries):
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT :n"), {"n": i})
+                await asyncio.sleep(0)
+            return finish_query_stats()
+
+        async def main():
+            return await asyncio.gather(request(2), request(5))
+
+        first, second = asyncio.run(main())
+
+        assert (first.count, second.count) == (2, 5)
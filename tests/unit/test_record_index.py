@@ -0,0 +1,62 @@
+"""
+Tests for api/services/record_index.py (SQLite index over JSON records)
+"""
+
+import json
+import pytest
+
+from api.services.record_index import RecordIndex
+
+
+def write_qa(records_dir, qa_id, question, answer, game_id=None, created_at="2025-01-01T00:00:00"):
+    record = {
+        "qa_id": qa_id, "question": question, "answer": answer,
+        "game_id": game_id, "is_favorite": False, "created_at": created_at
+    }
+    (records_dir / f"{qa_id}.json").write_text(json.dumps(record))
+    return record
+
+
+@pytest.fixture
+def qa_index(tmp_path):
+    records_dir = tmp_path / "qas"
+    records_dir.mkdir()
+    write_qa(records_dir, "a", "How many Meeples?", "Seven per player", game_id="carcassonne",
+             created_at="2025-01-02T00:00:00")
+    write_qa(records_dir, "b", "Can you trade?", "Only on your turn", game_id="catan",
+             created_at="2025-01-03T00:00:00")
+    return RecordIndex(
+        records_dir, table="qas", id_field="qa_id",
+        filter_fields=["game_id", "is_favorite"], text_fields=["question", "answer"],
+        db_path=tmp_path / "index.sqlite3"
+    )
+
+
+@pytest.mark.unit
+class TestRecordIndex:
+    """Tests for listing and searching JSON records through the index"""
+
+    def test_existing_files_are_imported_and_listed_newest_first(self, qa_index):
+        """Test that records written before the index existed are listed and filtered"""
+        assert [qa["qa_id"] for qa in qa_index.list()] == ["b", "a"]
+        assert [qa["qa_id"] for qa in qa_index.list(game_id="catan")] == ["b"]
+        assert qa_index.list(is_favorite=True) == []
+
+    def test_search_matches_substrings_case_insensitively(self, qa_index):
+        """Test that search keeps the old `query in question/answer` semantics"""
+        assert [qa["qa_id"] for qa in qa_index.search("meeple")] == ["a"]
+        assert [qa["qa_id"] for qa in qa_index.search("UR TU")] == ["b"]
+        assert [qa["qa_id"] for qa in qa_index.search("ca", game_id="catan")] == ["b"]
+        assert qa_index.search("meeple", game_id="catan") == []
+
+    def test_put_and_remove_keep_index_in_step_with_files(self, qa_index):
+        """Test that writes are visible immediately and deleted records disappear"""
+        record = write_qa(qa_index.records_dir, "c", "Who goes first?", "Youngest player",
+                          created_at="2025-01-04T00:00:00")
+        qa_index.put(record)
+        assert qa_index.list()[0]["qa_id"] == "c"
+
+        (qa_index.records_dir / "c.json").unlink()
+        qa_index.remove("c")
+        assert qa_index.search("youngest") == []
+        assert [qa["qa_id"] for qa in qa_index.list()] == ["b", "a"]
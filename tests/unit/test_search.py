@@ -0,0 +1,52 @@
+"""
+Tests for api/repositories/search.py (full-text search expressions)
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from api.models.db import ClothingItem
+from api.repositories.search import prefix_tsquery, suggest_query, text_headline, text_match
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.unit
+class TestSearchExpressions:
+    """Tests for tsquery building and the generated search predicates"""
+
+    def test_prefix_tsquery_keeps_only_words(self):
+        """Test that operators and punctuation in user input can't break to_tsquery"""
+        assert prefix_tsquery("Blue  Jack") == "blue:* & jack:*"
+        assert prefix_tsquery("it's a & (test) | !x:*") == "it:* & s:* & a:* & test:* & x:*"
+        assert prefix_tsquery("  &|! ") is None
+
+    def test_short_queries_use_full_text_only(self):
+        """Test that trigram predicates (unindexable under 3 chars) are skipped for short input"""
+        sql = compile_sql(select(ClothingItem.id).where(
+            text_match(ClothingItem.search_vector, ClothingItem.item, "bl")
+        ))
+
+        assert "@@ to_tsquery" in sql
+        assert "ILIKE" not in sql.upper()
+
+    def test_suggest_query_matches_vector_and_trigram(self):
+        """Test that suggestions use the GIN-indexed predicates and rank by similarity"""
+        sql = compile_sql(suggest_query(ClothingItem, ClothingItem.item_id, ClothingItem.item, "jacket"))
+
+        assert "clothing_items.search_vector @@ to_tsquery" in sql
+        assert "clothing_items.item ILIKE" in sql
+        assert "clothing_items.item %" in sql
+        assert "ORDER BY similarity(clothing_items.item" in sql
+
+    def test_headline_escapes_source_text(self):
+        """Test that user text is HTML-escaped before ts_headline adds <mark> tags"""
+        compiled = text_headline([ClothingItem.item, ClothingItem.details], "jacket").compile(
+            dialect=postgresql.dialect()
+        )
+
+        assert "replace(replace(replace(replace(replace(concat_ws(" in str(compiled)
+        assert {"&", "&amp;", "<", "&lt;", ">", "&gt;"} <= set(compiled.params.values())
@@ -0,0 +1,68 @@
+"""
+Tests for api/repositories/statements.py (targeted writes)
+"""
+
+import asyncio
+import pytest
+
+from sqlalchemy.dialects import postgresql
+
+from api.models.db import Character, ClothingItem
+from api.repositories.statements import delete_returning, json_merge, row_exists, update_returning
+
+
+class RecordingSession:
+    """Captures executed statements instead of running them"""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+
+        class Result:
+            def scalar_one_or_none(self):
+                return None
+
+        return Result()
+
+
+@pytest.mark.unit
+class TestTargetedStatements:
+    """Tests that writes are single statements touching only the given columns"""
+
+    def test_update_sets_only_given_columns_with_owner_filter(self):
+        """Test that update_returning emits one UPDATE ... WHERE key AND owner RETURNING"""
+        session = RecordingSession()
+
+        asyncio.run(update_returning(
+            session, ClothingItem, ClothingItem.item_id, "abc", {"color": "red"}, user_id=7
+        ))
+
+        [sql] = session.statements
+        set_clause = sql.split(" SET ")[1].split(" WHERE ")[0]
+        assert sql.startswith("UPDATE clothing_items SET")
+        assert "color=" in set_clause and "fabric" not in set_clause
+        assert "clothing_items.user_id = " in sql
+        assert "RETURNING clothing_items.id" in sql
+
+    def test_delete_and_exists_do_not_load_rows(self):
+        """Test that delete is a DELETE ... RETURNING id and exists is SELECT 1 LIMIT 1"""
+        session = RecordingSession()
+
+        asyncio.run(delete_returning(session, ClothingItem, ClothingItem.item_id, "abc"))
+        asyncio.run(row_exists(session, ClothingItem, ClothingItem.item_id == "abc"))
+
+        delete_sql, exists_sql = session.statements
+        assert delete_sql.startswith("DELETE FROM clothing_items WHERE")
+        assert delete_sql.endswith("RETURNING clothing_items.id")
+        assert "user_id" not in delete_sql
+        assert "clothing_items.item " not in exists_sql
+        assert "LIMIT" in exists_sql
+
+    def test_json_merge_patches_existing_metadata(self):
+        """Test that metadata updates merge server-side instead of replacing"""
+        sql = str(json_merge(Character.meta, {"a": 1}).compile(dialect=postgresql.dialect()))
+
+        assert "CAST(characters.metadata AS JSONB)" in sql
+        assert "||" in sql